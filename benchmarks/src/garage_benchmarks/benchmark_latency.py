@@ -0,0 +1,173 @@
+"""Latency benchmarks of single operations.
+
+Unlike the other benchmarks, these do not run experiments. They time an
+operation in a loop and print the mean latency of a call.
+"""
+import subprocess
+import sys
+import timeit
+
+import akro
+import numpy as np
+import torch
+
+from garage.envs import EnvSpec
+from garage.torch.policies import (DeterministicMLPPolicy, GaussianMLPPolicy,
+                                   TanhGaussianMLPPolicy)
+
+_OBS_DIM = 17
+_ACTION_DIM = 6
+_HIDDEN_SIZES = (256, 256)
+_BATCH_SIZES = (1, 8, 64)
+_N_CALLS = 2000
+
+_IMPORT_STATEMENTS = (
+    'pass',  # interpreter start-up
+    'import garage',
+    'from garage.envs import GarageEnv',
+    'from garage.experiment import LocalRunner',
+    'from garage.sampler import LocalSampler',
+    'from garage.sampler import RaySampler',
+    'from garage.np.algos import CEM',
+    'from garage.tf.algos import PPO',
+    'from garage.torch.algos import PPO',
+)
+_HEAVY_MODULES = ('scipy', 'tensorflow', 'torch', 'ray')
+_N_IMPORTS = 5
+
+
+def torch_policy_inference_benchmarks():
+    """Time get_action and get_actions of PyTorch policies.
+
+    Each policy is timed with a single observation (as in DefaultWorker)
+    and with batches of observations (as in VecWorker), with and without
+    TorchScript-traced inference. The legacy column times the conversion
+    path used before the fused inference API: a distribution is built and
+    each of its outputs is converted to NumPy separately.
+
+    """
+    torch.set_num_threads(1)
+    env_spec = EnvSpec(
+        akro.Box(low=-1., high=1., shape=(_OBS_DIM, ), dtype=np.float32),
+        akro.Box(low=-1., high=1., shape=(_ACTION_DIM, ), dtype=np.float32))
+    policies = dict(
+        GaussianMLPPolicy=GaussianMLPPolicy(env_spec,
+                                            hidden_sizes=_HIDDEN_SIZES),
+        TanhGaussianMLPPolicy=TanhGaussianMLPPolicy(
+            env_spec, hidden_sizes=_HIDDEN_SIZES),
+        DeterministicMLPPolicy=DeterministicMLPPolicy(
+            env_spec, hidden_sizes=_HIDDEN_SIZES))
+
+    print('{:<24}{:>8}{:>14}{:>14}{:>14}'.format('policy', 'batch',
+                                                 'legacy (us)', 'fused (us)',
+                                                 'traced (us)'))
+    for name, policy in policies.items():
+        for batch_size in _BATCH_SIZES:
+            # float64 observations, as returned by most gym environments
+            obs = np.random.uniform(-1., 1., (batch_size, _OBS_DIM))
+            if batch_size == 1:
+                obs = obs[0]
+                get = policy.get_action
+            else:
+                get = policy.get_actions
+            legacy = _time(lambda: _legacy_get_actions(policy, obs))
+            policy.jit_inference = False
+            fused = _time(lambda: get(obs))
+            policy.jit_inference = True
+            traced = _time(lambda: get(obs))
+            policy.jit_inference = False
+            print('{:<24}{:>8}{:>14.1f}{:>14.1f}{:>14.1f}'.format(
+                name, batch_size, legacy, fused, traced))
+
+
+def import_time_benchmarks():
+    """Time imports of garage in fresh interpreters.
+
+    Each statement runs in a new interpreter with `python -X importtime`
+    (Python 3.7 or later), as in a new sampler worker process or a short
+    script. The time is the total cumulative time of the top-level imports,
+    minimum over several runs. The last column lists the heavy dependencies
+    which the statement imported.
+
+    """
+    print('{:<44}{:>12}  {}'.format('statement', 'import (ms)',
+                                    'heavy modules'))
+    for statement in _IMPORT_STATEMENTS:
+        times = []
+        for _ in range(_N_IMPORTS):
+            total, modules = _import_time(statement)
+            times.append(total)
+        heavy = [m for m in _HEAVY_MODULES if m in modules]
+        print('{:<44}{:>12.1f}  {}'.format(statement,
+                                           min(times) / 1e3,
+                                           ', '.join(heavy) or '-'))
+
+
+def _import_time(statement):
+    """Time a statement with `python -X importtime`.
+
+    Args:
+        statement (str): Python statement, which imports modules.
+
+    Returns:
+        tuple[int, set[str]]: Total time of the top-level imports, in
+            microseconds, and names of the imported modules.
+
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                             statement],
+                            stderr=subprocess.PIPE,
+                            universal_newlines=True,
+                            check=True)
+    total = 0
+    modules = set()
+    # Lines look like "import time:       235 |        417 |   garage.envs",
+    # where nested imports are indented in the last column.
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            continue  # the header line
+        modules.add(name.strip())
+        if not name[1:].startswith(' '):
+            total += int(cumulative)
+    return total, modules
+
+
+def _legacy_get_actions(policy, observations):
+    """Compute actions the way policies did before the fused path.
+
+    Args:
+        policy (garage.torch.policies.Policy): Policy.
+        observations (np.ndarray): Observations.
+
+    Returns:
+        tuple: Actions and agent infos.
+
+    """
+    with torch.no_grad():
+        observations = torch.as_tensor(observations).float()
+        observations = torch.Tensor(observations)
+        if observations.dim() == 1:
+            observations = observations.unsqueeze(0)
+        output = policy.forward(observations)
+        if isinstance(output, torch.Tensor):
+            return output.numpy(), dict()
+        return (output.rsample().numpy(),
+                dict(mean=output.mean.numpy(),
+                     log_std=(output.variance**.5).log().numpy()))
+
+
+def _time(fn):
+    """Time the mean latency of a function.
+
+    Args:
+        fn (callable): Function to time.
+
+    Returns:
+        float: Mean latency of a call, in microseconds.
+
+    """
+    fn()  # warm up, and trace if needed
+    return timeit.timeit(fn, number=_N_CALLS) / _N_CALLS * 1e6
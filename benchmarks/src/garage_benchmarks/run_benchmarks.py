@@ -15,6 +15,7 @@ import click
 from garage_benchmarks import benchmark_algos
 from garage_benchmarks import benchmark_auto
 from garage_benchmarks import benchmark_baselines
+from garage_benchmarks import benchmark_latency
 from garage_benchmarks import benchmark_policies
 from garage_benchmarks import benchmark_q_functions
 
@@ -32,6 +33,7 @@ def list():  # pylint: disable=redefined-builtin
     _echo_run_names('Baselines', _get_runs_dict(benchmark_baselines))
     _echo_run_names('Q Functions', _get_runs_dict(benchmark_q_functions))
     _echo_run_names('Automatic benchmarking', _get_runs_dict(benchmark_auto))
+    _echo_run_names('Latency', _get_runs_dict(benchmark_latency))
 
 
 @click.command()
@@ -83,6 +85,7 @@ def _get_all_options():
     d.update(_get_runs_dict(benchmark_baselines))
     d.update(_get_runs_dict(benchmark_q_functions))
     d.update(_get_runs_dict(benchmark_auto))
+    d.update(_get_runs_dict(benchmark_latency))
     return d
 
 
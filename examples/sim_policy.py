@@ -3,9 +3,9 @@
 import argparse
 import sys
 
-import joblib
 import tensorflow as tf
 
+from garage.experiment.snapshotter import load_snapshot_file
 from garage.sampler.utils import rollout
 
 
@@ -57,7 +57,9 @@ if __name__ == '__main__':
     # with tf.compat.v1.Session():
     #     [rest of the code]
     with tf.compat.v1.Session() as sess:
-        data = joblib.load(args.file)
+        data = load_snapshot_file(args.file,
+                                  keys=['algo', 'env'],
+                                  mmap_mode='c')
         policy = data['algo'].policy
         env = data['env']
         while True:
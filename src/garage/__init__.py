@@ -1,10 +1,5 @@
 """Garage Base."""
-from garage._dtypes import InOutSpec
-from garage._dtypes import TimeStep
-from garage._dtypes import TrajectoryBatch
-from garage._functions import log_multitask_performance
-from garage._functions import log_performance
-from garage.experiment.experiment import wrap_experiment
+from garage._lazy import lazy_import
 
 __all__ = [
     'wrap_experiment',
@@ -14,3 +9,14 @@ __all__ = [
     'log_performance',
     'InOutSpec',
 ]
+
+_ATTRIBUTES = {
+    'InOutSpec': '_dtypes',
+    'TimeStep': '_dtypes',
+    'TrajectoryBatch': '_dtypes',
+    'log_multitask_performance': '_functions',
+    'log_performance': '_functions',
+    'wrap_experiment': 'experiment.experiment',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
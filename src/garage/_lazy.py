@@ -0,0 +1,69 @@
+"""Lazy loading of the attributes of packages."""
+import importlib
+import sys
+
+
+def lazy_import(package_name, attributes):
+    """Load the attributes of a package from its submodules on first use.
+
+    Packages re-export the classes and functions of their submodules. With
+    this, a submodule is only imported (with its dependencies, such as
+    TensorFlow, PyTorch or Ray) when one of its attributes is first
+    accessed, e.g. by `from garage.sampler import LocalSampler`.
+
+    The returned functions should be assigned to `__getattr__` and
+    `__dir__` of the package (PEP 562). Python versions before 3.7 do not
+    support module `__getattr__`, so there all attributes are imported
+    immediately.
+
+    Args:
+        package_name (str): Name of the package, i.e. its `__name__`.
+        attributes (dict[str, str]): Map from the name of each attribute to
+            the name of the submodule which defines it, relative to the
+            package.
+
+    Returns:
+        tuple[callable, callable]: The `__getattr__` and `__dir__` functions
+            of the package.
+
+    """
+    package = sys.modules[package_name]
+
+    def __getattr__(name):
+        """Import an attribute of the package.
+
+        Args:
+            name (str): Name of the attribute.
+
+        Returns:
+            object: The attribute.
+
+        Raises:
+            AttributeError: If the package has no such attribute.
+
+        """
+        try:
+            submodule = attributes[name]
+        except KeyError:
+            raise AttributeError('module {!r} has no attribute {!r}'.format(
+                package_name, name)) from None
+        value = getattr(
+            importlib.import_module('.' + submodule, package_name), name)
+        # Later accesses find the attribute without calling __getattr__.
+        setattr(package, name, value)
+        return value
+
+    def __dir__():
+        """List the attributes of the package.
+
+        Returns:
+            list[str]: Names of the attributes, including attributes which
+                are not imported yet.
+
+        """
+        return sorted(set(vars(package)) | set(attributes))
+
+    if sys.version_info < (3, 7):
+        for name in attributes:
+            __getattr__(name)
+    return __getattr__, __dir__
@@ -1,13 +1,5 @@
 """Garage wrappers for gym environments."""
-
-from garage.envs.env_spec import EnvSpec
-from garage.envs.garage_env import GarageEnv
-from garage.envs.grid_world_env import GridWorldEnv
-from garage.envs.multi_env_wrapper import MultiEnvWrapper
-from garage.envs.normalized_env import normalize
-from garage.envs.point_env import PointEnv
-from garage.envs.step import Step
-from garage.envs.task_onehot_wrapper import TaskOnehotWrapper
+from garage._lazy import lazy_import
 
 __all__ = [
     'GarageEnv',
@@ -19,3 +11,16 @@ __all__ = [
     'PointEnv',
     'TaskOnehotWrapper',
 ]
+
+_ATTRIBUTES = {
+    'EnvSpec': 'env_spec',
+    'GarageEnv': 'garage_env',
+    'GridWorldEnv': 'grid_world_env',
+    'MultiEnvWrapper': 'multi_env_wrapper',
+    'normalize': 'normalized_env',
+    'PointEnv': 'point_env',
+    'Step': 'step',
+    'TaskOnehotWrapper': 'task_onehot_wrapper',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
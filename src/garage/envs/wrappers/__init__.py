@@ -8,17 +8,23 @@ Example:
     StackFrames(GrayScale(gym.make('env')))
 
 """
-from garage.envs.wrappers.atari_env import AtariEnv
-from garage.envs.wrappers.clip_reward import ClipReward
-from garage.envs.wrappers.episodic_life import EpisodicLife
-from garage.envs.wrappers.fire_reset import FireReset
-from garage.envs.wrappers.grayscale import Grayscale
-from garage.envs.wrappers.max_and_skip import MaxAndSkip
-from garage.envs.wrappers.noop import Noop
-from garage.envs.wrappers.resize import Resize
-from garage.envs.wrappers.stack_frames import StackFrames
+from garage._lazy import lazy_import
 
 __all__ = [
     'AtariEnv', 'ClipReward', 'EpisodicLife', 'FireReset', 'Grayscale',
     'MaxAndSkip', 'Noop', 'Resize', 'StackFrames'
 ]
+
+_ATTRIBUTES = {
+    'AtariEnv': 'atari_env',
+    'ClipReward': 'clip_reward',
+    'EpisodicLife': 'episodic_life',
+    'FireReset': 'fire_reset',
+    'Grayscale': 'grayscale',
+    'MaxAndSkip': 'max_and_skip',
+    'Noop': 'noop',
+    'Resize': 'resize',
+    'StackFrames': 'stack_frames',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
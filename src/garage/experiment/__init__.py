@@ -1,13 +1,20 @@
 """Experiment functions."""
-from garage.experiment.experiment import run_experiment
-from garage.experiment.experiment import to_local_command
-from garage.experiment.experiment import wrap_experiment
-from garage.experiment.local_runner import LocalRunner
-from garage.experiment.meta_evaluator import MetaEvaluator
-from garage.experiment.snapshotter import SnapshotConfig, Snapshotter
-from garage.experiment.task_sampler import TaskSampler
+from garage._lazy import lazy_import
 
 __all__ = [
     'run_experiment', 'to_local_command', 'wrap_experiment', 'LocalRunner',
     'MetaEvaluator', 'Snapshotter', 'SnapshotConfig', 'TaskSampler'
 ]
+
+_ATTRIBUTES = {
+    'run_experiment': 'experiment',
+    'to_local_command': 'experiment',
+    'wrap_experiment': 'experiment',
+    'LocalRunner': 'local_runner',
+    'MetaEvaluator': 'meta_evaluator',
+    'SnapshotConfig': 'snapshotter',
+    'Snapshotter': 'snapshotter',
+    'TaskSampler': 'task_sampler',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
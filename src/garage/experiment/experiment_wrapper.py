@@ -17,7 +17,8 @@ import dowel
 from dowel import logger
 import psutil
 
-import garage.experiment
+import garage.experiment.deterministic
+import garage.experiment.experiment
 import garage.plotter
 import garage.tf.plotter
 
@@ -5,6 +5,7 @@ import time
 
 import cloudpickle
 from dowel import logger, tabular
+import numpy as np
 import psutil
 
 from garage.experiment.deterministic import get_seed, set_seed
@@ -13,8 +14,12 @@ from garage.sampler import parallel_sampler
 from garage.sampler.sampler_deprecated import BaseSampler
 # This is avoiding a circular import
 from garage.sampler.default_worker import DefaultWorker  # noqa: I100
+from garage.sampler.local_sampler import LocalSampler
 from garage.sampler.worker_factory import WorkerFactory
 
+# Size of the chunk files of arrays in asynchronous snapshots.
+_SNAPSHOT_ARRAY_CHUNK_BYTES = 16 * 2**20
+
 
 class ExperimentStats:
     # pylint: disable=too-few-public-methods
@@ -87,6 +92,10 @@ class LocalRunner:
             configuration used by LocalRunner to create the snapshotter.
             If None, it will create one with default settings.
         max_cpus (int): The maximum number of parallel sampler workers.
+        async_snapshot (bool): If True, snapshots are written to disk in a
+            background thread, and large arrays (such as replay buffers) are
+            stored in content-addressed chunk files shared between
+            snapshots, so only chunks which changed are written again.
 
     Note:
         For the use of any TensorFlow environments, policies and algorithms,
@@ -116,10 +125,14 @@ class LocalRunner:
 
     """
 
-    def __init__(self, snapshot_config, max_cpus=1):
-        self._snapshotter = Snapshotter(snapshot_config.snapshot_dir,
-                                        snapshot_config.snapshot_mode,
-                                        snapshot_config.snapshot_gap)
+    def __init__(self, snapshot_config, max_cpus=1, async_snapshot=False):
+        self._snapshotter = Snapshotter(
+            snapshot_config.snapshot_dir,
+            snapshot_config.snapshot_mode,
+            snapshot_config.snapshot_gap,
+            async_write=async_snapshot,
+            array_chunk_bytes=(_SNAPSHOT_ARRAY_CHUNK_BYTES
+                               if async_snapshot else None))
 
         parallel_sampler.initialize(max_cpus)
 
@@ -153,6 +166,8 @@ class LocalRunner:
         self._n_workers = None
         self._worker_class = None
         self._worker_args = None
+        self._cpu_resources = None
+        self._worker_pool = None
 
     def make_sampler(self,
                      sampler_cls,
@@ -162,7 +177,9 @@ class LocalRunner:
                      max_path_length=None,
                      worker_class=DefaultWorker,
                      sampler_args=None,
-                     worker_args=None):
+                     worker_args=None,
+                     cpu_resources=None,
+                     worker_pool=None):
         """Construct a Sampler from a Sampler class.
 
         Args:
@@ -173,9 +190,16 @@ class LocalRunner:
             n_workers (int): The number of workers the sampler should use.
             worker_class (type): Type of worker the Sampler should use.
             sampler_args (dict or None): Additional arguments that should be
-                passed to the sampler.
+                passed to the sampler. For samplers constructed with
+                `from_worker_factory`, `seed` and `max_path_length` entries
+                are used for the workers if not passed explicitly.
             worker_args (dict or None): Additional arguments that should be
                 passed to the sampler.
+            cpu_resources (garage.sampler.CPUResources or None): Allocated
+                cores and thread counts of the worker processes.
+            worker_pool (garage.sampler.WorkerPool or None): Pool to take the
+                sampler from, reusing the workers of a previous experiment
+                if possible.
 
         Raises:
             ValueError: If `max_path_length` isn't passed and the algorithm
@@ -189,6 +213,17 @@ class LocalRunner:
         if not hasattr(self._algo, 'policy'):
             raise ValueError('If the runner is used to construct a sampler, '
                              'the algorithm must have a `policy` field.')
+        if sampler_args is None:
+            sampler_args = {}
+        if not issubclass(sampler_cls, BaseSampler):
+            # These configure the workers, not the sampler itself.
+            sampler_args = dict(sampler_args)
+            args_max_path_length = sampler_args.pop('max_path_length', None)
+            args_seed = sampler_args.pop('seed', None)
+            if max_path_length is None:
+                max_path_length = args_max_path_length
+            if seed is None:
+                seed = args_seed
         if max_path_length is None:
             if hasattr(self._algo, 'max_path_length'):
                 max_path_length = self._algo.max_path_length
@@ -198,21 +233,26 @@ class LocalRunner:
                                  'a `max_path_length` field.')
         if seed is None:
             seed = get_seed()
-        if sampler_args is None:
-            sampler_args = {}
         if worker_args is None:
             worker_args = {}
         if issubclass(sampler_cls, BaseSampler):
             return sampler_cls(self._algo, self._env, **sampler_args)
-        else:
-            return sampler_cls.from_worker_factory(WorkerFactory(
-                seed=seed,
-                max_path_length=max_path_length,
-                n_workers=n_workers,
-                worker_class=worker_class,
-                worker_args=worker_args),
-                                                   agents=self._algo.policy,
-                                                   envs=self._env)
+        worker_factory = WorkerFactory(seed=seed,
+                                       max_path_length=max_path_length,
+                                       n_workers=n_workers,
+                                       worker_class=worker_class,
+                                       worker_args=worker_args,
+                                       cpu_resources=cpu_resources)
+        if worker_pool is not None:
+            return worker_pool.get_sampler(sampler_cls,
+                                           worker_factory,
+                                           agents=self._algo.policy,
+                                           envs=self._env,
+                                           sampler_args=sampler_args)
+        return sampler_cls.from_worker_factory(worker_factory,
+                                               agents=self._algo.policy,
+                                               envs=self._env,
+                                               **sampler_args)
 
     def setup(self,
               algo,
@@ -221,7 +261,9 @@ class LocalRunner:
               sampler_args=None,
               n_workers=psutil.cpu_count(logical=False),
               worker_class=DefaultWorker,
-              worker_args=None):
+              worker_args=None,
+              cpu_resources=None,
+              worker_pool=None):
         """Set up runner for algorithm and environment.
 
         This method saves algo and env within runner and creates a sampler.
@@ -240,6 +282,16 @@ class LocalRunner:
             worker_class (type): Type of worker the sampler should use.
             worker_args (dict or None): Additional arguments that should be
                 passed to the worker.
+            cpu_resources (garage.sampler.CPUResources or None): If given,
+                cores are reserved for the trainer and split between the
+                sampler worker processes, thread pools of each process are
+                sized to its cores, and CPU utilization is recorded in the
+                tabular logs. If the sampler has no worker processes, the
+                trainer keeps all cores.
+            worker_pool (garage.sampler.WorkerPool or None): If given, the
+                sampler is taken from this pool, reusing the worker processes
+                of a previous experiment if possible, and it is returned to
+                the pool instead of shut down after training.
 
         Raises:
             ValueError: If sampler_cls is passed and the algorithm doesn't
@@ -250,10 +302,16 @@ class LocalRunner:
         self._env = env
         self._n_workers = n_workers
         self._worker_class = worker_class
+        self._cpu_resources = cpu_resources
+        self._worker_pool = worker_pool
         if sampler_args is None:
             sampler_args = {}
         if sampler_cls is None:
             sampler_cls = getattr(algo, 'sampler_cls', None)
+        if cpu_resources is not None:
+            cpu_resources.allocate(
+                n_workers if _has_worker_processes(sampler_cls) else 0)
+            cpu_resources.configure_trainer()
         if worker_args is None:
             worker_args = {}
 
@@ -265,7 +323,9 @@ class LocalRunner:
                                               sampler_args=sampler_args,
                                               n_workers=n_workers,
                                               worker_class=worker_class,
-                                              worker_args=worker_args)
+                                              worker_args=worker_args,
+                                              cpu_resources=cpu_resources,
+                                              worker_pool=worker_pool)
 
         self._has_setup = True
 
@@ -286,7 +346,10 @@ class LocalRunner:
     def _shutdown_worker(self):
         """Shutdown Plotter and Sampler workers."""
         if self._sampler is not None:
-            self._sampler.shutdown_worker()
+            if self._worker_pool is not None:
+                self._worker_pool.release(self._sampler)
+            else:
+                self._sampler.shutdown_worker()
         if self._plot:
             self._plotter.close()
 
@@ -294,9 +357,16 @@ class LocalRunner:
                        itr,
                        batch_size=None,
                        agent_update=None,
-                       env_update=None):
+                       env_update=None,
+                       consumer=None):
         """Obtain one batch of samples.
 
+        If a consumer is given, it is called on each path as soon as the
+        sampler returns it. With samplers which stream trajectories (such
+        as MultiprocessingSampler and RaySampler), this overlaps processing
+        of the paths (e.g. inserting them in a replay buffer) with sampling
+        of the rest of the batch.
+
         Args:
             itr (int): Index of iteration (epoch).
             batch_size (int): Number of steps in batch.
@@ -309,6 +379,9 @@ class LocalRunner:
                 `env_update_fn` before doing rollouts. If a list is passed in,
                 it must have length exactly `factory.n_workers`, and will be
                 spread across the workers.
+            consumer (callable): Function called with each path (a dict in
+                the format of the returned paths) as soon as it is sampled.
+                Changes to the path are visible in the returned paths.
 
         Raises:
             ValueError: Raised if the runner was initialized without a sampler,
@@ -330,19 +403,103 @@ class LocalRunner:
         if isinstance(self._sampler, BaseSampler):
             paths = self._sampler.obtain_samples(
                 itr, (batch_size or self._train_args.batch_size))
+            if consumer is not None:
+                for path in paths:
+                    consumer(path)
         else:
             if agent_update is None:
                 agent_update = self._algo.policy.get_param_values()
-            paths = self._sampler.obtain_samples(
-                itr, (batch_size or self._train_args.batch_size),
-                agent_update=agent_update,
-                env_update=env_update)
-            paths = paths.to_trajectory_list()
+            if consumer is None:
+                paths = self._sampler.obtain_samples(
+                    itr, (batch_size or self._train_args.batch_size),
+                    agent_update=agent_update,
+                    env_update=env_update)
+                paths = paths.to_trajectory_list()
+            else:
+                paths = []
+                for batch in self._sampler.iter_samples(
+                        itr, (batch_size or self._train_args.batch_size),
+                        agent_update=agent_update,
+                        env_update=env_update):
+                    for path in batch.to_trajectory_list():
+                        consumer(path)
+                        paths.append(path)
 
         self._stats.total_env_steps += sum([len(p['rewards']) for p in paths])
 
         return paths
 
+    def obtain_samples_for_tasks(self,
+                                 itr,
+                                 batch_size,
+                                 agent_updates,
+                                 env_updates):
+        """Obtain one batch of samples for each of several tasks.
+
+        The tasks are spread across the sampler workers, so that workers
+        sample different tasks concurrently instead of all sampling one task
+        at a time. Each worker is sent the agent and environment updates of
+        the task it samples, e.g. a `SetTaskUpdate` as environment update.
+
+        Args:
+            itr (int): Index of iteration (epoch).
+            batch_size (int): Minimum number of steps sampled for each task.
+            agent_updates (list[object]): For each task, value which will be
+                passed into the `agent_update_fn` of the workers sampling the
+                task.
+            env_updates (list[object]): For each task, value which will be
+                passed into the `env_update_fn` of the workers sampling the
+                task.
+
+        Raises:
+            ValueError: Raised if the runner was initialized without a sampler
+                which can sample trajectories for each worker (such as
+                LocalSampler, MultiprocessingSampler or RaySampler), or if
+                agent_updates and env_updates have different lengths.
+
+        Returns:
+            list[list[dict]]: One batch of samples for each task.
+
+        """
+        del itr
+        if not hasattr(self._sampler, 'obtain_exact_trajectories'):
+            raise ValueError('Sampling for several tasks at once requires a '
+                             'sampler with `obtain_exact_trajectories`, such '
+                             'as LocalSampler, MultiprocessingSampler or '
+                             'RaySampler.')
+        if len(agent_updates) != len(env_updates):
+            raise ValueError('agent_updates and env_updates should have the '
+                             'same length, one per task.')
+        batch_size = batch_size or self._train_args.batch_size
+        n_traj_per_worker = max(
+            1, int(np.ceil(batch_size / self._algo.max_path_length)))
+        task_paths = [[] for _ in agent_updates]
+        task_steps = np.zeros(len(agent_updates), dtype=np.int64)
+        pending = list(range(len(agent_updates)))
+        while pending:
+            round_tasks = pending[:self._n_workers]
+            pending = pending[self._n_workers:]
+            # Workers left over in the last round sample a task once more.
+            worker_tasks = [
+                round_tasks[i % len(round_tasks)]
+                for i in range(self._n_workers)
+            ]
+            batch = self._sampler.obtain_exact_trajectories(
+                n_traj_per_worker, [agent_updates[t] for t in worker_tasks],
+                [env_updates[t] for t in worker_tasks])
+            # Trajectories are in worker order.
+            for i, path in enumerate(batch.to_trajectory_list()):
+                task = worker_tasks[i // n_traj_per_worker]
+                task_paths[task].append(path)
+                task_steps[task] += len(path['rewards'])
+            # Trajectories may end early, leaving some tasks short of steps.
+            pending.extend(t for t in round_tasks
+                           if task_steps[t] < batch_size)
+
+        self._stats.total_env_steps += int(task_steps.sum())
+
+        return task_paths
+
     def save(self, epoch):
         """Save snapshot of current batch.
 
@@ -364,18 +521,20 @@ class LocalRunner:
         params['train_args'] = self._train_args
         params['stats'] = self._stats
 
-        # Save states
-        params['env'] = self._env
+        # Save states. The algorithm is saved first, so that it (and its
+        # policy) can be loaded without loading the environment.
         params['algo'] = self._algo
+        params['env'] = self._env
         params['n_workers'] = self._n_workers
         params['worker_class'] = self._worker_class
         params['worker_args'] = self._worker_args
+        params['cpu_resources'] = self._cpu_resources
 
         self._snapshotter.save_itr_params(epoch, params)
 
         logger.log('Saved')
 
-    def restore(self, from_dir, from_epoch='last'):
+    def restore(self, from_dir, from_epoch='last', worker_pool=None):
         """Restore experiment from snapshot.
 
         Args:
@@ -384,6 +543,9 @@ class LocalRunner:
             from_epoch (str or int): The epoch to restore from.
                 Can be 'first', 'last' or a number.
                 Not applicable when snapshot_mode='last'.
+            worker_pool (garage.sampler.WorkerPool or None): Pool to take the
+                sampler from. If None, the pool passed to `setup`, if any, is
+                used.
 
         Returns:
             TrainArgs: Arguments for train().
@@ -403,7 +565,9 @@ class LocalRunner:
                    sampler_args=self._setup_args.sampler_args,
                    n_workers=saved['n_workers'],
                    worker_class=saved['worker_class'],
-                   worker_args=saved['worker_args'])
+                   worker_args=saved['worker_args'],
+                   cpu_resources=saved.get('cpu_resources', None),
+                   worker_pool=worker_pool or self._worker_pool)
 
         n_epochs = self._train_args.n_epochs
         last_epoch = self._stats.total_epoch
@@ -439,6 +603,8 @@ class LocalRunner:
         logger.log('Time %.2f s' % (time.time() - self._start_time))
         logger.log('EpochTime %.2f s' % (time.time() - self._itr_start_time))
         tabular.record('TotalEnvSteps', self._stats.total_env_steps)
+        if self._cpu_resources is not None:
+            self._cpu_resources.record_utilization()
         logger.log(tabular)
 
         if self._plot:
@@ -484,6 +650,7 @@ class LocalRunner:
 
         average_return = self._algo.train(self)
         self._shutdown_worker()
+        self._snapshotter.flush()
 
         return average_return
 
@@ -580,6 +747,7 @@ class LocalRunner:
 
         average_return = self._algo.train(self)
         self._shutdown_worker()
+        self._snapshotter.flush()
 
         return average_return
 
@@ -605,3 +773,21 @@ class LocalRunner:
 
 class NotSetupError(Exception):
     """Raise when an experiment is about to run without setup."""
+
+
+def _has_worker_processes(sampler_cls):
+    """Check whether a sampler runs its workers in processes it configures.
+
+    LocalSampler runs its workers in the trainer process, and samplers
+    deriving from BaseSampler do not configure their processes through a
+    WorkerFactory.
+
+    Args:
+        sampler_cls (type or None): The type of sampler.
+
+    Returns:
+        bool: Whether the sampler has worker processes.
+
+    """
+    return sampler_cls is not None and not issubclass(
+        sampler_cls, (BaseSampler, LocalSampler))
@@ -1,15 +1,24 @@
 """Defines SnapshotConfig and Snapshotter."""
 import collections
+import concurrent.futures
 import errno
+import hashlib
+import io
 import os
 import pathlib
+import pickle
 
 import cloudpickle
-import joblib
+import numpy as np
 
 SnapshotConfig = collections.namedtuple(
     'SnapshotConfig', ['snapshot_dir', 'snapshot_mode', 'snapshot_gap'])
 
+# Key of the header pickle of snapshots with arrays stored in chunk files.
+_CHUNKS_HEADER_KEY = 'garage_snapshot_chunks'
+_CHUNK_DIR = 'chunks'
+_KEYS_HEADER_KEY = 'keys'
+
 
 class Snapshotter:
     """Snapshotter snapshots training data.
@@ -17,14 +26,38 @@ class Snapshotter:
     When training, it saves data to binary files. When resuming,
     it loads from saved data.
 
+    Snapshot files are written atomically, through a temporary file which
+    is renamed.
+
+    If array_chunk_bytes is given, NumPy arrays larger than it (e.g. the
+    arrays of replay buffers) are not stored in the snapshot file. They are
+    split along their first axis into chunks of about array_chunk_bytes,
+    which are stored in the `chunks` subdirectory as .npy files named by
+    the hash of their contents, and referenced from the snapshot file.
+    Chunks which did not change since a previous snapshot, such as the
+    filled part of a replay buffer, are therefore not written again. The
+    values of dict snapshots are also pickled one after another, so that
+    `load` can stop after the keys it needs, and chunks can be memory-mapped
+    instead of read.
+
+    If async_write is True, save_itr_params only pickles the parameters
+    (copying large arrays instead of pickling them), and hashing and
+    writing happen in a background thread. Call `flush` to wait for them.
+
     Args:
         snapshot_dir (str): Path to save the log and iteration snapshot.
         snapshot_mode (str): Mode to save the snapshot. Can be either "all"
             (all iterations will be saved), "last" (only the last iteration
             will be saved), "gap" (every snapshot_gap iterations are saved),
-            or "none" (do not save snapshots).
+            "gap_and_last" (both "gap" and "last"), or "none" (do not save
+            snapshots).
         snapshot_gap (int): Gap between snapshot iterations. Wait this number
             of iterations before taking another snapshot.
+        async_write (bool): Whether snapshots are written in a background
+            thread.
+        array_chunk_bytes (int or None): Size of the chunks of large arrays
+            stored in chunk files. If None, arrays are stored in the
+            snapshot files.
 
     """
 
@@ -32,10 +65,16 @@ class Snapshotter:
                  snapshot_dir=os.path.join(os.getcwd(),
                                            'data/local/experiment'),
                  snapshot_mode='last',
-                 snapshot_gap=1):
+                 snapshot_gap=1,
+                 async_write=False,
+                 array_chunk_bytes=None):
         self._snapshot_dir = snapshot_dir
         self._snapshot_mode = snapshot_mode
         self._snapshot_gap = snapshot_gap
+        self._async_write = async_write
+        self._array_chunk_bytes = array_chunk_bytes
+        self._executor = None
+        self._pending_write = None
 
         pathlib.Path(snapshot_dir).mkdir(parents=True, exist_ok=True)
 
@@ -77,39 +116,158 @@ class Snapshotter:
             params (obj): Content of snapshot to be saved.
 
         Raises:
-            ValueError: If snapshot_mode is not one of "all", "last" or "gap".
+            ValueError: If snapshot_mode is not one of "all", "last", "gap",
+                "gap_and_last" or "none".
 
         """
-        file_name = None
+        file_names = []
 
         if self._snapshot_mode == 'all':
-            file_name = os.path.join(self._snapshot_dir, 'itr_%d.pkl' % itr)
+            file_names.append('itr_%d.pkl' % itr)
         elif self._snapshot_mode == 'last':
             # override previous params
-            file_name = os.path.join(self._snapshot_dir, 'params.pkl')
+            file_names.append('params.pkl')
         elif self._snapshot_mode == 'gap':
             if itr % self._snapshot_gap == 0:
-                file_name = os.path.join(self._snapshot_dir,
-                                         'itr_%d.pkl' % itr)
+                file_names.append('itr_%d.pkl' % itr)
         elif self._snapshot_mode == 'gap_and_last':
             if itr % self._snapshot_gap == 0:
-                file_name = os.path.join(self._snapshot_dir,
-                                         'itr_%d.pkl' % itr)
-            file_name_last = os.path.join(self._snapshot_dir, 'params.pkl')
-            with open(file_name_last, 'wb') as file:
-                cloudpickle.dump(params, file)
+                file_names.append('itr_%d.pkl' % itr)
+            file_names.append('params.pkl')
         elif self._snapshot_mode == 'none':
             pass
         else:
             raise ValueError('Invalid snapshot mode {}'.format(
                 self._snapshot_mode))
 
-        if file_name:
-            with open(file_name, 'wb') as file:
-                cloudpickle.dump(params, file)
+        if not file_names:
+            return
+        file_names = [
+            os.path.join(self._snapshot_dir, name) for name in file_names
+        ]
+        # Pickle once, even if the snapshot is written to several files.
+        payload, arrays, keys = self._pickle(params)
+        if not self._async_write:
+            self._write(file_names, payload, arrays, keys)
+            return
+        # Keep at most one snapshot in memory waiting to be written.
+        self.flush()
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1)
+        self._pending_write = self._executor.submit(self._write, file_names,
+                                                    payload, arrays, keys)
+
+    def flush(self):
+        """Wait until the snapshots being written in background are written.
+
+        Raises:
+            Exception: Any exception raised while writing a snapshot.
+
+        """
+        if self._pending_write is not None:
+            pending, self._pending_write = self._pending_write, None
+            pending.result()
+
+    def _pickle(self, params):
+        """Pickle parameters, taking large arrays out of the pickle.
+
+        Args:
+            params (obj): Content of snapshot to be saved.
+
+        Returns:
+            bytes: Pickled parameters.
+            list[numpy.ndarray]: Large arrays referenced by the pickle.
+                They are copies if snapshots are written in background.
+            list or None: Keys of the values of a dict snapshot, if they
+                are pickled one after another.
+
+        """
+        buffer = io.BytesIO()
+        pickler = _ArrayChunkingPickler(buffer,
+                                        min_bytes=self._array_chunk_bytes,
+                                        copy_arrays=self._async_write)
+        keys = None
+        if self._array_chunk_bytes and isinstance(params, dict):
+            # The memo of the pickler is shared between the values, so
+            # objects referenced by several values are still shared.
+            keys = list(params.keys())
+            for value in params.values():
+                pickler.dump(value)
+        else:
+            pickler.dump(params)
+        return buffer.getvalue(), pickler.arrays, keys
+
+    def _write(self, file_names, payload, arrays, keys):
+        """Write a pickled snapshot and its array chunks.
+
+        Args:
+            file_names (list[str]): Paths of the snapshot files.
+            payload (bytes): Pickled parameters.
+            arrays (list[numpy.ndarray]): Large arrays referenced by the
+                pickle.
+            keys (list or None): Keys of the values of a dict snapshot, if
+                they are pickled one after another.
+
+        """
+        data = payload
+        if arrays or keys is not None:
+            manifest = [self._write_chunks(array) for array in arrays]
+            data = pickle.dumps({
+                _CHUNKS_HEADER_KEY: manifest,
+                _KEYS_HEADER_KEY: keys
+            }) + payload
+        for file_name in file_names:
+            _atomic_write(file_name, data)
+        # Chunks of the overwritten params.pkl may not be used anymore.
+        if self._array_chunk_bytes and any(
+                os.path.basename(f) == 'params.pkl' for f in file_names):
+            self._remove_unused_chunks()
+
+    def _write_chunks(self, array):
+        """Write the chunks of an array which are not stored yet.
+
+        Args:
+            array (numpy.ndarray): Array.
+
+        Returns:
+            tuple: The dtype, shape and chunk names of the array.
 
-    def load(self, load_dir, itr='last'):
-        # pylint: disable=no-self-use
+        """
+        chunk_dir = os.path.join(self._snapshot_dir, _CHUNK_DIR)
+        pathlib.Path(chunk_dir).mkdir(exist_ok=True)
+        row_bytes = max(1, array.nbytes // max(1, len(array)))
+        rows = max(1, self._array_chunk_bytes // row_bytes)
+        chunk_names = []
+        for start in range(0, len(array), rows):
+            chunk = np.ascontiguousarray(array[start:start + rows])
+            digest = hashlib.sha1(
+                repr((chunk.dtype.str, chunk.shape)).encode())
+            digest.update(chunk.data)
+            chunk_name = digest.hexdigest() + '.npy'
+            chunk_path = os.path.join(chunk_dir, chunk_name)
+            if not os.path.exists(chunk_path):
+                _atomic_write(chunk_path, chunk)
+            chunk_names.append(chunk_name)
+        return array.dtype.str, array.shape, chunk_names
+
+    def _remove_unused_chunks(self):
+        """Remove the chunk files not referenced by any snapshot file."""
+        chunk_dir = os.path.join(self._snapshot_dir, _CHUNK_DIR)
+        if not os.path.isdir(chunk_dir):
+            return
+        used = set()
+        for name in os.listdir(self._snapshot_dir):
+            if name.endswith('.pkl'):
+                with open(os.path.join(self._snapshot_dir, name),
+                          'rb') as file:
+                    for _, _, chunk_names in _read_manifest(file):
+                        used.update(chunk_names)
+        for name in os.listdir(chunk_dir):
+            if name.endswith('.npy') and name not in used:
+                os.remove(os.path.join(chunk_dir, name))
+
+    def load(self, load_dir, itr='last', keys=None, mmap_mode=None):
         """Load one snapshot of parameters from disk.
 
         Args:
@@ -117,6 +275,10 @@ class Snapshotter:
                 to resume experiment from.
             itr (int or string): Iteration to load.
                 Can be an integer, 'last' or 'first'.
+            keys (list or None): If given, only these keys of a dict
+                snapshot are loaded. See `load_snapshot_file`.
+            mmap_mode (str or None): Memory-map mode of arrays stored in
+                chunk files. See `load_snapshot_file`.
 
         Returns:
             dict: Loaded snapshot.
@@ -149,8 +311,210 @@ class Snapshotter:
         if not os.path.isfile(load_from_file):
             raise NotAFileError('File not existing: ', load_from_file)
 
-        with open(load_from_file, 'rb') as file:
-            return joblib.load(file)
+        self.flush()
+        return load_snapshot_file(load_from_file,
+                                  keys=keys,
+                                  mmap_mode=mmap_mode)
+
+    def __getstate__(self):
+        """Object.__getstate__.
+
+        Returns:
+            dict: The state to be pickled for the instance.
+
+        """
+        self.flush()
+        data = self.__dict__.copy()
+        data['_executor'] = None
+        data['_pending_write'] = None
+        return data
+
+
+def load_snapshot_file(file_name, keys=None, mmap_mode=None):
+    """Load a snapshot file written by Snapshotter.
+
+    In snapshots written with array chunks, the values of a dict snapshot
+    are unpickled in order, and unpickling stops after the last requested
+    key, so e.g. `keys=['algo']` does not unpickle the values saved after
+    it. Values saved before it are still unpickled, since they may share
+    objects with it. Other snapshots are unpickled completely.
+
+    Args:
+        file_name (str): Path of the snapshot file.
+        keys (list or None): If given, only these keys of a dict snapshot
+            are returned.
+        mmap_mode (str or None): If given, arrays stored in a single chunk
+            file are memory-mapped with this mode (see `numpy.load`)
+            instead of read, so their pages are only read when accessed.
+            Use 'c' for arrays which may be modified in memory. Arrays
+            stored in several chunks are always read.
+
+    Returns:
+        object: Content of the snapshot.
+
+    Raises:
+        KeyError: If a requested key is not in the snapshot.
+
+    """
+    chunk_dir = os.path.join(os.path.dirname(file_name), _CHUNK_DIR)
+    with open(file_name, 'rb') as file:
+        params = pickle.load(file)
+        if isinstance(params, dict) and _CHUNKS_HEADER_KEY in params:
+            header = params
+            unpickler = _ChunkLoadingUnpickler(file,
+                                               header[_CHUNKS_HEADER_KEY],
+                                               chunk_dir, mmap_mode)
+            saved_keys = header.get(_KEYS_HEADER_KEY, None)
+            if saved_keys is None:
+                params = unpickler.load()
+            else:
+                wanted = set(saved_keys if keys is None else keys)
+                params = {}
+                for key in saved_keys:
+                    if not wanted:
+                        break
+                    params[key] = unpickler.load()
+                    wanted.discard(key)
+    if keys is None:
+        return params
+    return {key: params[key] for key in keys}
+
+
+class _ArrayChunkingPickler(cloudpickle.CloudPickler):
+    """Pickler which leaves large NumPy arrays out of the pickle.
+
+    Large arrays are replaced by persistent ids holding their index in
+    `arrays`. Each array object is only stored once.
+
+    Args:
+        file (io.BytesIO): File to pickle into.
+        min_bytes (int or None): Minimum size of arrays left out of the
+            pickle. If None, all arrays are pickled.
+        copy_arrays (bool): Whether arrays are copied, so that they can be
+            written after they are modified.
+
+    """
+
+    def __init__(self, file, min_bytes, copy_arrays):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._min_bytes = min_bytes
+        self._copy_arrays = copy_arrays
+        self.arrays = []
+        # id(array) -> index in self.arrays
+        self._array_ids = {}
+        # Keeps the arrays alive, so that their ids are not reused.
+        self._originals = []
+
+    def persistent_id(self, obj):
+        """Return the persistent id of large arrays.
+
+        Args:
+            obj (object): Object being pickled.
+
+        Returns:
+            tuple or None: Persistent id of obj, or None if obj is pickled.
+
+        """
+        # pylint: disable=unidiomatic-typecheck
+        if (self._min_bytes is None or type(obj) is not np.ndarray
+                or obj.dtype.hasobject or obj.ndim == 0
+                or obj.nbytes < self._min_bytes):
+            return None
+        index = self._array_ids.get(id(obj), None)
+        if index is None:
+            index = len(self.arrays)
+            self._array_ids[id(obj)] = index
+            self._originals.append(obj)
+            self.arrays.append(obj.copy() if self._copy_arrays else obj)
+        return (_CHUNKS_HEADER_KEY, index)
+
+
+class _ChunkLoadingUnpickler(pickle.Unpickler):
+    """Unpickler which loads the arrays left out by _ArrayChunkingPickler.
+
+    Args:
+        file (io.BufferedReader): File to unpickle from.
+        manifest (list[tuple]): The dtype, shape and chunk names of each
+            array.
+        chunk_dir (str): Directory of the chunk files.
+        mmap_mode (str or None): Memory-map mode of arrays stored in a
+            single chunk file, or None to read them.
+
+    """
+
+    def __init__(self, file, manifest, chunk_dir, mmap_mode=None):
+        super().__init__(file)
+        self._manifest = manifest
+        self._chunk_dir = chunk_dir
+        self._mmap_mode = mmap_mode
+        # Persistent ids are not memoized, so arrays referenced several
+        # times are cached here to keep them shared.
+        self._arrays = {}
+
+    def persistent_load(self, pid):
+        """Load an array from its chunks.
+
+        Args:
+            pid (tuple): Persistent id of the array.
+
+        Returns:
+            numpy.ndarray: The array.
+
+        Raises:
+            pickle.UnpicklingError: If pid is not the id of an array.
+
+        """
+        if pid[0] != _CHUNKS_HEADER_KEY:
+            raise pickle.UnpicklingError('Unsupported persistent id')
+        index = pid[1]
+        if index not in self._arrays:
+            dtype, shape, chunk_names = self._manifest[index]
+            mmap_mode = self._mmap_mode if len(chunk_names) == 1 else None
+            chunks = [
+                np.load(os.path.join(self._chunk_dir, name),
+                        mmap_mode=mmap_mode) for name in chunk_names
+            ]
+            array = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+            self._arrays[index] = array.astype(dtype,
+                                               copy=False).reshape(shape)
+        return self._arrays[index]
+
+
+def _read_manifest(file):
+    """Read the array manifest of an open snapshot file.
+
+    Args:
+        file (io.BufferedReader): Snapshot file.
+
+    Returns:
+        list[tuple]: The dtype, shape and chunk names of each array stored
+            in chunk files. Empty if no array is stored in chunk files.
+
+    """
+    # The header is small and starts with its key, so other snapshot files
+    # are recognized without unpickling them.
+    if _CHUNKS_HEADER_KEY.encode() not in file.read(64):
+        return []
+    file.seek(0)
+    return pickle.load(file)[_CHUNKS_HEADER_KEY]
+
+
+def _atomic_write(file_name, data):
+    """Write a file atomically, through a temporary file which is renamed.
+
+    Args:
+        file_name (str): Path of the file.
+        data (bytes or numpy.ndarray): Content of the file. Arrays are
+            written in .npy format.
+
+    """
+    tmp_name = '{}.tmp{}'.format(file_name, os.getpid())
+    with open(tmp_name, 'wb') as file:
+        if isinstance(data, np.ndarray):
+            np.save(file, data, allow_pickle=False)
+        else:
+            file.write(data)
+    os.replace(tmp_name, file_name)
 
 
 class NotAFileError(Exception):
@@ -1,6 +1,5 @@
 """Utiliy functions for tensors."""
 import numpy as np
-import scipy.signal
 
 
 def discount_cumsum(x, discount):
@@ -18,6 +17,9 @@ def discount_cumsum(x, discount):
         np.ndarrary: Discounted cumulative sum.
 
     """
+    # Imported here, so that processes which never compute returns (such as
+    # sampler workers) do not import scipy.signal.
+    import scipy.signal  # pylint: disable=import-outside-toplevel
     return scipy.signal.lfilter([1], [1, float(-discount)], x[::-1],
                                 axis=0)[::-1]
 
@@ -318,3 +320,35 @@ def slice_nested_dict(dict_or_array, start, stop):
         # It *should* be a numpy array (unless someone ignored the type
         # signature).
         return dict_or_array[start:stop]
+
+
+def scatter_and_pad(dict_or_array, rows, cols, n_rows, max_len):
+    """Scatter time steps into a zero-padded batch.
+
+    Time step i of the input is written to position (rows[i], cols[i]) of a
+    preallocated array of shape :math:`(n_rows, max_len, S^*)`, so that a
+    flat batch of steps is grouped and padded in a single pass.
+
+    Args:
+        dict_or_array (dict[str, dict or np.ndarray] or np.ndarray): Values
+            of shape :math:`(N, S^*)`, or a nested dictionary of them.
+        rows (np.ndarray): Row of each time step, with shape :math:`(N,)`.
+        cols (np.ndarray): Column of each time step, with shape
+            :math:`(N,)`.
+        n_rows (int): Number of rows.
+        max_len (int): Maximum length for padding.
+
+    Returns:
+        dict or np.ndarray: The input, scattered and padded. Values have
+            shape :math:`(n_rows, max_len, S^*)`.
+
+    """
+    if isinstance(dict_or_array, dict):
+        return {
+            k: scatter_and_pad(v, rows, cols, n_rows, max_len)
+            for (k, v) in dict_or_array.items()
+        }
+    ret = np.zeros((n_rows, max_len) + dict_or_array.shape[1:],
+                   dtype=dict_or_array.dtype)
+    ret[rows, cols] = dict_or_array
+    return ret
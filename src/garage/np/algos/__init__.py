@@ -1,13 +1,19 @@
 """Reinforcement learning algorithms which use NumPy as a numerical backend."""
-from garage.np.algos.batch_polopt import BatchPolopt
-from garage.np.algos.cem import CEM
-from garage.np.algos.cma_es import CMAES
-from garage.np.algos.meta_rl_algorithm import MetaRLAlgorithm
-from garage.np.algos.nop import NOP
-from garage.np.algos.off_policy_rl_algorithm import OffPolicyRLAlgorithm
-from garage.np.algos.rl_algorithm import RLAlgorithm
+from garage._lazy import lazy_import
 
 __all__ = [
     'RLAlgorithm', 'BatchPolopt', 'CEM', 'CMAES', 'MetaRLAlgorithm', 'NOP',
     'OffPolicyRLAlgorithm'
 ]
+
+_ATTRIBUTES = {
+    'BatchPolopt': 'batch_polopt',
+    'CEM': 'cem',
+    'CMAES': 'cma_es',
+    'MetaRLAlgorithm': 'meta_rl_algorithm',
+    'NOP': 'nop',
+    'OffPolicyRLAlgorithm': 'off_policy_rl_algorithm',
+    'RLAlgorithm': 'rl_algorithm',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -0,0 +1,72 @@
+"""Training mode sampling a whole population of policies at once."""
+import abc
+
+from dowel import logger, tabular
+import numpy as np
+
+
+class PopulationMixin:
+    """Mixin of BatchPolopt algorithms which can sample a whole population.
+
+    In each epoch, the whole population of parameter vectors is sent to the
+    sampler workers in a single call (one member per worker), and the
+    population is updated once from the returns of all members. This
+    requires a sampler which can sample for each worker, such as
+    LocalSampler, MultiprocessingSampler or RaySampler.
+
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def _train_population(self, runner):
+        """Train by sampling every member of a population at once.
+
+        Args:
+            runner (LocalRunner): LocalRunner is passed to give algorithm
+                the access to runner.step_epochs() and
+                runner.obtain_samples_for_tasks().
+
+        Returns:
+            float: The return of the last update.
+
+        """
+        last_return = None
+
+        for epoch in runner.step_epochs():
+            population = self._sample_population(epoch)
+            member_paths = runner.obtain_samples_for_tasks(
+                runner.step_itr, None, list(population),
+                [None] * len(population))
+            runner.step_path = [
+                path for paths in member_paths for path in paths
+            ]
+            tabular.record('Epoch', epoch)
+            self.process_samples(runner.step_itr, runner.step_path)
+            returns = np.array([
+                np.mean([np.sum(path['rewards']) for path in paths])
+                for paths in member_paths
+            ])
+            last_return = self._update_population(population, returns)
+            logger.log(tabular)
+            runner.step_itr += 1
+
+        return last_return
+
+    @abc.abstractmethod
+    def _sample_population(self, epoch):
+        """Sample the parameter vectors of a population.
+
+        Args:
+            epoch (int): Epoch number.
+
+        """
+
+    @abc.abstractmethod
+    def _update_population(self, population, returns):
+        """Update the algorithm from the returns of a population.
+
+        Args:
+            population (np.ndarray): Parameter vectors of the population.
+            returns (np.ndarray): Average return of each member.
+
+        """
@@ -73,13 +73,32 @@ class BatchPolopt(RLAlgorithm):
 
         for _ in runner.step_epochs():
             for _ in range(self.n_samples):
-                runner.step_path = runner.obtain_samples(runner.step_itr)
+                # Returns are computed as paths arrive.
+                runner.step_path = runner.obtain_samples(
+                    runner.step_itr, consumer=self._path_returns)
                 last_return = self.train_once(runner.step_itr,
                                               runner.step_path)
                 runner.step_itr += 1
 
         return last_return
 
+    def _path_returns(self, path):
+        """Get the discounted returns of a path, computing them if needed.
+
+        The returns are stored in the path, under the key `returns`.
+
+        Args:
+            path (dict): A path, as returned by `runner.obtain_samples`.
+
+        Returns:
+            np.ndarray: Discounted return at each step of the path.
+
+        """
+        if 'returns' not in path:
+            path['returns'] = tensor_utils.discount_cumsum(
+                path['rewards'], self.discount)
+        return path['returns']
+
     def process_samples(self, itr, paths):
         """Return processed sample data based on the collected paths.
 
@@ -110,9 +129,7 @@ class BatchPolopt(RLAlgorithm):
             baselines.append(path['baselines'])
 
             # returns
-            path['returns'] = tensor_utils.discount_cumsum(
-                path['rewards'], self.discount)
-            returns.append(path['returns'])
+            returns.append(self._path_returns(path))
 
         obs = [path['observations'] for path in paths]
         obs = tensor_utils.pad_tensor_n(obs, max_path_length)
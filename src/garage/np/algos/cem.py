@@ -2,10 +2,11 @@
 from dowel import logger, tabular
 import numpy as np
 
+from garage.np.algos._population import PopulationMixin
 from garage.np.algos.batch_polopt import BatchPolopt
 
 
-class CEM(BatchPolopt):
+class CEM(PopulationMixin, BatchPolopt):
     """Cross Entropy Method.
 
     CEM works by iteratively optimizing a gaussian distribution of policy.
@@ -17,6 +18,12 @@ class CEM(BatchPolopt):
     3. Update cur_mean and cur_std by doing Maximum Likelihood Estimation
        over the n_best top policies in terms of return.
 
+    By default, the policies are sampled one after another, one per
+    iteration. In population mode, all n_samples policies of an epoch are
+    sampled in a single call, spread over the sampler workers. This
+    requires a sampler which can sample for each worker, such as
+    LocalSampler, MultiprocessingSampler or RaySampler.
+
     Args:
         env_spec (garage.envs.EnvSpec): Environment specification.
         policy (garage.np.policies.Policy): Action policy.
@@ -29,6 +36,8 @@ class CEM(BatchPolopt):
         init_std (float): Initial std for policy param distribution.
         extra_std (float): Decaying std added to param distribution.
         extra_decay_time (float): Epochs that it takes to decay extra std.
+        population_mode (bool): Whether all policies of an epoch are
+            sampled at once.
 
     """
 
@@ -42,7 +51,8 @@ class CEM(BatchPolopt):
                  init_std=1,
                  best_frac=0.05,
                  extra_std=1.,
-                 extra_decay_time=100):
+                 extra_decay_time=100,
+                 population_mode=False):
         super().__init__(env_spec, policy, baseline, discount, max_path_length,
                          n_samples)
 
@@ -52,6 +62,7 @@ class CEM(BatchPolopt):
         self.best_frac = best_frac
         self.extra_std = extra_std
         self.extra_decay_time = extra_decay_time
+        self.population_mode = population_mode
 
         self.cur_std = None
         self.cur_mean = None
@@ -76,13 +87,59 @@ class CEM(BatchPolopt):
         Returns:
             np.ndarray: A numpy array of parameter values.
 
+        """
+        return np.random.standard_normal(
+            self.n_params) * self._sample_std(epoch) + self.cur_mean
+
+    def _sample_population(self, epoch):
+        """Return the sample parameters of all policies of an epoch.
+
+        Args:
+            epoch (int): Epoch number.
+
+        Returns:
+            np.ndarray: Parameter values, with shape
+                :math:`(n_samples, n_params)`.
+
+        """
+        return np.random.standard_normal(
+            (self.n_samples,
+             self.n_params)) * self._sample_std(epoch) + self.cur_mean
+
+    def _sample_std(self, epoch):
+        """Return the std of the parameter distribution, with extra std.
+
+        Args:
+            epoch (int): Epoch number.
+
+        Returns:
+            np.ndarray: Std of each parameter.
+
         """
         extra_var_mult = max(1.0 - epoch / self.extra_decay_time, 0)
-        sample_std = np.sqrt(
+        return np.sqrt(
             np.square(self.cur_std) +
             np.square(self.extra_std) * extra_var_mult)
-        return np.random.standard_normal(
-            self.n_params) * sample_std + self.cur_mean
+
+    def _update_population(self, population, returns):
+        """Refit the parameter distribution to the best policies.
+
+        Args:
+            population (np.ndarray): Parameter values of the policies.
+            returns (np.ndarray): Average return of each policy.
+
+        Returns:
+            float: The best average return.
+
+        """
+        best_inds = np.argsort(-returns)[:self.n_best]
+        best_params = population[best_inds]
+
+        # MLE of normal distribution
+        self.cur_mean = best_params.mean(axis=0)
+        self.cur_std = best_params.std(axis=0)
+        self.policy.set_param_values(self.cur_mean)
+        return returns.max()
 
     def train(self, runner):
         """Initialize variables and start training.
@@ -109,6 +166,8 @@ class CEM(BatchPolopt):
             'n_samples is too low. Make sure that n_samples * best_frac >= 1')
         self.n_params = len(self.cur_mean)
 
+        if self.population_mode:
+            return self._train_population(runner)
         return super().train(runner)
 
     def train_once(self, itr, paths):
@@ -134,17 +193,10 @@ class CEM(BatchPolopt):
 
         # -- Stage: Update policy distribution.
         if (itr + 1) % self.n_samples == 0:
-            avg_rtns = np.array(self.all_returns)
-            best_inds = np.argsort(-avg_rtns)[:self.n_best]
-            best_params = np.array(self.all_params)[best_inds]
-
-            # MLE of normal distribution
-            self.cur_mean = best_params.mean(axis=0)
-            self.cur_std = best_params.std(axis=0)
-            self.policy.set_param_values(self.cur_mean)
+            rtn = self._update_population(np.array(self.all_params),
+                                          np.array(self.all_returns))
 
             # Clear for next epoch
-            rtn = max(self.all_returns)
             self.all_returns.clear()
             self.all_params.clear()
 
@@ -3,10 +3,11 @@ import cma
 from dowel import logger, tabular
 import numpy as np
 
+from garage.np.algos._population import PopulationMixin
 from garage.np.algos.batch_polopt import BatchPolopt
 
 
-class CMAES(BatchPolopt):
+class CMAES(PopulationMixin, BatchPolopt):
     """Covariance Matrix Adaptation Evolution Strategy.
 
     Note:
@@ -14,6 +15,12 @@ class CMAES(BatchPolopt):
         simple task. It is still maintained here only for consistency with
         original rllab paper.
 
+    By default, the policies are sampled one after another, one per
+    iteration. In population mode, all n_samples policies of an epoch are
+    sampled in a single call, spread over the sampler workers. This
+    requires a sampler which can sample for each worker, such as
+    LocalSampler, MultiprocessingSampler or RaySampler.
+
     Args:
         env_spec (garage.envs.EnvSpec): Environment specification.
         policy (garage.np.policies.Policy): Action policy.
@@ -23,6 +30,8 @@ class CMAES(BatchPolopt):
         discount (float): Environment reward discount.
         max_path_length (int): Maximum length of a single rollout.
         sigma0 (float): Initial std for param distribution.
+        population_mode (bool): Whether all policies of an epoch are
+            sampled at once.
 
     """
 
@@ -33,7 +42,8 @@ class CMAES(BatchPolopt):
                  n_samples,
                  discount=0.99,
                  max_path_length=500,
-                 sigma0=1.):
+                 sigma0=1.,
+                 population_mode=False):
         super().__init__(env_spec=env_spec,
                          policy=policy,
                          baseline=baseline,
@@ -42,6 +52,7 @@ class CMAES(BatchPolopt):
                          n_samples=n_samples)
 
         self.sigma0 = sigma0
+        self.population_mode = population_mode
 
         self._es = None
         self._all_params = None
@@ -63,6 +74,35 @@ class CMAES(BatchPolopt):
         """
         return self._es.ask()
 
+    def _sample_population(self, epoch):
+        """Return the sample parameters of all policies of an epoch.
+
+        Args:
+            epoch (int): Epoch number.
+
+        Returns:
+            np.ndarray: Parameter values, with shape
+                :math:`(n_samples, n_params)`.
+
+        """
+        del epoch
+        return np.array(self._sample_params())
+
+    def _update_population(self, population, returns):
+        """Update the evolution strategy from the returns of the policies.
+
+        Args:
+            population (np.ndarray): Parameter values of the policies.
+            returns (np.ndarray): Average return of each policy.
+
+        Returns:
+            float: The best average return.
+
+        """
+        self._es.tell(list(population), -returns)
+        self.policy.set_param_values(self._es.best.get()[0])
+        return returns.max()
+
     def train(self, runner):
         """Initialize variables and start training.
 
@@ -78,6 +118,8 @@ class CMAES(BatchPolopt):
         init_mean = self.policy.get_param_values()
         self._es = cma.CMAEvolutionStrategy(init_mean, self.sigma0,
                                             {'popsize': self.n_samples})
+        if self.population_mode:
+            return self._train_population(runner)
         self._all_params = self._sample_params()
         self._cur_params = self._all_params[0]
         self.policy.set_param_values(self._cur_params)
@@ -108,12 +150,10 @@ class CMAES(BatchPolopt):
         self._all_returns.append(paths['average_return'])
 
         if (itr + 1) % self.n_samples == 0:
-            avg_rtns = np.array(self._all_returns)
-            self._es.tell(self._all_params, -avg_rtns)
-            self.policy.set_param_values(self._es.best.get()[0])
+            rtn = self._update_population(np.array(self._all_params),
+                                          np.array(self._all_returns))
 
             # Clear for next epoch
-            rtn = max(self._all_returns)
             self._all_returns.clear()
             self._all_params = self._sample_params()
 
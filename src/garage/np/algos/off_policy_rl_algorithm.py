@@ -35,6 +35,9 @@ class OffPolicyRLAlgorithm(RLAlgorithm):
         exploration_policy
             (garage.np.exploration_policies.ExplorationPolicy):
             Exploration strategy.
+        n_step (int): Number of steps of the returns used as targets. If
+            greater than 1, the replay buffer must support n-step sampling,
+            like `garage.replay_buffer.SimpleReplayBuffer`.
 
     """
 
@@ -56,7 +59,8 @@ class OffPolicyRLAlgorithm(RLAlgorithm):
             rollout_batch_size=1,
             reward_scale=1.,
             smooth_return=True,
-            exploration_policy=None):
+            exploration_policy=None,
+            n_step=1):
         self.env_spec = env_spec
         self.policy = policy
         self.qf = qf
@@ -73,6 +77,7 @@ class OffPolicyRLAlgorithm(RLAlgorithm):
         self.max_path_length = max_path_length
         self.max_eval_path_length = max_eval_path_length
         self.exploration_policy = exploration_policy
+        self.n_step = n_step
 
         self.sampler_cls = OffPolicyVectorizedSampler
 
@@ -143,7 +148,10 @@ class OffPolicyRLAlgorithm(RLAlgorithm):
         undiscounted_returns = [path['undiscounted_return'] for path in paths]
 
         # check if the last path is complete
-        complete = [path['dones'][-1] for path in paths]
+        complete = [
+            path['env_infos']['vec_env_executor.complete'][-1]
+            for path in paths
+        ]
 
         samples_data = dict(undiscounted_returns=undiscounted_returns,
                             success_history=success_history,
@@ -195,13 +203,7 @@ class OffPolicyRLAlgorithm(RLAlgorithm):
 
         """
         paths = []
-        max_path_length = self.max_eval_path_length
-        if max_path_length is None:
-            max_path_length = self.max_path_length
-        # Use a finite length rollout for evaluation.
-        if max_path_length is None or np.isinf(max_path_length):
-            max_path_length = 1000
-
+        max_path_length = self._get_eval_max_path_length()
         for _ in range(num_trajs):
             path = rollout(env,
                            self.policy,
@@ -210,6 +212,44 @@ class OffPolicyRLAlgorithm(RLAlgorithm):
             paths.append(path)
         return TrajectoryBatch.from_trajectory_list(self.env_spec, paths)
 
+    def _get_eval_max_path_length(self):
+        """Get the maximum length of evaluation rollouts.
+
+        Returns:
+            int: `max_eval_path_length`, or `max_path_length` if it is None.
+                Evaluation rollouts have a finite length, so it is 1000 if
+                both are None or infinite.
+
+        """
+        max_path_length = self.max_eval_path_length
+        if max_path_length is None:
+            max_path_length = self.max_path_length
+        # Use a finite length rollout for evaluation.
+        if max_path_length is None or np.isinf(max_path_length):
+            max_path_length = 1000
+        return max_path_length
+
+    def _sample_replay_transitions(self, batch_size):
+        """Sample transitions from the replay buffer.
+
+        Args:
+            batch_size (int): Number of transitions to sample.
+
+        Returns:
+            dict[str, numpy.ndarray]: Transitions, with the discount of the
+                bootstrapped value of each transition under the key
+                `discount`.
+
+        """
+        if self.n_step > 1:
+            return self.replay_buffer.sample(batch_size,
+                                             n_step=self.n_step,
+                                             discount=self.discount)
+        transitions = self.replay_buffer.sample(batch_size)
+        transitions['discount'] = np.full(len(transitions['reward']),
+                                          self.discount)
+        return transitions
+
     @property
     def _buffer_prefilled(self):
         """bool: Whether first min buffer size steps is done."""
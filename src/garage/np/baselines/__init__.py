@@ -1,6 +1,12 @@
 """Baselines (value functions) which use NumPy as a numerical backend."""
-from garage.np.baselines.baseline import Baseline
-from garage.np.baselines.linear_feature_baseline import LinearFeatureBaseline
-from garage.np.baselines.zero_baseline import ZeroBaseline
+from garage._lazy import lazy_import
 
 __all__ = ['Baseline', 'LinearFeatureBaseline', 'ZeroBaseline']
+
+_ATTRIBUTES = {
+    'Baseline': 'baseline',
+    'LinearFeatureBaseline': 'linear_feature_baseline',
+    'ZeroBaseline': 'zero_baseline',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -1,4 +1,11 @@
 """Embedding encoders and decoders which use NumPy as a numerical backend."""
-from garage.np.embeddings.encoder import Encoder, StochasticEncoder
+from garage._lazy import lazy_import
 
 __all__ = ['Encoder', 'StochasticEncoder']
+
+_ATTRIBUTES = {
+    'Encoder': 'encoder',
+    'StochasticEncoder': 'encoder',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -1,12 +1,16 @@
 """Exploration strategies which use NumPy as a numerical backend."""
-from garage.np.exploration_policies.add_gaussian_noise import AddGaussianNoise
-from garage.np.exploration_policies.add_ornstein_uhlenbeck_noise import (
-    AddOrnsteinUhlenbeckNoise)
-from garage.np.exploration_policies.epsilon_greedy_policy import (
-    EpsilonGreedyPolicy)
-from garage.np.exploration_policies.exploration_policy import ExplorationPolicy
+from garage._lazy import lazy_import
 
 __all__ = [
     'EpsilonGreedyPolicy', 'ExplorationPolicy', 'AddGaussianNoise',
     'AddOrnsteinUhlenbeckNoise'
 ]
+
+_ATTRIBUTES = {
+    'AddGaussianNoise': 'add_gaussian_noise',
+    'AddOrnsteinUhlenbeckNoise': 'add_ornstein_uhlenbeck_noise',
+    'EpsilonGreedyPolicy': 'epsilon_greedy_policy',
+    'ExplorationPolicy': 'exploration_policy',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
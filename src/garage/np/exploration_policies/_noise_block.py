@@ -0,0 +1,81 @@
+"""Random numbers for exploration noise, generated in blocks."""
+import numpy as np
+
+
+class NoiseBlock:
+    """Random numbers for a batch of environments, generated in blocks.
+
+    Generating random numbers for many steps in one call is much cheaper
+    than one call per step. The numbers of each step are taken from the
+    block in order, and a new block is generated when it runs out.
+
+    The block is not pickled, so copies of an exploration policy sent to
+    sampler workers generate their own numbers.
+
+    Args:
+        distribution (str): Either 'normal' (standard normal) or 'uniform'
+            (uniform on [0, 1)).
+        shape (tuple[int]): Shape of the numbers of one environment at one
+            step.
+        block_size (int or None): Number of environment steps to generate
+            numbers for at once. If None, numbers are generated by each
+            call to `take`.
+
+    """
+
+    def __init__(self, distribution, shape, block_size=None):
+        if distribution not in ('normal', 'uniform'):
+            raise ValueError(
+                'Unknown distribution {!r}'.format(distribution))
+        self._distribution = distribution
+        self._shape = tuple(shape)
+        self._block_size = block_size
+        self._block = None
+        self._position = 0
+
+    def take(self, n):
+        """Take the random numbers of a step of a batch of environments.
+
+        Args:
+            n (int): Number of environments.
+
+        Returns:
+            np.ndarray: Random numbers, with shape :math:`(n, ) + shape`.
+
+        """
+        if self._block_size is None:
+            return self._sample(n)
+        if self._block is None or self._position + n > len(self._block):
+            self._block = self._sample(max(self._block_size, n))
+            self._position = 0
+        numbers = self._block[self._position:self._position + n]
+        self._position += n
+        return numbers
+
+    def _sample(self, n):
+        """Generate random numbers.
+
+        Args:
+            n (int): Number of environment steps.
+
+        Returns:
+            np.ndarray: Random numbers, with shape :math:`(n, ) + shape`.
+
+        """
+        size = (n, ) + self._shape
+        if self._distribution == 'normal':
+            return np.random.standard_normal(size)
+        return np.random.random_sample(size)
+
+    def __getstate__(self):
+        """Object.__getstate__.
+
+        Returns:
+            dict: The state to be pickled for the instance, without the
+                generated numbers.
+
+        """
+        data = self.__dict__.copy()
+        data['_block'] = None
+        data['_position'] = 0
+        return data
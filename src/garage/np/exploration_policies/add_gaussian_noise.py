@@ -2,6 +2,7 @@
 import gym
 import numpy as np
 
+from garage.np.exploration_policies._noise_block import NoiseBlock
 from garage.np.exploration_policies.exploration_policy import ExplorationPolicy
 
 
@@ -17,6 +18,9 @@ class AddGaussianNoise(ExplorationPolicy):
             decay period.
         decay_period (int): Number of paths over which to linearly decay sigma
             from  max_sigma to min_sigma.
+        noise_block_size (int or None): Number of environment steps to
+            generate noise for at once (e.g. 10000). If None, noise is
+            generated by each call.
 
     """
 
@@ -25,7 +29,8 @@ class AddGaussianNoise(ExplorationPolicy):
                  policy,
                  max_sigma=1.0,
                  min_sigma=0.1,
-                 decay_period=1000000):
+                 decay_period=1000000,
+                 noise_block_size=None):
         assert isinstance(env_spec.action_space, gym.spaces.Box)
         assert len(env_spec.action_space.shape) == 1
         super().__init__(policy)
@@ -34,6 +39,8 @@ class AddGaussianNoise(ExplorationPolicy):
         self._decay_period = decay_period
         self._action_space = env_spec.action_space
         self._iteration = 0
+        self._noise = NoiseBlock('normal', self._action_space.shape,
+                                 noise_block_size)
 
     def reset(self, dones=None):
         """Reset the state of the exploration.
@@ -58,11 +65,7 @@ class AddGaussianNoise(ExplorationPolicy):
 
         """
         action, agent_info = self.policy.get_action(observation)
-        sigma = self._max_sigma - (self._max_sigma - self._min_sigma) * min(
-            1.0, self._iteration * 1.0 / self._decay_period)
-        return np.clip(action + np.random.normal(size=len(action)) * sigma,
-                       self._action_space.low,
-                       self._action_space.high), agent_info
+        return self._add_noise(np.asarray(action)[np.newaxis])[0], agent_info
 
     def get_actions(self, observations):
         """Get actions from this policy for the input observation.
@@ -76,8 +79,21 @@ class AddGaussianNoise(ExplorationPolicy):
 
         """
         actions, agent_infos = self.policy.get_actions(observations)
+        return self._add_noise(np.asarray(actions)), agent_infos
+
+    def _add_noise(self, actions):
+        """Add noise to the actions of a batch of environments.
+
+        Args:
+            actions (np.ndarray): Actions, with shape
+                :math:`(N, action_dim)`.
+
+        Returns:
+            np.ndarray: Actions with noise, clipped to the action space.
+
+        """
         sigma = self._max_sigma - (self._max_sigma - self._min_sigma) * min(
             1.0, self._iteration * 1.0 / self._decay_period)
-        return np.clip(actions + np.random.normal(size=len(actions)) * sigma,
-                       self._action_space.low,
-                       self._action_space.high), agent_infos
+        noise = self._noise.take(len(actions))
+        return np.clip(actions + noise * sigma, self._action_space.low,
+                       self._action_space.high)
@@ -7,6 +7,7 @@ transitions. And OU process is relatively smooth in time.
 """
 import numpy as np
 
+from garage.np.exploration_policies._noise_block import NoiseBlock
 from garage.np.exploration_policies.exploration_policy import ExplorationPolicy
 
 
@@ -18,6 +19,10 @@ class AddOrnsteinUhlenbeckNoise(ExplorationPolicy):
     .. math::
        dx_t = -\theta(\mu - x_t)dt + \sigma \sqrt{dt} \mathcal{N}(\mathbb{0}, \mathbb{1})  # noqa: E501
 
+    When actions are computed for a batch of environments with
+    `get_actions`, each environment has its own process, and
+    `reset(dones)` only resets the processes of the finished environments.
+
     Args:
         env_spec (EnvSpec): Environment to explore.
         policy (garage.Policy): Policy to wrap.
@@ -31,6 +36,9 @@ class AddOrnsteinUhlenbeckNoise(ExplorationPolicy):
         dt (float): Time-step quantum :math:`dt > 0` of this OU process. Must
             be greater than zero.
         x0 (float): Initial state :math:`x_0` of this OU process.
+        noise_block_size (int or None): Number of environment steps to
+            generate noise for at once (e.g. 10000). If None, noise is
+            generated by each call.
 
     """
 
@@ -42,7 +50,8 @@ class AddOrnsteinUhlenbeckNoise(ExplorationPolicy):
                  sigma=0.3,
                  theta=0.15,
                  dt=1e-2,
-                 x0=None):
+                 x0=None,
+                 noise_block_size=None):
         super().__init__(policy)
         self._env_spec = env_spec
         self._action_space = env_spec.action_space
@@ -53,20 +62,43 @@ class AddOrnsteinUhlenbeckNoise(ExplorationPolicy):
         self._dt = dt
         self._x0 = x0 if x0 is not None else self._mu * np.zeros(
             self._action_dim)
-        self._state = self._x0
+        self._noise = NoiseBlock('normal', (self._action_dim, ),
+                                 noise_block_size)
+        # State of the process of each environment, with shape
+        # (n_envs, action_dim).
+        self._state = self._initial_state(1)
+
+    def _initial_state(self, n):
+        """Get the initial state of the processes of a batch of environments.
+
+        Args:
+            n (int): Number of environments.
+
+        Returns:
+            np.ndarray: Initial states, with shape :math:`(n, action_dim)`.
+
+        """
+        return np.broadcast_to(np.asarray(self._x0, dtype=np.float64),
+                               (n, self._action_dim)).copy()
 
-    def _simulate(self):
-        """Advance the OU process.
+    def _simulate(self, n):
+        """Advance the OU processes of a batch of environments.
+
+        Args:
+            n (int): Number of environments. If it changed, the processes
+                are started again from the initial state.
 
         Returns:
-            np.ndarray: Updated OU process state.
+            np.ndarray: Updated OU process states, with shape
+                :math:`(n, action_dim)`.
 
         """
+        if len(self._state) != n:
+            self._state = self._initial_state(n)
         x = self._state
-        dx = self._theta * (self._mu - x) * self._dt + self._sigma * np.sqrt(
-            self._dt) * np.random.normal(size=len(x))
-        self._state = x + dx
-        return self._state
+        x += self._theta * (self._mu - x) * self._dt + self._sigma * np.sqrt(
+            self._dt) * self._noise.take(n)
+        return x
 
     def reset(self, dones=None):
         """Reset the state of the exploration.
@@ -76,7 +108,14 @@ class AddOrnsteinUhlenbeckNoise(ExplorationPolicy):
                 states to reset.
 
         """
-        self._state = self._x0
+        if dones is None:
+            self._state[:] = self._x0
+        else:
+            dones = np.asarray(dones, dtype=bool)
+            if len(dones) != len(self._state):
+                self._state = self._initial_state(len(dones))
+            else:
+                self._state[dones] = self._x0
         super().reset(dones)
 
     def get_action(self, observation):
@@ -91,7 +130,7 @@ class AddOrnsteinUhlenbeckNoise(ExplorationPolicy):
 
         """
         action, agent_infos = self.policy.get_action(observation)
-        ou_state = self._simulate()
+        ou_state = self._simulate(1)[0]
         return np.clip(action + ou_state, self._action_space.low,
                        self._action_space.high), agent_infos
 
@@ -107,6 +146,6 @@ class AddOrnsteinUhlenbeckNoise(ExplorationPolicy):
 
         """
         actions, agent_infos = self.policy.get_actions(observations)
-        ou_state = self._simulate()
+        ou_state = self._simulate(len(actions))
         return np.clip(actions + ou_state, self._action_space.low,
                        self._action_space.high), agent_infos
@@ -2,8 +2,10 @@
 
 Random exploration according to the value of epsilon.
 """
+import gym
 import numpy as np
 
+from garage.np.exploration_policies._noise_block import NoiseBlock
 from garage.np.exploration_policies.exploration_policy import ExplorationPolicy
 
 
@@ -25,6 +27,9 @@ class EpsilonGreedyPolicy(ExplorationPolicy):
         max_epsilon (float): The maximum(starting) value of epsilon.
         min_epsilon (float): The minimum(terminal) value of epsilon.
         decay_ratio (float): Fraction of total steps for epsilon decay.
+        noise_block_size (int or None): Number of environment steps to
+            generate random numbers for at once (e.g. 10000). If None,
+            random numbers are generated by each call.
 
     """
 
@@ -35,7 +40,8 @@ class EpsilonGreedyPolicy(ExplorationPolicy):
                  total_timesteps,
                  max_epsilon=1.0,
                  min_epsilon=0.02,
-                 decay_ratio=0.1):
+                 decay_ratio=0.1,
+                 noise_block_size=None):
         super().__init__(policy)
         self._env_spec = env_spec
         self._max_epsilon = max_epsilon
@@ -45,6 +51,7 @@ class EpsilonGreedyPolicy(ExplorationPolicy):
         self._epsilon = self._max_epsilon
         self._decrement = (self._max_epsilon -
                            self._min_epsilon) / self._decay_period
+        self._noise = NoiseBlock('uniform', (), noise_block_size)
 
     def get_action(self, observation):
         """Get action from this policy for the input observation.
@@ -58,8 +65,7 @@ class EpsilonGreedyPolicy(ExplorationPolicy):
 
         """
         opt_action, _ = self.policy.get_action(observation)
-        self._decay()
-        if np.random.random() < self._epsilon:
+        if self._explore(1)[0]:
             opt_action = self._action_space.sample()
 
         return opt_action, dict()
@@ -76,13 +82,37 @@ class EpsilonGreedyPolicy(ExplorationPolicy):
 
         """
         opt_actions, _ = self.policy.get_actions(observations)
-        for itr, _ in enumerate(opt_actions):
-            self._decay()
-            if np.random.random() < self._epsilon:
-                opt_actions[itr] = self._action_space.sample()
+        opt_actions = np.array(opt_actions)
+        explore = self._explore(len(opt_actions))
+        n_random = np.count_nonzero(explore)
+        if n_random:
+            if isinstance(self._action_space, gym.spaces.Discrete):
+                opt_actions[explore] = np.random.randint(self._action_space.n,
+                                                         size=n_random)
+            else:
+                for itr in np.flatnonzero(explore):
+                    opt_actions[itr] = self._action_space.sample()
 
         return opt_actions, dict()
 
-    def _decay(self):
-        if self._epsilon > self._min_epsilon:
-            self._epsilon -= self._decrement
+    def _explore(self, n):
+        """Decide which of a batch of actions are random, and decay epsilon.
+
+        Epsilon decays once per action, so action i of the batch uses the
+        value of epsilon after i + 1 decay steps. Epsilon stops decaying at
+        min_epsilon.
+
+        Args:
+            n (int): Number of actions.
+
+        Returns:
+            np.ndarray[bool]: Whether to take a random action, for each
+                action.
+
+        """
+        epsilons = np.maximum(
+            self._epsilon - np.arange(1, n + 1) * self._decrement,
+            min(self._epsilon, self._min_epsilon))
+        if n:
+            self._epsilon = float(epsilons[-1])
+        return self._noise.take(n) < epsilons
@@ -1,4 +1,10 @@
 """Optimizers which use NumPy as a numerical backend."""
-from garage.np.optimizers.minibatch_dataset import BatchDataset
+from garage._lazy import lazy_import
 
 __all__ = ['BatchDataset']
+
+_ATTRIBUTES = {
+    'BatchDataset': 'minibatch_dataset',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -1,7 +1,13 @@
 """Policies which use NumPy as a numerical backend."""
-
-from garage.np.policies.fixed_policy import FixedPolicy
-from garage.np.policies.policy import Policy, StochasticPolicy
-from garage.np.policies.scripted_policy import ScriptedPolicy
+from garage._lazy import lazy_import
 
 __all__ = ['FixedPolicy', 'Policy', 'StochasticPolicy', 'ScriptedPolicy']
+
+_ATTRIBUTES = {
+    'FixedPolicy': 'fixed_policy',
+    'Policy': 'policy',
+    'StochasticPolicy': 'policy',
+    'ScriptedPolicy': 'scripted_policy',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -1,4 +1,10 @@
 """Q-functions which use NumPy as a numerical backend."""
-from garage.np.q_functions.q_function import QFunction
+from garage._lazy import lazy_import
 
 __all__ = ['QFunction']
+
+_ATTRIBUTES = {
+    'QFunction': 'q_function',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
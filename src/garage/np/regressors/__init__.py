@@ -1,4 +1,10 @@
 """Regressors which use NumPy as a numerical backend."""
-from garage.np.regressors.product_regressor import ProductRegressor
+from garage._lazy import lazy_import
 
 __all__ = ['ProductRegressor']
+
+_ATTRIBUTES = {
+    'ProductRegressor': 'product_regressor',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
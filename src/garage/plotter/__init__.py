@@ -1,3 +1,10 @@
-from garage.plotter.plotter import Plotter
+"""Plotters of policy rollouts."""
+from garage._lazy import lazy_import
 
 __all__ = ['Plotter']
+
+_ATTRIBUTES = {
+    'Plotter': 'plotter',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
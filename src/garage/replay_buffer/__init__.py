@@ -2,11 +2,20 @@
 
 The replay buffer primitives can be used for RL algorithms.
 """
-from garage.replay_buffer.her_replay_buffer import HerReplayBuffer
-from garage.replay_buffer.path_buffer import PathBuffer
-from garage.replay_buffer.replay_buffer import ReplayBuffer
-from garage.replay_buffer.simple_replay_buffer import SimpleReplayBuffer
+from garage._lazy import lazy_import
 
 __all__ = [
-    'ReplayBuffer', 'HerReplayBuffer', 'PathBuffer', 'SimpleReplayBuffer'
+    'BatchPrefetcher', 'ReplayBuffer', 'HerReplayBuffer',
+    'MultiTaskPathBuffer', 'PathBuffer', 'SimpleReplayBuffer'
 ]
+
+_ATTRIBUTES = {
+    'BatchPrefetcher': 'batch_prefetcher',
+    'HerReplayBuffer': 'her_replay_buffer',
+    'MultiTaskPathBuffer': 'multi_task_path_buffer',
+    'PathBuffer': 'path_buffer',
+    'ReplayBuffer': 'replay_buffer',
+    'SimpleReplayBuffer': 'simple_replay_buffer',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
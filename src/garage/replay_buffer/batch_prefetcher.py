@@ -0,0 +1,113 @@
+"""This module implements prefetching of replay buffer batches.
+
+Sampling a batch from a replay buffer is done on the host and does not
+depend on the result of the previous gradient step. A BatchPrefetcher
+samples the next batches on a background thread while the current one is
+used for training, so sampling overlaps with computation.
+
+"""
+import queue
+import threading
+
+
+class BatchPrefetcher:
+    """Sample batches on a background thread.
+
+    The thread calls sample_fn n_batches times and hands the results to the
+    consumer through a bounded queue. It should be used as a context
+    manager, while nothing else modifies the sampled replay buffer.
+
+    Args:
+        sample_fn (callable): Function returning one batch.
+        n_batches (int): Number of batches to sample.
+        max_prefetch (int): Maximum number of batches sampled ahead of the
+            consumer. If 0, batches are sampled synchronously when they are
+            consumed.
+
+    """
+
+    def __init__(self, sample_fn, n_batches, max_prefetch=2):
+        self._sample_fn = sample_fn
+        self._n_batches = n_batches
+        self._max_prefetch = max_prefetch
+        self._queue = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        """Start the background thread.
+
+        Returns:
+            BatchPrefetcher: This prefetcher.
+
+        """
+        if self._max_prefetch > 0 and self._n_batches > 0:
+            self._stop.clear()
+            self._queue = queue.Queue(maxsize=self._max_prefetch)
+            self._thread = threading.Thread(target=self._produce, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop the background thread.
+
+        Args:
+            exc_type (type): Type of the exception raised in the context, or
+                None.
+            exc_value (Exception): Exception raised in the context, or None.
+            traceback (traceback): Traceback of the exception, or None.
+
+        """
+        del exc_type, exc_value, traceback
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            self._queue = None
+
+    def __iter__(self):
+        """Iterate over the sampled batches.
+
+        Yields:
+            object: A batch returned by sample_fn.
+
+        Raises:
+            Exception: Any exception raised by sample_fn.
+
+        """
+        if self._thread is None:
+            for _ in range(self._n_batches):
+                yield self._sample_fn()
+            return
+        for _ in range(self._n_batches):
+            succeeded, batch = self._queue.get()
+            if not succeeded:
+                raise batch
+            yield batch
+
+    def _produce(self):
+        """Sample batches until n_batches are sampled or stop is requested."""
+        try:
+            for _ in range(self._n_batches):
+                if not self._put((True, self._sample_fn())):
+                    return
+        except Exception as e:  # pylint: disable=broad-except
+            self._put((False, e))
+
+    def _put(self, item):
+        """Put an item into the queue unless stop is requested.
+
+        Args:
+            item (tuple): Item to put into the queue.
+
+        Returns:
+            bool: True if the item was put into the queue.
+
+        """
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
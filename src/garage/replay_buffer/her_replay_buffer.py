@@ -160,7 +160,7 @@ class HerReplayBuffer(ReplayBuffer):
             state (dict): Unpickled state.
 
         """
-        self.__dict__ = state
+        super().__setstate__(state)
         replay_k = state['_replay_k']
         reward_fun = state['_reward_fun']
         self._sample_transitions = make_her_sample(replay_k, reward_fun)
@@ -0,0 +1,187 @@
+"""A replay buffer that stores the transitions of several tasks together."""
+import numpy as np
+
+
+class MultiTaskPathBuffer:
+    """A replay buffer that stores transitions of several tasks.
+
+    The transitions of all tasks are stored in one array per key, with
+    shape :math:`(n_tasks, capacity, flat_dim)`. Each task has its own ring
+    of `capacity` transitions in this array, so a batch of every task in a
+    list of tasks can be sampled with a single indexing operation.
+
+    Unlike PathBuffer, this buffer does not keep track of the paths, and
+    only samples single transitions.
+
+    Args:
+        n_tasks (int): Number of tasks.
+        capacity_in_transitions (int): Number of transitions stored for
+            each task.
+
+    """
+
+    def __init__(self, n_tasks, capacity_in_transitions):
+        self._n_tasks = n_tasks
+        self._capacity = int(capacity_in_transitions)
+        self._transitions_stored = np.zeros(n_tasks, dtype=np.int64)
+        self._next_idx = np.zeros(n_tasks, dtype=np.int64)
+        self._buffer = {}
+        # Views of the arrays of self._buffer, with the tasks flattened.
+        self._flat_buffer = {}
+
+    def add_path(self, task, path):
+        """Add a path of a task to the buffer.
+
+        Args:
+            task (int): Index of the task.
+            path (dict): A dict of array of shape (path_len, flat_dim).
+
+        Raises:
+            ValueError: If a key is missing from path, path has wrong shape
+                or path is too long to store in the buffer.
+
+        """
+        for key, buf_arr in self._buffer.items():
+            path_array = path.get(key, None)
+            if path_array is None:
+                raise ValueError('Key {} missing from path.'.format(key))
+            if (len(path_array.shape) != 2
+                    or path_array.shape[1] != buf_arr.shape[2]):
+                raise ValueError('Array {} has wrong shape.'.format(key))
+        path_len = len(next(iter(path.values())))
+        if path_len > self._capacity:
+            raise ValueError('Path is too long to store in buffer.')
+        start = self._next_idx[task]
+        first_len = min(path_len, self._capacity - start)
+        for key, array in path.items():
+            buf_arr = self._get_or_allocate_key(key, array)
+            buf_arr[task, start:start + first_len] = array[:first_len]
+            buf_arr[task, :path_len - first_len] = array[first_len:]
+        self._next_idx[task] = (start + path_len) % self._capacity
+        self._transitions_stored[task] = min(
+            self._capacity, self._transitions_stored[task] + path_len)
+
+    def sample_indices(self, batch_size, tasks):
+        """Sample indices of transitions of each of several tasks.
+
+        Args:
+            batch_size (int): Number of indices to sample for each task.
+            tasks (list[int]): Indices of the tasks.
+
+        Returns:
+            numpy.ndarray: Indices into the arrays returned by `get_array`,
+                with shape :math:`(X, batch_size)`, where X is the number
+                of tasks.
+
+        Raises:
+            ValueError: If a task has no transitions stored.
+
+        """
+        tasks = np.asarray(tasks, dtype=np.int64).reshape(-1)
+        n_stored = self._transitions_stored[tasks]
+        if not np.all(n_stored):
+            raise ValueError('No transitions stored for task(s) {}.'.format(
+                tasks[n_stored == 0].tolist()))
+        steps = (np.random.random_sample((len(tasks), batch_size)) *
+                 n_stored[:, np.newaxis]).astype(np.int64)
+        return tasks[:, np.newaxis] * self._capacity + steps
+
+    def sample_transitions(self, batch_size, tasks):
+        """Sample a batch of transitions of each of several tasks.
+
+        Args:
+            batch_size (int): Number of transitions to sample for each task.
+            tasks (list[int]): Indices of the tasks.
+
+        Returns:
+            dict: A dict of arrays of shape (X, batch_size, flat_dim), where
+                X is the number of tasks.
+
+        """
+        idx = self.sample_indices(batch_size, tasks)
+        return {key: self.get_array(key)[idx] for key in self._buffer}
+
+    def get_array(self, key):
+        """Get the array storing a key of the transitions of all tasks.
+
+        The array is not copied, so it must not be modified.
+
+        Args:
+            key (str): Key of the transitions.
+
+        Returns:
+            numpy.ndarray: The array, with shape
+                :math:`(n_tasks * capacity, flat_dim)`.
+
+        """
+        return self._flat_buffer[key]
+
+    def _get_or_allocate_key(self, key, array):
+        """Get or allocate key in the buffer.
+
+        Args:
+            key (str): Key in buffer.
+            array (numpy.ndarray): Array corresponding to key.
+
+        Returns:
+            numpy.ndarray: A NumPy array corresponding to key in the buffer.
+
+        """
+        buf_arr = self._buffer.get(key, None)
+        if buf_arr is None:
+            buf_arr = np.zeros(
+                (self._n_tasks, self._capacity, array.shape[1]), array.dtype)
+            self._buffer[key] = buf_arr
+            self._flat_buffer[key] = buf_arr.reshape(-1, array.shape[1])
+        return buf_arr
+
+    def clear(self, task=None):
+        """Clear the transitions of a task, or of all tasks.
+
+        Args:
+            task (int or None): Index of the task. If None, all tasks are
+                cleared.
+
+        """
+        if task is None:
+            self._transitions_stored[:] = 0
+            self._next_idx[:] = 0
+        else:
+            self._transitions_stored[task] = 0
+            self._next_idx[task] = 0
+
+    def __getstate__(self):
+        """Object.__getstate__.
+
+        Returns:
+            dict: The state to be pickled for the instance.
+
+        """
+        data = self.__dict__.copy()
+        del data['_flat_buffer']
+        return data
+
+    def __setstate__(self, state):
+        """Object.__setstate__.
+
+        Args:
+            state (dict): Unpickled state.
+
+        """
+        self.__dict__.update(state)
+        self._flat_buffer = {
+            key: buf_arr.reshape(-1, buf_arr.shape[2])
+            for key, buf_arr in self._buffer.items()
+        }
+
+    def n_transitions_stored(self, task):
+        """Return the number of transitions stored for a task.
+
+        Args:
+            task (int): Index of the task.
+
+        Returns:
+            int: Number of transitions stored for the task.
+
+        """
+        return int(self._transitions_stored[task])
@@ -0,0 +1,46 @@
+"""Vectorized computation of n-step returns for replay buffers."""
+import numpy as np
+
+
+def n_step_returns(rewards, terminals, valid, discount, completes=None):
+    """Compute the n-step returns of a batch of sampled transitions.
+
+    Row i holds the n steps following the i-th sampled transition, starting
+    with the sampled step itself. Rewards after the first terminal or
+    complete step of a row, or after its last valid step, are not included
+    in the return.
+
+    Args:
+        rewards (numpy.ndarray): Rewards, with shape :math:`(N, n)`.
+        terminals (numpy.ndarray): Terminal flags, with shape
+            :math:`(N, n)`.
+        valid (numpy.ndarray): Whether each step belongs to the episode of
+            the sampled transition, with shape :math:`(N, n)`. The first
+            step of each row must be valid.
+        discount (float): Discount factor.
+        completes (numpy.ndarray or None): Whether each step ends its
+            episode, by a terminal or e.g. a time limit, with shape
+            :math:`(N, n)`. Unlike a terminal, a complete step which is
+            not terminal is bootstrapped from.
+
+    Returns:
+        numpy.ndarray: Discounted n-step returns, with shape :math:`(N, )`.
+        numpy.ndarray: Number of rewards summed in each return, with shape
+            :math:`(N, )`.
+        numpy.ndarray: Whether a terminal step was reached, with shape
+            :math:`(N, )`.
+
+    """
+    terminals = np.asarray(terminals, dtype=bool) & valid
+    ends = terminals
+    if completes is not None:
+        ends = ends | (np.asarray(completes, dtype=bool) & valid)
+    # A step is included iff it is valid and no earlier step ends the
+    # episode.
+    ended_before = (np.cumsum(ends, axis=1) - ends) > 0
+    included = valid & ~ended_before
+    discounts = discount**np.arange(rewards.shape[1])
+    returns = np.sum(rewards * discounts * included, axis=1)
+    n_steps = np.sum(included, axis=1)
+    dones = np.any(terminals & included, axis=1)
+    return returns, n_steps, dones
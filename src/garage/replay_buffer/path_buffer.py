@@ -3,6 +3,8 @@ import collections
 
 import numpy as np
 
+from garage.replay_buffer.n_step import n_step_returns
+
 
 class PathBuffer:
     """A replay buffer that stores and can sample whole paths.
@@ -25,6 +27,10 @@ class PathBuffer:
         # The "left" side of the deque contains the oldest path.
         self._path_segments = collections.deque()
         self._buffer = {}
+        # Number of steps from each index to the end of its path, including
+        # the step at the index itself.
+        self._steps_to_path_end = np.zeros(int(capacity_in_transitions),
+                                           dtype=np.int64)
 
     def add_path(self, path):
         """Add a path to the buffer.
@@ -60,6 +66,11 @@ class PathBuffer:
             # pylint: disable=invalid-slice-index
             buf_arr[first_seg.start:first_seg.stop] = array[:len(first_seg)]
             buf_arr[second_seg.start:second_seg.stop] = array[len(first_seg):]
+        steps_to_end = np.arange(path_len, 0, -1)
+        self._steps_to_path_end[first_seg.start:first_seg.stop] = (
+            steps_to_end[:len(first_seg)])
+        self._steps_to_path_end[second_seg.start:second_seg.stop] = (
+            steps_to_end[len(first_seg):])
         if second_seg.stop != 0:
             self._first_idx_of_next_path = second_seg.stop
         else:
@@ -82,18 +93,103 @@ class PathBuffer:
         path = {key: buf_arr[indices] for key, buf_arr in self._buffer.items()}
         return path
 
-    def sample_transitions(self, batch_size):
+    def sample_transitions(self, batch_size, n_step=1, discount=1.):
         """Sample a batch of transitions from the buffer.
 
+        If n_step is greater than 1, each sampled transition is extended to
+        the following steps of its path: `reward` holds the discounted sum
+        of up to n_step rewards, and `next_observation` and `terminal` are
+        the ones of the last summed step. Summing stops early at a terminal
+        step or at the end of the path, so the returned `discount` holds
+        the discount of the bootstrapped value, `discount ** k` for k summed
+        rewards. This requires the paths to have the keys `reward` and
+        `next_observation`, and optionally `terminal`.
+
         Args:
             batch_size (int): Number of transitions to sample.
+            n_step (int): Number of steps of the returns.
+            discount (float): Discount factor of the n-step returns. Only
+                used if n_step is greater than 1.
 
         Returns:
             dict: A dict of arrays of shape (batch_size, flat_dim).
 
         """
-        idx = np.random.randint(self._transitions_stored, size=batch_size)
-        return {key: buf_arr[idx] for key, buf_arr in self._buffer.items()}
+        idx = self.sample_indices(batch_size)
+        transitions = {
+            key: buf_arr[idx]
+            for key, buf_arr in self._buffer.items()
+        }
+        if n_step > 1:
+            transitions.update(self._sample_n_step(idx, n_step, discount))
+        return transitions
+
+    def sample_indices(self, batch_size):
+        """Sample indices of transitions stored in the buffer.
+
+        Args:
+            batch_size (int): Number of indices to sample.
+
+        Returns:
+            numpy.ndarray: Indices into the arrays returned by `get_array`,
+                with shape :math:`(batch_size, )`.
+
+        """
+        return np.random.randint(self._transitions_stored, size=batch_size)
+
+    def get_array(self, key):
+        """Get the array storing a key of all transitions.
+
+        The array is not copied, so it must not be modified. It is replaced
+        by a new array when the buffer is cleared.
+
+        Args:
+            key (str): Key of the transitions.
+
+        Returns:
+            numpy.ndarray: The array, with shape :math:`(capacity, flat_dim)`.
+
+        """
+        return self._buffer[key]
+
+    def _sample_n_step(self, idx, n_step, discount):
+        """Compute the n-step entries of sampled transitions.
+
+        Args:
+            idx (numpy.ndarray): Sampled indices.
+            n_step (int): Number of steps of the returns.
+            discount (float): Discount factor.
+
+        Returns:
+            dict: The `reward`, `terminal` (if stored), `next_observation`
+                and `discount` of the transitions.
+
+        """
+        batch_size = len(idx)
+        steps_to_end = self._steps_to_path_end[idx][:, np.newaxis]
+        offsets = np.arange(n_step)
+        valid = offsets < steps_to_end
+        # Stay inside the path, so that no other path is read.
+        steps = (idx[:, np.newaxis] +
+                 np.minimum(offsets, steps_to_end - 1)) % self._capacity
+        rewards = self._buffer['reward'][steps].reshape(batch_size, n_step)
+        terminal_arr = self._buffer.get('terminal', None)
+        if terminal_arr is None:
+            terminals = np.zeros((batch_size, n_step), dtype=bool)
+        else:
+            terminals = terminal_arr[steps].reshape(batch_size, n_step)
+        returns, n_steps, dones = n_step_returns(rewards, terminals, valid,
+                                                 discount)
+        last_idx = (idx + n_steps - 1) % self._capacity
+        n_step_transitions = dict(
+            reward=returns.astype(self._buffer['reward'].dtype).reshape(
+                batch_size, -1),
+            next_observation=self._buffer['next_observation'][last_idx],
+            discount=discount**n_steps)
+        if terminal_arr is not None:
+            n_step_transitions['terminal'] = dones.astype(
+                terminal_arr.dtype).reshape(batch_size, -1)
+        return n_step_transitions
 
     def _next_path_segments(self, n_indices):
         """Compute where the next path should be stored.
@@ -141,6 +237,7 @@ class PathBuffer:
         self._first_idx_of_next_path = 0
         self._path_segments.clear()
         self._buffer.clear()
+        self._steps_to_path_end[:] = 0
 
     @staticmethod
     def _get_path_length(path):
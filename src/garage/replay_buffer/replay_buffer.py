@@ -35,16 +35,18 @@ class ReplayBuffer(metaclass=abc.ABCMeta):
         self._size = size_in_transitions // time_horizon
         self._initialized_buffer = False
         self._buffer = {}
+        # Episodes being added, with shape (rollout_batch_size, time_horizon,
+        # ...) for each key, and the time step of the next transitions.
         self._episode_buffer = {}
+        self._episode_step = 0
 
     def store_episode(self):
         """Add an episode to the buffer."""
-        episode_buffer = self._convert_episode_to_batch_major()
-        rollout_batch_size = len(episode_buffer['observation'])
+        rollout_batch_size = len(self._episode_buffer['observation'])
         idx = self._get_storage_idx(rollout_batch_size)
 
         for key in self._buffer:
-            self._buffer[key][idx] = episode_buffer[key]
+            self._buffer[key][idx] = self._episode_buffer[key]
         self._n_transitions_stored = min(
             self._size_in_transitions, self._n_transitions_stored +
             self._time_horizon * rollout_batch_size)
@@ -79,6 +81,12 @@ class ReplayBuffer(metaclass=abc.ABCMeta):
         {'observation': [obs1, obs2, obs3]} where obs1 is one
         numpy.ndarray observation from the environment.
 
+        The transitions are written into a preallocated episode array, at
+        the current time step of each episode. Every call must add the same
+        number of transitions, one per episode. Episodes are only copied to
+        the buffer once complete, since the buffer rows they replace can
+        still be sampled until then.
+
         Args:
             kwargs (dict(str, [numpy.ndarray])): Dictionary that holds
                 the transitions.
@@ -86,24 +94,32 @@ class ReplayBuffer(metaclass=abc.ABCMeta):
         """
         if not self._initialized_buffer:
             self._initialize_buffer(**kwargs)
+        if not self._episode_buffer:
+            self._initialize_episode_buffer(**kwargs)
 
         for key, value in kwargs.items():
-            self._episode_buffer[key].append(value)
+            self._episode_buffer[key][:, self._episode_step] = value
+        self._episode_step += 1
 
-        if len(self._episode_buffer['observation']) == self._time_horizon:
+        if self._episode_step == self._time_horizon:
             self.store_episode()
-            for key in self._episode_buffer:
-                self._episode_buffer[key].clear()
+            self._episode_step = 0
 
     def _initialize_buffer(self, **kwargs):
         for key, value in kwargs.items():
-            self._episode_buffer[key] = list()
             values = np.array(value)
             self._buffer[key] = np.zeros(
                 [self._size, self._time_horizon, *values.shape[1:]],
                 dtype=values.dtype)
         self._initialized_buffer = True
 
+    def _initialize_episode_buffer(self, **kwargs):
+        for key, value in kwargs.items():
+            values = np.array(value)
+            self._episode_buffer[key] = np.zeros(
+                [len(values), self._time_horizon, *values.shape[1:]],
+                dtype=values.dtype)
+
     def _get_storage_idx(self, size_increment=1):
         """Get the storage index for the episode to add into the buffer.
 
@@ -145,22 +161,30 @@ class ReplayBuffer(metaclass=abc.ABCMeta):
 
         return idx
 
-    def _convert_episode_to_batch_major(self):
-        """Convert the shape of episode_buffer.
+    def __setstate__(self, state):
+        """Object.__setstate__.
 
-        episode_buffer: {time_horizon, algo.rollout_batch_size, flat_dim}.
-        buffer: {size, time_horizon, flat_dim}.
+        Buffers pickled by earlier versions of garage kept a list of
+        transitions for each key of the episode being added, and are
+        converted to episode arrays.
 
-        Returns:
-            dict: Transitions that have been formated to fit properly in this
-                replay buffer.
+        Args:
+            state (dict): Unpickled state.
 
         """
-        transitions = {}
-        for key in self._episode_buffer:
-            val = np.array(self._episode_buffer[key])
-            transitions[key] = val.swapaxes(0, 1)
-        return transitions
+        self.__dict__ = state
+        if '_episode_step' not in state:
+            episode_buffer = self._episode_buffer
+            self._episode_buffer = {}
+            self._episode_step = len(episode_buffer.get('observation', []))
+            if self._episode_step:
+                for key, value in episode_buffer.items():
+                    # (time step, episode, ...) -> (episode, time step, ...)
+                    values = np.array(value).swapaxes(0, 1)
+                    self._episode_buffer[key] = np.zeros(
+                        [len(values), self._time_horizon, *values.shape[2:]],
+                        dtype=values.dtype)
+                    self._episode_buffer[key][:, :self._episode_step] = values
 
     @property
     def full(self):
@@ -1,6 +1,7 @@
 """This module implements a simple replay buffer."""
 import numpy as np
 
+from garage.replay_buffer.n_step import n_step_returns
 from garage.replay_buffer.replay_buffer import ReplayBuffer
 
 
@@ -10,8 +11,30 @@ class SimpleReplayBuffer(ReplayBuffer):
     It uses random batch sample to minimize correlations between samples.
     """
 
-    def sample(self, batch_size):
-        """Sample a transition of batch_size."""
+    def sample(self, batch_size, n_step=1, discount=1.):
+        """Sample a transition of batch_size.
+
+        If n_step is greater than 1, each sampled transition is extended to
+        the following steps of its stored episode: `reward` holds the
+        discounted sum of up to n_step rewards, and `next_observation` and
+        `terminal` are the ones of the last summed step. Summing stops
+        early at a terminal step, at a step whose `complete` entry is set
+        (if transitions were added with one, e.g. for episodes ending at a
+        time limit), or at the end of the stored episode. The returned
+        `discount` holds the discount of the bootstrapped value,
+        `discount ** k` for k summed rewards.
+
+        Args:
+            batch_size (int): The number of transitions to be sampled.
+            n_step (int): Number of steps of the returns.
+            discount (float): Discount factor of the n-step returns. Only
+                used if n_step is greater than 1.
+
+        Returns:
+            dict[numpy.ndarray]: Transitions which transitions[key] has the
+                shape of :math:`(N, S^*)`.
+
+        """
         assert self._n_transitions_stored >= batch_size
         buffer = {}
         for key in self._buffer:
@@ -29,5 +52,55 @@ class SimpleReplayBuffer(ReplayBuffer):
             samples = buffer[key][episode_idxs, t_samples]
             transitions[key] = samples.reshape(batch_size, *samples.shape[1:])
 
+        if n_step > 1:
+            transitions.update(
+                self._sample_n_step(buffer, episode_idxs, t_samples, n_step,
+                                    discount))
+
         assert transitions['action'].shape[0] == batch_size
         return transitions
+
+    @staticmethod
+    def _sample_n_step(buffer, episode_idxs, t_samples, n_step, discount):
+        """Compute the n-step entries of sampled transitions.
+
+        Args:
+            buffer (dict[numpy.ndarray]): Stored episodes.
+            episode_idxs (numpy.ndarray): Sampled episode indices.
+            t_samples (numpy.ndarray): Sampled time steps.
+            n_step (int): Number of steps of the returns.
+            discount (float): Discount factor.
+
+        Returns:
+            dict[numpy.ndarray]: The `reward`, `terminal`,
+                `next_observation` and `discount` of the transitions.
+
+        """
+        batch_size = len(episode_idxs)
+        time_horizon = buffer['reward'].shape[1]
+        steps = t_samples[:, np.newaxis] + np.arange(n_step)
+        valid = steps < time_horizon
+        steps = np.minimum(steps, time_horizon - 1)
+        rows = episode_idxs[:, np.newaxis]
+        rewards = buffer['reward'][rows, steps].reshape(batch_size, n_step)
+        terminals = buffer['terminal'][rows, steps].reshape(batch_size, n_step)
+        completes = None
+        if 'complete' in buffer:
+            completes = buffer['complete'][rows,
+                                           steps].reshape(batch_size, n_step)
+        returns, n_steps, dones = n_step_returns(rewards,
+                                                 terminals,
+                                                 valid,
+                                                 discount,
+                                                 completes=completes)
+        last_steps = t_samples + n_steps - 1
+        reward_shape = (batch_size, *buffer['reward'].shape[2:])
+        terminal_shape = (batch_size, *buffer['terminal'].shape[2:])
+        return dict(
+            reward=returns.astype(buffer['reward'].dtype).reshape(
+                reward_shape),
+            terminal=dones.astype(buffer['terminal'].dtype).reshape(
+                terminal_shape),
+            next_observation=buffer['next_observation'][episode_idxs,
+                                                        last_steps],
+            discount=discount**n_steps)
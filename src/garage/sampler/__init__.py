@@ -1,26 +1,34 @@
 """Samplers which run agents in environments."""
-
-from garage.sampler.batch_sampler import BatchSampler
-from garage.sampler.default_worker import DefaultWorker
-from garage.sampler.is_sampler import ISSampler
-from garage.sampler.local_sampler import LocalSampler
-from garage.sampler.multiprocessing_sampler import MultiprocessingSampler
-from garage.sampler.off_policy_vectorized_sampler import (
-    OffPolicyVectorizedSampler)
-from garage.sampler.on_policy_vectorized_sampler import (
-    OnPolicyVectorizedSampler)
-from garage.sampler.parallel_vec_env_executor import ParallelVecEnvExecutor
-from garage.sampler.ray_sampler import RaySampler
-from garage.sampler.sampler import Sampler
-from garage.sampler.stateful_pool import singleton_pool
-from garage.sampler.vec_env_executor import VecEnvExecutor
-from garage.sampler.vec_worker import VecWorker
-from garage.sampler.worker import Worker
-from garage.sampler.worker_factory import WorkerFactory
+from garage._lazy import lazy_import
 
 __all__ = [
     'BatchSampler', 'Sampler', 'ISSampler', 'singleton_pool', 'LocalSampler',
     'RaySampler', 'MultiprocessingSampler', 'ParallelVecEnvExecutor',
     'VecEnvExecutor', 'VecWorker', 'OffPolicyVectorizedSampler',
-    'OnPolicyVectorizedSampler', 'WorkerFactory', 'Worker', 'DefaultWorker'
+    'OnPolicyVectorizedSampler', 'WorkerFactory', 'Worker', 'DefaultWorker',
+    'CPUResources', 'BatchEvaluator', 'WorkerPool', 'SubprocVecEnvExecutor'
 ]
+
+_ATTRIBUTES = {
+    'BatchEvaluator': 'batch_evaluator',
+    'BatchSampler': 'batch_sampler',
+    'CPUResources': 'cpu_resources',
+    'DefaultWorker': 'default_worker',
+    'ISSampler': 'is_sampler',
+    'LocalSampler': 'local_sampler',
+    'MultiprocessingSampler': 'multiprocessing_sampler',
+    'OffPolicyVectorizedSampler': 'off_policy_vectorized_sampler',
+    'OnPolicyVectorizedSampler': 'on_policy_vectorized_sampler',
+    'ParallelVecEnvExecutor': 'parallel_vec_env_executor',
+    'RaySampler': 'ray_sampler',
+    'Sampler': 'sampler',
+    'singleton_pool': 'stateful_pool',
+    'SubprocVecEnvExecutor': 'subproc_vec_env_executor',
+    'VecEnvExecutor': 'vec_env_executor',
+    'VecWorker': 'vec_worker',
+    'Worker': 'worker',
+    'WorkerFactory': 'worker_factory',
+    'WorkerPool': 'worker_pool',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
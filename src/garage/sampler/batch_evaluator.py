@@ -0,0 +1,211 @@
+"""Evaluator which runs evaluation rollouts in a batch of environments."""
+import concurrent.futures
+import copy
+
+import cloudpickle
+import numpy as np
+
+from garage import TrajectoryBatch
+from garage.misc import tensor_utils
+
+
+class BatchEvaluator:
+    """Runs evaluation rollouts of a policy in several environment copies.
+
+    All environment copies are stepped together, and the actions of all of
+    them are computed with a single `get_actions` call per time step,
+    instead of one `get_action` call per step of each rollout.
+
+    Rollouts are assigned to copies round-robin (rollout i runs in copy
+    i % n_envs), and copy i is taken from env after i resets. Therefore,
+    copies of environments which change on reset, such as a MultiEnvWrapper
+    with a round-robin strategy, start from different tasks. If n_envs is a
+    multiple of the number of tasks and divides the number of
+    trajectories, every task is evaluated equally often.
+
+    Evaluation can also run in a background thread with `start`, on a copy
+    of the policy, while training continues.
+
+    Args:
+        env (garage.envs.GarageEnv): Environment to evaluate the policy in.
+            It is reset while taking copies.
+        n_envs (int): Number of environment copies.
+        max_path_length (int): Maximum length of rollouts.
+
+    """
+
+    def __init__(self, env, n_envs, max_path_length):
+        self._env = env
+        self._n_envs = n_envs
+        self._max_path_length = max_path_length
+        self._envs = None
+        self._executor = None
+
+    def evaluate(self, policy, n_trajs, deterministic=True):
+        """Run evaluation rollouts of a policy.
+
+        Args:
+            policy (garage.Policy): Policy to evaluate. Must implement
+                `get_actions`.
+            n_trajs (int): Number of trajectories.
+            deterministic (bool): If True, use the mean action of the policy
+                (from the `mean` agent info) when it is available.
+
+        Returns:
+            TrajectoryBatch: Evaluation trajectories, in order of
+                completion.
+
+        """
+        envs = self._get_envs()[:n_trajs]
+        # Number of rollouts left to start in each environment copy.
+        n_left = [
+            len(range(i, n_trajs, len(envs))) for i in range(len(envs))
+        ]
+        paths = []
+        active = []
+        for i, env in enumerate(envs):
+            if n_left[i]:
+                active.append(_Rollout(env))
+                n_left[i] -= 1
+        slots = list(range(len(active)))
+        policy.reset()
+        while active:
+            obs = np.stack([r.obs for r in active])
+            actions, agent_infos = policy.get_actions(obs)
+            if deterministic and 'mean' in agent_infos:
+                actions = agent_infos['mean']
+            still_active, still_slots = [], []
+            for j, (slot, r) in enumerate(zip(slots, active)):
+                done = r.step(actions[j],
+                              {k: v[j]
+                               for k, v in agent_infos.items()},
+                              self._max_path_length)
+                if not done:
+                    still_active.append(r)
+                    still_slots.append(slot)
+                    continue
+                paths.append(r.to_path())
+                if n_left[slot]:
+                    n_left[slot] -= 1
+                    still_active.append(_Rollout(envs[slot]))
+                    still_slots.append(slot)
+            active, slots = still_active, still_slots
+        return TrajectoryBatch.from_trajectory_list(self._env.spec, paths)
+
+    def start(self, policy, n_trajs, deterministic=True):
+        """Start evaluating a copy of a policy in a background thread.
+
+        The policy is copied before this returns, so it can be trained while
+        the evaluation runs. Only one evaluation runs at a time.
+
+        Args:
+            policy (garage.Policy): Policy to evaluate.
+            n_trajs (int): Number of trajectories.
+            deterministic (bool): If True, use the mean action of the policy.
+
+        Returns:
+            concurrent.futures.Future: Future of the TrajectoryBatch.
+
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1)
+        return self._executor.submit(self.evaluate, copy.deepcopy(policy),
+                                     n_trajs, deterministic)
+
+    def _get_envs(self):
+        """Get the environment copies, creating them if needed.
+
+        Returns:
+            list[gym.Env]: Environment copies.
+
+        """
+        if self._envs is None:
+            self._envs = []
+            for _ in range(self._n_envs):
+                self._envs.append(cloudpickle.loads(
+                    cloudpickle.dumps(self._env)))
+                self._env.reset()
+        return self._envs
+
+    def shutdown(self):
+        """Wait for background evaluation and close the environments."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._envs is not None:
+            for env in self._envs:
+                env.close()
+            self._envs = None
+
+    def __getstate__(self):
+        """Object.__getstate__.
+
+        Returns:
+            dict: The state to be pickled for the instance. Environment
+                copies and the background thread are not pickled.
+
+        """
+        data = self.__dict__.copy()
+        data['_envs'] = None
+        data['_executor'] = None
+        return data
+
+
+class _Rollout:
+    """A rollout in progress in one environment copy.
+
+    Args:
+        env (gym.Env): Environment of the rollout. It is reset.
+
+    """
+
+    def __init__(self, env):
+        self._env = env
+        self.obs = env.observation_space.flatten(env.reset())
+        self._observations = []
+        self._actions = []
+        self._rewards = []
+        self._agent_infos = []
+        self._env_infos = []
+        self._dones = []
+
+    def step(self, action, agent_info, max_path_length):
+        """Take a step of the rollout.
+
+        Args:
+            action (np.ndarray): Action.
+            agent_info (dict[str, np.ndarray]): Agent info of the action.
+            max_path_length (int): Maximum length of the rollout.
+
+        Returns:
+            bool: True if the rollout is complete.
+
+        """
+        next_o, r, d, env_info = self._env.step(action)
+        self._observations.append(self.obs)
+        self._actions.append(action)
+        self._rewards.append(r)
+        self._agent_infos.append(agent_info)
+        self._env_infos.append(env_info)
+        self._dones.append(d)
+        self.obs = self._env.observation_space.flatten(next_o)
+        return d or len(self._rewards) >= max_path_length
+
+    def to_path(self):
+        """Get the rollout as a path.
+
+        Returns:
+            dict: A path, in the format returned by
+                `garage.sampler.utils.rollout`.
+
+        """
+        return dict(
+            observations=np.array(self._observations),
+            actions=np.array(self._actions),
+            rewards=np.array(self._rewards),
+            agent_infos=tensor_utils.stack_tensor_dict_list(
+                self._agent_infos),
+            env_infos=tensor_utils.stack_tensor_dict_list(self._env_infos),
+            dones=np.array(self._dones),
+        )
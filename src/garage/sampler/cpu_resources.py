@@ -0,0 +1,223 @@
+"""Assignment of CPU cores and thread counts to the trainer and workers."""
+import os
+import sys
+
+from dowel import tabular
+import numpy as np
+import psutil
+
+# Environment variables read by BLAS and OpenMP runtimes when they start.
+_THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS',
+                    'OPENBLAS_NUM_THREADS', 'NUMEXPR_NUM_THREADS',
+                    'VECLIB_MAXIMUM_THREADS')
+
+
+class CPUResources:
+    """Assigns CPU cores and thread counts to the trainer and workers.
+
+    By default, every sampler worker process and the trainer create thread
+    pools (OpenMP, BLAS, PyTorch and TensorFlow) as large as the number of
+    cores, so N workers oversubscribe the cores N times. This class splits
+    the cores available to the process into a set reserved for the trainer
+    and disjoint sets for the workers, pins each process to its set, and
+    limits its thread pools to the size of its set.
+
+    When there are more workers than unreserved cores, workers share cores
+    round-robin and use a single thread each. When the sampler runs its
+    workers in the trainer process (e.g. LocalSampler), there are no worker
+    processes, and the trainer gets all cores.
+
+    Pass an instance to `LocalRunner.setup`, which allocates the cores and
+    configures the trainer process. Sampler worker processes configure
+    themselves through their `WorkerFactory`.
+
+    Args:
+        n_trainer_cpus (int): Number of cores reserved for the trainer. If
+            this leaves no core for the workers, workers use all cores.
+        threads_per_worker (int or None): Number of threads of each worker.
+            If None, it is the number of cores of the worker.
+        pin (bool): Whether processes are pinned to their cores. Pinning is
+            skipped on platforms which do not support it.
+
+    """
+
+    def __init__(self, n_trainer_cpus=1, threads_per_worker=None, pin=True):
+        self._n_trainer_cpus = n_trainer_cpus
+        self._threads_per_worker = threads_per_worker
+        self._pin = pin
+        self._trainer_cpus = None
+        self._worker_cpus = None
+        # pid -> psutil.Process, kept to measure CPU usage across calls.
+        self._processes = {}
+
+    def allocate(self, n_workers):
+        """Assign cores to the trainer and to each worker.
+
+        Args:
+            n_workers (int): Number of sampler worker processes. If 0, the
+                trainer gets all cores.
+
+        """
+        cpus = _available_cpus()
+        if n_workers == 0:
+            self._trainer_cpus = cpus
+            self._worker_cpus = []
+            return
+        n_trainer_cpus = min(self._n_trainer_cpus, len(cpus))
+        self._trainer_cpus = cpus[:n_trainer_cpus]
+        pool = cpus[n_trainer_cpus:] or cpus
+        if n_workers <= len(pool):
+            self._worker_cpus = [
+                chunk.tolist()
+                for chunk in np.array_split(np.array(pool), n_workers)
+            ]
+        else:
+            self._worker_cpus = [[pool[i % len(pool)]]
+                                 for i in range(n_workers)]
+
+    @property
+    def trainer_cpus(self):
+        """list[int]: Cores of the trainer, or None before `allocate`."""
+        return self._trainer_cpus
+
+    @property
+    def worker_cpus(self):
+        """list[list[int]]: Cores of each worker, or None before `allocate`."""
+        return self._worker_cpus
+
+    def configure_trainer(self):
+        """Pin the current process to the trainer cores and limit threads.
+
+        Raises:
+            ValueError: If the cores have not been allocated.
+
+        """
+        self._check_allocated()
+        self._configure_process(self._trainer_cpus,
+                                len(self._trainer_cpus))
+
+    def configure_worker(self, worker_number):
+        """Pin the current process to the cores of a worker.
+
+        This must be called in the worker process, before the worker is
+        constructed.
+
+        Args:
+            worker_number (int): Number of the worker.
+
+        Raises:
+            ValueError: If the cores have not been allocated.
+
+        """
+        self._check_allocated()
+        cpus = self._worker_cpus[worker_number % len(self._worker_cpus)]
+        n_threads = self._threads_per_worker or len(cpus)
+        self._configure_process(cpus, n_threads)
+
+    def _check_allocated(self):
+        """Check that the cores have been allocated.
+
+        Raises:
+            ValueError: If the cores have not been allocated.
+
+        """
+        if self._trainer_cpus is None:
+            raise ValueError('allocate() must be called before configuring '
+                             'a process.')
+
+    def _configure_process(self, cpus, n_threads):
+        """Pin the current process to cores and limit its thread pools.
+
+        Args:
+            cpus (list[int]): Cores of the process.
+            n_threads (int): Number of threads of each thread pool.
+
+        """
+        if self._pin:
+            try:
+                psutil.Process().cpu_affinity(cpus)
+            except (AttributeError, OSError, ValueError):
+                # cpu_affinity is not available on macOS.
+                pass
+        _set_thread_counts(n_threads)
+
+    def record_utilization(self):
+        """Record CPU utilization of the trainer and its children.
+
+        Utilization is measured since the previous call, in percent of one
+        core, and recorded in the tabular logs. Child processes of the
+        trainer, such as the workers of MultiprocessingSampler, are
+        measured. Ray workers are started by Ray's own processes, so they
+        are not.
+
+        """
+        trainer = psutil.Process()
+        procs = [trainer] + trainer.children(recursive=True)
+        usage = {}
+        for proc in procs:
+            proc = self._processes.setdefault(proc.pid, proc)
+            try:
+                usage[proc.pid] = proc.cpu_percent()
+            except psutil.NoSuchProcess:
+                pass
+        self._processes = {
+            pid: proc
+            for pid, proc in self._processes.items() if pid in usage
+        }
+        children = [u for pid, u in usage.items() if pid != trainer.pid]
+        with tabular.prefix('CPU/'):
+            tabular.record('Trainer', usage.get(trainer.pid, 0.))
+            tabular.record('NumChildProcesses', len(children))
+            tabular.record('ChildMean',
+                           np.mean(children) if children else 0.)
+            tabular.record('ChildMin', np.min(children) if children else 0.)
+            tabular.record('ChildMax', np.max(children) if children else 0.)
+            tabular.record('Total', sum(usage.values()))
+
+    def __getstate__(self):
+        """Object.__getstate__.
+
+        Returns:
+            dict: The state to be pickled for the instance.
+
+        """
+        data = self.__dict__.copy()
+        data['_processes'] = {}
+        return data
+
+
+def _available_cpus():
+    """Get the cores the current process may run on.
+
+    Returns:
+        list[int]: Sorted core ids.
+
+    """
+    try:
+        return sorted(psutil.Process().cpu_affinity())
+    except AttributeError:
+        return list(range(psutil.cpu_count()))
+
+
+def _set_thread_counts(n_threads):
+    """Limit the thread pools of the current process.
+
+    Environment variables only affect runtimes which have not started yet,
+    so PyTorch and TensorFlow are also configured if already imported.
+
+    Args:
+        n_threads (int): Number of threads of each thread pool.
+
+    """
+    for var in _THREAD_ENV_VARS:
+        os.environ[var] = str(n_threads)
+    if 'torch' in sys.modules:
+        sys.modules['torch'].set_num_threads(n_threads)
+    if 'tensorflow' in sys.modules:
+        threading = sys.modules['tensorflow'].config.threading
+        try:
+            threading.set_intra_op_parallelism_threads(n_threads)
+            threading.set_inter_op_parallelism_threads(n_threads)
+        except RuntimeError:
+            # TensorFlow has already been initialized.
+            pass
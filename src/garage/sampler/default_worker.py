@@ -132,6 +132,16 @@ class DefaultWorker(Worker):
         self._last_observations.append(self._prev_obs)
         return True
 
+    def truncate_rollout(self):
+        """End the current rollout before it is done.
+
+        The rollout ends as if it reached `max_path_length`: its last step
+        is not marked as terminal.
+
+        """
+        self._lengths.append(self._path_length)
+        self._last_observations.append(self._prev_obs)
+
     def collect_rollout(self):
         """Collect the current rollout, clearing the internal buffer.
 
@@ -143,9 +143,16 @@ class LocalSampler(Sampler):
                 then all trajectories from worker 1, etc.
 
         """
-        self._update_workers(agent_update, env_update)
+        agent_updates = self._factory.prepare_worker_messages(agent_update)
+        env_updates = self._factory.prepare_worker_messages(
+            env_update, preprocess=copy.deepcopy)
         batches = []
-        for worker in self._workers:
+        # Update each worker just before its rollouts, since workers may share
+        # the same agent.
+        for worker, agent_up, env_up in zip(self._workers, agent_updates,
+                                            env_updates):
+            worker.update_agent(agent_up)
+            worker.update_env(env_up)
             for _ in range(n_traj_per_worker):
                 batch = worker.rollout()
                 batches.append(batch)
@@ -5,11 +5,13 @@ import multiprocessing as mp
 import queue
 
 import cloudpickle
+from dowel import tabular
 import setproctitle
 
 from garage import TrajectoryBatch
 from garage.misc.prog_bar_counter import ProgBarCounter
 from garage.sampler.sampler import Sampler
+from garage.sampler.worker_pool import rebuild_worker
 
 
 class MultiprocessingSampler(Sampler):
@@ -86,6 +88,47 @@ class MultiprocessingSampler(Sampler):
         """
         return cls(worker_factory, agents, envs)
 
+    def reconfigure(self, worker_factory, agents, envs):
+        """Construct the workers again, in their existing processes.
+
+        Args:
+            worker_factory(WorkerFactory): Pickleable factory for creating
+                workers. Must have the same number of workers.
+            agents(Agent or List[Agent]): Agent(s) to use to perform rollouts.
+                If a list is passed in, it must have length exactly
+                `worker_factory.n_workers`, and will be spread across the
+                workers.
+            envs(gym.Env or List[gym.Env]): Environment rollouts are performed
+                in. If a list is passed in, it must have length exactly
+                `worker_factory.n_workers`, and will be spread across the
+                workers.
+
+        Raises:
+            ValueError: If the number of workers is different.
+            RuntimeError: If a worker process has exited.
+
+        """
+        if worker_factory.n_workers != self._factory.n_workers:
+            raise ValueError('Workers can only be reconfigured with the same '
+                             'number of workers.')
+        self._factory = worker_factory
+        self._agents = self._factory.prepare_worker_messages(
+            agents, cloudpickle.dumps)
+        self._envs = self._factory.prepare_worker_messages(envs)
+        for worker_number, q in enumerate(self._to_worker):
+            message = ('reconfigure',
+                       (self._factory, self._agents[worker_number],
+                        cloudpickle.dumps(self._envs[worker_number])))
+            # Wait until the worker has read its previous message.
+            while True:
+                try:
+                    q.put(message, timeout=1)
+                    break
+                except queue.Full:
+                    if not self._workers[worker_number].is_alive():
+                        raise RuntimeError(
+                            'Worker {} has exited.'.format(worker_number))
+
     def _push_updates(self, updated_workers, agent_updates, env_updates):
         """Apply updates to the workers and (re)start them.
 
@@ -138,51 +181,89 @@ class MultiprocessingSampler(Sampler):
         Returns:
             garage.TrajectoryBatch: The batch of collected trajectories.
 
+        """
+        return TrajectoryBatch.concatenate(
+            *self.iter_samples(itr, num_samples, agent_update, env_update))
+
+    def iter_samples(self, itr, num_samples, agent_update, env_update=None):
+        """Collect at least a given number transitions, as they arrive.
+
+        Each trajectory is yielded as soon as a worker returns it, so the
+        caller can process it while the workers keep sampling. The workers
+        are stopped once enough transitions are collected, or when the
+        generator is closed.
+
+        The number of steps sampled beyond num_samples, and of steps
+        sampled with a previous agent and discarded, are recorded in the
+        tabular logs, under `Sampler/`.
+
+        Args:
+            itr(int): The current iteration number. Using this argument is
+                deprecated.
+            num_samples(int): Minimum number of transitions / timesteps to
+                sample.
+            agent_update(object): Value which will be passed into the
+                `agent_update_fn` before doing rollouts. If a list is passed
+                in, it must have length exactly `factory.n_workers`, and will
+                be spread across the workers.
+            env_update(object): Value which will be passed into the
+                `env_update_fn` before doing rollouts. If a list is passed in,
+                it must have length exactly `factory.n_workers`, and will be
+                spread across the workers.
+
+        Yields:
+            garage.TrajectoryBatch: Batches of collected trajectories.
+
         Raises:
             AssertionError: On internal errors.
 
         """
         del itr
         pbar = ProgBarCounter(num_samples)
-        batches = []
         completed_samples = 0
+        stale_samples = 0
         self._agent_version += 1
         updated_workers = set()
         agent_ups = self._factory.prepare_worker_messages(
             agent_update, cloudpickle.dumps)
         env_ups = self._factory.prepare_worker_messages(env_update)
 
-        while completed_samples < num_samples:
-            self._push_updates(updated_workers, agent_ups, env_ups)
-            for _ in range(self._factory.n_workers):
-                try:
-                    tag, contents = self._to_sampler.get_nowait()
-                    if tag == 'trajectory':
-                        batch, version, worker_n = contents
-                        del worker_n
-                        if version == self._agent_version:
-                            batches.append(batch)
-                            num_returned_samples = batch.lengths.sum()
-                            completed_samples += num_returned_samples
-                            pbar.inc(num_returned_samples)
-                        else:
-                            # Receiving paths from previous iterations is
-                            # normal.  Potentially, we could gather them here,
-                            # if an off-policy method wants them.
-                            pass
-                    else:
+        try:
+            while completed_samples < num_samples:
+                self._push_updates(updated_workers, agent_ups, env_ups)
+                for _ in range(self._factory.n_workers):
+                    try:
+                        tag, contents = self._to_sampler.get_nowait()
+                    except queue.Empty:
+                        continue
+                    if tag != 'trajectory':
                         raise AssertionError(
                             'Unknown tag {} with contents {}'.format(
                                 tag, contents))
-                except queue.Empty:
+                    batch, version, worker_n = contents
+                    del worker_n
+                    if version == self._agent_version:
+                        num_returned_samples = batch.lengths.sum()
+                        completed_samples += num_returned_samples
+                        pbar.inc(num_returned_samples)
+                        yield batch
+                        if completed_samples >= num_samples:
+                            break
+                    else:
+                        # Receiving paths from previous iterations is
+                        # normal.  Potentially, we could gather them here,
+                        # if an off-policy method wants them.
+                        stale_samples += batch.lengths.sum()
+        finally:
+            for q in self._to_worker:
+                try:
+                    q.put_nowait(('stop', ()))
+                except queue.Full:
                     pass
-        for q in self._to_worker:
-            try:
-                q.put_nowait(('stop', ()))
-            except queue.Full:
-                pass
-        pbar.stop()
-        return TrajectoryBatch.concatenate(*batches)
+            pbar.stop()
+        with tabular.prefix('Sampler/'):
+            tabular.record('Overshoot', completed_samples - num_samples)
+            tabular.record('StaleSteps', stale_samples)
 
     def obtain_exact_trajectories(self,
                                   n_traj_per_worker,
@@ -306,6 +387,8 @@ def run_worker(factory, to_worker, to_sampler, worker_number, agent, env):
     process.
     When it receives a "stop" message, or the queue back to the parent process
     is full, it enters the "not streaming" state.
+    When it receives a "reconfigure" message, it constructs its worker again,
+    and enters the "not streaming" state.
     When it receives the "exit" message, it terminates.
 
     Critically, the worker never blocks on sending messages back to the
@@ -342,6 +425,7 @@ def run_worker(factory, to_worker, to_sampler, worker_number, agent, env):
     to_sampler.cancel_join_thread()
     setproctitle.setproctitle('worker:' + setproctitle.getproctitle())
 
+    factory.configure_process(worker_number)
     inner_worker = factory(worker_number)
     inner_worker.update_agent(cloudpickle.loads(agent))
     inner_worker.update_env(env)
@@ -370,6 +454,12 @@ def run_worker(factory, to_worker, to_sampler, worker_number, agent, env):
             streaming_samples = True
         elif tag == 'stop':
             streaming_samples = False
+        elif tag == 'reconfigure':
+            factory, agent, env_pkl = contents
+            inner_worker = rebuild_worker(inner_worker, factory,
+                                          worker_number,
+                                          cloudpickle.loads(agent), env_pkl)
+            streaming_samples = False
         elif tag == 'continue':
             batch = inner_worker.rollout()
             try:
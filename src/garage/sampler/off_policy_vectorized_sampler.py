@@ -8,7 +8,6 @@ It diffs from OnPolicyVectorizedSampler in two parts:
  - It needs to add transitions to replay buffer throughout the rollout.
 """
 
-import itertools
 import warnings
 
 import cloudpickle
@@ -17,6 +16,7 @@ import numpy as np
 from garage.experiment import deterministic
 from garage.misc import tensor_utils
 from garage.sampler.batch_sampler import BatchSampler
+from garage.sampler.subproc_vec_env_executor import SubprocVecEnvExecutor
 from garage.sampler.vec_env_executor import VecEnvExecutor
 
 
@@ -28,23 +28,29 @@ class OffPolicyVectorizedSampler(BatchSampler):
         env (garage.envs.GarageEnv): Environment.
         n_envs (int): Number of parallel environments managed by sampler.
         no_reset (bool): Reset environment between samples or not.
+        n_workers (int or None): Number of subprocesses to step the
+            environments in, with a SubprocVecEnvExecutor. If None, the
+            environments are stepped in this process.
 
     """
 
-    def __init__(self, algo, env, n_envs=None, no_reset=True):
+    def __init__(self, algo, env, n_envs=None, no_reset=True, n_workers=None):
         if n_envs is None:
             n_envs = int(algo.rollout_batch_size)
         super().__init__(algo, env)
         self._n_envs = n_envs
+        self._n_workers = n_workers
         self._no_reset = no_reset
 
         self._vec_env = None
         self._env_spec = self.env.spec
 
         self._last_obses = None
-        self._last_uncounted_discount = [0] * n_envs
-        self._last_running_length = [0] * n_envs
-        self._last_success_count = [0] * n_envs
+        # Statistics of the path running in each environment, which may
+        # have started in an earlier batch.
+        self._last_uncounted_discount = np.zeros(n_envs)
+        self._last_running_length = np.zeros(n_envs, dtype=int)
+        self._last_success_count = np.zeros(n_envs)
 
         warnings.warn(
             DeprecationWarning(
@@ -67,17 +73,27 @@ class OffPolicyVectorizedSampler(BatchSampler):
             for (i, e) in enumerate(envs):
                 e.seed(seed0 + i)
 
-        self._vec_env = VecEnvExecutor(
-            envs=envs, max_path_length=self.algo.max_path_length)
+        if self._n_workers is None:
+            self._vec_env = VecEnvExecutor(
+                envs=envs, max_path_length=self.algo.max_path_length)
+        else:
+            self._vec_env = SubprocVecEnvExecutor(
+                envs=envs,
+                max_path_length=self.algo.max_path_length,
+                n_workers=self._n_workers)
 
     def shutdown_worker(self):
         """Terminate workers if necessary."""
         self._vec_env.close()
 
-    # pylint: disable=too-many-branches, too-many-statements
     def obtain_samples(self, itr, batch_size=None, whole_paths=True):
         """Collect samples for the given iteration number.
 
+        Transitions are added to the replay buffer of the algorithm one step
+        of all environments at a time. The rewards, dones and environment
+        infos of each step are written into arrays preallocated for the
+        whole batch, and split into paths once the batch is complete.
+
         Args:
             itr(int): Iteration number.
             batch_size(int): Number of environment interactions in one batch.
@@ -94,38 +110,31 @@ class OffPolicyVectorizedSampler(BatchSampler):
         """
         assert batch_size is not None
 
-        paths = []
         if not self._no_reset or self._last_obses is None:
             obses = self._vec_env.reset()
         else:
             obses = self._last_obses
         completes = np.asarray([True] * self._vec_env.num_envs)
-        running_paths = [None] * self._vec_env.num_envs
-        n_samples = 0
+        n_steps = -(-batch_size // self._vec_env.num_envs)
+        step_rewards = np.zeros((n_steps, self._vec_env.num_envs))
+        step_dones = np.zeros((n_steps, self._vec_env.num_envs), dtype=bool)
+        step_env_infos = None
 
         policy = self.algo.exploration_policy
         if policy is None:
             raise ValueError('OffPolicyVectoriizedSampler should only be used '
                              'with an exploration_policy.')
-        while n_samples < batch_size:
+        obs_space = self.algo.env_spec.observation_space
+        for step in range(n_steps):
             policy.reset(completes)
-            obs_space = self.algo.env_spec.observation_space
             input_obses = obs_space.flatten_n(obses)
 
-            actions, agent_infos = policy.get_actions(input_obses)
+            actions, _ = policy.get_actions(input_obses)
 
             next_obses, rewards, dones, env_infos = \
                 self._vec_env.step(actions)
             completes = env_infos['vec_env_executor.complete']
             self._last_obses = next_obses
-            agent_infos = tensor_utils.split_tensor_dict_list(agent_infos)
-            env_infos = tensor_utils.split_tensor_dict_list(env_infos)
-            n_samples += len(next_obses)
-
-            if agent_infos is None:
-                agent_infos = [dict() for _ in range(self._vec_env.num_envs)]
-            if env_infos is None:
-                env_infos = [dict() for _ in range(self._vec_env.num_envs)]
 
             self.algo.replay_buffer.add_transitions(
                 observation=obses,
@@ -133,52 +142,121 @@ class OffPolicyVectorizedSampler(BatchSampler):
                 reward=rewards,
                 terminal=dones,
                 next_observation=next_obses,
+                complete=completes,
             )
 
-            for idx, reward, env_info, done in zip(itertools.count(), rewards,
-                                                   env_infos, dones):
-                if running_paths[idx] is None:
-                    running_paths[idx] = dict(
-                        rewards=[],
-                        env_infos=[],
-                        dones=[],
-                        undiscounted_return=self._last_uncounted_discount[idx],
-                        # running_length: Length of path up to now
-                        # Note that running_length is not len(rewards)
-                        # Because a path may not be complete in one batch
-                        running_length=self._last_running_length[idx],
-                        success_count=self._last_success_count[idx])
-
-                running_paths[idx]['rewards'].append(reward)
-                running_paths[idx]['env_infos'].append(env_info)
-                running_paths[idx]['dones'].append(done)
-                running_paths[idx]['running_length'] += 1
-                running_paths[idx]['undiscounted_return'] += reward
-                running_paths[idx]['success_count'] += env_info.get(
-                    'is_success') or 0
-
-                self._last_uncounted_discount[idx] += reward
-                self._last_success_count[idx] += env_info.get(
-                    'is_success') or 0
-                self._last_running_length[idx] += 1
-
-                if done or n_samples >= batch_size:
-                    paths.append(
-                        dict(
-                            rewards=np.asarray(running_paths[idx]['rewards']),
-                            dones=np.asarray(running_paths[idx]['dones']),
-                            env_infos=tensor_utils.stack_tensor_dict_list(
-                                running_paths[idx]['env_infos']),
-                            running_length=running_paths[idx]
-                            ['running_length'],
-                            undiscounted_return=running_paths[idx]
-                            ['undiscounted_return'],
-                            success_count=running_paths[idx]['success_count']))
-                    running_paths[idx] = None
-
-                    if done:
-                        self._last_running_length[idx] = 0
-                        self._last_success_count[idx] = 0
-                        self._last_uncounted_discount[idx] = 0
+            step_rewards[step] = rewards
+            step_dones[step] = dones
+            if step_env_infos is None:
+                step_env_infos = _allocate_env_infos(env_infos, n_steps)
+            _write_env_infos(step_env_infos, env_infos, step)
             obses = next_obses
+        return self._split_paths(step_rewards, step_dones, step_env_infos)
+
+    def _split_paths(self, rewards, dones, env_infos):
+        """Split the steps of a batch into paths.
+
+        Each environment's steps are split after each step which completes
+        a path, by a done signal or max_path_length, and after the last step
+        of the batch. A path that isn't complete continues in the next batch,
+        so the statistics of its running path are carried over.
+
+        Args:
+            rewards (np.ndarray): Rewards, with shape :math:`(S, N)` for S
+                steps of N environments.
+            dones (np.ndarray): Done signals, with shape :math:`(S, N)`.
+            env_infos (dict[str, np.ndarray]): Environment infos, with shape
+                :math:`(S, N, ...)`, including the complete signals of the
+                vector environment.
+
+        Returns:
+            list: A list of paths, in the order in which they ended.
+
+        """
+        successes = env_infos.get('is_success')
+        if successes is None:
+            successes = np.zeros_like(rewards)
+        completes = env_infos['vec_env_executor.complete']
+        ends = completes.copy()
+        ends[-1] = True
+        starts = np.zeros(len(self._last_running_length), dtype=int)
+        paths = []
+        # np.nonzero orders the ends by step, then by environment.
+        for step, idx in zip(*np.nonzero(ends)):
+            start, stop = starts[idx], step + 1
+            starts[idx] = stop
+            path_rewards = rewards[start:stop, idx]
+            self._last_uncounted_discount[idx] += path_rewards.sum()
+            self._last_running_length[idx] += stop - start
+            self._last_success_count[idx] += np.sum(successes[start:stop,
+                                                              idx])
+            paths.append(
+                dict(rewards=path_rewards,
+                     dones=dones[start:stop, idx],
+                     env_infos=tensor_utils.slice_nested_dict(
+                         _select_env(env_infos, idx), start, stop),
+                     running_length=self._last_running_length[idx],
+                     undiscounted_return=self._last_uncounted_discount[idx],
+                     success_count=self._last_success_count[idx]))
+            if completes[step, idx]:
+                self._last_running_length[idx] = 0
+                self._last_success_count[idx] = 0
+                self._last_uncounted_discount[idx] = 0
         return paths
+
+
+def _allocate_env_infos(env_infos, n_steps):
+    """Allocate arrays for the environment infos of a batch.
+
+    Args:
+        env_infos (dict[str, dict or np.ndarray]): Environment infos of one
+            step, with shape :math:`(N, ...)`.
+        n_steps (int): Number of steps in the batch.
+
+    Returns:
+        dict[str, dict or np.ndarray]: Zeroed environment infos, with shape
+            :math:`(S, N, ...)`.
+
+    """
+    return {
+        k: (_allocate_env_infos(v, n_steps) if isinstance(v, dict) else
+            np.zeros((n_steps, ) + np.shape(v), dtype=np.asarray(v).dtype))
+        for k, v in env_infos.items()
+    }
+
+
+def _write_env_infos(step_env_infos, env_infos, step):
+    """Write the environment infos of one step of a batch.
+
+    Args:
+        step_env_infos (dict[str, dict or np.ndarray]): Environment infos of
+            the batch, with shape :math:`(S, N, ...)`.
+        env_infos (dict[str, dict or np.ndarray]): Environment infos of the
+            step, with shape :math:`(N, ...)`.
+        step (int): Index of the step.
+
+    """
+    for k, v in env_infos.items():
+        if isinstance(v, dict):
+            _write_env_infos(step_env_infos[k], v, step)
+        else:
+            step_env_infos[k][step] = v
+
+
+def _select_env(env_infos, idx):
+    """Select the environment infos of one environment.
+
+    Args:
+        env_infos (dict[str, dict or np.ndarray]): Environment infos, with
+            shape :math:`(S, N, ...)`.
+        idx (int): Index of the environment.
+
+    Returns:
+        dict[str, dict or np.ndarray]: Environment infos of the environment,
+            with shape :math:`(S, ...)`.
+
+    """
+    return {
+        k: _select_env(v, idx) if isinstance(v, dict) else v[:, idx]
+        for k, v in env_infos.items()
+    }
@@ -12,6 +12,7 @@ from garage.misc import tensor_utils
 from garage.misc.prog_bar_counter import ProgBarCounter
 from garage.sampler.batch_sampler import BatchSampler
 from garage.sampler.stateful_pool import singleton_pool
+from garage.sampler.subproc_vec_env_executor import SubprocVecEnvExecutor
 from garage.sampler.utils import truncate_paths
 from garage.sampler.vec_env_executor import VecEnvExecutor
 
@@ -24,14 +25,18 @@ class OnPolicyVectorizedSampler(BatchSampler):
         env (garage.envs.GarageEnv): An environement instance.
         n_envs (int): Number of environment instances to setup.
             This parameter has effect on sampling performance.
+        n_workers (int or None): Number of subprocesses to step the
+            environments in, with a SubprocVecEnvExecutor. If None, the
+            environments are stepped in this process.
 
     """
 
-    def __init__(self, algo, env, n_envs=None):
+    def __init__(self, algo, env, n_envs=None, n_workers=None):
         if n_envs is None:
             n_envs = singleton_pool.n_parallel * 4
         super().__init__(algo, env)
         self._n_envs = n_envs
+        self._n_workers = n_workers
 
         self._vec_env = None
         self._env_spec = self.env.spec
@@ -57,8 +62,14 @@ class OnPolicyVectorizedSampler(BatchSampler):
             for (i, e) in enumerate(envs):
                 e.seed(seed0 + i)
 
-        self._vec_env = VecEnvExecutor(
-            envs=envs, max_path_length=self.algo.max_path_length)
+        if self._n_workers is None:
+            self._vec_env = VecEnvExecutor(
+                envs=envs, max_path_length=self.algo.max_path_length)
+        else:
+            self._vec_env = SubprocVecEnvExecutor(
+                envs=envs,
+                max_path_length=self.algo.max_path_length,
+                n_workers=self._n_workers)
 
     def shutdown_worker(self):
         """Shutdown workers."""
@@ -105,7 +116,7 @@ class OnPolicyVectorizedSampler(BatchSampler):
         paths = []
         n_samples = 0
         obses = self._vec_env.reset()
-        dones = np.asarray([True] * self._vec_env.num_envs)
+        completes = np.asarray([True] * self._vec_env.num_envs)
         running_paths = [None] * self._vec_env.num_envs
 
         pbar = ProgBarCounter(batch_size)
@@ -117,7 +128,7 @@ class OnPolicyVectorizedSampler(BatchSampler):
 
         while n_samples < batch_size:
             t = time.time()
-            policy.reset(dones)
+            policy.reset(completes)
 
             actions, agent_infos = policy.get_actions(obses)
 
@@ -127,6 +138,7 @@ class OnPolicyVectorizedSampler(BatchSampler):
                 self._vec_env.step(actions)
             env_time += time.time() - t
             t = time.time()
+            completes = env_infos['vec_env_executor.complete']
 
             agent_infos = tensor_utils.split_tensor_dict_list(agent_infos)
             env_infos = tensor_utils.split_tensor_dict_list(env_infos)
@@ -134,9 +146,9 @@ class OnPolicyVectorizedSampler(BatchSampler):
                 env_infos = [dict() for _ in range(self._vec_env.num_envs)]
             if agent_infos is None:
                 agent_infos = [dict() for _ in range(self._vec_env.num_envs)]
-            for idx, observation, action, reward, env_info, agent_info, done in zip(  # noqa: E501
+            for idx, observation, action, reward, env_info, agent_info, done, complete in zip(  # noqa: E501
                     itertools.count(), obses, actions, rewards, env_infos,
-                    agent_infos, dones):
+                    agent_infos, dones, completes):
                 if running_paths[idx] is None:
                     running_paths[idx] = dict(observations=[],
                                               actions=[],
@@ -150,7 +162,7 @@ class OnPolicyVectorizedSampler(BatchSampler):
                 running_paths[idx]['env_infos'].append(env_info)
                 running_paths[idx]['agent_infos'].append(agent_info)
                 running_paths[idx]['dones'].append(done)
-                if done:
+                if complete:
                     obs = np.asarray(running_paths[idx]['observations'])
                     actions = np.asarray(running_paths[idx]['actions'])
                     paths.append(
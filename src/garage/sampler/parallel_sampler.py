@@ -6,7 +6,6 @@ import signal
 import cloudpickle
 from dowel import logger
 import numpy as np
-import tensorflow as tf
 
 from garage.experiment import deterministic
 from garage.sampler.stateful_pool import SharedGlobal
@@ -114,6 +113,9 @@ def set_seed(seed):
 def _worker_set_policy_params(g, params, scope=None):
     g = _get_scoped_g(g, scope)
     if 'default' not in g.policy.model.networks:
+        # Only TensorFlow policies are built here, so TensorFlow is only
+        # imported when one is used.
+        import tensorflow as tf  # pylint: disable=import-outside-toplevel
         obs_ph = tf.compat.v1.placeholder(tf.float32,
                                           shape=(None, None, g.policy.obs_dim))
         g.policy.build(obs_ph)
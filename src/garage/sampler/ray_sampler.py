@@ -8,26 +8,55 @@ function, and a rollout function.
 """
 from collections import defaultdict
 import itertools
+import time
 
 import cloudpickle
+from dowel import tabular
+import numpy as np
 import ray
 
 from garage import TrajectoryBatch
 from garage.misc.prog_bar_counter import ProgBarCounter
 from garage.sampler.sampler import Sampler
+from garage.sampler.worker_pool import rebuild_worker
+
+# Weight of the latest measurement in the running estimates of step rates
+# and path lengths.
+_ESTIMATE_WEIGHT = 0.5
 
 
 class RaySampler(Sampler):
     """Collects Policy Rollouts in a data parallel fashion.
 
+    Every idle worker starts a new rollout until the requested number of
+    steps is collected.
+
+    If truncate_rollouts is True, the sampler uses running estimates of the
+    step rate of each worker and of the path length to give each rollout a
+    step budget, so that all workers are expected to finish at the same
+    time: faster workers get larger budgets. A rollout is then only started
+    when the rollouts in flight are not expected to collect enough steps,
+    which limits the number of steps sampled beyond the requested number. Rollouts reaching their budget end as if
+    they reached `max_path_length` (their last step is not terminal). This
+    cuts the latency of the last rollouts of a batch, but shortens some
+    paths, so it is best suited to algorithms which bootstrap values of
+    unfinished paths.
+
+    The overshoot (number of steps sampled beyond the requested number), the
+    fraction of time workers were idle and the number of truncated rollouts
+    of the last batch are recorded in the tabular logs, under `Sampler/`.
+
     Args:
         worker_factory(garage.sampler.WorkerFactory): Used for worker behavior.
         agents(list[garage.Policy]): Agents to distribute across workers.
         envs(list[gym.Env]): Environments to distribute across workers.
+        truncate_rollouts(bool): Whether rollouts are given step budgets.
+            Only workers with a `truncate_rollout` method (such as
+            DefaultWorker) support budgets.
 
     """
 
-    def __init__(self, worker_factory, agents, envs):
+    def __init__(self, worker_factory, agents, envs, truncate_rollouts=False):
         # pylint: disable=super-init-not-called
         if not ray.is_initialized():
             ray.init(log_to_driver=False)
@@ -37,10 +66,18 @@ class RaySampler(Sampler):
         self._envs = self._worker_factory.prepare_worker_messages(envs)
         self._all_workers = defaultdict(None)
         self._workers_started = False
+        self._truncate_rollouts = truncate_rollouts
+        # Running estimates, 0 until measured.
+        self._step_rates = np.zeros(worker_factory.n_workers)
+        self._path_length = 0.
         self.start_worker()
 
     @classmethod
-    def from_worker_factory(cls, worker_factory, agents, envs):
+    def from_worker_factory(cls,
+                            worker_factory,
+                            agents,
+                            envs,
+                            truncate_rollouts=False):
         """Construct this sampler.
 
         Args:
@@ -56,12 +93,17 @@ class RaySampler(Sampler):
                 in. If a list is passed in, it must have length exactly
                 `worker_factory.n_workers`, and will be spread across the
                 workers.
+            truncate_rollouts(bool): Whether rollouts are given step
+                budgets.
 
         Returns:
             Sampler: An instance of `cls`.
 
         """
-        return cls(worker_factory, agents, envs)
+        return cls(worker_factory,
+                   agents,
+                   envs,
+                   truncate_rollouts=truncate_rollouts)
 
     def start_worker(self):
         """Initialize a new ray worker."""
@@ -77,6 +119,44 @@ class RaySampler(Sampler):
                 worker_id, self._envs[worker_id], agent_pkls[worker_id],
                 self._worker_factory)
 
+    def reconfigure(self, worker_factory, agents, envs):
+        """Construct the workers again, in their existing actors.
+
+        Args:
+            worker_factory(WorkerFactory): Pickleable factory for creating
+                workers. Must have the same number of workers.
+            agents(Agent or List[Agent]): Agent(s) to use to perform rollouts.
+                If a list is passed in, it must have length exactly
+                `worker_factory.n_workers`, and will be spread across the
+                workers.
+            envs(gym.Env or List[gym.Env]): Environment rollouts are performed
+                in. If a list is passed in, it must have length exactly
+                `worker_factory.n_workers`, and will be spread across the
+                workers.
+
+        Raises:
+            ValueError: If the number of workers is different.
+
+        """
+        if worker_factory.n_workers != self._worker_factory.n_workers:
+            raise ValueError('Workers can only be reconfigured with the same '
+                             'number of workers.')
+        self._worker_factory = worker_factory
+        self._agents = agents
+        self._envs = self._worker_factory.prepare_worker_messages(envs)
+        agent_pkls = self._worker_factory.prepare_worker_messages(
+            self._agents, cloudpickle.dumps)
+        reconfiguring = []
+        for worker_id in range(self._worker_factory.n_workers):
+            reconfiguring.append(
+                self._all_workers[worker_id].reconfigure.remote(
+                    self._worker_factory, agent_pkls[worker_id],
+                    cloudpickle.dumps(self._envs[worker_id])))
+        ray.get(reconfiguring)
+        # The step rates may depend on the environment.
+        self._step_rates = np.zeros(worker_factory.n_workers)
+        self._path_length = 0.
+
     def _update_workers(self, agent_update, env_update):
         """Update all of the workers.
 
@@ -124,10 +204,40 @@ class RaySampler(Sampler):
             TrajectoryBatch: Batch of gathered trajectories.
 
         """
-        active_workers = []
+        return TrajectoryBatch.concatenate(
+            *self.iter_samples(itr, num_samples, agent_update, env_update))
+
+    def iter_samples(self, itr, num_samples, agent_update, env_update=None):
+        """Sample the policy for new trajectories, as they arrive.
+
+        Each trajectory is yielded as soon as a worker returns it, so the
+        caller can process it while the workers keep sampling. Rollouts
+        still running when enough steps are collected are discarded.
+
+        Args:
+            itr(int): Iteration number.
+            num_samples(int): Number of steps the the sampler should collect.
+            agent_update(object): Value which will be passed into the
+                `agent_update_fn` before doing rollouts. If a list is passed
+                in, it must have length exactly `factory.n_workers`, and will
+                be spread across the workers.
+            env_update(object): Value which will be passed into the
+                `env_update_fn` before doing rollouts. If a list is passed in,
+                it must have length exactly `factory.n_workers`, and will be
+                spread across the workers.
+
+        Yields:
+            TrajectoryBatch: Batches of gathered trajectories.
+
+        """
+        del itr
+        # worker id -> (object id, start time, step budget, expected steps)
+        active_workers = {}
         pbar = ProgBarCounter(num_samples)
         completed_samples = 0
-        batches = []
+        n_truncated = 0
+        busy_time = 0.
+        start_time = time.time()
 
         # update the policy params of each worker before sampling
         # for the current iteration
@@ -146,29 +256,124 @@ class RaySampler(Sampler):
                 upd = [ray.get(up) for up in updated]
                 idle_worker_ids.extend(upd)
 
-            # if there are idle workers, use them to collect trajectories
-            # mark the newly busy workers as active
+            # if there are idle workers, start new rollouts on them. When
+            # truncating rollouts, only start them if the active workers are
+            # not expected to collect enough steps.
             while idle_worker_ids:
+                remaining = num_samples - completed_samples - sum(
+                    active[3] for active in active_workers.values())
+                if (self._truncate_rollouts and remaining <= 0
+                        and active_workers):
+                    break
                 idle_worker_id = idle_worker_ids.pop()
+                budget = self._step_budget(idle_worker_id, remaining)
                 worker = self._all_workers[idle_worker_id]
-                active_workers.append(worker.rollout.remote())
+                active_workers[idle_worker_id] = (
+                    worker.rollout.remote(budget), time.time(), budget,
+                    self._expected_steps(budget))
 
+            if not active_workers:
+                continue
             # check which workers are done/not done collecting a sample
             # if any are done, send them to process the collected trajectory
             # if they are not, keep checking if they are done
-            ready, not_ready = ray.wait(active_workers,
-                                        num_returns=1,
-                                        timeout=0.001)
-            active_workers = not_ready
+            ready, _ = ray.wait([a[0] for a in active_workers.values()],
+                                num_returns=1,
+                                timeout=0.001)
             for result in ready:
                 ready_worker_id, trajectory_batch = ray.get(result)
+                _, rollout_start, budget, _ = active_workers.pop(
+                    ready_worker_id)
+                duration = time.time() - rollout_start
+                busy_time += duration
                 idle_worker_ids.append(ready_worker_id)
                 num_returned_samples = trajectory_batch.lengths.sum()
+                truncated = (budget is not None
+                             and num_returned_samples == budget
+                             and not trajectory_batch.terminals[-1])
+                n_truncated += int(truncated)
+                self._update_estimates(ready_worker_id, trajectory_batch,
+                                       duration, truncated)
                 completed_samples += num_returned_samples
                 pbar.inc(num_returned_samples)
-                batches.append(trajectory_batch)
+                yield trajectory_batch
         pbar.stop()
-        return TrajectoryBatch.concatenate(*batches)
+
+        # Rollouts still active are discarded, but their workers were busy.
+        end_time = time.time()
+        busy_time += sum(end_time - active[1]
+                         for active in active_workers.values())
+        total_time = (end_time - start_time) * self._worker_factory.n_workers
+        with tabular.prefix('Sampler/'):
+            tabular.record('Overshoot', completed_samples - num_samples)
+            tabular.record('WorkerIdleFraction',
+                           max(0., 1. - busy_time / max(total_time, 1e-9)))
+            tabular.record('TruncatedRollouts', n_truncated)
+
+    def _step_budget(self, worker_id, remaining):
+        """Compute the step budget of a rollout.
+
+        Args:
+            worker_id(int): Worker running the rollout.
+            remaining(int): Number of steps needed, beyond the steps expected
+                from active rollouts.
+
+        Returns:
+            int or None: Step budget, or None for a complete rollout.
+
+        """
+        if (not self._truncate_rollouts or remaining <= 0
+                or not np.all(self._step_rates > 0)):
+            return None
+        # Steps of this worker if all workers collect the remaining steps
+        # together, at their estimated rates.
+        budget = int(
+            np.ceil(self._step_rates[worker_id] * remaining /
+                    self._step_rates.sum()))
+        if budget >= self._worker_factory.max_path_length:
+            return None
+        return max(budget, 1)
+
+    def _expected_steps(self, budget):
+        """Estimate the number of steps of a rollout.
+
+        Args:
+            budget(int or None): Step budget of the rollout.
+
+        Returns:
+            float: Expected number of steps.
+
+        """
+        # Until paths are measured, rollouts are not expected to collect any
+        # steps, so that all workers start rollouts.
+        expected = self._path_length
+        if budget is not None:
+            expected = min(expected, budget)
+        return expected
+
+    def _update_estimates(self, worker_id, trajectory_batch, duration,
+                          truncated):
+        """Update the estimates of step rate and path length.
+
+        Args:
+            worker_id(int): Worker which ran the rollout.
+            trajectory_batch(TrajectoryBatch): Trajectory of the rollout.
+            duration(float): Time from the start of the rollout until it
+                was received, in seconds.
+            truncated(bool): Whether the rollout reached its step budget.
+
+        """
+        rate = trajectory_batch.lengths.sum() / max(duration, 1e-9)
+        if self._step_rates[worker_id] > 0:
+            rate = (_ESTIMATE_WEIGHT * rate +
+                    (1 - _ESTIMATE_WEIGHT) * self._step_rates[worker_id])
+        self._step_rates[worker_id] = rate
+        if not truncated:
+            length = trajectory_batch.lengths.mean()
+            if self._path_length > 0:
+                length = (_ESTIMATE_WEIGHT * length +
+                          (1 - _ESTIMATE_WEIGHT) * self._path_length)
+            self._path_length = length
 
     def obtain_exact_trajectories(self,
                                   n_traj_per_worker,
@@ -264,6 +469,7 @@ class SamplerWorker:
     """
 
     def __init__(self, worker_id, env, agent_pkl, worker_factory):
+        worker_factory.configure_process(worker_id)
         # Must be called before pickle.loads below.
         self.inner_worker = worker_factory(worker_id)
         self.worker_id = worker_id
@@ -285,14 +491,41 @@ class SamplerWorker:
         self.inner_worker.update_env(env_update)
         return self.worker_id
 
-    def rollout(self):
+    def rollout(self, max_steps=None):
         """Compute one rollout of the agent in the environment.
 
+        Args:
+            max_steps(int or None): If given, and supported by the worker,
+                the rollout is truncated after this many steps.
+
         Returns:
             tuple[int, garage.TrajectoryBatch]: Worker ID and batch of samples.
 
         """
-        return (self.worker_id, self.inner_worker.rollout())
+        worker = self.inner_worker
+        if max_steps is None or not hasattr(worker, 'truncate_rollout'):
+            return (self.worker_id, worker.rollout())
+        worker.start_rollout()
+        for _ in range(max_steps):
+            if worker.step_rollout():
+                break
+        else:
+            worker.truncate_rollout()
+        return (self.worker_id, worker.collect_rollout())
+
+    def reconfigure(self, worker_factory, agent_pkl, env_pkl):
+        """Construct the worker again.
+
+        Args:
+            worker_factory(WorkerFactory): Factory of the new worker.
+            agent_pkl(bytes): The pickled agent.
+            env_pkl(bytes): The pickled environment.
+
+        """
+        self.inner_worker = rebuild_worker(self.inner_worker, worker_factory,
+                                           self.worker_id,
+                                           cloudpickle.loads(agent_pkl),
+                                           env_pkl)
 
     def shutdown(self):
         """Shuts down the worker."""
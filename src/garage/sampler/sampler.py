@@ -92,6 +92,33 @@ class Sampler(abc.ABC):
 
         """
 
+    def iter_samples(self, itr, num_samples, agent_update, env_update=None):
+        """Collect at least a given number transitions, as they arrive.
+
+        Samplers with parallel workers override this to yield trajectories
+        as soon as they are sampled. This implementation yields a single
+        batch from `obtain_samples`.
+
+        Args:
+            itr(int): The current iteration number. Using this argument is
+                deprecated.
+            num_samples(int): Minimum number of transitions / timesteps to
+                sample.
+            agent_update(object): Value which will be passed into the
+                `agent_update_fn` before doing rollouts. If a list is passed
+                in, it must have length exactly `factory.n_workers`, and will
+                be spread across the workers.
+            env_update(object): Value which will be passed into the
+                `env_update_fn` before doing rollouts. If a list is passed in,
+                it must have length exactly `factory.n_workers`, and will be
+                spread across the workers.
+
+        Yields:
+            garage.TrajectoryBatch: Batches of collected trajectories.
+
+        """
+        yield self.obtain_samples(itr, num_samples, agent_update, env_update)
+
     @abc.abstractmethod
     def shutdown_worker(self):
         """Terminate workers if necessary.
@@ -0,0 +1,317 @@
+"""Environment wrapper that steps environments in subprocesses."""
+import multiprocessing as mp
+import traceback
+
+import cloudpickle
+import numpy as np
+
+from garage.misc import tensor_utils
+
+
+class SubprocVecEnvExecutor:
+    """Environment wrapper that steps environments in subprocesses.
+
+    It has the same interface as VecEnvExecutor, so samplers can use either.
+    Each subprocess owns a contiguous slice of the environments. Actions,
+    observations, rewards and done signals are exchanged through shared
+    memory arrays, and the pipe to each subprocess only carries a short
+    command and the environment infos of its environments.
+
+    Stepping can be split into `step_async`, which starts stepping and
+    returns immediately, and `step_wait`, which waits for the results, so
+    that the caller can do other work while the environments step.
+
+    Environments are reset automatically when a rollout completes, i.e. when
+    the environment is done or the rollout reaches max_path_length. The
+    observation returned for that step is the first observation of the next
+    rollout, and both its done signal and the environment info
+    'vec_env_executor.complete' are True.
+
+    Observations and actions are stored with the shape and dtype of their
+    space, so both spaces must have fixed ones (e.g. Box or Discrete).
+
+    Args:
+        envs (list[gym.Env]): Environments to batch together. Each one is
+            pickled separately and sent to a subprocess, so an environment
+            can be repeated to get several copies of it.
+        max_path_length (int or None): Maximum length of any path.
+        n_workers (int or None): Number of subprocesses. If None, each
+            environment gets its own subprocess.
+
+    Raises:
+        ValueError: If the observation or action space has no fixed shape
+            or dtype.
+
+    """
+
+    def __init__(self, envs, max_path_length, n_workers=None):
+        self._observation_space = envs[0].observation_space
+        self._action_space = envs[0].action_space
+        self._num_envs = len(envs)
+        self.max_path_length = max_path_length
+
+        n = self._num_envs
+        self._buffers = dict(
+            actions=_SharedArray((n, ) + _space_shape(self._action_space),
+                                 self._action_space.dtype),
+            observations=_SharedArray(
+                (n, ) + _space_shape(self._observation_space),
+                self._observation_space.dtype),
+            rewards=_SharedArray((n, ), np.float64),
+            dones=_SharedArray((n, ), np.bool_))
+        self._arrays = {
+            name: buffer.as_array()
+            for name, buffer in self._buffers.items()
+        }
+
+        n_workers = min(n_workers or n, n)
+        bounds = np.linspace(0, n, n_workers + 1).astype(int)
+        self._conns = []
+        self._processes = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            conn, child_conn = mp.Pipe()
+            process = mp.Process(
+                target=_run_worker,
+                args=(child_conn, [
+                    cloudpickle.dumps(env) for env in envs[start:stop]
+                ], start, self._buffers, max_path_length),
+                daemon=True)
+            process.start()
+            child_conn.close()
+            self._conns.append(conn)
+            self._processes.append(process)
+        self._waiting = False
+        self._closed = False
+
+    def step_async(self, action_n):
+        """Start stepping all environments, without waiting for them.
+
+        Args:
+            action_n (np.ndarray): Array of actions.
+
+        """
+        self._arrays['actions'][:] = action_n
+        for conn in self._conns:
+            conn.send(('step', None))
+        self._waiting = True
+
+    def step_wait(self):
+        """Wait for the environments to finish stepping.
+
+        Returns:
+            tuple: Tuple containing:
+                * observations (np.ndarray)
+                * rewards (np.ndarray)
+                * dones (np.ndarray): True if the environment is done or the
+                    path reached max_path_length.
+                * env_infos (dict[str, np.ndarray])
+
+        """
+        env_infos = []
+        for infos in self._receive():
+            env_infos.extend(infos)
+        self._waiting = False
+        dones = self._arrays['dones'].copy()
+        for env_info, done in zip(env_infos, dones):
+            env_info['vec_env_executor.complete'] = done
+        return (self._arrays['observations'].copy(),
+                self._arrays['rewards'].copy(), dones,
+                tensor_utils.stack_tensor_dict_list(env_infos))
+
+    def step(self, action_n):
+        """Step all environments using the provided actions.
+
+        Inserts an environment info 'vec_env_executor.complete' containing the
+        episode end signal (time limit reached or done signal from
+        environment).
+
+        Args:
+            action_n (np.ndarray): Array of actions.
+
+        Returns:
+            tuple: Tuple containing:
+                * observations (np.ndarray)
+                * rewards (np.ndarray)
+                * dones (np.ndarray): True if the environment is done or the
+                    path reached max_path_length.
+                * env_infos (dict[str, np.ndarray])
+
+        """
+        self.step_async(action_n)
+        return self.step_wait()
+
+    def reset(self):
+        """Reset all environments.
+
+        Returns:
+            np.ndarray: Observations of shape :math:`(K, O*)`
+
+        """
+        if self._waiting:
+            self.step_wait()
+        for conn in self._conns:
+            conn.send(('reset', None))
+        self._receive()
+        return self._arrays['observations'].copy()
+
+    def _receive(self):
+        """Receive a reply from each subprocess.
+
+        Returns:
+            list: The reply of each subprocess.
+
+        Raises:
+            RuntimeError: If a subprocess raised an exception.
+
+        """
+        replies = [conn.recv() for conn in self._conns]
+        for status, reply in replies:
+            if status == 'error':
+                raise RuntimeError(
+                    'Environment raised an exception in a subprocess:\n' +
+                    reply)
+        return [reply for _, reply in replies]
+
+    @property
+    def num_envs(self):
+        """Read the number of environments.
+
+        Returns:
+            int: Number of environments
+
+        """
+        return self._num_envs
+
+    @property
+    def action_space(self):
+        """Read the action space.
+
+        Returns:
+            gym.Space: The action space.
+
+        """
+        return self._action_space
+
+    @property
+    def observation_space(self):
+        """Read the observation space.
+
+        Returns:
+            gym.Space: The observation space.
+
+        """
+        return self._observation_space
+
+    def close(self):
+        """Close all environments and stop the subprocesses."""
+        if self._closed:
+            return
+        self._closed = True
+        for conn in self._conns:
+            try:
+                conn.send(('close', None))
+            except (BrokenPipeError, EOFError):
+                pass
+        for process in self._processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._conns:
+            conn.close()
+
+
+class _SharedArray:
+    """An array in shared memory, which can be sent to subprocesses.
+
+    Args:
+        shape (tuple[int]): Shape of the array.
+        dtype (numpy.dtype): Type of the array.
+
+    """
+
+    def __init__(self, shape, dtype):
+        self._shape = shape
+        self._dtype = np.dtype(dtype)
+        self._raw = mp.RawArray(
+            'b', max(1, int(np.prod(shape)) * self._dtype.itemsize))
+
+    def as_array(self):
+        """Get a NumPy view of the shared memory.
+
+        Returns:
+            np.ndarray: The array.
+
+        """
+        size = int(np.prod(self._shape))
+        return np.frombuffer(self._raw, dtype=self._dtype,
+                             count=size).reshape(self._shape)
+
+
+def _space_shape(space):
+    """Get the shape of the elements of a space.
+
+    Args:
+        space (gym.Space): Space of observations or actions.
+
+    Returns:
+        tuple[int]: Shape of the elements.
+
+    Raises:
+        ValueError: If the space has no fixed shape or dtype.
+
+    """
+    if getattr(space, 'shape', None) is None or getattr(space, 'dtype',
+                                                        None) is None:
+        raise ValueError('SubprocVecEnvExecutor only supports spaces with a '
+                         'fixed shape and dtype, such as Box and Discrete, '
+                         'not {}'.format(space))
+    return tuple(space.shape)
+
+
+def _run_worker(conn, env_pkls, start, buffers, max_path_length):
+    """Step environments in a subprocess, until told to close.
+
+    Args:
+        conn (multiprocessing.connection.Connection): Pipe to the parent
+            process.
+        env_pkls (list[bytes]): Pickled environments.
+        start (int): Index of the first environment in the shared arrays.
+        buffers (dict[str, _SharedArray]): Shared memory arrays.
+        max_path_length (int or None): Maximum length of any path.
+
+    """
+    envs = [cloudpickle.loads(env_pkl) for env_pkl in env_pkls]
+    arrays = {name: buffer.as_array() for name, buffer in buffers.items()}
+    indices = range(start, start + len(envs))
+    path_lengths = np.zeros(len(envs), dtype=int)
+    while True:
+        command, _ = conn.recv()
+        try:
+            if command == 'step':
+                env_infos = []
+                for j, (i, env) in enumerate(zip(indices, envs)):
+                    # Copy the action, since the environment might keep it.
+                    obs, reward, done, env_info = env.step(
+                        arrays['actions'][i].copy())
+                    path_lengths[j] += 1
+                    complete = done or (max_path_length is not None
+                                        and path_lengths[j] >= max_path_length)
+                    if complete:
+                        obs = env.reset()
+                        path_lengths[j] = 0
+                    arrays['observations'][i] = obs
+                    arrays['rewards'][i] = reward
+                    arrays['dones'][i] = complete
+                    env_infos.append(env_info)
+                conn.send(('ok', env_infos))
+            elif command == 'reset':
+                for i, env in zip(indices, envs):
+                    arrays['observations'][i] = env.reset()
+                path_lengths[:] = 0
+                conn.send(('ok', None))
+            elif command == 'close':
+                for env in envs:
+                    env.close()
+                return
+        except Exception:  # pylint: disable=broad-except
+            conn.send(('error', traceback.format_exc()))
@@ -43,7 +43,8 @@ class VecEnvExecutor:
             tuple: Tuple containing:
                 * observations (np.ndarray)
                 * rewards (np.ndarray)
-                * dones (np.ndarray): The done signal from the environment.
+                * dones (np.ndarray): True if the environment is done or the
+                    path reached max_path_length.
                 * env_infos (dict[str, np.ndarray])
 
         """
@@ -53,14 +54,16 @@ class VecEnvExecutor:
         dones = np.asarray(dones)
         rewards = np.asarray(rewards)
         self.ts += 1
-        completes = np.asarray(dones)
+        # The done signals include the time limit, so algorithms treat the
+        # last step of a rollout as terminal.
+        completes = dones
         if self.max_path_length is not None:
             completes[self.ts >= self.max_path_length] = True
         for (i, complete) in enumerate(completes):
             if complete:
                 obs[i] = self.envs[i].reset()
                 self.ts[i] = 0
-            env_infos[i]['vec_env_executor.complete'] = completes
+            env_infos[i]['vec_env_executor.complete'] = complete
         return (obs, rewards, dones,
                 tensor_utils.stack_tensor_dict_list(env_infos))
 
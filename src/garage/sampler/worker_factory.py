@@ -38,6 +38,9 @@ class WorkerFactory:
             the Worker interface.
         worker_args (dict or None): Additional arguments that should be passed
             to the worker.
+        cpu_resources (garage.sampler.CPUResources or None): Allocated cores
+            and thread counts of the worker processes. If None, worker
+            processes are not configured.
 
     """
 
@@ -48,7 +51,8 @@ class WorkerFactory:
             max_path_length,
             n_workers=psutil.cpu_count(logical=False),
             worker_class=DefaultWorker,
-            worker_args=None):
+            worker_args=None,
+            cpu_resources=None):
         self.n_workers = n_workers
         self._seed = seed
         self._max_path_length = max_path_length
@@ -57,6 +61,12 @@ class WorkerFactory:
             self._worker_args = {}
         else:
             self._worker_args = worker_args
+        self._cpu_resources = cpu_resources
+
+    @property
+    def max_path_length(self):
+        """int: The maximum length of paths of the workers."""
+        return self._max_path_length
 
     def prepare_worker_messages(self, objs, preprocess=identity_function):
         """Take an argument and canonicalize it into a list for all workers.
@@ -87,6 +97,19 @@ class WorkerFactory:
         else:
             return [preprocess(objs) for _ in range(self.n_workers)]
 
+    def configure_process(self, worker_number):
+        """Configure the CPU resources of the current worker process.
+
+        Samplers which run workers in their own processes call this in the
+        worker process, before constructing the worker.
+
+        Args:
+            worker_number(int): The worker number.
+
+        """
+        if self._cpu_resources is not None:
+            self._cpu_resources.configure_worker(worker_number)
+
     def __call__(self, worker_number):
         """Construct a worker given its number.
 
@@ -0,0 +1,119 @@
+"""Pool of sampler workers kept alive between experiments."""
+import atexit
+import collections
+
+import cloudpickle
+
+
+class WorkerPool:
+    """Keeps the workers of samplers alive between experiments.
+
+    Starting the workers of MultiprocessingSampler or RaySampler starts
+    processes (or Ray actors), which import TensorFlow or PyTorch and build
+    their environments. When several experiments run one after another in
+    the same process (e.g. a sweep of functions decorated with
+    `wrap_experiment`), passing the same pool to `LocalRunner.setup`
+    reuses the samplers of previous experiments instead.
+
+    A reused sampler is reconfigured: its workers are constructed again in
+    their processes, with the new seed, max_path_length, agents and
+    environments. Environments are always unpickled again rather than kept,
+    since a used environment carries state (random number generator,
+    normalization statistics, an unfinished episode) from the previous
+    experiment, so an experiment samples the same trajectories whether its
+    sampler comes from a pool or not.
+
+    Samplers without a `reconfigure` method are not kept.
+
+    The workers in the pool are shut down by `shutdown`, or when the
+    interpreter exits.
+
+    """
+
+    def __init__(self):
+        # (sampler class, n_workers, sampler args) -> list of idle samplers
+        self._idle = collections.defaultdict(list)
+        self._keys = {}
+        atexit.register(self.shutdown)
+
+    def get_sampler(self,
+                    sampler_cls,
+                    worker_factory,
+                    agents,
+                    envs,
+                    sampler_args=None):
+        """Get a sampler, reusing an idle sampler if possible.
+
+        Args:
+            sampler_cls (type): The type of sampler.
+            worker_factory (WorkerFactory): Factory of the workers.
+            agents (Agent or List[Agent]): Agent(s) to use to perform
+                rollouts.
+            envs (gym.Env or List[gym.Env]): Environment(s) rollouts are
+                performed in.
+            sampler_args (dict or None): Additional arguments of the sampler.
+
+        Returns:
+            garage.sampler.Sampler: The sampler.
+
+        """
+        sampler_args = sampler_args or {}
+        key = (sampler_cls, worker_factory.n_workers,
+               repr(sorted(sampler_args.items())))
+        if self._idle[key]:
+            sampler = self._idle[key].pop()
+            sampler.reconfigure(worker_factory, agents, envs)
+        else:
+            sampler = sampler_cls.from_worker_factory(worker_factory,
+                                                      agents=agents,
+                                                      envs=envs,
+                                                      **sampler_args)
+        self._keys[id(sampler)] = key
+        return sampler
+
+    def release(self, sampler):
+        """Return a sampler to the pool, or shut it down.
+
+        Releasing a sampler which is already in the pool does nothing.
+
+        Args:
+            sampler (garage.sampler.Sampler): A sampler from `get_sampler`.
+
+        """
+        key = self._keys.pop(id(sampler), None)
+        if key is None:
+            if not any(sampler in idle for idle in self._idle.values()):
+                sampler.shutdown_worker()
+        elif hasattr(sampler, 'reconfigure'):
+            self._idle[key].append(sampler)
+        else:
+            sampler.shutdown_worker()
+
+    def shutdown(self):
+        """Shut down the idle samplers."""
+        for samplers in self._idle.values():
+            for sampler in samplers:
+                sampler.shutdown_worker()
+        self._idle.clear()
+
+
+def rebuild_worker(worker, factory, worker_number, agent, env_pkl):
+    """Construct a worker again, in the process of an existing worker.
+
+    Args:
+        worker (garage.sampler.Worker): The existing worker.
+        factory (WorkerFactory): Factory of the new worker.
+        worker_number (int): Number of the worker.
+        agent (Agent): Agent of the new worker.
+        env_pkl (bytes): Pickled environment of the new worker.
+
+    Returns:
+        garage.sampler.Worker: The new worker.
+
+    """
+    worker.shutdown()
+    factory.configure_process(worker_number)
+    new_worker = factory(worker_number)
+    new_worker.update_agent(agent)
+    new_worker.update_env(cloudpickle.loads(env_pkl))
+    return new_worker
@@ -1,18 +1,5 @@
 """Tensorflow implementation of reinforcement learning algorithms."""
-from garage.tf.algos.batch_polopt import BatchPolopt
-from garage.tf.algos.ddpg import DDPG
-from garage.tf.algos.dqn import DQN
-from garage.tf.algos.erwr import ERWR
-from garage.tf.algos.npo import NPO
-from garage.tf.algos.ppo import PPO
-from garage.tf.algos.reps import REPS
-from garage.tf.algos.rl2 import RL2
-from garage.tf.algos.rl2ppo import RL2PPO
-from garage.tf.algos.rl2trpo import RL2TRPO
-from garage.tf.algos.td3 import TD3
-from garage.tf.algos.tnpg import TNPG
-from garage.tf.algos.trpo import TRPO
-from garage.tf.algos.vpg import VPG
+from garage._lazy import lazy_import
 
 __all__ = [
     'BatchPolopt',
@@ -30,3 +17,22 @@ __all__ = [
     'TRPO',
     'VPG',
 ]
+
+_ATTRIBUTES = {
+    'BatchPolopt': 'batch_polopt',
+    'DDPG': 'ddpg',
+    'DQN': 'dqn',
+    'ERWR': 'erwr',
+    'NPO': 'npo',
+    'PPO': 'ppo',
+    'REPS': 'reps',
+    'RL2': 'rl2',
+    'RL2PPO': 'rl2ppo',
+    'RL2TRPO': 'rl2trpo',
+    'TD3': 'td3',
+    'TNPG': 'tnpg',
+    'TRPO': 'trpo',
+    'VPG': 'vpg',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
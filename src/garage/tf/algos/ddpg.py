@@ -55,6 +55,8 @@ class DDPG(OffPolicyRLAlgorithm):
         max_action (float): Maximum action magnitude.
         reward_scale (float): Reward scale.
         smooth_return (bool): Whether to smooth the return.
+        n_step (int): Number of steps of the returns used as critic
+            targets.
         name (str): Name of the algorithm shown in computation graph.
 
     """
@@ -87,6 +89,7 @@ class DDPG(OffPolicyRLAlgorithm):
             max_action=None,
             reward_scale=1.,
             smooth_return=True,
+            n_step=1,
             name='DDPG'):
         action_bound = env_spec.action_space.high
         self.max_action = action_bound if max_action is None else max_action
@@ -126,7 +129,8 @@ class DDPG(OffPolicyRLAlgorithm):
                                    use_target=True,
                                    discount=discount,
                                    reward_scale=reward_scale,
-                                   smooth_return=smooth_return)
+                                   smooth_return=smooth_return,
+                                   n_step=n_step)
 
     def init_opt(self):
         """Build the loss function and init the optimizer."""
@@ -322,15 +326,17 @@ class DDPG(OffPolicyRLAlgorithm):
             float: Q value predicted by the q network.
 
         """
-        transitions = self.replay_buffer.sample(self.buffer_batch_size)
+        transitions = self._sample_replay_transitions(self.buffer_batch_size)
         observations = transitions['observation']
         rewards = transitions['reward']
         actions = transitions['action']
         next_observations = transitions['next_observation']
         terminals = transitions['terminal']
+        discounts = transitions['discount']
 
         rewards = rewards.reshape(-1, 1)
         terminals = terminals.reshape(-1, 1)
+        discounts = discounts.reshape(-1, 1)
 
         next_inputs = next_observations
         inputs = observations
@@ -342,7 +348,7 @@ class DDPG(OffPolicyRLAlgorithm):
         clip_range = (-self.clip_return,
                       0. if self.clip_pos_returns else self.clip_return)
         ys = np.clip(
-            rewards + (1.0 - terminals) * self.discount * target_qvals,
+            rewards + (1.0 - terminals) * discounts * target_qvals,
             clip_range[0], clip_range[1])
 
         _, qval_loss, qval = self.f_train_qf(ys, inputs, actions)
@@ -1,10 +1,10 @@
 """Deep Q-Learning Network algorithm."""
-import akro
 from dowel import tabular
 import numpy as np
 import tensorflow as tf
 
 from garage.np.algos.off_policy_rl_algorithm import OffPolicyRLAlgorithm
+from garage.replay_buffer import BatchPrefetcher
 from garage.tf.misc import tensor_utils
 
 
@@ -17,6 +17,11 @@ class DQN(OffPolicyRLAlgorithm):
     usually needed, e.g. skipping frames and stacking frames as single
     observation.
 
+    Replay batches are sampled on a background thread while the previous
+    gradient steps run, and (flattened) image observations are reshaped
+    inside the graph. Several gradient steps can share a single replay
+    sample with `grad_steps_per_call`.
+
     Args:
         env_spec (garage.envs.env_spec.EnvSpec): Environment specification.
         policy (garage.tf.policies.Policy): Policy.
@@ -44,8 +49,20 @@ class DQN(OffPolicyRLAlgorithm):
         double_q (bool): Bool for using double q-network.
         reward_scale (float): Reward scale.
         smooth_return (bool): Whether to smooth the return.
+        grad_steps_per_call (int): Number of gradient steps run on each
+            replay sample. Each sample holds
+            `buffer_batch_size * grad_steps_per_call` transitions, which are
+            split into one batch per gradient step. `n_train_steps` must be
+            divisible by it.
+        n_prefetch_batches (int): Number of replay batches sampled ahead on
+            a background thread. If 0, batches are sampled synchronously.
+        n_step (int): Number of steps of the returns used as targets.
         name (str): Name of the algorithm.
 
+    Raises:
+        ValueError: If `n_train_steps` is not divisible by
+            `grad_steps_per_call`.
+
     """
 
     def __init__(self,
@@ -68,13 +85,22 @@ class DQN(OffPolicyRLAlgorithm):
                  double_q=False,
                  reward_scale=1.,
                  smooth_return=True,
+                 grad_steps_per_call=1,
+                 n_prefetch_batches=2,
+                 n_step=1,
                  name='DQN'):
+        if n_train_steps % grad_steps_per_call != 0:
+            raise ValueError('n_train_steps ({}) must be divisible by '
+                             'grad_steps_per_call ({}).'.format(
+                                 n_train_steps, grad_steps_per_call))
         self.qf_lr = qf_lr
         self.qf_optimizer = qf_optimizer
         self.name = name
         self.target_network_update_freq = target_network_update_freq
         self.grad_norm_clipping = grad_norm_clipping
         self.double_q = double_q
+        self._grad_steps_per_call = grad_steps_per_call
+        self._n_prefetch_batches = n_prefetch_batches
 
         # clone a target q-function
         self.target_qf = qf.clone('target_qf')
@@ -92,7 +118,8 @@ class DQN(OffPolicyRLAlgorithm):
                                   max_path_length=max_path_length,
                                   discount=discount,
                                   reward_scale=reward_scale,
-                                  smooth_return=smooth_return)
+                                  smooth_return=smooth_return,
+                                  n_step=n_step)
 
     def init_opt(self):
         """Initialize the networks and Ops.
@@ -100,13 +127,20 @@ class DQN(OffPolicyRLAlgorithm):
         Assume discrete space for dqn, so action dimension
         will always be action_space.n
         """
-        action_dim = self.env_spec.action_space.n
-
         self.episode_rewards = []
         self.episode_qf_losses = []
 
         # build q networks
         with tf.name_scope(self.name):
+            # Observations are fed with unknown shape, since the replay
+            # buffer may hold flattened observations, and are reshaped to
+            # the shape of the q-function input in the graph.
+            obs_t_ph = tf.compat.v1.placeholder(self.qf.input.dtype,
+                                                None,
+                                                name='observation')
+            next_obs_t_ph = tf.compat.v1.placeholder(self.qf.input.dtype,
+                                                     None,
+                                                     name='next_observation')
             action_t_ph = tf.compat.v1.placeholder(tf.int32,
                                                    None,
                                                    name='action')
@@ -114,6 +148,9 @@ class DQN(OffPolicyRLAlgorithm):
                                                    None,
                                                    name='reward')
             done_t_ph = tf.compat.v1.placeholder(tf.float32, None, name='done')
+            discount_t_ph = tf.compat.v1.placeholder(tf.float32,
+                                                     None,
+                                                     name='discount')
 
             with tf.name_scope('update_ops'):
                 target_update_op = tensor_utils.get_target_ops(
@@ -123,65 +160,101 @@ class DQN(OffPolicyRLAlgorithm):
             self._qf_update_ops = tensor_utils.compile_function(
                 inputs=[], outputs=target_update_op)
 
-            with tf.name_scope('td_error'):
-                # Q-value of the selected action
-                action = tf.one_hot(action_t_ph,
-                                    action_dim,
-                                    on_value=1.,
-                                    off_value=0.)
-                q_selected = tf.reduce_sum(
-                    self.qf.q_vals * action,  # yapf: disable
-                    axis=1)
-
-                # r + Q'(s', argmax_a(Q(s', _)) - Q(s, a)
-                if self.double_q:
-                    target_qval_with_online_q = self.qf.get_qval_sym(
-                        self.target_qf.input, self.qf.name)
-                    future_best_q_val_action = tf.argmax(
-                        target_qval_with_online_q, 1)
-                    future_best_q_val = tf.reduce_sum(
-                        self.target_qf.q_vals *
-                        tf.one_hot(future_best_q_val_action,
-                                   action_dim,
-                                   on_value=1.,
-                                   off_value=0.),
-                        axis=1)
-                else:
-                    # r + max_a(Q'(s', _)) - Q(s, a)
-                    future_best_q_val = tf.reduce_max(self.target_qf.q_vals,
-                                                      axis=1)
-
-                q_best_masked = (1.0 - done_t_ph) * future_best_q_val
-                # if done, it's just reward
-                # else reward + discount * future_best_q_val
-                target_q_values = (reward_t_ph + self.discount * q_best_masked)
-
-                # td_error = q_selected - tf.stop_gradient(target_q_values)
-                loss = tf.compat.v1.losses.huber_loss(
-                    q_selected, tf.stop_gradient(target_q_values))
-                loss = tf.reduce_mean(loss)
+            with tf.name_scope('reshape_inputs'):
+                obs_shape = self.qf.input.shape[1:].as_list()
+                obs = tf.reshape(obs_t_ph, [-1] + obs_shape)
+                next_obs = tf.reshape(next_obs_t_ph, [-1] + obs_shape)
 
+            loss = self._build_loss(obs, action_t_ph, reward_t_ph, done_t_ph,
+                                    next_obs, discount_t_ph)
             with tf.name_scope('optimize_ops'):
-                optimizer = self.qf_optimizer(self.qf_lr)
-                if self.grad_norm_clipping is not None:
-                    gradients = optimizer.compute_gradients(
-                        loss, var_list=self.qf.get_trainable_vars())
-                    for i, (grad, var) in enumerate(gradients):
-                        if grad is not None:
-                            gradients[i] = (tf.clip_by_norm(
-                                grad, self.grad_norm_clipping), var)
-                        optimize_loss = optimizer.apply_gradients(gradients)
-                else:
-                    optimize_loss = optimizer.minimize(
-                        loss, var_list=self.qf.get_trainable_vars())
+                optimize_loss = self._build_optimize_op(
+                    self.qf_optimizer(self.qf_lr), loss)
 
             self._train_qf = tensor_utils.compile_function(
                 inputs=[
-                    self.qf.input, action_t_ph, reward_t_ph, done_t_ph,
-                    self.target_qf.input
+                    obs_t_ph, action_t_ph, reward_t_ph, done_t_ph,
+                    next_obs_t_ph, discount_t_ph
                 ],
                 outputs=[loss, optimize_loss])
 
+    def _build_loss(self, obs, action_t, reward_t, done_t, next_obs,
+                    discount_t):
+        """Build the TD loss of a gradient step.
+
+        Args:
+            obs (tf.Tensor): Observations.
+            action_t (tf.Tensor): Actions taken.
+            reward_t (tf.Tensor): Rewards.
+            done_t (tf.Tensor): Terminal flags.
+            next_obs (tf.Tensor): Next observations.
+            discount_t (tf.Tensor): Discounts of the bootstrapped values.
+
+        Returns:
+            tf.Tensor: Huber loss of the TD error.
+
+        """
+        action_dim = self.env_spec.action_space.n
+        with tf.name_scope('td_error'):
+            q_vals = self.qf.get_qval_sym(obs, 'train_qval')
+            target_q_vals = self.target_qf.get_qval_sym(next_obs,
+                                                        'train_target_qval')
+
+            # Q-value of the selected action
+            action = tf.one_hot(action_t,
+                                action_dim,
+                                on_value=1.,
+                                off_value=0.)
+            q_selected = tf.reduce_sum(q_vals * action, axis=1)
+
+            # r + Q'(s', argmax_a(Q(s', _)) - Q(s, a)
+            if self.double_q:
+                target_qval_with_online_q = self.qf.get_qval_sym(
+                    next_obs, 'train_double_qval')
+                future_best_q_val_action = tf.argmax(
+                    target_qval_with_online_q, 1)
+                future_best_q_val = tf.reduce_sum(
+                    target_q_vals * tf.one_hot(future_best_q_val_action,
+                                               action_dim,
+                                               on_value=1.,
+                                               off_value=0.),
+                    axis=1)
+            else:
+                # r + max_a(Q'(s', _)) - Q(s, a)
+                future_best_q_val = tf.reduce_max(target_q_vals, axis=1)
+
+            q_best_masked = (1.0 - done_t) * future_best_q_val
+            # if done, it's just reward
+            # else reward + discount * future_best_q_val
+            target_q_values = (reward_t + discount_t * q_best_masked)
+
+            # td_error = q_selected - tf.stop_gradient(target_q_values)
+            loss = tf.compat.v1.losses.huber_loss(
+                q_selected, tf.stop_gradient(target_q_values))
+            return tf.reduce_mean(loss)
+
+    def _build_optimize_op(self, optimizer, loss):
+        """Build the operation applying a gradient step.
+
+        Args:
+            optimizer (tf.compat.v1.train.Optimizer): Q-function optimizer.
+            loss (tf.Tensor): Loss to minimize.
+
+        Returns:
+            tf.Operation: Operation applying the gradients.
+
+        """
+        if self.grad_norm_clipping is not None:
+            gradients = optimizer.compute_gradients(
+                loss, var_list=self.qf.get_trainable_vars())
+            for i, (grad, var) in enumerate(gradients):
+                if grad is not None:
+                    gradients[i] = (tf.clip_by_norm(grad,
+                                                    self.grad_norm_clipping),
+                                    var)
+            return optimizer.apply_gradients(gradients)
+        return optimizer.minimize(loss, var_list=self.qf.get_trainable_vars())
+
     def train_once(self, itr, paths):
         """Perform one step of policy optimization given one batch of samples.
 
@@ -198,10 +271,13 @@ class DQN(OffPolicyRLAlgorithm):
 
         self.episode_rewards.extend(paths['undiscounted_returns'])
         last_average_return = np.mean(self.episode_rewards)
-        for _ in range(self.n_train_steps):
-            if self._buffer_prefilled:
-                qf_loss = self.optimize_policy(epoch, None)
-                self.episode_qf_losses.append(qf_loss)
+        if self._buffer_prefilled:
+            n_calls = self.n_train_steps // self._grad_steps_per_call
+            with BatchPrefetcher(self._sample_transitions, n_calls,
+                                 self._n_prefetch_batches) as batches:
+                for transitions in batches:
+                    self.episode_qf_losses.extend(
+                        self._optimize_qf(transitions))
 
         if self._buffer_prefilled:
             if itr % self.target_network_update_freq == 0:
@@ -226,31 +302,50 @@ class DQN(OffPolicyRLAlgorithm):
             samples_data (list): Processed batch data.
 
         Returns:
-            numpy.float64: Loss of policy.
+            numpy.float64: Mean loss of the gradient steps.
 
         """
         del itr
         del samples_data
 
-        transitions = self.replay_buffer.sample(self.buffer_batch_size)
+        return np.mean(self._optimize_qf(self._sample_transitions()))
 
-        observations = transitions['observation']
-        rewards = transitions['reward']
-        actions = transitions['action']
-        next_observations = transitions['next_observation']
-        dones = transitions['terminal']
+    def _sample_transitions(self):
+        """Sample the transitions for grad_steps_per_call gradient steps.
 
-        if isinstance(self.env_spec.observation_space, akro.Image):
-            if len(self.env_spec.observation_space.shape) < 3:
-                observations = self.env_spec.observation_space.unflatten_n(
-                    observations)
-                next_observations = self.env_spec.observation_space.\
-                    unflatten_n(next_observations)
+        Returns:
+            dict[str, numpy.ndarray]: Transitions of
+                `buffer_batch_size * grad_steps_per_call` steps.
 
-        loss, _ = self._train_qf(observations, actions, rewards, dones,
-                                 next_observations)
+        """
+        return self._sample_replay_transitions(self.buffer_batch_size *
+                                               self._grad_steps_per_call)
+
+    def _optimize_qf(self, transitions):
+        """Run grad_steps_per_call gradient steps on a batch of transitions.
+
+        Each gradient step runs in its own session call, on its own slice of
+        the transitions, so it sees the parameters updated by the previous
+        step.
+
+        Args:
+            transitions (dict[str, numpy.ndarray]): Transitions sampled by
+                `_sample_transitions`.
+
+        Returns:
+            list[numpy.float64]: Loss of each gradient step.
 
-        return loss
+        """
+        keys = ('observation', 'action', 'reward', 'terminal',
+                'next_observation', 'discount')
+        losses = []
+        for step in range(self._grad_steps_per_call):
+            start = step * self.buffer_batch_size
+            end = start + self.buffer_batch_size
+            loss, _ = self._train_qf(
+                *[transitions[key][start:end] for key in keys])
+            losses.append(loss)
+        return losses
 
     def __getstate__(self):
         """Parameters to save in snapshot.
@@ -3,7 +3,6 @@
 This module contains RL2, RL2Worker and the environment wrapper for RL2.
 """
 import abc
-import collections
 
 import akro
 from dowel import logger
@@ -380,15 +379,20 @@ class RL2(MetaRLAlgorithm, abc.ABC):
 
     # pylint: disable=protected-access
     def _process_samples(self, itr, paths):
-        # pylint: disable=too-many-statements
         """Return processed sample data based on the collected paths.
 
+        All paths sampled from the same task are concatenated in order into
+        a single path, which is fed to the inner algorithm. The batch is
+        built in one pass over a single TrajectoryBatch: every time step is
+        scattered into a preallocated array of shape
+        :math:`(N, max_path_length * episode_per_task, S^*)`, where N is the
+        number of tasks, and tasks are sorted by their batch index.
+
         Args:
             itr (int): Iteration number.
-            paths (OrderedDict[dict]): A list of collected paths for each
-                task. In RL^2, there are n environments/tasks and paths in
-                each of them will be concatenated at some point and fed to
-                the policy.
+            paths (list[dict]): A list of collected paths. In RL^2, there
+                are n environments/tasks and paths in each of them will be
+                concatenated at some point and fed to the policy.
 
         Returns:
             dict: Processed sample data, with key
@@ -396,44 +400,72 @@ class RL2(MetaRLAlgorithm, abc.ABC):
                 * actions: (numpy.ndarray)
                 * rewards: (numpy.ndarray)
                 * returns: (numpy.ndarray)
+                * dones: (numpy.ndarray)
                 * valids: (numpy.ndarray)
+                * baselines: (numpy.ndarray)
                 * agent_infos: (dict)
                 * env_infos: (dict)
                 * paths: (list[dict])
                 * average_return: (numpy.float64)
 
-        Raises:
-            ValueError: If 'batch_idx' is not found.
-
         """
-        concatenated_paths = []
-
-        paths_by_task = collections.defaultdict(list)
-        for path in paths:
-            path['returns'] = np_tensor_utils.discount_cumsum(
-                path['rewards'], self._discount)
-            path['lengths'] = [len(path['rewards'])]
-            if 'batch_idx' in path:
-                paths_by_task[path['batch_idx']].append(path)
-            elif 'batch_idx' in path['agent_infos']:
-                paths_by_task[path['agent_infos']['batch_idx'][0]].append(path)
-            else:
-                raise ValueError(
-                    'Batch idx is required for RL2 but not found, '
-                    'Make sure to use garage.tf.algos.rl2.RL2Worker '
-                    'for sampling')
-
-        # all path in paths_by_task[i] are sampled from task[i]
-        for _paths in paths_by_task.values():
-            concatenated_path = self._concatenate_paths(_paths)
-            concatenated_paths.append(concatenated_path)
-
-        # stack and pad to max path length of the concatenated
-        # path, which will be fed to inner algo
-        # i.e. max_path_length * episode_per_task
-        concatenated_paths_stacked = (
-            np_tensor_utils.stack_and_pad_tensor_dict_list(
-                concatenated_paths, self._inner_algo.max_path_length))
+        trajectories = TrajectoryBatch.from_trajectory_list(
+            self._env_spec, paths)
+        lengths = trajectories.lengths
+        n_paths = len(lengths)
+        path_starts = np.cumsum(lengths) - lengths
+        task_ids = self._get_task_ids(paths, trajectories, path_starts)
+
+        # Path and time step within the path of every step.
+        step_paths = np.repeat(np.arange(n_paths), lengths)
+        steps_in_path = np.arange(lengths.sum()) - path_starts[step_paths]
+
+        # Returns are computed within each path, for all paths at once.
+        rewards_by_path = np_tensor_utils.scatter_and_pad(
+            trajectories.rewards, step_paths, steps_in_path, n_paths,
+            lengths.max())
+        returns = np_tensor_utils.discount_cumsum(rewards_by_path.T,
+                                                  self._discount).T
+        returns = returns[step_paths, steps_in_path]
+
+        # Row of each path, and column of its first step in the row.
+        task_values, path_rows = np.unique(task_ids, return_inverse=True)
+        n_tasks = len(task_values)
+        order = np.argsort(path_rows, kind='stable')
+        sorted_rows = path_rows[order]
+        offsets = np.cumsum(lengths[order]) - lengths[order]
+        row_starts = offsets[np.searchsorted(sorted_rows, np.arange(n_tasks))]
+        path_cols = np.empty(n_paths, dtype=np.int64)
+        path_cols[order] = offsets - row_starts[sorted_rows]
+
+        observations = trajectories.observations
+        if self._flatten_input:
+            observations = self._env_spec.observation_space.flatten_n(
+                observations)
+        samples = dict(
+            observations=observations,
+            actions=self._env_spec.action_space.flatten_n(
+                trajectories.actions),
+            rewards=trajectories.rewards,
+            returns=returns,
+            dones=trajectories.terminals,
+            valids=np.ones_like(trajectories.rewards),
+            baselines=np.zeros_like(trajectories.rewards),
+            agent_infos=trajectories.agent_infos,
+            env_infos=trajectories.env_infos)
+        samples_data = np_tensor_utils.scatter_and_pad(
+            samples, path_rows[step_paths],
+            path_cols[step_paths] + steps_in_path, n_tasks,
+            self._inner_algo.max_path_length)
+
+        # The concatenated path of each task is a view of its row.
+        task_lengths = np.bincount(path_rows, weights=lengths)
+        concatenated_paths = [
+            np_tensor_utils.truncate_tensor_dict(path, int(length))
+            for path, length in zip(
+                np_tensor_utils.split_tensor_dict_list(samples_data),
+                task_lengths)
+        ]
 
         name_map = None
         if hasattr(self._task_sampler, '_envs') and hasattr(
@@ -444,60 +476,38 @@ class RL2(MetaRLAlgorithm, abc.ABC):
             name_map = dict(enumerate(names))
 
         undiscounted_returns = log_multitask_performance(
-            itr,
-            TrajectoryBatch.from_trajectory_list(self._env_spec, paths),
-            self._inner_algo.discount,
-            name_map=name_map)
-
-        concatenated_paths_stacked['paths'] = concatenated_paths
-        concatenated_paths_stacked['average_return'] = np.mean(
-            undiscounted_returns)
+            itr, trajectories, self._inner_algo.discount, name_map=name_map)
 
-        return concatenated_paths_stacked
+        samples_data['paths'] = concatenated_paths
+        samples_data['average_return'] = np.mean(undiscounted_returns)
 
-    def _concatenate_paths(self, paths):
-        """Concatenate paths.
+        return samples_data
 
-        The input paths are from different rollouts but same task/environment.
-        In RL^2, paths within each meta batch are all concatenate into a single
-        path and fed to the policy.
+    @staticmethod
+    def _get_task_ids(paths, trajectories, path_starts):
+        """Get the batch index of the task of each path.
 
         Args:
-            paths (dict): Input paths. All paths are from different rollouts,
-                but the same task/environment.
+            paths (list[dict]): A list of collected paths.
+            trajectories (TrajectoryBatch): The collected paths as a
+                TrajectoryBatch.
+            path_starts (numpy.ndarray): Index of the first step of each
+                path in trajectories.
 
         Returns:
-            dict: Concatenated paths from the same task/environment. Shape of
-                values: :math:`[max_path_length * episode_per_task, S^*]`
-            list[dict]: Original input paths. Length of the list is
-                :math:`episode_per_task` and each path in the list has
-                values of shape :math:`[max_path_length, S^*]`
+            numpy.ndarray: Batch index of the task of each path.
+
+        Raises:
+            ValueError: If 'batch_idx' is not found.
 
         """
-        if self._flatten_input:
-            observations = np.concatenate([
-                self._env_spec.observation_space.flatten_n(
-                    path['observations']) for path in paths
-            ])
-        else:
-            observations = np.concatenate(
-                [path['observations'] for path in paths])
-        actions = np.concatenate([
-            self._env_spec.action_space.flatten_n(path['actions'])
-            for path in paths
-        ])
-        valids = np.concatenate(
-            [np.ones_like(path['rewards']) for path in paths])
-        baselines = np.concatenate(
-            [np.zeros_like(path['rewards']) for path in paths])
-
-        concatenated_path = np_tensor_utils.concat_tensor_dict_list(paths)
-        concatenated_path['observations'] = observations
-        concatenated_path['actions'] = actions
-        concatenated_path['valids'] = valids
-        concatenated_path['baselines'] = baselines
-
-        return concatenated_path
+        if 'batch_idx' in trajectories.agent_infos:
+            return trajectories.agent_infos['batch_idx'][path_starts]
+        if all('batch_idx' in path for path in paths):
+            return np.asarray([path['batch_idx'] for path in paths])
+        raise ValueError('Batch idx is required for RL2 but not found, '
+                         'Make sure to use garage.tf.algos.rl2.RL2Worker '
+                         'for sampling')
 
     @property
     def policy(self):
@@ -62,6 +62,8 @@ class TD3(DDPG):
             Otherwise do statistics on one batch.
         exploration_policy (garage.np.exploration_policies.ExplorationPolicy): # noqa: E501
             Exploration strategy.
+        n_step (int): Number of steps of the returns used as critic
+            targets.
 
     """
 
@@ -97,7 +99,8 @@ class TD3(DDPG):
             actor_update_period=2,
             exploration_policy_clip=0.5,
             smooth_return=True,
-            exploration_policy=None):
+            exploration_policy=None,
+            n_step=1):
         self.qf2 = qf2
         self._exploration_policy_sigma = exploration_policy_sigma
         self._exploration_policy_clip = exploration_policy_clip
@@ -131,7 +134,8 @@ class TD3(DDPG):
                                   rollout_batch_size=rollout_batch_size,
                                   reward_scale=reward_scale,
                                   smooth_return=smooth_return,
-                                  exploration_policy=exploration_policy)
+                                  exploration_policy=exploration_policy,
+                                  n_step=n_step)
 
     def init_opt(self):
         """Build the loss function and init the optimizer."""
@@ -271,15 +275,17 @@ class TD3(DDPG):
             qval(float): Q value predicted by the q network.
 
         """
-        transitions = self.replay_buffer.sample(self.buffer_batch_size)
+        transitions = self._sample_replay_transitions(self.buffer_batch_size)
         observations = transitions['observation']
         rewards = transitions['reward']
         actions = transitions['action']
         next_observations = transitions['next_observation']
         terminals = transitions['terminal']
+        discounts = transitions['discount']
 
         rewards = rewards.reshape(-1, 1)
         terminals = terminals.reshape(-1, 1)
+        discounts = discounts.reshape(-1, 1)
 
         next_inputs = next_observations
         inputs = observations
@@ -297,7 +303,7 @@ class TD3(DDPG):
         target_q2vals = self.target_qf2_f_prob_online(next_inputs,
                                                       target_actions)
         target_qvals = np.minimum(target_qvals, target_q2vals)
-        ys = (rewards + (1.0 - terminals) * self.discount * target_qvals)
+        ys = (rewards + (1.0 - terminals) * discounts * target_qvals)
 
         _, qval_loss, qval = self.f_train_qf(ys, inputs, actions)
         _, q2val_loss, q2val = self.f_train_qf2(ys, inputs, actions)
@@ -1,10 +1,16 @@
 """Baseline estimators for TensorFlow-based algorithms."""
-from garage.tf.baselines.continuous_mlp_baseline import ContinuousMLPBaseline
-from garage.tf.baselines.gaussian_cnn_baseline import GaussianCNNBaseline
-from garage.tf.baselines.gaussian_mlp_baseline import GaussianMLPBaseline
+from garage._lazy import lazy_import
 
 __all__ = [
     'ContinuousMLPBaseline',
     'GaussianCNNBaseline',
     'GaussianMLPBaseline',
 ]
+
+_ATTRIBUTES = {
+    'ContinuousMLPBaseline': 'continuous_mlp_baseline',
+    'GaussianCNNBaseline': 'gaussian_cnn_baseline',
+    'GaussianMLPBaseline': 'gaussian_mlp_baseline',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
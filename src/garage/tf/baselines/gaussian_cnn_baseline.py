@@ -1,8 +1,8 @@
 """Gaussian CNN Baseline."""
 import akro
 import numpy as np
+import tensorflow as tf
 
-from garage.misc.tensor_utils import normalize_pixel_batch
 from garage.np.baselines import Baseline
 from garage.tf.regressors import GaussianCNNRegressor
 
@@ -11,6 +11,8 @@ class GaussianCNNBaseline(Baseline):
     """GaussianCNNBaseline With Model.
 
     It fits the input data to a gaussian distribution estimated by a CNN.
+    Image observations are fed to the regressor as uint8 and normalized
+    inside its graph.
 
     Args:
         env_spec (garage.envs.env_spec.EnvSpec): Environment specification.
@@ -39,8 +41,9 @@ class GaussianCNNBaseline(Baseline):
                     env_spec.observation_space.shape))
 
         super().__init__(env_spec)
-        if regressor_args is None:
-            regressor_args = dict()
+        regressor_args = dict(regressor_args or {})
+        if isinstance(env_spec.observation_space, akro.Image):
+            regressor_args.setdefault('input_dtype', tf.uint8)
 
         self._regressor = GaussianCNNRegressor(
             input_shape=(env_spec.observation_space.shape),
@@ -59,9 +62,6 @@ class GaussianCNNBaseline(Baseline):
 
         """
         observations = np.concatenate([p['observations'] for p in paths])
-        if isinstance(self.env_spec.observation_space, akro.Image):
-            observations = normalize_pixel_batch(observations)
-
         returns = np.concatenate([p['returns'] for p in paths])
         self._regressor.fit(observations, returns.reshape((-1, 1)))
 
@@ -75,11 +75,7 @@ class GaussianCNNBaseline(Baseline):
             numpy.ndarray: Predicted value.
 
         """
-        observations = path['observations']
-        if isinstance(self.env_spec.observation_space, akro.Image):
-            observations = normalize_pixel_batch(observations)
-
-        return self._regressor.predict(observations).flatten()
+        return self._regressor.predict(path['observations']).flatten()
 
     def get_param_values(self):
         """Get parameter values.
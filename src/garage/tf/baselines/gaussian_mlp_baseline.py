@@ -17,6 +17,9 @@ class GaussianMLPBaseline(Baseline):
             default it is 1.0, which means using all the data.
         num_seq_inputs (float): Number of sequence per input. By default
             it is 1.0, which means only one single sequence.
+        num_slices (int): Number of slices the data is divided into when
+            fitting the regressor, to bound peak memory usage for large
+            batches. A `num_slices` entry of regressor_args takes precedence.
         regressor_args (dict): Arguments for regressor.
         name (str): Name of baseline.
 
@@ -27,12 +30,13 @@ class GaussianMLPBaseline(Baseline):
             env_spec,
             subsample_factor=1.,
             num_seq_inputs=1,
+            num_slices=1,
             regressor_args=None,
             name='GaussianMLPBaseline',
     ):
         super().__init__(env_spec)
-        if regressor_args is None:
-            regressor_args = dict()
+        regressor_args = dict(regressor_args or {})
+        regressor_args.setdefault('num_slices', num_slices)
 
         self._regressor = GaussianMLPRegressor(
             input_shape=(env_spec.observation_space.flat_dim *
@@ -1,11 +1,5 @@
-# flake8: noqa
-from garage.tf.distributions.distribution import Distribution
-from garage.tf.distributions.bernoulli import Bernoulli
-from garage.tf.distributions.categorical import Categorical
-from garage.tf.distributions.diagonal_gaussian import DiagonalGaussian
-from garage.tf.distributions.recurrent_categorical import RecurrentCategorical
-from garage.tf.distributions.recurrent_diagonal_gaussian import (
-    RecurrentDiagonalGaussian)
+"""Distributions for TensorFlow-based policies."""
+from garage._lazy import lazy_import
 
 __all__ = [
     'Distribution',
@@ -15,3 +9,14 @@ __all__ = [
     'RecurrentCategorical',
     'RecurrentDiagonalGaussian',
 ]
+
+_ATTRIBUTES = {
+    'Distribution': 'distribution',
+    'Bernoulli': 'bernoulli',
+    'Categorical': 'categorical',
+    'DiagonalGaussian': 'diagonal_gaussian',
+    'RecurrentCategorical': 'recurrent_categorical',
+    'RecurrentDiagonalGaussian': 'recurrent_diagonal_gaussian',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
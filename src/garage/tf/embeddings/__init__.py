@@ -1,5 +1,12 @@
 """Embeddings."""
-from garage.tf.embeddings.encoder import Encoder, StochasticEncoder
-from garage.tf.embeddings.gaussian_mlp_encoder import GaussianMLPEncoder
+from garage._lazy import lazy_import
 
 __all__ = ['Encoder', 'StochasticEncoder', 'GaussianMLPEncoder']
+
+_ATTRIBUTES = {
+    'Encoder': 'encoder',
+    'StochasticEncoder': 'encoder',
+    'GaussianMLPEncoder': 'gaussian_mlp_encoder',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
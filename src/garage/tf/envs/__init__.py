@@ -1,5 +1,10 @@
 """Garage wrapper for environments used for Tensorflow."""
-
-from garage.tf.envs.tf_env import TfEnv
+from garage._lazy import lazy_import
 
 __all__ = ['TfEnv']
+
+_ATTRIBUTES = {
+    'TfEnv': 'tf_env',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
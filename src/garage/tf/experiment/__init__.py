@@ -1,4 +1,10 @@
 """TensorFlow Experiment functions."""
-from garage.tf.experiment.local_tf_runner import LocalTFRunner
+from garage._lazy import lazy_import
 
 __all__ = ['LocalTFRunner']
+
+_ATTRIBUTES = {
+    'LocalTFRunner': 'local_tf_runner',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -29,6 +29,8 @@ class LocalTFRunner(LocalRunner):
         max_cpus (int): The maximum number of parallel sampler workers.
         sess (tf.Session): An optional TensorFlow session.
               A new session will be created immediately if not provided.
+        async_snapshot (bool): If True, snapshots are written to disk in a
+            background thread, in incremental chunks. See LocalRunner.
 
     Note:
         The local runner will set up a joblib task pool of size max_cpus
@@ -75,8 +77,14 @@ class LocalTFRunner(LocalRunner):
 
     """
 
-    def __init__(self, snapshot_config, sess=None, max_cpus=1):
-        super().__init__(snapshot_config=snapshot_config, max_cpus=max_cpus)
+    def __init__(self,
+                 snapshot_config,
+                 sess=None,
+                 max_cpus=1,
+                 async_snapshot=False):
+        super().__init__(snapshot_config=snapshot_config,
+                         max_cpus=max_cpus,
+                         async_snapshot=async_snapshot)
         self.sess = sess or tf.compat.v1.Session()
         self.sess_entered = False
 
@@ -114,7 +122,9 @@ class LocalTFRunner(LocalRunner):
                      max_path_length=None,
                      worker_class=DefaultWorker,
                      sampler_args=None,
-                     worker_args=None):
+                     worker_args=None,
+                     cpu_resources=None,
+                     worker_pool=None):
         """Construct a Sampler from a Sampler class.
 
         Args:
@@ -128,6 +138,10 @@ class LocalTFRunner(LocalRunner):
                 passed to the sampler.
             worker_args (dict or None): Additional arguments that should be
                 passed to the worker.
+            cpu_resources (garage.sampler.CPUResources or None): Allocated
+                cores and thread counts of the worker processes.
+            worker_pool (garage.sampler.WorkerPool or None): Pool to take the
+                sampler from.
 
         Returns:
             sampler_cls: An instance of the sampler class.
@@ -141,7 +155,9 @@ class LocalTFRunner(LocalRunner):
             max_path_length=max_path_length,
             worker_class=TFWorkerClassWrapper(worker_class),
             sampler_args=sampler_args,
-            worker_args=worker_args)
+            worker_args=worker_args,
+            cpu_resources=cpu_resources,
+            worker_pool=worker_pool)
 
     def setup(self,
               algo,
@@ -150,7 +166,9 @@ class LocalTFRunner(LocalRunner):
               sampler_args=None,
               n_workers=psutil.cpu_count(logical=False),
               worker_class=DefaultWorker,
-              worker_args=None):
+              worker_args=None,
+              cpu_resources=None,
+              worker_pool=None):
         """Set up runner and sessions for algorithm and environment.
 
         This method saves algo and env within runner and creates a sampler,
@@ -170,12 +188,16 @@ class LocalTFRunner(LocalRunner):
             worker_class (type): Type of worker the sampler should use.
             worker_args (dict or None): Additional arguments that should be
                 passed to the worker.
+            cpu_resources (garage.sampler.CPUResources or None): Cores and
+                thread counts of the trainer and the sampler workers.
+            worker_pool (garage.sampler.WorkerPool or None): Pool of sampler
+                workers reused between experiments.
 
         """
         self.initialize_tf_vars()
         logger.log(self.sess.graph)
         super().setup(algo, env, sampler_cls, sampler_args, n_workers,
-                      worker_class, worker_args)
+                      worker_class, worker_args, cpu_resources, worker_pool)
 
     def _start_worker(self):
         """Start Plotter and Sampler workers."""
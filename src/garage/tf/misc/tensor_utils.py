@@ -439,6 +439,31 @@ def compute_advantages(discount,
     return advantages
 
 
+def normalize_pixel_input(input_var,
+                          dtype=tf.float32,
+                          name='normalize_pixel_input'):
+    """Cast an image tensor to a floating point dtype inside the graph.
+
+    Integer (e.g. uint8 pixel) inputs are cast and scaled to [0, 1], so
+    observations can be fed to the graph without converting them on the
+    host first. Floating point inputs are only cast to dtype.
+
+    Args:
+        input_var (tf.Tensor): Image input tensor.
+        dtype (tf.DType): Floating point dtype of the output.
+        name (string): Name of the operation.
+
+    Returns:
+        tf.Tensor: Tensor of dtype dtype.
+    """
+    with tf.name_scope(name):
+        if input_var.dtype.is_integer:
+            return tf.cast(input_var, dtype) * tf.constant(1. / 255., dtype)
+        if input_var.dtype != dtype:
+            return tf.cast(input_var, dtype)
+        return input_var
+
+
 def center_advs(advs, axes, eps, offset=0, scale=1, name='center_adv'):
     """Normalize the advs tensor.
 
@@ -1,26 +1,5 @@
 """Network Models."""
-from garage.tf.models.categorical_cnn_model import CategoricalCNNModel
-from garage.tf.models.categorical_gru_model import CategoricalGRUModel
-from garage.tf.models.categorical_lstm_model import CategoricalLSTMModel
-from garage.tf.models.categorical_mlp_model import CategoricalMLPModel
-from garage.tf.models.cnn_mlp_merge_model import CNNMLPMergeModel
-from garage.tf.models.cnn_model import CNNModel
-from garage.tf.models.cnn_model_max_pooling import CNNModelWithMaxPooling
-from garage.tf.models.gaussian_cnn_model import GaussianCNNModel
-from garage.tf.models.gaussian_gru_model import GaussianGRUModel
-from garage.tf.models.gaussian_lstm_model import GaussianLSTMModel
-from garage.tf.models.gaussian_mlp_model import GaussianMLPModel
-from garage.tf.models.gaussian_mlp_model2 import GaussianMLPModel2
-from garage.tf.models.gru_model import GRUModel
-from garage.tf.models.lstm_model import LSTMModel
-from garage.tf.models.mlp_dueling_model import MLPDuelingModel
-from garage.tf.models.mlp_merge_model import MLPMergeModel
-from garage.tf.models.mlp_model import MLPModel
-from garage.tf.models.model import BaseModel, Model
-from garage.tf.models.module import Module, StochasticModule
-from garage.tf.models.normalized_input_mlp_model import (
-    NormalizedInputMLPModel)
-from garage.tf.models.sequential import Sequential
+from garage._lazy import lazy_import
 
 __all__ = [
     'BaseModel', 'CategoricalCNNModel', 'CategoricalGRUModel',
@@ -31,3 +10,31 @@ __all__ = [
     'MLPMergeModel', 'MLPModel', 'NormalizedInputMLPModel', 'Sequential',
     'StochasticModule'
 ]
+
+_ATTRIBUTES = {
+    'CategoricalCNNModel': 'categorical_cnn_model',
+    'CategoricalGRUModel': 'categorical_gru_model',
+    'CategoricalLSTMModel': 'categorical_lstm_model',
+    'CategoricalMLPModel': 'categorical_mlp_model',
+    'CNNMLPMergeModel': 'cnn_mlp_merge_model',
+    'CNNModel': 'cnn_model',
+    'CNNModelWithMaxPooling': 'cnn_model_max_pooling',
+    'GaussianCNNModel': 'gaussian_cnn_model',
+    'GaussianGRUModel': 'gaussian_gru_model',
+    'GaussianLSTMModel': 'gaussian_lstm_model',
+    'GaussianMLPModel': 'gaussian_mlp_model',
+    'GaussianMLPModel2': 'gaussian_mlp_model2',
+    'GRUModel': 'gru_model',
+    'LSTMModel': 'lstm_model',
+    'MLPDuelingModel': 'mlp_dueling_model',
+    'MLPMergeModel': 'mlp_merge_model',
+    'MLPModel': 'mlp_model',
+    'BaseModel': 'model',
+    'Model': 'model',
+    'Module': 'module',
+    'StochasticModule': 'module',
+    'NormalizedInputMLPModel': 'normalized_input_mlp_model',
+    'Sequential': 'sequential',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -55,6 +55,9 @@ class CategoricalCNNModel(Model):
             of output dense layer(s). The function should return a
             tf.Tensor.
         layer_normalization (bool): Bool for using layer normalization or not.
+        compute_dtype (tf.DType): Dtype used for the convolutions, e.g.
+            tf.float16 or tf.bfloat16 for reduced-precision compute.
+            Variables are stored in tf.float32 regardless.
 
     """
 
@@ -72,13 +75,15 @@ class CategoricalCNNModel(Model):
                  output_nonlinearity=None,
                  output_w_init=tf.initializers.glorot_uniform(),
                  output_b_init=tf.zeros_initializer(),
-                 layer_normalization=False):
+                 layer_normalization=False,
+                 compute_dtype=tf.float32):
         super().__init__(name)
         self._cnn_model = CNNModel(filter_dims=filter_dims,
                                    num_filters=num_filters,
                                    strides=strides,
                                    padding=padding,
                                    hidden_nonlinearity=hidden_nonlinearity,
+                                   compute_dtype=compute_dtype,
                                    name='CNNModel')
         self._mlp_model = CategoricalMLPModel(
             output_dim=output_dim,
@@ -2,6 +2,8 @@
 
 import tensorflow as tf
 
+from garage.tf.misc.tensor_utils import normalize_pixel_input
+
 
 def cnn(input_var,
         filter_dims,
@@ -11,11 +13,14 @@ def cnn(input_var,
         padding,
         hidden_nonlinearity=tf.nn.relu,
         hidden_w_init=tf.initializers.glorot_uniform(),
-        hidden_b_init=tf.zeros_initializer()):
+        hidden_b_init=tf.zeros_initializer(),
+        compute_dtype=tf.float32):
     """Convolutional neural network (CNN).
 
     Note:
         Based on 'NHWC' data format: [batch, height, width, channel].
+        Integer (e.g. uint8 pixel) inputs are cast and scaled to [0, 1]
+        inside the graph.
 
     Args:
         input_var (tf.Tensor): Input tf.Tensor to the CNN.
@@ -41,25 +46,29 @@ def cnn(input_var,
         hidden_b_init (callable): Initializer function for the bias
             of intermediate dense layer(s). The function should return a
             tf.Tensor.
+        compute_dtype (tf.DType): Dtype used for the convolutions. Variables
+            are always stored in tf.float32, so tf.float16 or tf.bfloat16
+            can be used for reduced-precision compute where the device
+            supports it.
 
     Return:
-        tf.Tensor: The output tf.Tensor of the CNN.
+        tf.Tensor: The output tf.Tensor of the CNN, in tf.float32.
 
     """
     with tf.compat.v1.variable_scope(name):
-        h = input_var
+        h = normalize_pixel_input(input_var, compute_dtype)
         for index, (filter_dim, num_filter,
                     stride) in enumerate(zip(filter_dims, num_filters,
                                              strides)):
             _stride = [1, stride, stride, 1]
             h = _conv(h, 'h{}'.format(index), filter_dim, num_filter, _stride,
-                      hidden_w_init, hidden_b_init, padding)
+                      hidden_w_init, hidden_b_init, padding, compute_dtype)
             if hidden_nonlinearity is not None:
                 h = hidden_nonlinearity(h)
 
         # flatten
         dim = tf.reduce_prod(h.get_shape()[1:].as_list())
-        return tf.reshape(h, [-1, dim])
+        return tf.cast(tf.reshape(h, [-1, dim]), tf.float32)
 
 
 def cnn_with_max_pooling(input_var,
@@ -72,11 +81,14 @@ def cnn_with_max_pooling(input_var,
                          padding,
                          hidden_nonlinearity=tf.nn.relu,
                          hidden_w_init=tf.initializers.glorot_uniform(),
-                         hidden_b_init=tf.zeros_initializer()):
+                         hidden_b_init=tf.zeros_initializer(),
+                         compute_dtype=tf.float32):
     """Convolutional neural network (CNN) with max-pooling.
 
     Note:
         Based on 'NHWC' data format: [batch, height, width, channel].
+        Integer (e.g. uint8 pixel) inputs are cast and scaled to [0, 1]
+        inside the graph.
 
     Args:
         input_var (tf.Tensor): Input tf.Tensor to the CNN.
@@ -108,22 +120,26 @@ def cnn_with_max_pooling(input_var,
         hidden_b_init (callable): Initializer function for the bias
             of intermediate dense layer(s). The function should return a
             tf.Tensor.
+        compute_dtype (tf.DType): Dtype used for the convolutions. Variables
+            are always stored in tf.float32, so tf.float16 or tf.bfloat16
+            can be used for reduced-precision compute where the device
+            supports it.
 
     Return:
-        tf.Tensor: The output tf.Tensor of the CNN.
+        tf.Tensor: The output tf.Tensor of the CNN, in tf.float32.
 
     """
     pool_strides = [1, pool_strides[0], pool_strides[1], 1]
     pool_shapes = [1, pool_shapes[0], pool_shapes[1], 1]
 
     with tf.compat.v1.variable_scope(name):
-        h = input_var
+        h = normalize_pixel_input(input_var, compute_dtype)
         for index, (filter_dim, num_filter,
                     stride) in enumerate(zip(filter_dims, num_filters,
                                              strides)):
             _stride = [1, stride, stride, 1]
             h = _conv(h, 'h{}'.format(index), filter_dim, num_filter, _stride,
-                      hidden_w_init, hidden_b_init, padding)
+                      hidden_w_init, hidden_b_init, padding, compute_dtype)
             if hidden_nonlinearity is not None:
                 h = hidden_nonlinearity(h)
             h = tf.nn.max_pool2d(h,
@@ -133,11 +149,18 @@ def cnn_with_max_pooling(input_var,
 
         # flatten
         dim = tf.reduce_prod(h.get_shape()[1:].as_list())
-        return tf.reshape(h, [-1, dim])
-
-
-def _conv(input_var, name, filter_size, num_filter, strides, hidden_w_init,
-          hidden_b_init, padding):
+        return tf.cast(tf.reshape(h, [-1, dim]), tf.float32)
+
+
+def _conv(input_var,
+          name,
+          filter_size,
+          num_filter,
+          strides,
+          hidden_w_init,
+          hidden_b_init,
+          padding,
+          compute_dtype=tf.float32):
     """Helper function for performing convolution.
 
     Args:
@@ -161,6 +184,8 @@ def _conv(input_var, name, filter_size, num_filter, strides, hidden_w_init,
             tf.Tensor.
         padding (str): The type of padding algorithm to use,
             either 'SAME' or 'VALID'.
+        compute_dtype (tf.DType): Dtype the variables are cast to before the
+            convolution.
 
     Return:
         tf.Tensor: The output of the convolution.
@@ -180,5 +205,9 @@ def _conv(input_var, name, filter_size, num_filter, strides, hidden_w_init,
                                          b_shape,
                                          initializer=hidden_b_init)
 
+        if compute_dtype != weight.dtype.base_dtype:
+            weight = tf.cast(weight, compute_dtype)
+            bias = tf.cast(bias, compute_dtype)
+
         return tf.nn.conv2d(
             input_var, weight, strides=strides, padding=padding) + bias
@@ -37,6 +37,9 @@ class CNNModelWithMaxPooling(Model):
         hidden_b_init (callable): Initializer function for the bias
             of intermediate dense layer(s). The function should return a
             tf.Tensor.
+        compute_dtype (tf.DType): Dtype used for the convolutions, e.g.
+            tf.float16 or tf.bfloat16 for reduced-precision compute.
+            Variables are stored in tf.float32 regardless.
 
     """
 
@@ -50,7 +53,8 @@ class CNNModelWithMaxPooling(Model):
                  pool_shapes=(2, 2),
                  hidden_nonlinearity=tf.nn.relu,
                  hidden_w_init=tf.initializers.glorot_uniform(),
-                 hidden_b_init=tf.zeros_initializer()):
+                 hidden_b_init=tf.zeros_initializer(),
+                 compute_dtype=tf.float32):
         super().__init__(name)
         self._filter_dims = filter_dims
         self._num_filters = num_filters
@@ -61,13 +65,15 @@ class CNNModelWithMaxPooling(Model):
         self._hidden_nonlinearity = hidden_nonlinearity
         self._hidden_w_init = hidden_w_init
         self._hidden_b_init = hidden_b_init
+        self._compute_dtype = compute_dtype
 
     # pylint: disable=arguments-differ
     def _build(self, state_input, name=None):
         """Build model given input placeholder(s).
 
         Args:
-            state_input (tf.Tensor): Tensor input for state.
+            state_input (tf.Tensor): Tensor input for state. Integer (e.g.
+                uint8 pixel) inputs are scaled to [0, 1] inside the graph.
             name (str): Inner model name, also the variable scope of the
                 inner model, if exist. One example is
                 garage.tf.models.Sequential.
@@ -88,4 +94,5 @@ class CNNModelWithMaxPooling(Model):
             padding=self._padding,
             pool_shapes=self._pool_shapes,
             pool_strides=self._pool_strides,
+            compute_dtype=self._compute_dtype,
             name='cnn')
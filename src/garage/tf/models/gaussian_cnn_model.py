@@ -90,6 +90,9 @@ class GaussianCNNModel(Model):
                exponential transformation
             - softplus: the std will be computed as log(1+exp(x))
         layer_normalization (bool): Bool for using layer normalization or not.
+        compute_dtype (tf.DType): Dtype used for the convolutions, e.g.
+            tf.float16 or tf.bfloat16 for reduced-precision compute.
+            Variables are stored in tf.float32 regardless.
 
     """
 
@@ -124,7 +127,8 @@ class GaussianCNNModel(Model):
                  std_output_nonlinearity=None,
                  std_output_w_init=tf.initializers.glorot_uniform(),
                  std_parameterization='exp',
-                 layer_normalization=False):
+                 layer_normalization=False,
+                 compute_dtype=tf.float32):
         # Network parameters
         super().__init__(name)
         self._output_dim = output_dim
@@ -157,6 +161,7 @@ class GaussianCNNModel(Model):
         self._std_output_w_init = std_output_w_init
         self._std_parameterization = std_parameterization
         self._layer_normalization = layer_normalization
+        self._compute_dtype = compute_dtype
 
         # Tranform std arguments to parameterized space
         self._init_std_param = None
@@ -224,6 +229,7 @@ class GaussianCNNModel(Model):
                     num_filters=self._num_filters,
                     strides=self._strides,
                     padding=self._padding,
+                    compute_dtype=self._compute_dtype,
                     name='mean_std_cnn')
                 mean_std_network = mlp(
                     mean_std_conv,
@@ -253,6 +259,7 @@ class GaussianCNNModel(Model):
                                 num_filters=self._num_filters,
                                 strides=self._strides,
                                 padding=self._padding,
+                                compute_dtype=self._compute_dtype,
                                 name='mean_cnn')
 
                 mean_network = mlp(
@@ -279,6 +286,7 @@ class GaussianCNNModel(Model):
                         num_filters=self._std_num_filters,
                         strides=self._std_strides,
                         padding=self._std_padding,
+                        compute_dtype=self._compute_dtype,
                         name='log_std_cnn')
 
                     log_std_network = mlp(
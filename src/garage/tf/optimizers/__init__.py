@@ -1,12 +1,17 @@
-from garage.tf.optimizers.conjugate_gradient_optimizer import (
-    ConjugateGradientOptimizer)
-from garage.tf.optimizers.conjugate_gradient_optimizer import (
-    FiniteDifferenceHvp)
-from garage.tf.optimizers.first_order_optimizer import FirstOrderOptimizer
-from garage.tf.optimizers.lbfgs_optimizer import LbfgsOptimizer
-from garage.tf.optimizers.penalty_lbfgs_optimizer import PenaltyLbfgsOptimizer
+"""Optimizers for TensorFlow-based algorithms."""
+from garage._lazy import lazy_import
 
 __all__ = [
     'ConjugateGradientOptimizer', 'FiniteDifferenceHvp', 'FirstOrderOptimizer',
     'LbfgsOptimizer', 'PenaltyLbfgsOptimizer'
 ]
+
+_ATTRIBUTES = {
+    'ConjugateGradientOptimizer': 'conjugate_gradient_optimizer',
+    'FiniteDifferenceHvp': 'conjugate_gradient_optimizer',
+    'FirstOrderOptimizer': 'first_order_optimizer',
+    'LbfgsOptimizer': 'lbfgs_optimizer',
+    'PenaltyLbfgsOptimizer': 'penalty_lbfgs_optimizer',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
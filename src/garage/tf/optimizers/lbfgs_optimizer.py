@@ -5,7 +5,7 @@ import scipy.optimize
 import tensorflow as tf
 
 from garage.tf.misc import tensor_utils
-from garage.tf.optimizers.utils import LazyDict
+from garage.tf.optimizers.utils import LazyDict, sliced_fun
 
 
 class LbfgsOptimizer:
@@ -16,14 +16,18 @@ class LbfgsOptimizer:
     Args:
         max_opt_itr (int): Maximum iteration for update.
         callback (callable): Function to call during optimization.
+        num_slices (int): The loss and gradient functions' inputs will be
+            divided into num_slices and then averaged together to reduce
+            peak memory usage.
 
     """
 
-    def __init__(self, max_opt_itr=20, callback=None):
+    def __init__(self, max_opt_itr=20, callback=None, num_slices=1):
         self._max_opt_itr = max_opt_itr
         self._opt_fun = None
         self._target = None
         self._callback = callback
+        self._num_slices = num_slices
 
     def update_opt(self,
                    loss,
@@ -95,7 +99,8 @@ class LbfgsOptimizer:
                 'Use update_opt() to setup the loss function first.')
         if extra_inputs is None:
             extra_inputs = list()
-        return self._opt_fun['f_loss'](*(list(inputs) + list(extra_inputs)))
+        return sliced_fun(self._opt_fun['f_loss'],
+                          self._num_slices)(inputs, extra_inputs)
 
     def optimize(self, inputs, extra_inputs=None, name='optimize'):
         """Perform optimization.
@@ -130,7 +135,8 @@ class LbfgsOptimizer:
 
                 """
                 self._target.set_param_values(flat_params)
-                ret = f_opt(*inputs)
+                ret = sliced_fun(f_opt, self._num_slices)(inputs,
+                                                          extra_inputs)
                 return ret
 
             itr = [0]
@@ -145,7 +151,8 @@ class LbfgsOptimizer:
                         params (numpy.ndarray): Parameters.
 
                     """
-                    loss = self._opt_fun['f_loss'](*(inputs + extra_inputs))
+                    loss = sliced_fun(self._opt_fun['f_loss'],
+                                      self._num_slices)(inputs, extra_inputs)
                     elapsed = time.time() - start_time
                     self._callback(
                         dict(
@@ -5,7 +5,7 @@ import scipy.optimize
 import tensorflow as tf
 
 from garage.tf.misc import tensor_utils
-from garage.tf.optimizers.utils import LazyDict
+from garage.tf.optimizers.utils import LazyDict, sliced_fun
 
 
 class PenaltyLbfgsOptimizer:
@@ -28,6 +28,9 @@ class PenaltyLbfgsOptimizer:
         max_penalty_itr (int): Maximum penalty iterations to perform.
         adapt_penalty (bool): Whether the penalty is adaptive or not. If false,
             penalty will not change.
+        num_slices (int): The loss, constraint and gradient functions' inputs
+            will be divided into num_slices and then averaged together to
+            reduce peak memory usage.
 
     """
 
@@ -39,7 +42,8 @@ class PenaltyLbfgsOptimizer:
                  increase_penalty_factor=2,
                  decrease_penalty_factor=0.5,
                  max_penalty_itr=10,
-                 adapt_penalty=True):
+                 adapt_penalty=True,
+                 num_slices=1):
         self._max_opt_itr = max_opt_itr
         self._penalty = initial_penalty
         self._initial_penalty = initial_penalty
@@ -49,6 +53,7 @@ class PenaltyLbfgsOptimizer:
         self._decrease_penalty_factor = decrease_penalty_factor
         self._max_penalty_itr = max_penalty_itr
         self._adapt_penalty = adapt_penalty
+        self._num_slices = num_slices
 
         self._opt_fun = None
         self._target = None
@@ -141,7 +146,7 @@ class PenaltyLbfgsOptimizer:
         if self._opt_fun is None:
             raise Exception(
                 'Use update_opt() to setup the loss function first.')
-        return self._opt_fun['f_loss'](*inputs)
+        return sliced_fun(self._opt_fun['f_loss'], self._num_slices)(inputs)
 
     def constraint_val(self, inputs):
         """The constraint value.
@@ -159,7 +164,8 @@ class PenaltyLbfgsOptimizer:
         if self._opt_fun is None:
             raise Exception(
                 'Use update_opt() to setup the loss function first.')
-        return self._opt_fun['f_constraint'](*inputs)
+        return sliced_fun(self._opt_fun['f_constraint'],
+                          self._num_slices)(inputs)
 
     def optimize(self, inputs, name='optimize'):
         """Perform optimization.
@@ -184,8 +190,9 @@ class PenaltyLbfgsOptimizer:
                                   self._max_penalty)
 
             penalty_scale_factor = None
-            f_opt = self._opt_fun['f_opt']
-            f_penalized_loss = self._opt_fun['f_penalized_loss']
+            f_opt = sliced_fun(self._opt_fun['f_opt'], self._num_slices)
+            f_penalized_loss = sliced_fun(self._opt_fun['f_penalized_loss'],
+                                          self._num_slices)
 
             def gen_f_opt(penalty):  # noqa: D202
                 """Return a function that set parameters values.
@@ -209,7 +216,7 @@ class PenaltyLbfgsOptimizer:
 
                     """
                     self._target.set_param_values(flat_params)
-                    return f_opt(*(inputs + (penalty, )))
+                    return f_opt(inputs, [penalty])
 
                 return f
 
@@ -224,8 +231,8 @@ class PenaltyLbfgsOptimizer:
                     x0=cur_params,
                     maxiter=self._max_opt_itr)
 
-                _, try_loss, try_constraint_val = f_penalized_loss(*(
-                    inputs + (try_penalty, )))
+                _, try_loss, try_constraint_val = f_penalized_loss(
+                    inputs, [try_penalty])
 
                 logger.log('penalty %f => loss %f, %s %f' %
                            (try_penalty, try_loss, self._constraint_name,
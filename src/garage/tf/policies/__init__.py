@@ -1,18 +1,5 @@
 """Policies for TensorFlow-based algorithms."""
-from garage.tf.policies.categorical_cnn_policy import CategoricalCNNPolicy
-from garage.tf.policies.categorical_gru_policy import CategoricalGRUPolicy
-from garage.tf.policies.categorical_lstm_policy import CategoricalLSTMPolicy
-from garage.tf.policies.categorical_mlp_policy import CategoricalMLPPolicy
-from garage.tf.policies.continuous_mlp_policy import ContinuousMLPPolicy
-from garage.tf.policies.discrete_qf_derived_policy import (
-    DiscreteQfDerivedPolicy)
-from garage.tf.policies.gaussian_gru_policy import GaussianGRUPolicy
-from garage.tf.policies.gaussian_lstm_policy import GaussianLSTMPolicy
-from garage.tf.policies.gaussian_mlp_policy import GaussianMLPPolicy
-from garage.tf.policies.gaussian_mlp_task_embedding_policy import (
-    GaussianMLPTaskEmbeddingPolicy)
-from garage.tf.policies.policy import Policy, StochasticPolicy
-from garage.tf.policies.task_embedding_policy import TaskEmbeddingPolicy
+from garage._lazy import lazy_import
 
 __all__ = [
     'Policy', 'StochasticPolicy', 'CategoricalCNNPolicy',
@@ -21,3 +8,21 @@ __all__ = [
     'GaussianLSTMPolicy', 'GaussianMLPPolicy',
     'GaussianMLPTaskEmbeddingPolicy', 'TaskEmbeddingPolicy'
 ]
+
+_ATTRIBUTES = {
+    'CategoricalCNNPolicy': 'categorical_cnn_policy',
+    'CategoricalGRUPolicy': 'categorical_gru_policy',
+    'CategoricalLSTMPolicy': 'categorical_lstm_policy',
+    'CategoricalMLPPolicy': 'categorical_mlp_policy',
+    'ContinuousMLPPolicy': 'continuous_mlp_policy',
+    'DiscreteQfDerivedPolicy': 'discrete_qf_derived_policy',
+    'GaussianGRUPolicy': 'gaussian_gru_policy',
+    'GaussianLSTMPolicy': 'gaussian_lstm_policy',
+    'GaussianMLPPolicy': 'gaussian_mlp_policy',
+    'GaussianMLPTaskEmbeddingPolicy': 'gaussian_mlp_task_embedding_policy',
+    'Policy': 'policy',
+    'StochasticPolicy': 'policy',
+    'TaskEmbeddingPolicy': 'task_embedding_policy',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
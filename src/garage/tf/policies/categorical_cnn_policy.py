@@ -19,7 +19,8 @@ class CategoricalCNNPolicy(StochasticPolicy):
     A policy that contains a CNN and a MLP to make prediction based on
     a categorical distribution.
 
-    It only works with akro.Discrete action space.
+    It only works with akro.Discrete action space. Image observations can
+    be fed as uint8 and are normalized inside the graph.
 
     Args:
         env_spec (garage.envs.env_spec.EnvSpec): Environment specification.
@@ -59,6 +60,9 @@ class CategoricalCNNPolicy(StochasticPolicy):
             of output dense layer(s). The function should return a
             tf.Tensor.
         layer_normalization (bool): Bool for using layer normalization or not.
+        compute_dtype (tf.DType): Dtype used for the convolutions, e.g.
+            tf.float16 or tf.bfloat16 for reduced-precision compute.
+            Variables are stored in tf.float32 regardless.
 
     """
 
@@ -76,7 +80,8 @@ class CategoricalCNNPolicy(StochasticPolicy):
                  output_nonlinearity=None,
                  output_w_init=tf.initializers.glorot_uniform(),
                  output_b_init=tf.zeros_initializer(),
-                 layer_normalization=False):
+                 layer_normalization=False,
+                 compute_dtype=tf.float32):
         assert isinstance(env_spec.action_space, akro.Discrete), (
             'CategoricalCNNPolicy only works with akro.Discrete action '
             'space.')
@@ -95,6 +100,7 @@ class CategoricalCNNPolicy(StochasticPolicy):
         self._output_w_init = output_w_init
         self._output_b_init = output_b_init
         self._layer_normalization = layer_normalization
+        self._compute_dtype = compute_dtype
 
         self._f_prob = None
         self._dist = None
@@ -112,7 +118,8 @@ class CategoricalCNNPolicy(StochasticPolicy):
             output_nonlinearity=output_nonlinearity,
             output_w_init=output_w_init,
             output_b_init=output_b_init,
-            layer_normalization=layer_normalization)
+            layer_normalization=layer_normalization,
+            compute_dtype=compute_dtype)
 
     def build(self, state_input, name=None):
         """Build model.
@@ -124,11 +131,11 @@ class CategoricalCNNPolicy(StochasticPolicy):
         """
         with tf.compat.v1.variable_scope(self.name) as vs:
             self._variable_scope = vs
-            if isinstance(self.env_spec.observation_space, akro.Image):
-                augmented_state_input = tf.cast(state_input, tf.float32)
-                augmented_state_input /= 255.0
-            else:
-                augmented_state_input = state_input
+            augmented_state_input = state_input
+            if (isinstance(self.env_spec.observation_space, akro.Image)
+                    and not state_input.dtype.is_integer):
+                # uint8 pixels are normalized by the CNN itself
+                augmented_state_input = state_input / 255.0
             self._dist = self.model.build(augmented_state_input, name=name)
             self._f_prob = tf.compat.v1.get_default_session().make_callable(
                 [tf.argmax(self._dist.sample(), -1), self._dist.probs],
@@ -210,7 +217,8 @@ class CategoricalCNNPolicy(StochasticPolicy):
                               output_nonlinearity=self._output_nonlinearity,
                               output_w_init=self._output_w_init,
                               output_b_init=self._output_b_init,
-                              layer_normalization=self._layer_normalization)
+                              layer_normalization=self._layer_normalization,
+                              compute_dtype=self._compute_dtype)
 
     def __getstate__(self):
         """Object.__getstate__.
@@ -1,15 +1,17 @@
 """Q-Functions for TensorFlow-based algorithms."""
-# noqa: I100
-
-from garage.tf.q_functions.q_function import QFunction
-from garage.tf.q_functions.continuous_cnn_q_function import (  # noqa: I100
-    ContinuousCNNQFunction)
-from garage.tf.q_functions.continuous_mlp_q_function import (
-    ContinuousMLPQFunction)
-from garage.tf.q_functions.discrete_cnn_q_function import DiscreteCNNQFunction
-from garage.tf.q_functions.discrete_mlp_q_function import DiscreteMLPQFunction
+from garage._lazy import lazy_import
 
 __all__ = [
     'QFunction', 'ContinuousMLPQFunction', 'DiscreteCNNQFunction',
     'DiscreteMLPQFunction', 'ContinuousCNNQFunction'
 ]
+
+_ATTRIBUTES = {
+    'QFunction': 'q_function',
+    'ContinuousCNNQFunction': 'continuous_cnn_q_function',
+    'ContinuousMLPQFunction': 'continuous_mlp_q_function',
+    'DiscreteCNNQFunction': 'discrete_cnn_q_function',
+    'DiscreteMLPQFunction': 'discrete_mlp_q_function',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -15,7 +15,8 @@ class DiscreteCNNQFunction(QFunction):
 
     This class implements a Q value network to predict Q based on the
     input state and action. It uses an CNN and a MLP to fit the function
-    of Q(s, a).
+    of Q(s, a). Image observations are fed as uint8 and normalized inside
+    the graph.
 
     Args:
         env_spec (garage.envs.env_spec.EnvSpec): Environment specification.
@@ -65,6 +66,9 @@ class DiscreteCNNQFunction(QFunction):
             a tf.Tensor.
         dueling (bool): Bool for using dueling network or not.
         layer_normalization (bool): Bool for using layer normalization or not.
+        compute_dtype (tf.DType): Dtype used for the convolutions, e.g.
+            tf.float16 or tf.bfloat16 for reduced-precision compute.
+            Variables are stored in tf.float32 regardless.
 
     """
 
@@ -87,7 +91,8 @@ class DiscreteCNNQFunction(QFunction):
                  output_w_init=tf.initializers.glorot_uniform(),
                  output_b_init=tf.zeros_initializer(),
                  dueling=False,
-                 layer_normalization=False):
+                 layer_normalization=False,
+                 compute_dtype=tf.float32):
         if not isinstance(env_spec.observation_space, akro.Box) or \
                 not len(env_spec.observation_space.shape) in (2, 3):
             raise ValueError(
@@ -118,6 +123,7 @@ class DiscreteCNNQFunction(QFunction):
         self._output_b_init = output_b_init
         self._layer_normalization = layer_normalization
         self._dueling = dueling
+        self._compute_dtype = compute_dtype
 
         self.obs_dim = self._env_spec.observation_space.shape
         action_dim = self._env_spec.action_space.flat_dim
@@ -127,7 +133,8 @@ class DiscreteCNNQFunction(QFunction):
                                  num_filters=num_filters,
                                  strides=strides,
                                  padding=padding,
-                                 hidden_nonlinearity=cnn_hidden_nonlinearity)
+                                 hidden_nonlinearity=cnn_hidden_nonlinearity,
+                                 compute_dtype=compute_dtype)
         else:
             cnn_model = CNNModelWithMaxPooling(
                 filter_dims=filter_dims,
@@ -136,7 +143,8 @@ class DiscreteCNNQFunction(QFunction):
                 padding=padding,
                 pool_strides=pool_strides,
                 pool_shapes=pool_shapes,
-                hidden_nonlinearity=cnn_hidden_nonlinearity)
+                hidden_nonlinearity=cnn_hidden_nonlinearity,
+                compute_dtype=compute_dtype)
         if not dueling:
             output_model = MLPModel(output_dim=action_dim,
                                     hidden_sizes=hidden_sizes,
@@ -166,19 +174,16 @@ class DiscreteCNNQFunction(QFunction):
     def _initialize(self):
         """Initialize QFunction."""
         if isinstance(self._env_spec.observation_space, akro.Image):
-            obs_ph = tf.compat.v1.placeholder(tf.uint8,
-                                              (None, ) + self.obs_dim,
-                                              name='obs')
-            augmented_obs_ph = tf.cast(obs_ph, tf.float32) / 255.0
+            # pixels are normalized by the CNN inside the graph
+            obs_dtype = tf.uint8
         else:
-            obs_ph = tf.compat.v1.placeholder(tf.float32,
-                                              (None, ) + self.obs_dim,
-                                              name='obs')
-            augmented_obs_ph = obs_ph
+            obs_dtype = tf.float32
+        obs_ph = tf.compat.v1.placeholder(obs_dtype, (None, ) + self.obs_dim,
+                                          name='obs')
 
         with tf.compat.v1.variable_scope(self.name) as vs:
             self._variable_scope = vs
-            self.model.build(augmented_obs_ph)
+            self.model.build(obs_ph)
 
         self._obs_input = obs_ph
 
@@ -216,9 +221,10 @@ class DiscreteCNNQFunction(QFunction):
         """
         with tf.compat.v1.variable_scope(self._variable_scope):
             augmented_state_input = state_input
-            if isinstance(self._env_spec.observation_space, akro.Image):
-                augmented_state_input = tf.cast(state_input,
-                                                tf.float32) / 255.0
+            if (isinstance(self._env_spec.observation_space, akro.Image)
+                    and not state_input.dtype.is_integer):
+                # uint8 pixels are normalized by the CNN itself
+                augmented_state_input = state_input / 255.0
             return self.model.build(augmented_state_input, name=name)
 
     def clone(self, name):
@@ -251,7 +257,8 @@ class DiscreteCNNQFunction(QFunction):
                               output_w_init=self._output_w_init,
                               output_b_init=self._output_b_init,
                               dueling=self._dueling,
-                              layer_normalization=self._layer_normalization)
+                              layer_normalization=self._layer_normalization,
+                              compute_dtype=self._compute_dtype)
 
     def __setstate__(self, state):
         """Object.__setstate__.
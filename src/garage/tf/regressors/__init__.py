@@ -1,14 +1,5 @@
 """Regressors for TensorFlow-based algorithms."""
-from garage.tf.regressors.bernoulli_mlp_regressor import BernoulliMLPRegressor
-from garage.tf.regressors.categorical_mlp_regressor import (
-    CategoricalMLPRegressor)
-from garage.tf.regressors.continuous_mlp_regressor import (
-    ContinuousMLPRegressor)
-from garage.tf.regressors.gaussian_cnn_regressor import GaussianCNNRegressor
-from garage.tf.regressors.gaussian_cnn_regressor_model import (
-    GaussianCNNRegressorModel)
-from garage.tf.regressors.gaussian_mlp_regressor import GaussianMLPRegressor
-from garage.tf.regressors.regressor import Regressor, StochasticRegressor
+from garage._lazy import lazy_import
 
 __all__ = [
     'BernoulliMLPRegressor', 'CategoricalMLPRegressor',
@@ -16,3 +7,16 @@ __all__ = [
     'GaussianCNNRegressorModel', 'GaussianMLPRegressor', 'Regressor',
     'StochasticRegressor'
 ]
+
+_ATTRIBUTES = {
+    'BernoulliMLPRegressor': 'bernoulli_mlp_regressor',
+    'CategoricalMLPRegressor': 'categorical_mlp_regressor',
+    'ContinuousMLPRegressor': 'continuous_mlp_regressor',
+    'GaussianCNNRegressor': 'gaussian_cnn_regressor',
+    'GaussianCNNRegressorModel': 'gaussian_cnn_regressor_model',
+    'GaussianMLPRegressor': 'gaussian_mlp_regressor',
+    'Regressor': 'regressor',
+    'StochasticRegressor': 'regressor',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -95,6 +95,12 @@ class GaussianCNNRegressor(StochasticRegressor):
         use_trust_region (bool): Whether to use a KL-divergence constraint.
         max_kl_step (float): KL divergence constraint for each iteration, if
             `use_trust_region` is active.
+        input_dtype (tf.DType): Dtype of the input placeholder. Use tf.uint8
+            to feed raw pixel observations, which are then scaled to [0, 1]
+            inside the graph instead of on the host.
+        compute_dtype (tf.DType): Dtype used for the convolutions, e.g.
+            tf.float16 or tf.bfloat16 for reduced-precision compute.
+            Variables are stored in tf.float32 regardless.
 
     """
 
@@ -131,7 +137,9 @@ class GaussianCNNRegressor(StochasticRegressor):
                  optimizer=None,
                  optimizer_args=None,
                  use_trust_region=True,
-                 max_kl_step=0.01):
+                 max_kl_step=0.01,
+                 input_dtype=tf.float32,
+                 compute_dtype=tf.float32):
 
         super().__init__(input_shape, output_dim, name)
         self._use_trust_region = use_trust_region
@@ -139,6 +147,7 @@ class GaussianCNNRegressor(StochasticRegressor):
         self._max_kl_step = max_kl_step
         self._normalize_inputs = normalize_inputs
         self._normalize_outputs = normalize_outputs
+        self._input_dtype = tf.as_dtype(input_dtype)
 
         with tf.compat.v1.variable_scope(self._name, reuse=False) as vs:
             self._variable_scope = vs
@@ -181,11 +190,12 @@ class GaussianCNNRegressor(StochasticRegressor):
             std_hidden_nonlinearity=std_hidden_nonlinearity,
             std_output_nonlinearity=std_output_nonlinearity,
             std_parameterization='exp',
-            layer_normalization=layer_normalization)
+            layer_normalization=layer_normalization,
+            compute_dtype=compute_dtype)
         self._initialize()
 
     def _initialize(self):
-        input_var = tf.compat.v1.placeholder(tf.float32,
+        input_var = tf.compat.v1.placeholder(self._input_dtype,
                                              shape=(None, ) +
                                              self._input_shape)
 
@@ -273,10 +283,13 @@ class GaussianCNNRegressor(StochasticRegressor):
 
         if self._normalize_inputs:
             # recompute normalizing constants for inputs
-            self.model.networks['default'].x_mean.load(
-                np.mean(xs, axis=0, keepdims=True))
-            self.model.networks['default'].x_std.load(
-                np.std(xs, axis=0, keepdims=True) + 1e-8)
+            x_mean = np.mean(xs, axis=0, keepdims=True)
+            x_std = np.std(xs, axis=0, keepdims=True)
+            if self._input_dtype.is_integer:
+                # pixel inputs are scaled to [0, 1] inside the graph
+                x_mean, x_std = x_mean / 255., x_std / 255.
+            self.model.networks['default'].x_mean.load(x_mean)
+            self.model.networks['default'].x_std.load(x_std + 1e-8)
         if self._normalize_outputs:
             # recompute normalizing constants for outputs
             self.model.networks['default'].y_mean.load(
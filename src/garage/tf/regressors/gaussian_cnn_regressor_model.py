@@ -2,6 +2,7 @@
 import numpy as np
 import tensorflow as tf
 
+from garage.tf.misc.tensor_utils import normalize_pixel_input
 from garage.tf.models import GaussianCNNModel
 
 
@@ -86,6 +87,9 @@ class GaussianCNNRegressorModel(GaussianCNNModel):
                exponential transformation
             - softplus: the std will be computed as log(1+exp(x))
         layer_normalization (bool): Bool for using layer normalization or not.
+        compute_dtype (tf.DType): Dtype used for the convolutions, e.g.
+            tf.float16 or tf.bfloat16 for reduced-precision compute.
+            Variables are stored in tf.float32 regardless.
     """
 
     def __init__(self,
@@ -130,6 +134,7 @@ class GaussianCNNRegressorModel(GaussianCNNModel):
                 initializer=tf.ones_initializer(),
                 trainable=False)
 
+        state_input = normalize_pixel_input(state_input)
         normalized_xs_var = (state_input - x_mean_var) / x_std_var
 
         sample, normalized_mean, normalized_log_std, std_param, dist = super(
@@ -60,6 +60,14 @@ class GaussianMLPRegressor(StochasticRegressor):
         normalize_outputs (bool): Bool for normalizing outputs or not.
         subsample_factor (float): The factor to subsample the data. By default
             it is 1.0, which means using all the data.
+        num_slices (int): Number of slices the data is divided into when
+            fitting. The normalization statistics, the old distribution and
+            (for the default optimizers) the loss and gradient are computed
+            one slice at a time, which bounds peak memory usage for large
+            batches.
+        warm_start_normalization (bool): If True, the normalization
+            statistics are accumulated across calls to fit() instead of
+            being recomputed from each batch.
 
     """
 
@@ -87,19 +95,27 @@ class GaussianMLPRegressor(StochasticRegressor):
                  layer_normalization=False,
                  normalize_inputs=True,
                  normalize_outputs=True,
-                 subsample_factor=1.0):
+                 subsample_factor=1.0,
+                 num_slices=1,
+                 warm_start_normalization=False):
         super().__init__(input_shape, output_dim, name)
         self._use_trust_region = use_trust_region
         self._subsample_factor = subsample_factor
         self._max_kl_step = max_kl_step
         self._normalize_inputs = normalize_inputs
         self._normalize_outputs = normalize_outputs
+        self._num_slices = num_slices
+        self._warm_start_normalization = warm_start_normalization
+        self._x_moments = None
+        self._y_moments = None
 
         with tf.compat.v1.variable_scope(self._name, reuse=False) as vs:
             self._variable_scope = vs
             if optimizer_args is None:
                 optimizer_args = dict()
             if optimizer is None:
+                optimizer_args = dict(optimizer_args)
+                optimizer_args.setdefault('num_slices', num_slices)
                 if use_trust_region:
                     optimizer = PenaltyLbfgsOptimizer(**optimizer_args)
                 else:
@@ -221,18 +237,26 @@ class GaussianMLPRegressor(StochasticRegressor):
 
         if self._normalize_inputs:
             # recompute normalizing constants for inputs
-            self.model.networks['default'].x_mean.load(
-                np.mean(xs, axis=0, keepdims=True))
-            self.model.networks['default'].x_std.load(
-                np.std(xs, axis=0, keepdims=True) + 1e-8)
+            self._x_moments = self._compute_moments(xs, self._x_moments)
+            _, x_mean, x_var = self._x_moments
+            self.model.networks['default'].x_mean.load(x_mean)
+            self.model.networks['default'].x_std.load(np.sqrt(x_var) + 1e-8)
         if self._normalize_outputs:
             # recompute normalizing constants for outputs
-            self.model.networks['default'].y_mean.load(
-                np.mean(ys, axis=0, keepdims=True))
-            self.model.networks['default'].y_std.load(
-                np.std(ys, axis=0, keepdims=True) + 1e-8)
+            self._y_moments = self._compute_moments(ys, self._y_moments)
+            _, y_mean, y_var = self._y_moments
+            self.model.networks['default'].y_mean.load(y_mean)
+            self.model.networks['default'].y_std.load(np.sqrt(y_var) + 1e-8)
         if self._use_trust_region:
-            old_means, old_log_stds = self._f_pdists(xs)
+            # same slicing as garage.tf.optimizers.utils.sliced_fun
+            slice_size = max(1, len(xs) // self._num_slices)
+            old_dists = [
+                self._f_pdists(xs[start:start + slice_size])
+                for start in range(0, len(xs), slice_size)
+            ]
+            old_means = np.concatenate([means for means, _ in old_dists])
+            old_log_stds = np.concatenate(
+                [log_stds for _, log_stds in old_dists])
             inputs = [xs, ys, old_means, old_log_stds]
         else:
             inputs = [xs, ys]
@@ -246,6 +270,42 @@ class GaussianMLPRegressor(StochasticRegressor):
                            self._optimizer.constraint_val(inputs))
         tabular.record('{}/dLoss'.format(self._name), loss_before - loss_after)
 
+    def _compute_moments(self, data, moments=None):
+        """Compute the mean and variance of data one slice at a time.
+
+        Statistics of the slices are merged with the parallel algorithm of
+        Chan et al., so the data is never copied as a whole.
+
+        Args:
+            data (numpy.ndarray): Data to compute the statistics of.
+            moments (tuple): Count, mean and variance of the data seen in
+                previous calls, or None. Only used if warm-starting the
+                normalization.
+
+        Returns:
+            tuple[int, numpy.ndarray, numpy.ndarray]: Count, mean and
+                variance of the data seen so far.
+
+        """
+        if not self._warm_start_normalization:
+            moments = None
+        slice_size = max(1, len(data) // self._num_slices)
+        for start in range(0, len(data), slice_size):
+            data_slice = data[start:start + slice_size]
+            count = len(data_slice)
+            mean = np.mean(data_slice, axis=0, keepdims=True)
+            var = np.var(data_slice, axis=0, keepdims=True)
+            if moments is not None:
+                prev_count, prev_mean, prev_var = moments
+                total = prev_count + count
+                delta = mean - prev_mean
+                mean = prev_mean + delta * count / total
+                var = (prev_var * prev_count + var * count +
+                       np.square(delta) * prev_count * count / total) / total
+                count = total
+            moments = (count, mean, var)
+        return moments
+
     def predict(self, xs):
         """Predict ys based on input xs.
 
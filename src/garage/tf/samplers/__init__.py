@@ -1,6 +1,12 @@
 """Samplers which run agents that use Tensorflow in environments."""
-
-from garage.tf.samplers.batch_sampler import BatchSampler
-from garage.tf.samplers.worker import TFWorkerClassWrapper, TFWorkerWrapper
+from garage._lazy import lazy_import
 
 __all__ = ['BatchSampler', 'TFWorkerClassWrapper', 'TFWorkerWrapper']
+
+_ATTRIBUTES = {
+    'BatchSampler': 'batch_sampler',
+    'TFWorkerClassWrapper': 'worker',
+    'TFWorkerWrapper': 'worker',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -38,6 +38,9 @@ class DDPG(OffPolicyRLAlgorithm):
                 Exploration strategy.
         target_update_tau (float): Interpolation parameter for doing the
             soft target update.
+        target_update_freq (int): Number of gradient steps between two
+            updates of the target networks. Each update applies the
+            averaging of target_update_freq soft updates at once.
         discount(float): Discount factor for the cumulative return.
         policy_weight_decay (float): L2 weight decay factor for parameters
             of the policy network.
@@ -80,6 +83,7 @@ class DDPG(OffPolicyRLAlgorithm):
             rollout_batch_size=1,
             exploration_policy=None,
             target_update_tau=0.01,
+            target_update_freq=1,
             discount=0.99,
             policy_weight_decay=0,
             qf_weight_decay=0,
@@ -94,6 +98,8 @@ class DDPG(OffPolicyRLAlgorithm):
             smooth_return=True):
         action_bound = env_spec.action_space.high
         self._tau = target_update_tau
+        self._target_update_freq = target_update_freq
+        self._n_grad_steps = 0
         self._policy_weight_decay = policy_weight_decay
         self._qf_weight_decay = qf_weight_decay
         self._clip_pos_returns = clip_pos_returns
@@ -250,18 +256,15 @@ class DDPG(OffPolicyRLAlgorithm):
         self._policy_optimizer.step()
 
         # update target networks
-        self.update_target()
+        self._n_grad_steps += 1
+        if self._n_grad_steps % self._target_update_freq == 0:
+            self.update_target()
         return (qval_loss.detach(), y_target, qval.detach(),
                 action_loss.detach())
 
     def update_target(self):
         """Update parameters in the target policy and Q-value network."""
-        for t_param, param in zip(self._target_qf.parameters(),
-                                  self.qf.parameters()):
-            t_param.data.copy_(t_param.data * (1.0 - self._tau) +
-                               param.data * self._tau)
-
-        for t_param, param in zip(self._target_policy.parameters(),
-                                  self.policy.parameters()):
-            t_param.data.copy_(t_param.data * (1.0 - self._tau) +
-                               param.data * self._tau)
+        tu.soft_update_model(self._target_qf, self.qf, self._tau,
+                             self._target_update_freq)
+        tu.soft_update_model(self._target_policy, self.policy, self._tau,
+                             self._target_update_freq)
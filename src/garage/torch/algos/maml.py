@@ -113,11 +113,9 @@ class MAML:
         itr = runner.step_itr
         old_theta = dict(self._policy.named_parameters())
 
-        kl_before = self._compute_kl_constraint(all_samples,
-                                                all_params,
-                                                set_grad=False)
-
-        meta_objective = self._compute_meta_loss(all_samples, all_params)
+        meta_objective, kl_before = self._compute_meta_loss_and_kl(
+            all_samples, all_params)
+        kl_before = kl_before.detach()
 
         self._meta_optimizer.zero_grad()
         meta_objective.backward()
@@ -125,12 +123,9 @@ class MAML:
         self._meta_optimize(all_samples, all_params)
 
         # Log
-        loss_after = self._compute_meta_loss(all_samples,
-                                             all_params,
-                                             set_grad=False)
-        kl_after = self._compute_kl_constraint(all_samples,
-                                               all_params,
-                                               set_grad=False)
+        loss_after, kl_after = self._compute_meta_loss_and_kl(all_samples,
+                                                              all_params,
+                                                              set_grad=False)
 
         with torch.no_grad():
             policy_entropy = self._compute_policy_entropy(
@@ -240,11 +235,23 @@ class MAML:
 
     def _meta_optimize(self, all_samples, all_params):
         if isinstance(self._meta_optimizer, ConjugateGradientOptimizer):
-            self._meta_optimizer.step(
-                f_loss=lambda: self._compute_meta_loss(
-                    all_samples, all_params, set_grad=False),
-                f_constraint=lambda: self._compute_kl_constraint(
-                    all_samples, all_params))
+            # The line search evaluates the constraint right after the loss,
+            # with the same parameters, so the KL divergence computed along
+            # with the loss is used instead of adapting to all tasks again.
+            kl_cache = {}
+
+            def f_loss():
+                loss, kl_cache['kl'] = self._compute_meta_loss_and_kl(
+                    all_samples, all_params, set_grad=False)
+                return loss
+
+            def f_constraint():
+                kl = kl_cache.pop('kl', None)
+                if kl is None:
+                    kl = self._compute_kl_constraint(all_samples, all_params)
+                return kl
+
+            self._meta_optimizer.step(f_loss=f_loss, f_constraint=f_constraint)
         else:
             self._meta_optimizer.step(lambda: self._compute_meta_loss(
                 all_samples, all_params, set_grad=False))
@@ -264,11 +271,38 @@ class MAML:
         Returns:
             torch.Tensor: Calculated mean value of loss.
 
+        """
+        return self._compute_meta_loss_and_kl(all_samples, all_params,
+                                              set_grad)[0]
+
+    def _compute_meta_loss_and_kl(self,
+                                  all_samples,
+                                  all_params,
+                                  set_grad=True):
+        """Compute loss to meta-optimize and KL divergence.
+
+        Both are computed with the same adapted policy of each task, so that
+        the inner adaptation to each task is done once for both.
+
+        Args:
+            all_samples (list[list[MAMLTrajectoryBatch]]): A two
+                dimensional list of MAMLTrajectoryBatch of size
+                [meta_batch_size * (num_grad_updates + 1)]
+            all_params (list[dict]): A list of named parameter dictionaries.
+                Each dictionary contains key value pair of names (str) and
+                parameters (torch.Tensor).
+            set_grad (bool): Whether to enable gradient calculation or not.
+
+        Returns:
+            torch.Tensor: Calculated mean value of loss.
+            torch.Tensor: Calculated mean value of KL divergence.
+
         """
         theta = dict(self._policy.named_parameters())
         old_theta = dict(self._old_policy.named_parameters())
 
         losses = []
+        kls = []
         for task_samples, task_params in zip(all_samples, all_params):
             for i in range(self._num_grad_updates):
                 require_grad = i < self._num_grad_updates - 1 or set_grad
@@ -279,12 +313,15 @@ class MAML:
                 # pylint: disable=protected-access
                 last_update = task_samples[-1]
                 loss = self._inner_algo._compute_loss(*last_update[1:])
+                kl = self._inner_algo._compute_kl_constraint(
+                    last_update.observations)
             losses.append(loss)
+            kls.append(kl)
 
             tu.update_module_params(self._policy, theta)
             tu.update_module_params(self._old_policy, old_theta)
 
-        return torch.stack(losses).mean()
+        return torch.stack(losses).mean(), torch.stack(kls).mean()
 
     def _compute_kl_constraint(self, all_samples, all_params, set_grad=True):
         """Compute KL divergence.
@@ -2,7 +2,7 @@
 import numpy as np
 import torch
 
-from garage import log_multitask_performance, TrajectoryBatch
+from garage import log_multitask_performance
 from garage.torch.algos import SAC
 import garage.torch.utils as tu
 
@@ -54,6 +54,8 @@ class MTSAC(SAC):
             be in the replay buffer before training can begin.
         target_update_tau (float): A coefficient that controls the rate at
             which the target q_functions update over optimization iterations.
+        target_update_freq (int): Number of gradient steps between two
+            updates of the target q_functions.
         policy_lr (float): Learning rate for policy optimizers.
         qf_lr (float): Learning rate for q_function optimizers.
         reward_scale (float): Reward multiplier. Changing this hyperparameter
@@ -66,6 +68,11 @@ class MTSAC(SAC):
         num_evaluation_trajectories (int): The number of evaluation
             trajectories used for computing eval stats at the end of every
             epoch.
+        num_eval_envs (int or None): Number of copies of the evaluation
+            environment, which are stepped together with batched policy
+            calls. If None, there is one copy per task.
+        async_evaluation (bool): If True, the policy of each epoch is
+            evaluated in a background thread during the next epoch.
 
     """
 
@@ -87,12 +94,15 @@ class MTSAC(SAC):
             buffer_batch_size=64,
             min_buffer_size=int(1e4),
             target_update_tau=5e-3,
+            target_update_freq=1,
             policy_lr=3e-4,
             qf_lr=3e-4,
             reward_scale=1.0,
             optimizer=torch.optim.Adam,
             steps_per_epoch=1,
             num_evaluation_trajectories=5,
+            num_eval_envs=None,
+            async_evaluation=False,
     ):
 
         super().__init__(
@@ -110,13 +120,16 @@ class MTSAC(SAC):
             buffer_batch_size=buffer_batch_size,
             min_buffer_size=min_buffer_size,
             target_update_tau=target_update_tau,
+            target_update_freq=target_update_freq,
             policy_lr=policy_lr,
             qf_lr=qf_lr,
             reward_scale=reward_scale,
             optimizer=optimizer,
             steps_per_epoch=steps_per_epoch,
             num_evaluation_trajectories=num_evaluation_trajectories,
-            eval_env=eval_env)
+            eval_env=eval_env,
+            num_eval_envs=num_eval_envs or num_tasks,
+            async_evaluation=async_evaluation)
         self._num_tasks = num_tasks
         self._eval_env = eval_env
         self._use_automatic_entropy_tuning = fixed_alpha is None
@@ -165,7 +178,7 @@ class MTSAC(SAC):
         ret = torch.mm(one_hots, log_alpha.unsqueeze(0).t()).squeeze()
         return ret
 
-    def _evaluate_policy(self, epoch):
+    def _evaluate_policy(self, epoch, eval_trajectories=None):
         """Evaluate the performance of the policy via deterministic rollouts.
 
             Statistics such as (average) discounted return and success rate are
@@ -173,23 +186,31 @@ class MTSAC(SAC):
 
         Args:
             epoch (int): The current training epoch.
+            eval_trajectories (TrajectoryBatch or None): Evaluation
+                trajectories obtained in the background. If None, they are
+                obtained now.
 
         Returns:
             float: The average return across self._num_evaluation_trajectories
                 trajectories
 
         """
-        eval_trajs = []
-        for _ in range(self._num_tasks):
-            eval_trajs.append(
-                self._obtain_evaluation_samples(
-                    self._eval_env,
-                    num_trajs=self._num_evaluation_trajectories))
-        eval_trajs = TrajectoryBatch.concatenate(*eval_trajs)
-        last_return = log_multitask_performance(epoch, eval_trajs,
+        if eval_trajectories is None:
+            eval_trajectories = self._evaluator.evaluate(
+                self.policy, self._get_num_evaluation_trajectories())
+        last_return = log_multitask_performance(epoch, eval_trajectories,
                                                 self.discount)
         return last_return
 
+    def _get_num_evaluation_trajectories(self):
+        """Get the number of trajectories of each evaluation.
+
+        Returns:
+            int: Number of evaluation trajectories of all tasks.
+
+        """
+        return self._num_tasks * self._num_evaluation_trajectories
+
     def to(self, device=None):
         """Put all the networks within the model on device.
 
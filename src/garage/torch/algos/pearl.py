@@ -14,10 +14,12 @@ from garage import InOutSpec, TimeStep
 from garage.envs import EnvSpec
 from garage.experiment import MetaEvaluator
 from garage.np.algos import MetaRLAlgorithm
-from garage.replay_buffer import PathBuffer
+from garage.replay_buffer import MultiTaskPathBuffer
 from garage.sampler import DefaultWorker
 from garage.torch.embeddings import MLPEncoder
+from garage.torch.modules import EnsembleMLPModule
 from garage.torch.policies import ContextConditionedPolicy
+from garage.torch.replay_staging import ReplayStager
 import garage.torch.utils as tu
 
 
@@ -40,7 +42,10 @@ class PEARL(MetaRLAlgorithm):
         encoder_class (garage.torch.embeddings.ContextEncoder): Encoder class
             for the encoder in context-conditioned policy.
         inner_policy (garage.torch.policies.Policy): Policy.
-        qf (torch.nn.Module): Q-function.
+        qf (torch.nn.Module): Q-function. A copy of it is used as the second
+            Q-function. If it is an ensemble of Q-functions, like
+            garage.torch.q_functions.EnsembleContinuousMLPQFunction, all its
+            members are used instead, and evaluated in a single forward pass.
         vf (torch.nn.Module): Value function.
         num_train_tasks (int): Number of tasks for training.
         num_test_tasks (int): Number of tasks for testing.
@@ -58,6 +63,9 @@ class PEARL(MetaRLAlgorithm):
         policy_pre_activation_coeff (float): Policy pre-activation weight.
         soft_target_tau (float): Interpolation parameter for doing the
             soft target update.
+        target_update_freq (int): Number of gradient steps between two
+            updates of the target value function. Each update applies the
+            averaging of target_update_freq soft updates at once.
         kl_lambda (float): KL lambda value.
         optimizer_class (callable): Type of optimizer for training networks.
         use_information_bottleneck (bool): False means latent context is
@@ -112,6 +120,7 @@ class PEARL(MetaRLAlgorithm):
                  policy_std_reg_coeff=1E-3,
                  policy_pre_activation_coeff=0.,
                  soft_target_tau=0.005,
+                 target_update_freq=1,
                  kl_lambda=.1,
                  optimizer_class=torch.optim.Adam,
                  use_information_bottleneck=True,
@@ -134,7 +143,9 @@ class PEARL(MetaRLAlgorithm):
 
         self._env = env
         self._qf1 = qf
-        self._qf2 = copy.deepcopy(qf)
+        self._qf2 = (None if isinstance(qf, EnsembleMLPModule) else
+                     copy.deepcopy(qf))
+        self._qfs = [qf] if self._qf2 is None else [qf, self._qf2]
         self._vf = vf
         self._num_train_tasks = num_train_tasks
         self._num_test_tasks = num_test_tasks
@@ -144,6 +155,8 @@ class PEARL(MetaRLAlgorithm):
         self._policy_std_reg_coeff = policy_std_reg_coeff
         self._policy_pre_activation_coeff = policy_pre_activation_coeff
         self._soft_target_tau = soft_target_tau
+        self._target_update_freq = target_update_freq
+        self._n_grad_steps = 0
         self._kl_lambda = kl_lambda
         self._use_information_bottleneck = use_information_bottleneck
         self._use_next_obs_in_context = use_next_obs_in_context
@@ -167,7 +180,9 @@ class PEARL(MetaRLAlgorithm):
 
         self._is_resuming = False
 
-        worker_args = dict(deterministic=True, accum_context=True)
+        worker_args = dict(deterministic=True,
+                           accum_context=True,
+                           update_posterior=True)
         self._evaluator = MetaEvaluator(test_task_sampler=test_env_sampler,
                                         max_path_length=max_path_length,
                                         worker_class=PEARLWorker,
@@ -188,16 +203,21 @@ class PEARL(MetaRLAlgorithm):
             use_information_bottleneck=use_information_bottleneck,
             use_next_obs=use_next_obs_in_context)
 
-        # buffer for training RL update
-        self._replay_buffers = {
-            i: PathBuffer(replay_buffer_size)
-            for i in range(num_train_tasks)
-        }
+        # buffers of all train tasks for training RL update
+        self._replay_buffers = MultiTaskPathBuffer(num_train_tasks,
+                                                   replay_buffer_size)
 
-        self._context_replay_buffers = {
-            i: PathBuffer(replay_buffer_size)
-            for i in range(num_train_tasks)
-        }
+        self._context_replay_buffers = MultiTaskPathBuffer(
+            num_train_tasks, replay_buffer_size)
+
+        # reused tensors which batches of the buffers are gathered into
+        self._data_stager = ReplayStager(('observations', 'actions',
+                                          'rewards', 'next_observations',
+                                          'dones'))
+        self._context_keys = ['observations', 'actions', 'rewards']
+        if use_next_obs_in_context:
+            self._context_keys.append('next_observations')
+        self._context_stager = ReplayStager(self._context_keys)
 
         self.target_vf = copy.deepcopy(self._vf)
         self.vf_criterion = torch.nn.MSELoss()
@@ -206,12 +226,8 @@ class PEARL(MetaRLAlgorithm):
             self._policy.networks[1].parameters(),
             lr=policy_lr,
         )
-        self.qf1_optimizer = optimizer_class(
-            self._qf1.parameters(),
-            lr=qf_lr,
-        )
-        self.qf2_optimizer = optimizer_class(
-            self._qf2.parameters(),
+        self.qf_optimizer = optimizer_class(
+            [param for qf in self._qfs for param in qf.parameters()],
             lr=qf_lr,
         )
         self.vf_optimizer = optimizer_class(
@@ -243,15 +259,11 @@ class PEARL(MetaRLAlgorithm):
 
         """
         self.__dict__.update(state)
-        self._replay_buffers = {
-            i: PathBuffer(self._replay_buffer_size)
-            for i in range(self._num_train_tasks)
-        }
-
-        self._context_replay_buffers = {
-            i: PathBuffer(self._replay_buffer_size)
-            for i in range(self._num_train_tasks)
-        }
+        self._replay_buffers = MultiTaskPathBuffer(self._num_train_tasks,
+                                                   self._replay_buffer_size)
+
+        self._context_replay_buffers = MultiTaskPathBuffer(
+            self._num_train_tasks, self._replay_buffer_size)
         self._is_resuming = True
 
     def train(self, runner):
@@ -268,21 +280,22 @@ class PEARL(MetaRLAlgorithm):
 
             # obtain initial set of samples from all train tasks
             if epoch == 0 or self._is_resuming:
-                for idx in range(self._num_train_tasks):
-                    self._task_idx = idx
-                    self._obtain_samples(runner, epoch,
-                                         self._num_initial_steps, np.inf)
-                    self._is_resuming = False
+                self._obtain_prior_samples(runner, epoch,
+                                           range(self._num_train_tasks),
+                                           self._num_initial_steps)
+                self._is_resuming = False
 
             # obtain samples from random tasks
-            for _ in range(self._num_tasks_sample):
-                idx = np.random.randint(self._num_train_tasks)
+            task_indices = np.random.randint(self._num_train_tasks,
+                                             size=self._num_tasks_sample)
+            for idx in task_indices:
+                self._context_replay_buffers.clear(idx)
+            # obtain samples with z ~ prior, for all tasks at once
+            if self._num_steps_prior > 0:
+                self._obtain_prior_samples(runner, epoch, task_indices,
+                                           self._num_steps_prior)
+            for idx in task_indices:
                 self._task_idx = idx
-                self._context_replay_buffers[idx].clear()
-                # obtain samples with z ~ prior
-                if self._num_steps_prior > 0:
-                    self._obtain_samples(runner, epoch, self._num_steps_prior,
-                                         np.inf)
                 # obtain samples with z ~ posterior
                 if self._num_steps_posterior > 0:
                     self._obtain_samples(runner, epoch,
@@ -337,8 +350,7 @@ class PEARL(MetaRLAlgorithm):
         next_obs = next_obs.view(t * b, -1)
 
         # optimize qf and encoder networks
-        q1_pred = self._qf1(torch.cat([obs, actions], dim=1), task_z)
-        q2_pred = self._qf2(torch.cat([obs, actions], dim=1), task_z)
+        q_pred = self._q_values(torch.cat([obs, actions], dim=1), task_z)
         v_pred = self._vf(obs, task_z.detach())
 
         with torch.no_grad():
@@ -351,26 +363,22 @@ class PEARL(MetaRLAlgorithm):
             kl_loss = self._kl_lambda * kl_div
             kl_loss.backward(retain_graph=True)
 
-        self.qf1_optimizer.zero_grad()
-        self.qf2_optimizer.zero_grad()
+        self.qf_optimizer.zero_grad()
 
         rewards_flat = rewards.view(self._batch_size * num_tasks, -1)
         rewards_flat = rewards_flat * self._reward_scale
         terms_flat = terms.view(self._batch_size * num_tasks, -1)
         q_target = rewards_flat + (
             1. - terms_flat) * self._discount * target_v_values
-        qf_loss = torch.mean((q1_pred - q_target)**2) + torch.mean(
-            (q2_pred - q_target)**2)
+        qf_loss = torch.mean((q_pred - q_target)**2, dim=(1, 2)).sum()
         qf_loss.backward()
 
-        self.qf1_optimizer.step()
-        self.qf2_optimizer.step()
+        self.qf_optimizer.step()
         self.context_optimizer.step()
 
         # compute min Q on the new actions
-        q1 = self._qf1(torch.cat([obs, new_actions], dim=1), task_z.detach())
-        q2 = self._qf2(torch.cat([obs, new_actions], dim=1), task_z.detach())
-        min_q = torch.min(q1, q2)
+        min_q = self._q_values(torch.cat([obs, new_actions], dim=1),
+                               task_z.detach()).min(dim=0).values
 
         # optimize vf
         v_target = min_q - log_pi
@@ -378,7 +386,9 @@ class PEARL(MetaRLAlgorithm):
         self.vf_optimizer.zero_grad()
         vf_loss.backward()
         self.vf_optimizer.step()
-        self._update_target_network()
+        self._n_grad_steps += 1
+        if self._n_grad_steps % self._target_update_freq == 0:
+            self._update_target_network()
 
         # optimize policy
         log_policy_target = min_q
@@ -397,6 +407,24 @@ class PEARL(MetaRLAlgorithm):
         policy_loss.backward()
         self._policy_optimizer.step()
 
+    def _q_values(self, inputs, task_z):
+        """Evaluate all Q-functions.
+
+        Args:
+            inputs (torch.Tensor): Observations and actions, with shape
+                :math:`(N, O + A)`.
+            task_z (torch.Tensor): Latent context, with shape
+                :math:`(N, Z)`.
+
+        Returns:
+            torch.Tensor: Q-values of each Q-function, with shape
+                :math:`(K, N, 1)`.
+
+        """
+        return torch.cat([
+            qf(inputs, task_z).reshape(-1, len(inputs), 1) for qf in self._qfs
+        ])
+
     def _obtain_samples(self,
                         runner,
                         itr,
@@ -429,24 +457,56 @@ class PEARL(MetaRLAlgorithm):
                                           self._policy,
                                           self._env[self._task_idx])
             total_samples += sum([len(path['rewards']) for path in paths])
-
-            for path in paths:
-                p = {
-                    'observations': path['observations'],
-                    'actions': path['actions'],
-                    'rewards': path['rewards'].reshape(-1, 1),
-                    'next_observations': path['next_observations'],
-                    'dones': path['dones'].reshape(-1, 1)
-                }
-                self._replay_buffers[self._task_idx].add_path(p)
-
-                if add_to_enc_buffer:
-                    self._context_replay_buffers[self._task_idx].add_path(p)
+            self._add_paths(self._task_idx, paths, add_to_enc_buffer)
 
             if update_posterior_rate != np.inf:
                 context = self._sample_context(self._task_idx)
                 self._policy.infer_posterior(context)
 
+    def _obtain_prior_samples(self, runner, itr, task_indices, num_samples):
+        """Obtain samples with z ~ prior for several tasks at once.
+
+        The tasks are sampled concurrently by the sampler workers. The
+        samples are added to the replay buffer and encoder buffer of each
+        task.
+
+        Args:
+            runner (LocalRunner): LocalRunner.
+            itr (int): Index of iteration (epoch).
+            task_indices (list[int]): Indices of the tasks.
+            num_samples (int): Number of samples to obtain for each task.
+
+        """
+        self._policy.reset_belief()
+        task_paths = runner.obtain_samples_for_tasks(
+            itr, num_samples, [self._policy] * len(task_indices),
+            [self._env[idx] for idx in task_indices])
+        for idx, paths in zip(task_indices, task_paths):
+            self._add_paths(idx, paths, add_to_enc_buffer=True)
+
+    def _add_paths(self, task_idx, paths, add_to_enc_buffer):
+        """Add paths of a task to the buffers.
+
+        Args:
+            task_idx (int): Index of the task.
+            paths (list[dict]): Paths of the task.
+            add_to_enc_buffer (bool): Whether or not to add samples to encoder
+                buffer.
+
+        """
+        for path in paths:
+            p = {
+                'observations': path['observations'],
+                'actions': path['actions'],
+                'rewards': path['rewards'].reshape(-1, 1),
+                'next_observations': path['next_observations'],
+                'dones': path['dones'].reshape(-1, 1)
+            }
+            self._replay_buffers.add_path(task_idx, p)
+
+            if add_to_enc_buffer:
+                self._context_replay_buffers.add_path(task_idx, p)
+
     def _sample_data(self, indices):
         """Sample batch of training data from a list of tasks.
 
@@ -463,31 +523,10 @@ class PEARL(MetaRLAlgorithm):
 
         """
         # transitions sampled randomly from replay buffer
-        initialized = False
-        for idx in indices:
-            batch = self._replay_buffers[idx].sample_transitions(
-                self._batch_size)
-            if not initialized:
-                o = batch['observations'][np.newaxis]
-                a = batch['actions'][np.newaxis]
-                r = batch['rewards'][np.newaxis]
-                no = batch['next_observations'][np.newaxis]
-                d = batch['dones'][np.newaxis]
-                initialized = True
-            else:
-                o = np.vstack((o, batch['observations'][np.newaxis]))
-                a = np.vstack((a, batch['actions'][np.newaxis]))
-                r = np.vstack((r, batch['rewards'][np.newaxis]))
-                no = np.vstack((no, batch['next_observations'][np.newaxis]))
-                d = np.vstack((d, batch['dones'][np.newaxis]))
-
-        o = torch.as_tensor(o, device=tu.global_device()).float()
-        a = torch.as_tensor(a, device=tu.global_device()).float()
-        r = torch.as_tensor(r, device=tu.global_device()).float()
-        no = torch.as_tensor(no, device=tu.global_device()).float()
-        d = torch.as_tensor(d, device=tu.global_device()).float()
-
-        return o, a, r, no, d
+        batch = self._data_stager.sample_tasks(self._replay_buffers, indices,
+                                               self._batch_size)
+        return (batch['observations'], batch['actions'], batch['rewards'],
+                batch['next_observations'], batch['dones'])
 
     def _sample_context(self, indices):
         """Sample batch of context from a list of tasks.
@@ -507,37 +546,14 @@ class PEARL(MetaRLAlgorithm):
         if not hasattr(indices, '__iter__'):
             indices = [indices]
 
-        initialized = False
-        for idx in indices:
-            batch = self._context_replay_buffers[idx].sample_transitions(
-                self._embedding_batch_size)
-            o = batch['observations']
-            a = batch['actions']
-            r = batch['rewards']
-            context = np.hstack((np.hstack((o, a)), r))
-            if self._use_next_obs_in_context:
-                context = np.hstack((context, batch['next_observations']))
-
-            if not initialized:
-                final_context = context[np.newaxis]
-                initialized = True
-            else:
-                final_context = np.vstack((final_context, context[np.newaxis]))
-
-        final_context = torch.as_tensor(final_context,
-                                        device=tu.global_device()).float()
-        if len(indices) == 1:
-            final_context = final_context.unsqueeze(0)
-
-        return final_context
+        batch = self._context_stager.sample_tasks(
+            self._context_replay_buffers, indices, self._embedding_batch_size)
+        return torch.cat([batch[key] for key in self._context_keys], dim=-1)
 
     def _update_target_network(self):
         """Update parameters in the target vf network."""
-        for target_param, param in zip(self.target_vf.parameters(),
-                                       self._vf.parameters()):
-            target_param.data.copy_(target_param.data *
-                                    (1.0 - self._soft_target_tau) +
-                                    param.data * self._soft_target_tau)
+        tu.soft_update_model(self.target_vf, self._vf, self._soft_target_tau,
+                             self._target_update_freq)
 
     @property
     def policy(self):
@@ -557,21 +573,23 @@ class PEARL(MetaRLAlgorithm):
             list: A list of networks.
 
         """
-        return self._policy.networks + [self._policy] + [
-            self._qf1, self._qf2, self._vf, self.target_vf
+        return self._policy.networks + [self._policy] + self._qfs + [
+            self._vf, self.target_vf
         ]
 
     def get_exploration_policy(self):
         """Return a policy used before adaptation to a specific task.
 
         Each time it is retrieved, this policy should only be evaluated in one
-        task.
+        task. Its belief is reset to the prior, so that it doesn't depend on
+        the context of previous tasks.
 
         Returns:
             garage.Policy: The policy used to obtain samples that are later
                 used for meta-RL adaptation.
 
         """
+        self._policy.reset_belief()
         return self._policy
 
     def adapt_policy(self, exploration_policy, exploration_trajectories):
@@ -688,6 +706,11 @@ class PEARLWorker(DefaultWorker):
             stochastic policy instead of sampling from the returned action
             distribution.
         accum_context(bool): If true, update context of the agent.
+        update_posterior(bool): If true, update the posterior of the agent
+            with the context accumulated during each rollout, at the end of
+            the rollout. Requires accum_context. The agent ignores this
+            once its posterior has been inferred from other context, e.g.
+            by PEARL.adapt_policy, until its belief is reset.
 
     Attributes:
         agent(Policy or None): The worker's agent.
@@ -701,9 +724,11 @@ class PEARLWorker(DefaultWorker):
                  max_path_length,
                  worker_number,
                  deterministic=False,
-                 accum_context=False):
+                 accum_context=False,
+                 update_posterior=False):
         self._deterministic = deterministic
         self._accum_context = accum_context
+        self._update_posterior = update_posterior
         super().__init__(seed=seed,
                          max_path_length=max_path_length,
                          worker_number=worker_number)
@@ -765,4 +790,6 @@ class PEARLWorker(DefaultWorker):
             pass
         self._agent_infos['context'] = [self.agent.z.detach().cpu().numpy()
                                         ] * self._max_path_length
+        if self._accum_context and self._update_posterior:
+            self.agent.update_posterior()
         return self.collect_rollout()
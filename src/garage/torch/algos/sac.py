@@ -2,13 +2,14 @@
 from collections import deque
 import copy
 
-from dowel import tabular
+from dowel import logger, tabular
 import numpy as np
 import torch
-import torch.nn.functional as F
 
 from garage import log_performance
 from garage.np.algos.off_policy_rl_algorithm import OffPolicyRLAlgorithm
+from garage.sampler import BatchEvaluator
+from garage.torch.replay_staging import ReplayStager
 import garage.torch.utils as tu
 
 
@@ -33,10 +34,13 @@ class SAC(OffPolicyRLAlgorithm):
             optimized by SAC.
         qf1 (garage.torch.q_function.ContinuousMLPQFunction): QFunction/Critic
             used for actor/policy optimization. See Soft Actor-Critic and
-            Applications.
-        qf2 (garage.torch.q_function.ContinuousMLPQFunction): QFunction/Critic
-            used for actor/policy optimization. See Soft Actor-Critic and
-            Applications.
+            Applications. It can also be a
+            garage.torch.q_functions.EnsembleContinuousMLPQFunction, in
+            which case qf2 should be None, and all critics of the ensemble
+            are evaluated in a single forward pass.
+        qf2 (garage.torch.q_function.ContinuousMLPQFunction or None):
+            QFunction/Critic used for actor/policy optimization. See Soft
+            Actor-Critic and Applications. None if qf1 is an ensemble.
         replay_buffer (garage.replay_buffer.ReplayBuffer): Stores transitions
             that are previously collected by the sampler.
         env_spec (garage.envs.env_spec.EnvSpec): The env_spec attribute of the
@@ -66,6 +70,9 @@ class SAC(OffPolicyRLAlgorithm):
             be in the replay buffer before training can begin.
         target_update_tau (float): coefficient that controls the rate at which
             the target q_functions update over optimization iterations.
+        target_update_freq (int): Number of gradient steps between two
+            updates of the target q_functions. Each update applies the
+            averaging of target_update_freq soft updates at once.
         policy_lr (float): learning rate for policy optimizers.
         qf_lr (float): learning rate for q_function optimizers.
         reward_scale (float): reward scale. Changing this hyperparameter
@@ -80,6 +87,23 @@ class SAC(OffPolicyRLAlgorithm):
             epoch.
         eval_env (garage.envs.GarageEnv): environment used for collecting
             evaluation trajectories. If None, a copy of the train env is used.
+        target_qf_subset_size (int or None): If given, the target Q-value is
+            the minimum over a random subset of this many critics, and the
+            policy is trained on the mean over all critics, as in REDQ
+            (https://arxiv.org/abs/2101.05982). If None, the minimum over all
+            critics is used for both. It must be between 1 and the number of
+            critics.
+        num_eval_envs (int or None): Number of copies of the evaluation
+            environment, which are stepped together with batched policy
+            calls. If None, there is one copy per evaluation trajectory.
+        async_evaluation (bool): If True, the policy of each epoch is
+            evaluated in a background thread during the next epoch, and
+            logged at the end of it. The first evaluation is of the
+            initial policy, and the last one is logged after training.
+
+    Raises:
+        ValueError: If target_qf_subset_size is not between 1 and the number
+            of critics.
 
     """
 
@@ -101,6 +125,7 @@ class SAC(OffPolicyRLAlgorithm):
             buffer_batch_size=64,
             min_buffer_size=int(1e4),
             target_update_tau=5e-3,
+            target_update_freq=1,
             policy_lr=3e-4,
             qf_lr=3e-4,
             reward_scale=1.0,
@@ -108,6 +133,9 @@ class SAC(OffPolicyRLAlgorithm):
             steps_per_epoch=1,
             num_evaluation_trajectories=10,
             eval_env=None,
+            target_qf_subset_size=None,
+            num_eval_envs=None,
+            async_evaluation=False,
     ):
 
         self._policy = policy
@@ -115,6 +143,11 @@ class SAC(OffPolicyRLAlgorithm):
         self._qf2 = qf2
         self.replay_buffer = replay_buffer
         self._tau = target_update_tau
+        self._target_update_freq = target_update_freq
+        self._n_grad_steps = 0
+        self._replay_stager = ReplayStager(
+            ('observation', 'action', 'reward', 'terminal',
+             'next_observation'))
         self._policy_lr = policy_lr
         self._qf_lr = qf_lr
         self._initial_log_entropy = initial_log_entropy
@@ -122,6 +155,18 @@ class SAC(OffPolicyRLAlgorithm):
         self._optimizer = optimizer
         self._num_evaluation_trajectories = num_evaluation_trajectories
         self._eval_env = eval_env
+        self._num_eval_envs = num_eval_envs or num_evaluation_trajectories
+        self._async_evaluation = async_evaluation
+        self._evaluator = None
+        self._target_qf_subset_size = target_qf_subset_size
+        # All critics; a single module if qf1 is an ensemble.
+        self._qfs = [qf1] if qf2 is None else [qf1, qf2]
+        num_qfs = sum(getattr(qf, 'n_members', 1) for qf in self._qfs)
+        if (target_qf_subset_size is not None
+                and not 1 <= target_qf_subset_size <= num_qfs):
+            raise ValueError('target_qf_subset_size must be between 1 and '
+                             'the number of Q-functions ({}), got {}'.format(
+                                 num_qfs, target_qf_subset_size))
 
         super().__init__(env_spec=env_spec,
                          policy=policy,
@@ -136,15 +181,15 @@ class SAC(OffPolicyRLAlgorithm):
                          discount=discount,
                          steps_per_epoch=steps_per_epoch)
         self.reward_scale = reward_scale
-        # use 2 target q networks
-        self._target_qf1 = copy.deepcopy(self._qf1)
-        self._target_qf2 = copy.deepcopy(self._qf2)
+        # use target q networks
+        self._target_qfs = copy.deepcopy(self._qfs)
         self._policy_optimizer = self._optimizer(self._policy.parameters(),
                                                  lr=self._policy_lr)
-        self._qf1_optimizer = self._optimizer(self._qf1.parameters(),
-                                              lr=self._qf_lr)
-        self._qf2_optimizer = self._optimizer(self._qf2.parameters(),
-                                              lr=self._qf_lr)
+        # Critics have separate parameters, so a single optimizer step over
+        # all of them is the same as one step per critic.
+        self._qf_optimizer = self._optimizer(
+            [param for qf in self._qfs for param in qf.parameters()],
+            lr=self._qf_lr)
         # automatic entropy coefficient tuning
         self._use_automatic_entropy_tuning = fixed_alpha is None
         self._fixed_alpha = fixed_alpha
@@ -176,35 +221,68 @@ class SAC(OffPolicyRLAlgorithm):
         """
         if not self._eval_env:
             self._eval_env = runner.get_env_copy()
+        if self._evaluator is None:
+            self._evaluator = BatchEvaluator(
+                self._eval_env,
+                n_envs=self._num_eval_envs,
+                max_path_length=self._get_eval_max_path_length())
         last_return = None
+        pending_eval = None
+        if self._async_evaluation:
+            pending_eval = (runner.step_itr - 1, self._start_evaluation())
         for _ in runner.step_epochs():
             for _ in range(self.steps_per_epoch):
                 if not self._buffer_prefilled:
                     batch_size = int(self.min_buffer_size)
                 else:
                     batch_size = None
+                # Paths are inserted in the replay buffer as they arrive.
                 runner.step_path = runner.obtain_samples(
-                    runner.step_itr, batch_size)
+                    runner.step_itr,
+                    batch_size,
+                    consumer=self._add_path_to_buffer)
                 path_returns = []
                 for path in runner.step_path:
-                    self.replay_buffer.add_path(
-                        dict(observation=path['observations'],
-                             action=path['actions'],
-                             reward=path['rewards'].reshape(-1, 1),
-                             next_observation=path['next_observations'],
-                             terminal=path['dones'].reshape(-1, 1)))
                     path_returns.append(sum(path['rewards']))
                 assert len(path_returns) is len(runner.step_path)
                 self.episode_rewards.append(np.mean(path_returns))
                 for _ in range(self._gradient_steps):
-                    policy_loss, qf1_loss, qf2_loss = self.train_once()
-            last_return = self._evaluate_policy(runner.step_itr)
-            self._log_statistics(policy_loss, qf1_loss, qf2_loss)
+                    policy_loss, qf_losses = self.train_once()
+            if pending_eval is not None:
+                eval_epoch, eval_future = pending_eval
+                last_return = self._evaluate_policy(eval_epoch,
+                                                    eval_future.result())
+                pending_eval = (runner.step_itr, self._start_evaluation())
+            else:
+                last_return = self._evaluate_policy(runner.step_itr)
+            self._log_statistics(policy_loss, qf_losses)
             tabular.record('TotalEnvSteps', runner.total_env_steps)
             runner.step_itr += 1
 
+        if pending_eval is not None:
+            eval_epoch, eval_future = pending_eval
+            last_return = self._evaluate_policy(eval_epoch,
+                                                eval_future.result())
+            logger.log(tabular)
+            logger.dump_all(runner.step_itr)
+            tabular.clear()
+        self._evaluator.shutdown()
         return np.mean(last_return)
 
+    def _add_path_to_buffer(self, path):
+        """Insert a sampled path in the replay buffer.
+
+        Args:
+            path (dict): A path, as returned by `runner.obtain_samples`.
+
+        """
+        self.replay_buffer.add_path(
+            dict(observation=path['observations'],
+                 action=path['actions'],
+                 reward=path['rewards'].reshape(-1, 1),
+                 next_observation=path['next_observations'],
+                 terminal=path['dones'].reshape(-1, 1)))
+
     def train_once(self, itr=None, paths=None):
         """Complete 1 training iteration of SAC.
 
@@ -215,20 +293,21 @@ class SAC(OffPolicyRLAlgorithm):
 
         Returns:
             torch.Tensor: loss from actor/policy network after optimization.
-            torch.Tensor: loss from 1st q-function after optimization.
-            torch.Tensor: loss from 2nd q-function after optimization.
+            tuple[torch.Tensor]: loss from each q-function after
+                optimization.
 
         """
         del itr
         del paths
         if self._buffer_prefilled:
-            samples = self.replay_buffer.sample_transitions(
-                self.buffer_batch_size)
-            samples = tu.dict_np_to_torch(samples)
-            policy_loss, qf1_loss, qf2_loss = self.optimize_policy(0, samples)
-            self._update_targets()
+            samples = self._replay_stager.sample(self.replay_buffer,
+                                                 self.buffer_batch_size)
+            policy_loss, qf_losses = self.optimize_policy(0, samples)
+            self._n_grad_steps += 1
+            if self._n_grad_steps % self._target_update_freq == 0:
+                self._update_targets()
 
-        return policy_loss, qf1_loss, qf2_loss
+        return policy_loss, qf_losses
 
     def _get_log_alpha(self, samples_data):
         """Return the value of log_alpha.
@@ -317,10 +396,13 @@ class SAC(OffPolicyRLAlgorithm):
         obs = samples_data['observation']
         with torch.no_grad():
             alpha = self._get_log_alpha(samples_data).exp()
-        min_q_new_actions = torch.min(self._qf1(obs, new_actions),
-                                      self._qf2(obs, new_actions))
+        q_new_actions = self._q_values(self._qfs, obs, new_actions)
+        if self._target_qf_subset_size is None:
+            q_new_actions = q_new_actions.min(dim=0).values
+        else:
+            q_new_actions = q_new_actions.mean(dim=0)
         policy_objective = ((alpha * log_pi_new_actions) -
-                            min_q_new_actions.flatten()).mean()
+                            q_new_actions).mean()
         return policy_objective
 
     def _critic_objective(self, samples_data):
@@ -341,8 +423,7 @@ class SAC(OffPolicyRLAlgorithm):
                 next_observation: :math:`(N, O^*)`
 
         Returns:
-            torch.Tensor: loss from 1st q-function after optimization.
-            torch.Tensor: loss from 2nd q-function after optimization.
+            tuple[torch.Tensor]: loss from each q-function.
 
         """
         obs = samples_data['observation']
@@ -353,8 +434,7 @@ class SAC(OffPolicyRLAlgorithm):
         with torch.no_grad():
             alpha = self._get_log_alpha(samples_data).exp()
 
-        q1_pred = self._qf1(obs, actions)
-        q2_pred = self._qf2(obs, actions)
+        q_pred = self._q_values(self._qfs, obs, actions)
 
         new_next_actions_dist = self._policy(next_obs)
         new_next_actions_pre_tanh, new_next_actions = (
@@ -362,26 +442,46 @@ class SAC(OffPolicyRLAlgorithm):
         new_log_pi = new_next_actions_dist.log_prob(
             value=new_next_actions, pre_tanh_value=new_next_actions_pre_tanh)
 
-        target_q_values = torch.min(
-            self._target_qf1(next_obs, new_next_actions),
-            self._target_qf2(
-                next_obs, new_next_actions)).flatten() - (alpha * new_log_pi)
+        target_q_values = self._q_values(self._target_qfs, next_obs,
+                                         new_next_actions)
+        if self._target_qf_subset_size is not None:
+            subset = torch.randperm(
+                len(target_q_values))[:self._target_qf_subset_size]
+            target_q_values = target_q_values[subset]
+        target_q_values = target_q_values.min(
+            dim=0).values - (alpha * new_log_pi)
         with torch.no_grad():
             q_target = rewards * self.reward_scale + (
                 1. - terminals) * self.discount * target_q_values
-        qf1_loss = F.mse_loss(q1_pred.flatten(), q_target)
-        qf2_loss = F.mse_loss(q2_pred.flatten(), q_target)
+        qf_losses = ((q_pred - q_target)**2).mean(dim=1)
+
+        return qf_losses.unbind()
+
+    @staticmethod
+    def _q_values(qfs, observations, actions):
+        """Evaluate all critics.
+
+        Args:
+            qfs (list[torch.nn.Module]): Critics, or a single ensemble of
+                critics.
+            observations (torch.Tensor): Observations with shape
+                :math:`(N, O^*)`.
+            actions (torch.Tensor): Actions with shape :math:`(N, A^*)`.
+
+        Returns:
+            torch.Tensor: Q-values of each critic, with shape :math:`(K, N)`.
 
-        return qf1_loss, qf2_loss
+        """
+        return torch.cat([
+            qf(observations, actions).reshape(-1, len(observations))
+            for qf in qfs
+        ])
 
     def _update_targets(self):
         """Update parameters in the target q-functions."""
-        target_qfs = [self._target_qf1, self._target_qf2]
-        qfs = [self._qf1, self._qf2]
-        for target_qf, qf in zip(target_qfs, qfs):
-            for t_param, param in zip(target_qf.parameters(), qf.parameters()):
-                t_param.data.copy_(t_param.data * (1.0 - self._tau) +
-                                   param.data * self._tau)
+        for target_qf, qf in zip(self._target_qfs, self._qfs):
+            tu.soft_update_model(target_qf, qf, self._tau,
+                                 self._target_update_freq)
 
     def optimize_policy(self, itr, samples_data):
         """Optimize the policy q_functions, and temperature coefficient.
@@ -403,20 +503,16 @@ class SAC(OffPolicyRLAlgorithm):
 
         Returns:
             torch.Tensor: loss from actor/policy network after optimization.
-            torch.Tensor: loss from 1st q-function after optimization.
-            torch.Tensor: loss from 2nd q-function after optimization.
+            tuple[torch.Tensor]: loss from each q-function after
+                optimization.
 
         """
         obs = samples_data['observation']
-        qf1_loss, qf2_loss = self._critic_objective(samples_data)
+        qf_losses = self._critic_objective(samples_data)
 
-        self._qf1_optimizer.zero_grad()
-        qf1_loss.backward()
-        self._qf1_optimizer.step()
-
-        self._qf2_optimizer.zero_grad()
-        qf2_loss.backward()
-        self._qf2_optimizer.step()
+        self._qf_optimizer.zero_grad()
+        sum(qf_losses).backward()
+        self._qf_optimizer.step()
 
         action_dists = self._policy(obs)
         new_actions_pre_tanh, new_actions = (
@@ -438,9 +534,9 @@ class SAC(OffPolicyRLAlgorithm):
             alpha_loss.backward()
             self._alpha_optimizer.step()
 
-        return policy_loss, qf1_loss, qf2_loss
+        return policy_loss, qf_losses
 
-    def _evaluate_policy(self, epoch):
+    def _evaluate_policy(self, epoch, eval_trajectories=None):
         """Evaluate the performance of the policy via deterministic rollouts.
 
             Statistics such as (average) discounted return and success rate are
@@ -448,34 +544,57 @@ class SAC(OffPolicyRLAlgorithm):
 
         Args:
             epoch(int): The current training epoch.
+            eval_trajectories (TrajectoryBatch or None): Evaluation
+                trajectories obtained in the background. If None, they are
+                obtained now.
 
         Returns:
             float: The average return across self._num_evaluation_trajectories
                 trajectories
 
         """
-        eval_trajectories = self._obtain_evaluation_samples(
-            self._eval_env, num_trajs=self._num_evaluation_trajectories)
+        if eval_trajectories is None:
+            eval_trajectories = self._evaluator.evaluate(
+                self.policy, self._get_num_evaluation_trajectories())
         last_return = log_performance(epoch,
                                       eval_trajectories,
                                       discount=self.discount)
         return last_return
 
-    def _log_statistics(self, policy_loss, qf1_loss, qf2_loss):
+    def _start_evaluation(self):
+        """Start evaluating a copy of the policy in the background.
+
+        Returns:
+            concurrent.futures.Future: Future of the evaluation
+                trajectories.
+
+        """
+        return self._evaluator.start(self.policy,
+                                     self._get_num_evaluation_trajectories())
+
+    def _get_num_evaluation_trajectories(self):
+        """Get the number of trajectories of each evaluation.
+
+        Returns:
+            int: Number of evaluation trajectories.
+
+        """
+        return self._num_evaluation_trajectories
+
+    def _log_statistics(self, policy_loss, qf_losses):
         """Record training statistics to dowel such as losses and returns.
 
         Args:
             policy_loss(torch.Tensor): loss from actor/policy network.
-            qf1_loss(torch.Tensor): loss from 1st qf/critic network.
-            qf2_loss(torch.Tensor): loss from 2nd qf/critic network.
+            qf_losses(tuple[torch.Tensor]): loss from each qf/critic network.
 
         """
         with torch.no_grad():
             tabular.record('AlphaTemperature/mean',
                            self._log_alpha.exp().mean().item())
         tabular.record('Policy/Loss', policy_loss.item())
-        tabular.record('QF/{}'.format('Qf1Loss'), float(qf1_loss))
-        tabular.record('QF/{}'.format('Qf2Loss'), float(qf2_loss))
+        for i, qf_loss in enumerate(qf_losses):
+            tabular.record('QF/Qf{}Loss'.format(i + 1), float(qf_loss))
         tabular.record('ReplayBuffer/buffer_size',
                        self.replay_buffer.n_transitions_stored)
         tabular.record('Average/TrainAverageReturn',
@@ -489,10 +608,7 @@ class SAC(OffPolicyRLAlgorithm):
             list: A list of networks.
 
         """
-        return [
-            self._policy, self._qf1, self._qf2, self._target_qf1,
-            self._target_qf2
-        ]
+        return [self._policy] + self._qfs + self._target_qfs
 
     def to(self, device=None):
         """Put all the networks within the model on device.
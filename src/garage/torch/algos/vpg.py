@@ -8,7 +8,6 @@ import torch
 import torch.nn.functional as F
 
 from garage import log_performance, TrajectoryBatch
-from garage.misc import tensor_utils as tu
 from garage.np.algos import BatchPolopt
 from garage.torch.algos import (compute_advantages, filter_valids, pad_to_last)
 from garage.torch.optimizers import OptimizerWrapper
@@ -452,8 +451,7 @@ class VPG(BatchPolopt):
             for path in paths
         ])
         returns = torch.stack([
-            pad_to_last(tu.discount_cumsum(path['rewards'],
-                                           self.discount).copy(),
+            pad_to_last(self._path_returns(path).copy(),
                         total_length=self.max_path_length) for path in paths
         ])
         with torch.no_grad():
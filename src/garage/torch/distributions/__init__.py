@@ -1,4 +1,10 @@
 """PyTorch Custom Distributions."""
-from garage.torch.distributions.tanh_normal import TanhNormal
+from garage._lazy import lazy_import
 
 __all__ = ['TanhNormal']
+
+_ATTRIBUTES = {
+    'TanhNormal': 'tanh_normal',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
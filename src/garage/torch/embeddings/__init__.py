@@ -1,5 +1,10 @@
 """PyTorch embedding modules for meta-learning algorithms."""
-
-from garage.torch.embeddings.mlp_encoder import MLPEncoder
+from garage._lazy import lazy_import
 
 __all__ = ['MLPEncoder']
+
+_ATTRIBUTES = {
+    'MLPEncoder': 'mlp_encoder',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
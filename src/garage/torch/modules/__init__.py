@@ -1,15 +1,22 @@
 """Pytorch modules."""
-
-from garage.torch.modules.gaussian_mlp_module import \
-    GaussianMLPIndependentStdModule, GaussianMLPModule, \
-    GaussianMLPTwoHeadedModule
-from garage.torch.modules.mlp_module import MLPModule
-from garage.torch.modules.multi_headed_mlp_module import MultiHeadedMLPModule
+from garage._lazy import lazy_import
 
 __all__ = [
+    'EnsembleMLPModule',
     'MLPModule',
     'MultiHeadedMLPModule',
     'GaussianMLPModule',
     'GaussianMLPIndependentStdModule',
     'GaussianMLPTwoHeadedModule',
 ]
+
+_ATTRIBUTES = {
+    'EnsembleMLPModule': 'ensemble_mlp_module',
+    'GaussianMLPIndependentStdModule': 'gaussian_mlp_module',
+    'GaussianMLPModule': 'gaussian_mlp_module',
+    'GaussianMLPTwoHeadedModule': 'gaussian_mlp_module',
+    'MLPModule': 'mlp_module',
+    'MultiHeadedMLPModule': 'multi_headed_mlp_module',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
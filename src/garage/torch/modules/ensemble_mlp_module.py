@@ -0,0 +1,126 @@
+"""EnsembleMLPModule."""
+import torch
+from torch import nn
+from torch.nn import functional as F
+
+from garage.torch.modules.multi_headed_mlp_module import _NonLinearity
+
+
+class EnsembleMLPModule(nn.Module):
+    """EnsembleMLPModule Model.
+
+    A PyTorch module composed of an ensemble of multi-layer perceptrons
+    (MLPs) with identical architectures. The weights of each layer are
+    stored as a single tensor stacked over the ensemble members, and all
+    members are evaluated together with one batched matrix multiplication
+    (`torch.baddbmm`) per layer instead of one forward pass per member.
+
+    Args:
+        n_members (int): Number of MLPs in the ensemble.
+        input_dim (int): Dimension of the network input.
+        output_dim (int): Dimension of the network output.
+        hidden_sizes (list[int]): Output dimension of dense layer(s).
+            For example, (32, 32) means each MLP consists of two
+            hidden layers, each with 32 hidden units.
+        hidden_nonlinearity (callable or torch.nn.Module): Activation function
+            for intermediate dense layer(s). It should return a torch.Tensor.
+            Set it to None to maintain a linear activation.
+        hidden_w_init (callable): Initializer function for the weight
+            of intermediate dense layer(s). The function should return a
+            torch.Tensor. It is called on the weight of each member
+            separately, with the :math:`(out, in)` shape of nn.Linear.
+        hidden_b_init (callable): Initializer function for the bias
+            of intermediate dense layer(s). The function should return a
+            torch.Tensor.
+        output_nonlinearity (callable or torch.nn.Module): Activation function
+            for output dense layer. It should return a torch.Tensor.
+            Set it to None to maintain a linear activation.
+        output_w_init (callable): Initializer function for the weight
+            of output dense layer(s). The function should return a
+            torch.Tensor.
+        output_b_init (callable): Initializer function for the bias
+            of output dense layer(s). The function should return a
+            torch.Tensor.
+
+    """
+
+    def __init__(self,
+                 n_members,
+                 input_dim,
+                 output_dim,
+                 hidden_sizes,
+                 hidden_nonlinearity=F.relu,
+                 hidden_w_init=nn.init.xavier_normal_,
+                 hidden_b_init=nn.init.zeros_,
+                 output_nonlinearity=None,
+                 output_w_init=nn.init.xavier_normal_,
+                 output_b_init=nn.init.zeros_):
+        super().__init__()
+        self._n_members = n_members
+        self._output_dim = output_dim
+
+        self._weights = nn.ParameterList()
+        self._biases = nn.ParameterList()
+        self._nonlinearities = nn.ModuleList()
+
+        sizes = [input_dim] + list(hidden_sizes) + [output_dim]
+        n_layers = len(sizes) - 1
+        for i, (in_size, out_size) in enumerate(zip(sizes[:-1], sizes[1:])):
+            is_output = i == n_layers - 1
+            w_init = output_w_init if is_output else hidden_w_init
+            b_init = output_b_init if is_output else hidden_b_init
+            nonlinearity = (output_nonlinearity
+                            if is_output else hidden_nonlinearity)
+
+            weight = torch.empty(n_members, in_size, out_size)
+            bias = torch.empty(n_members, 1, out_size)
+            for member in range(n_members):
+                # initialize like nn.Linear, whose weight is (out, in)
+                w_init(weight[member].t())
+                b_init(bias[member, 0])
+            self._weights.append(nn.Parameter(weight))
+            self._biases.append(nn.Parameter(bias))
+            self._nonlinearities.append(
+                _NonLinearity(nonlinearity) if nonlinearity else nn.Identity())
+
+    # pylint: disable=arguments-differ
+    def forward(self, input_val):
+        """Forward method.
+
+        Args:
+            input_val (torch.Tensor): Input values with :math:`(N, input_dim)`
+                shape, shared by all members, or with
+                :math:`(n_members, N, input_dim)` shape, one batch per member.
+
+        Returns:
+            torch.Tensor: Output values with :math:`(n_members, N,
+                output_dim)` shape.
+
+        """
+        x = input_val
+        if x.dim() == 2:
+            x = x.expand(self._n_members, *x.shape)
+        for weight, bias, nonlinearity in zip(self._weights, self._biases,
+                                              self._nonlinearities):
+            x = nonlinearity(torch.baddbmm(bias, x, weight))
+        return x
+
+    @property
+    def n_members(self):
+        """Return number of MLPs in the ensemble.
+
+        Returns:
+            int: Number of MLPs in the ensemble.
+
+        """
+        return self._n_members
+
+    @property
+    def output_dim(self):
+        """Return output dimension of network.
+
+        Returns:
+            int: Output dimension of network.
+
+        """
+        return self._output_dim
@@ -155,15 +155,16 @@ class GaussianMLPBaseModule(nn.Module):
     def _get_mean_and_log_std(self, *inputs):
         pass
 
-    def forward(self, *inputs):
-        """Forward method.
+    def _get_dist_params(self, *inputs):
+        """Get the parameters of the Gaussian distribution given inputs.
 
         Args:
             *inputs: Input to the module.
 
         Returns:
-            torch.distributions.independent.Independent: Independent
-                distribution.
+            torch.Tensor: The mean of Gaussian distribution.
+            torch.Tensor: The standard deviation of Gaussian distribution.
+            torch.Tensor: The logarithm of the standard deviation.
 
         """
         mean, log_std_uncentered = self._get_mean_and_log_std(*inputs)
@@ -177,8 +178,24 @@ class GaussianMLPBaseModule(nn.Module):
 
         if self._std_parameterization == 'exp':
             std = log_std_uncentered.exp()
+            log_std = log_std_uncentered
         else:
             std = log_std_uncentered.exp().exp().add(1.).log()
+            log_std = std.log()
+        return mean, std, log_std
+
+    def forward(self, *inputs):
+        """Forward method.
+
+        Args:
+            *inputs: Input to the module.
+
+        Returns:
+            torch.distributions.independent.Independent: Independent
+                distribution.
+
+        """
+        mean, std, _ = self._get_dist_params(*inputs)
         dist = self._norm_dist_class(mean, std)
         # This control flow is needed because if a TanhNormal distribution is
         # wrapped by torch.distributions.Independent, then custom functions
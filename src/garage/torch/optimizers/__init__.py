@@ -1,9 +1,14 @@
 """PyTorch optimizers."""
-from garage.torch.optimizers.conjugate_gradient_optimizer import (
-    ConjugateGradientOptimizer)
-from garage.torch.optimizers.differentiable_sgd import DifferentiableSGD
-from garage.torch.optimizers.optimizer_wrapper import OptimizerWrapper
+from garage._lazy import lazy_import
 
 __all__ = [
     'OptimizerWrapper', 'ConjugateGradientOptimizer', 'DifferentiableSGD'
 ]
+
+_ATTRIBUTES = {
+    'ConjugateGradientOptimizer': 'conjugate_gradient_optimizer',
+    'DifferentiableSGD': 'differentiable_sgd',
+    'OptimizerWrapper': 'optimizer_wrapper',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
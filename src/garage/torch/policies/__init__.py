@@ -1,12 +1,5 @@
 """PyTorch Policies."""
-from garage.torch.policies.context_conditioned_policy import (
-    ContextConditionedPolicy)
-from garage.torch.policies.policy import Policy
-from garage.torch.policies.deterministic_mlp_policy import (  # noqa: I100
-    DeterministicMLPPolicy)
-from garage.torch.policies.gaussian_mlp_policy import GaussianMLPPolicy
-from garage.torch.policies.tanh_gaussian_mlp_policy import (
-    TanhGaussianMLPPolicy)
+from garage._lazy import lazy_import
 
 __all__ = [
     'DeterministicMLPPolicy',
@@ -15,3 +8,13 @@ __all__ = [
     'TanhGaussianMLPPolicy',
     'ContextConditionedPolicy',
 ]
+
+_ATTRIBUTES = {
+    'ContextConditionedPolicy': 'context_conditioned_policy',
+    'Policy': 'policy',
+    'DeterministicMLPPolicy': 'deterministic_mlp_policy',
+    'GaussianMLPPolicy': 'gaussian_mlp_policy',
+    'TanhGaussianMLPPolicy': 'tanh_gaussian_mlp_policy',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -55,6 +55,9 @@ class ContextConditionedPolicy(nn.Module):
         self.register_buffer('z_means', torch.zeros(1, latent_dim))
         self.register_buffer('z_vars', torch.zeros(1, latent_dim))
 
+        # the context is stored in the first _context_len rows of
+        # _context_buffer, which is grown by doubling its capacity
+        self._context_buffer = None
         self.reset_belief()
 
     def reset_belief(self, num_tasks=1):
@@ -77,48 +80,61 @@ class ContextConditionedPolicy(nn.Module):
         # sample a new z from the prior
         self.sample_from_belief()
         # reset the context collected so far
-        self._context = None
+        self._context_len = 0
+        # reset the running sums of update_posterior, and enable it
+        self._n_folded = 0
+        self._precision_sum = None
+        self._weighted_mean_sum = None
         # reset any hidden state in the encoder network (relevant for RNN)
         self._context_encoder.reset()
 
     def sample_from_belief(self):
         """Sample z using distributions from current means and variances."""
         if self._use_information_bottleneck:
-            posteriors = [
-                torch.distributions.Normal(m, torch.sqrt(s)) for m, s in zip(
-                    torch.unbind(self.z_means), torch.unbind(self.z_vars))
-            ]
-            z = [d.rsample() for d in posteriors]
-            self.z = torch.stack(z)
+            posterior = torch.distributions.Normal(self.z_means,
+                                                   torch.sqrt(self.z_vars))
+            self.z = posterior.rsample()
         else:
             self.z = self.z_means
 
     def update_context(self, timestep):
         """Append single transition to the current context.
 
+        The transition is written in place into a preallocated buffer,
+        whose capacity is doubled when it is full.
+
         Args:
             timestep (garage._dtypes.TimeStep): Timestep containing transition
                 information to be added to context.
 
         """
-        o = torch.as_tensor(timestep.observation[None, None, ...],
-                            device=tu.global_device()).float()
-        a = torch.as_tensor(timestep.action[None, None, ...],
-                            device=tu.global_device()).float()
-        r = torch.as_tensor(np.array([timestep.reward])[None, None, ...],
-                            device=tu.global_device()).float()
-        no = torch.as_tensor(timestep.next_observation[None, None, ...],
-                             device=tu.global_device()).float()
-
+        values = [timestep.observation, timestep.action, [timestep.reward]]
         if self._use_next_obs:
-            data = torch.cat([o, a, r, no], dim=2)
-        else:
-            data = torch.cat([o, a, r], dim=2)
+            values.append(timestep.next_observation)
+        data = np.concatenate(
+            [np.asarray(v, dtype=np.float32).ravel() for v in values])
 
-        if self._context is None:
-            self._context = data
-        else:
-            self._context = torch.cat([self._context, data], dim=1)
+        if (self._context_buffer is None
+                or self._context_len == self._context_buffer.size(1)):
+            self._grow_context(len(data))
+        self._context_buffer[0, self._context_len] = torch.from_numpy(data)
+        self._context_len += 1
+
+    def _grow_context(self, context_dim):
+        """Allocate a context buffer with twice the current capacity.
+
+        Args:
+            context_dim (int): Size of a transition of the context.
+
+        """
+        capacity = max(2 * self._context_len, 16)
+        context_buffer = torch.zeros(1,
+                                     capacity,
+                                     context_dim,
+                                     device=tu.global_device())
+        if self._context_len:
+            context_buffer[:, :self._context_len] = self.context
+        self._context_buffer = context_buffer
 
     def infer_posterior(self, context):
         r"""Compute :math:`q(z \| c)` as a function of input context and sample new z.
@@ -138,16 +154,61 @@ class ContextConditionedPolicy(nn.Module):
         if self._use_information_bottleneck:
             mu = params[..., :self._latent_dim]
             sigma_squared = F.softplus(params[..., self._latent_dim:])
-            z_params = [
-                tu.product_of_gaussians(m, s)
-                for m, s in zip(torch.unbind(mu), torch.unbind(sigma_squared))
-            ]
-            self.z_means = torch.stack([p[0] for p in z_params])
-            self.z_vars = torch.stack([p[1] for p in z_params])
+            self.z_means, self.z_vars = tu.product_of_gaussians(mu,
+                                                                sigma_squared,
+                                                                dim=1)
         else:
             self.z_means = torch.mean(params, dim=1)
+        # the belief no longer follows the collected context
+        self._n_folded = None
         self.sample_from_belief()
 
+    def update_posterior(self):
+        r"""Update :math:`q(z \| c)` with the new transitions of the context.
+
+        Only the transitions added with `update_context` since the last
+        call are encoded. Their gaussian factors are folded into running
+        sums of precisions and precision-weighted means (or of means, if z
+        is deterministic), so that updating the posterior after every step
+        of a rollout costs O(1) per step. The result is the posterior
+        `infer_posterior(self.context)` would compute, as long as the
+        context encoder encodes each transition independently (e.g.
+        MLPEncoder). Gradients are not tracked, and a new z is sampled.
+
+        After `infer_posterior` sets the belief from another context (e.g.
+        when adapting to a task), this does nothing until `reset_belief`.
+
+        """
+        if self._n_folded is None or self._context_len == self._n_folded:
+            return
+        with torch.no_grad():
+            new_context = self.context[:, self._n_folded:]
+            params = self._context_encoder.forward(new_context)
+            params = params.view(1, -1, self._context_encoder.output_dim)
+            if self._use_information_bottleneck:
+                mu = params[..., :self._latent_dim]
+                sigma_squared = F.softplus(params[..., self._latent_dim:])
+                sigma_squared = torch.clamp(sigma_squared, min=1e-7)
+                precision = torch.sum(torch.reciprocal(sigma_squared), dim=1)
+                weighted_mean = torch.sum(mu / sigma_squared, dim=1)
+                if self._precision_sum is None:
+                    self._precision_sum = precision
+                    self._weighted_mean_sum = weighted_mean
+                else:
+                    self._precision_sum += precision
+                    self._weighted_mean_sum += weighted_mean
+                self.z_vars = 1. / self._precision_sum
+                self.z_means = self.z_vars * self._weighted_mean_sum
+            else:
+                mean_sum = torch.sum(params, dim=1)
+                if self._weighted_mean_sum is None:
+                    self._weighted_mean_sum = mean_sum
+                else:
+                    self._weighted_mean_sum += mean_sum
+                self.z_means = self._weighted_mean_sum / self._context_len
+            self._n_folded = self._context_len
+            self.sample_from_belief()
+
     # pylint: disable=arguments-differ
     def forward(self, obs, context):
         """Given observations and context, get actions and probs from policy.
@@ -229,15 +290,10 @@ class ContextConditionedPolicy(nn.Module):
         prior = torch.distributions.Normal(
             torch.zeros(self._latent_dim).to(tu.global_device()),
             torch.ones(self._latent_dim).to(tu.global_device()))
-        posteriors = [
-            torch.distributions.Normal(mu, torch.sqrt(var)) for mu, var in zip(
-                torch.unbind(self.z_means), torch.unbind(self.z_vars))
-        ]
-        kl_divs = [
-            torch.distributions.kl.kl_divergence(post, prior)
-            for post in posteriors
-        ]
-        kl_div_sum = torch.sum(torch.stack(kl_divs))
+        posterior = torch.distributions.Normal(self.z_means,
+                                               torch.sqrt(self.z_vars))
+        kl_divs = torch.distributions.kl.kl_divergence(posterior, prior)
+        kl_div_sum = torch.sum(kl_divs)
         return kl_div_sum
 
     @property
@@ -254,12 +310,18 @@ class ContextConditionedPolicy(nn.Module):
     def context(self):
         """Return context.
 
+        The context is a view of the context buffer. It is overwritten by
+        the transitions added after the next call to `reset_belief`.
+
         Returns:
             torch.Tensor: Context values, with shape :math:`(X, N, C)`.
                 X is the number of tasks. N is batch size. C is the combined
                 size of observation, action, reward, and next observation if
                 next observation is used in context. Otherwise, C is the
-                combined size of observation, action, and reward.
+                combined size of observation, action, and reward. None if
+                no transition was added to the context.
 
         """
-        return self._context
+        if not self._context_len:
+            return None
+        return self._context_buffer[:, :self._context_len]
@@ -51,8 +51,9 @@ class DeterministicMLPPolicy(Policy, MLPModule):
 
         """
         with torch.no_grad():
-            x = self.forward(torch.Tensor(observation).unsqueeze(0))
-            return x.squeeze(0).numpy(), dict()
+            observation = self._prepare_observations(observation)
+            x = self._run_inference(self.forward, observation.unsqueeze(0))
+            return x.squeeze(0).cpu().numpy(), dict()
 
     def get_actions(self, observations):
         """Get actions given observations.
@@ -70,8 +71,9 @@ class DeterministicMLPPolicy(Policy, MLPModule):
 
         """
         with torch.no_grad():
-            x = self.forward(torch.Tensor(observations))
-            return x.numpy(), dict()
+            observations = self._prepare_observations(observations)
+            x = self._run_inference(self.forward, observations)
+            return x.cpu().numpy(), dict()
 
     def reset(self, dones=None):
         """Reset the environment.
@@ -4,7 +4,6 @@ from torch import nn
 
 from garage.torch.modules import GaussianMLPModule
 from garage.torch.policies.policy import Policy
-import garage.torch.utils as tu
 
 
 class GaussianMLPPolicy(Policy, GaussianMLPModule):
@@ -106,14 +105,10 @@ class GaussianMLPPolicy(Policy, GaussianMLPModule):
 
         """
         with torch.no_grad():
-            if not isinstance(observation, torch.Tensor):
-                observation = torch.as_tensor(observation).float().to(
-                    tu.global_device())
-            observation = torch.Tensor(observation).unsqueeze(0)
-            dist = self.forward(observation)
-            return (dist.rsample().squeeze(0).numpy(),
-                    dict(mean=dist.mean.squeeze(0).numpy(),
-                         log_std=(dist.variance**.5).log().squeeze(0).numpy()))
+            observation = self._prepare_observations(observation)
+            actions, agent_infos = self._sample_actions(
+                observation.unsqueeze(0))
+            return actions[0], {k: v[0] for k, v in agent_infos.items()}
 
     def get_actions(self, observations):
         r"""Get actions given observations.
@@ -133,13 +128,33 @@ class GaussianMLPPolicy(Policy, GaussianMLPModule):
 
         """
         with torch.no_grad():
-            if not isinstance(observations, torch.Tensor):
-                observations = torch.as_tensor(observations).float().to(
-                    tu.global_device())
-            dist = self.forward(torch.Tensor(observations))
-            return (dist.rsample().numpy(),
-                    dict(mean=dist.mean.numpy(),
-                         log_std=(dist.variance.sqrt()).log().numpy()))
+            observations = self._prepare_observations(observations)
+            return self._sample_actions(observations)
+
+    def _sample_actions(self, observations):
+        """Sample actions and convert them to NumPy.
+
+        Actions are sampled from the mean and standard deviation directly,
+        without building a distribution, and all outputs are transferred
+        with a single conversion to NumPy.
+
+        Args:
+            observations (torch.Tensor): Batch of float32 observations.
+
+        Returns:
+            tuple:
+                * np.ndarray: Sampled actions.
+                * dict:
+                    * np.ndarray[float]: Mean of the distribution.
+                    * np.ndarray[float]: Standard deviation of logarithmic
+                        values of the distribution.
+
+        """
+        mean, std, log_std = self._run_inference(self._get_dist_params,
+                                                 observations)
+        actions = torch.randn_like(mean).mul_(std).add_(mean)
+        actions, mean, log_std = self._to_numpy(actions, mean, log_std)
+        return actions, dict(mean=mean, log_std=log_std)
 
     def log_likelihood(self, observation, action):
         """Compute log likelihood given observations and action.
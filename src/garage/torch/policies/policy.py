@@ -1,8 +1,11 @@
 """Base Policy."""
 import abc
 
+import numpy as np
 import torch
 
+import garage.torch.utils as tu
+
 
 class Policy(abc.ABC, torch.nn.Module):
     """Policy base class.
@@ -18,6 +21,11 @@ class Policy(abc.ABC, torch.nn.Module):
         # See issue #1141
         self._env_spec = env_spec
         self._name = name
+        self._jit_inference = False
+        # Observation shape -> preallocated input tensor, and
+        # (input shape, device) -> traced inference module.
+        self._input_buffers = {}
+        self._traced_modules = {}
 
     @abc.abstractmethod
     def get_action(self, observation):
@@ -53,6 +61,130 @@ class Policy(abc.ABC, torch.nn.Module):
 
         """
 
+    def _prepare_observations(self, observations):
+        """Convert observations to a float32 tensor on the global device.
+
+        Float32 NumPy observations are used without copying them on the
+        CPU. Other observations are copied once into an input tensor which
+        is allocated for each observation shape and reused. This tensor is
+        overwritten by the next call, so the result must not be kept.
+
+        Args:
+            observations (np.ndarray or torch.Tensor): Observations.
+
+        Returns:
+            torch.Tensor: Observations as a float32 tensor.
+
+        """
+        device = tu.global_device()
+        if isinstance(observations, torch.Tensor):
+            return observations.to(device=device, dtype=torch.float32)
+        observations = np.asarray(observations)
+        on_gpu = device is not None and device.type == 'cuda'
+        if (observations.dtype == np.float32 and not on_gpu
+                and observations.flags.c_contiguous):
+            return torch.from_numpy(observations)
+        buf = self._input_buffers.get(observations.shape, None)
+        if buf is None:
+            buf = torch.empty(observations.shape, dtype=torch.float32)
+            if on_gpu:
+                buf = buf.pin_memory()
+            self._input_buffers[observations.shape] = buf
+        buf.copy_(torch.from_numpy(np.ascontiguousarray(observations)))
+        return buf.to(device, non_blocking=True) if on_gpu else buf
+
+    def _run_inference(self, fn, observations):
+        """Evaluate the inference function of the policy.
+
+        If `jit_inference` is enabled, fn is traced with TorchScript once
+        for each input shape, and the traced module is used afterwards.
+
+        Args:
+            fn (callable): Function mapping a float32 observation tensor to
+                a tensor or a tuple of tensors. It must only depend on the
+                parameters of the policy.
+            observations (torch.Tensor): Observations.
+
+        Returns:
+            torch.Tensor or tuple[torch.Tensor]: Outputs of fn.
+
+        """
+        if not self._jit_inference:
+            return fn(observations)
+        key = (tuple(observations.shape), observations.device)
+        traced = self._traced_modules.get(key, None)
+        if traced is None:
+            traced = torch.jit.trace(_InferenceModule(self, fn), observations,
+                                     check_trace=False)
+            self._traced_modules[key] = traced
+        return traced(observations)
+
+    @staticmethod
+    def _to_numpy(*tensors):
+        """Convert tensors to NumPy with a single device transfer.
+
+        The tensors are concatenated along their last dimension into a
+        single new tensor, which is converted to NumPy once and split into
+        views. The returned arrays do not share memory with later calls.
+
+        Args:
+            *tensors (torch.Tensor): Tensors with the same leading
+                dimensions.
+
+        Returns:
+            list[np.ndarray]: Arrays with the values of tensors.
+
+        """
+        fused = torch.cat(tensors, dim=-1).cpu().numpy()
+        splits = np.cumsum([t.shape[-1] for t in tensors[:-1]])
+        return np.split(fused, splits, axis=-1)
+
+    @property
+    def jit_inference(self):
+        """Whether inference uses modules traced with TorchScript.
+
+        Returns:
+            bool: Whether inference uses traced modules.
+
+        """
+        return self._jit_inference
+
+    @jit_inference.setter
+    def jit_inference(self, enabled):
+        """Enable or disable inference with traced modules.
+
+        Args:
+            enabled (bool): Whether inference uses traced modules.
+
+        """
+        self._jit_inference = enabled
+        self._traced_modules = {}
+
+    def __getstate__(self):
+        """Object.__getstate__.
+
+        Returns:
+            dict: The state to be pickled for the instance. Input tensors
+                and traced modules are not pickled.
+
+        """
+        data = self.__dict__.copy()
+        data['_input_buffers'] = {}
+        data['_traced_modules'] = {}
+        return data
+
+    def __setstate__(self, state):
+        """Object.__setstate__.
+
+        Args:
+            state (dict): Unpickled state.
+
+        """
+        super().__setstate__(state)
+        self.__dict__.setdefault('_jit_inference', False)
+        self._input_buffers = {}
+        self._traced_modules = {}
+
     @property
     def observation_space(self):
         """The observation space for the environment.
@@ -114,3 +246,32 @@ class Policy(abc.ABC, torch.nn.Module):
 
         """
         self.load_state_dict(state_dict)
+
+
+class _InferenceModule(torch.nn.Module):
+    """Module wrapping the inference function of a policy for tracing.
+
+    Args:
+        policy (Policy): Policy whose parameters are used by fn.
+        fn (callable): Inference function of the policy.
+
+    """
+
+    def __init__(self, policy, fn):
+        super().__init__()
+        self.policy = policy
+        self._fn = fn
+
+    # pylint: disable=arguments-differ
+    def forward(self, observations):
+        """Forward method.
+
+        Args:
+            observations (torch.Tensor): Observations.
+
+        Returns:
+            torch.Tensor or tuple[torch.Tensor]: Outputs of the inference
+                function.
+
+        """
+        return self._fn(observations)
@@ -6,7 +6,6 @@ from torch import nn
 from garage.torch.distributions import TanhNormal
 from garage.torch.modules import GaussianMLPTwoHeadedModule
 from garage.torch.policies.policy import Policy
-import garage.torch.utils as tu
 
 
 class TanhGaussianMLPPolicy(Policy, GaussianMLPTwoHeadedModule):
@@ -108,15 +107,10 @@ class TanhGaussianMLPPolicy(Policy, GaussianMLPTwoHeadedModule):
 
         """
         with torch.no_grad():
-            if not isinstance(observation, torch.Tensor):
-                observation = torch.from_numpy(observation).float().to(
-                    tu.global_device())
-            observation = observation.unsqueeze(0)
-            dist = self.forward(observation)
-            ret_mean = dist.mean.squeeze(0).cpu().numpy()
-            ret_log_std = (dist.variance.sqrt()).log().squeeze(0).cpu().numpy()
-            return (dist.rsample().squeeze(0).cpu().numpy(),
-                    dict(mean=ret_mean, log_std=ret_log_std))
+            observation = self._prepare_observations(observation)
+            actions, agent_infos = self._sample_actions(
+                observation.unsqueeze(0))
+            return actions[0], {k: v[0] for k, v in agent_infos.items()}
 
     def get_actions(self, observations):
         r"""Get actions given observations.
@@ -136,14 +130,34 @@ class TanhGaussianMLPPolicy(Policy, GaussianMLPTwoHeadedModule):
 
         """
         with torch.no_grad():
-            if not isinstance(observations, torch.Tensor):
-                observations = torch.from_numpy(observations).float().to(
-                    tu.global_device())
-            dist = self.forward(observations)
-            ret_mean = dist.mean.cpu().numpy()
-            ret_log_std = (dist.variance.sqrt()).log().cpu().numpy()
-            return (dist.rsample().cpu().numpy(),
-                    dict(mean=ret_mean, log_std=ret_log_std))
+            observations = self._prepare_observations(observations)
+            return self._sample_actions(observations)
+
+    def _sample_actions(self, observations):
+        """Sample actions and convert them to NumPy.
+
+        Actions are sampled from the parameters of the underlying normal
+        distribution directly, without building a TanhNormal, and all
+        outputs are transferred with a single conversion to NumPy.
+
+        Args:
+            observations (torch.Tensor): Batch of float32 observations.
+
+        Returns:
+            tuple:
+                * np.ndarray: Sampled actions.
+                * dict:
+                    * np.ndarray[float]: Mean of the distribution.
+                    * np.ndarray[float]: Standard deviation of logarithmic
+                        values of the distribution.
+
+        """
+        mean, std, log_std = self._run_inference(self._get_dist_params,
+                                                 observations)
+        actions = torch.randn_like(mean).mul_(std).add_(mean).tanh_()
+        actions, mean, log_std = self._to_numpy(actions, mean.tanh(),
+                                                log_std)
+        return actions, dict(mean=mean, log_std=log_std)
 
     def log_likelihood(self, observation, action):
         r"""Compute log likelihood given observations and action.
@@ -1,5 +1,11 @@
 """PyTorch Q-functions."""
-from garage.torch.q_functions.continuous_mlp_q_function import (
-    ContinuousMLPQFunction)
+from garage._lazy import lazy_import
 
-__all__ = ['ContinuousMLPQFunction']
+__all__ = ['ContinuousMLPQFunction', 'EnsembleContinuousMLPQFunction']
+
+_ATTRIBUTES = {
+    'ContinuousMLPQFunction': 'continuous_mlp_q_function',
+    'EnsembleContinuousMLPQFunction': 'ensemble_continuous_mlp_q_function',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -0,0 +1,38 @@
+"""This modules creates an ensemble of continuous Q-function networks."""
+
+import torch
+
+from garage.torch.modules import EnsembleMLPModule
+
+
+class EnsembleContinuousMLPQFunction(EnsembleMLPModule):
+    """
+    Implements an ensemble of continuous MLP Q-value networks.
+
+    All Q-functions of the ensemble are evaluated in a single forward pass,
+    with batched matrix multiplications. It can be used in place of twin
+    Q-functions (with n_members=2), or as a larger ensemble.
+    """
+
+    def __init__(self, env_spec, n_members=2, **kwargs):
+        """
+        Initialize class with multiple attributes.
+
+        Args:
+            env_spec (garage.envs.env_spec.EnvSpec): Environment specification.
+            n_members (int): Number of Q-functions in the ensemble.
+            kwargs: Keyword arguments of EnsembleMLPModule.
+        """
+        self._env_spec = env_spec
+        self._obs_dim = env_spec.observation_space.flat_dim
+        self._action_dim = env_spec.action_space.flat_dim
+
+        EnsembleMLPModule.__init__(self,
+                                   n_members=n_members,
+                                   input_dim=self._obs_dim + self._action_dim,
+                                   output_dim=1,
+                                   **kwargs)
+
+    def forward(self, observations, actions):
+        """Return Q-value(s) of all Q-functions, with shape (K, N, 1)."""
+        return super().forward(torch.cat([observations, actions], 1))
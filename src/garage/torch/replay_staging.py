@@ -0,0 +1,239 @@
+"""Gather replay buffer samples into preallocated PyTorch tensors."""
+import torch
+
+import garage.torch.utils as tu
+
+
+class ReplayStager:
+    """Gather transitions from replay buffers into reusable tensors.
+
+    Sampling with `PathBuffer.sample_transitions` and converting the result
+    with `dict_np_to_torch` allocates a new array and a new tensor for
+    every key of every batch. This class instead keeps zero-copy torch
+    views of the NumPy arrays of the buffers, and gathers the sampled rows
+    with `torch.index_select` into float32 staging tensors, which are
+    allocated once and reused. Batches of several buffers (e.g. one per
+    task) are gathered into slices of the same staging tensor, and batches
+    of several tasks of a MultiTaskPathBuffer with a single gather.
+
+    If the global device is a GPU, staging tensors are pinned and copied
+    into reused device tensors.
+
+    The returned tensors are overwritten by the next call, so they must not
+    be kept across calls.
+
+    Args:
+        keys (list[str]): Keys of the transitions to gather.
+
+    """
+
+    def __init__(self, keys):
+        self._keys = list(keys)
+        # (id(buffer), key) -> (array, zero-copy view of array)
+        self._views = {}
+        # key -> float32 staging tensor of shape (n_buffers, N, flat_dim)
+        self._staging = {}
+        # key -> staging tensor on the global device
+        self._device_staging = {}
+        # (key, dtype) -> gather tensor for arrays which are not float32
+        self._scratch = {}
+
+    def sample(self, buffer, batch_size):
+        """Sample a batch of transitions from a buffer.
+
+        Args:
+            buffer (garage.replay_buffer.PathBuffer): Buffer to sample from.
+            batch_size (int): Number of transitions to sample.
+
+        Returns:
+            dict[str, torch.Tensor]: Transitions, with shape
+                :math:`(N, S^*)`.
+
+        """
+        samples = self.sample_buffers([buffer], batch_size)
+        return {key: value[0] for key, value in samples.items()}
+
+    def sample_buffers(self, buffers, batch_size):
+        """Sample a batch of transitions from each of several buffers.
+
+        Args:
+            buffers (list[garage.replay_buffer.PathBuffer]): Buffers to
+                sample from.
+            batch_size (int): Number of transitions to sample from each
+                buffer.
+
+        Returns:
+            dict[str, torch.Tensor]: Transitions, with shape
+                :math:`(X, N, S^*)`, where X is the number of buffers.
+
+        """
+        indices = [
+            torch.from_numpy(buffer.sample_indices(batch_size))
+            for buffer in buffers
+        ]
+        samples = {}
+        for key in self._keys:
+            views = [self._get_view(buffer, key) for buffer in buffers]
+            staging = self._get_staging(key,
+                                        (len(buffers), batch_size,
+                                         views[0].shape[1]))
+            for i, (view, idx) in enumerate(zip(views, indices)):
+                self._gather(key, view, idx, staging[i])
+            samples[key] = self._to_device(key, staging)
+        return samples
+
+    def sample_tasks(self, buffer, tasks, batch_size):
+        """Sample a batch of transitions of each of several tasks.
+
+        The batches of all tasks are gathered with a single index_select
+        per key.
+
+        Args:
+            buffer (garage.replay_buffer.MultiTaskPathBuffer): Buffer to
+                sample from.
+            tasks (list[int]): Indices of the tasks.
+            batch_size (int): Number of transitions to sample for each task.
+
+        Returns:
+            dict[str, torch.Tensor]: Transitions, with shape
+                :math:`(X, N, S^*)`, where X is the number of tasks.
+
+        """
+        idx = torch.from_numpy(
+            buffer.sample_indices(batch_size, tasks).reshape(-1))
+        samples = {}
+        for key in self._keys:
+            view = self._get_view(buffer, key)
+            staging = self._get_staging(
+                key, (len(idx) // batch_size, batch_size, view.shape[1]))
+            self._gather(key, view, idx, staging.view(-1, view.shape[1]))
+            samples[key] = self._to_device(key, staging)
+        return samples
+
+    def _gather(self, key, view, idx, out):
+        """Gather rows of a view into a float32 tensor.
+
+        Args:
+            key (str): Key of the transitions.
+            view (torch.Tensor): View of the array of a buffer.
+            idx (torch.Tensor): Indices of the rows.
+            out (torch.Tensor): Contiguous float32 tensor the rows are
+                gathered into.
+
+        """
+        if view.dtype == torch.float32:
+            torch.index_select(view, 0, idx, out=out)
+        else:
+            scratch = self._get_scratch(key, view.dtype, out.shape)
+            torch.index_select(view, 0, idx, out=scratch)
+            out.copy_(scratch)
+
+    def _get_view(self, buffer, key):
+        """Get a torch view of the array of a buffer.
+
+        Args:
+            buffer (garage.replay_buffer.PathBuffer or
+                garage.replay_buffer.MultiTaskPathBuffer): Buffer.
+            key (str): Key of the transitions.
+
+        Returns:
+            torch.Tensor: Tensor sharing memory with the array.
+
+        """
+        array = buffer.get_array(key)
+        cached = self._views.get((id(buffer), key), None)
+        if cached is None or cached[0] is not array:
+            cached = (array, torch.from_numpy(array))
+            self._views[(id(buffer), key)] = cached
+        return cached[1]
+
+    def _get_staging(self, key, shape):
+        """Get the staging tensor of a key.
+
+        Args:
+            key (str): Key of the transitions.
+            shape (tuple[int]): Shape of the staging tensor.
+
+        Returns:
+            torch.Tensor: Float32 staging tensor on the CPU.
+
+        """
+        staging = self._staging.get(key, None)
+        if staging is None or staging.shape != shape:
+            staging = torch.empty(shape, dtype=torch.float32)
+            if self._on_gpu():
+                staging = staging.pin_memory()
+            self._staging[key] = staging
+        return staging
+
+    def _get_scratch(self, key, dtype, shape):
+        """Get the tensor used to gather rows of an array of another dtype.
+
+        Args:
+            key (str): Key of the transitions.
+            dtype (torch.dtype): Data type of the array.
+            shape (tuple[int]): Shape of the gathered rows.
+
+        Returns:
+            torch.Tensor: Gather tensor.
+
+        """
+        scratch = self._scratch.get((key, dtype), None)
+        if scratch is None or scratch.shape != shape:
+            scratch = torch.empty(shape, dtype=dtype)
+            self._scratch[(key, dtype)] = scratch
+        return scratch
+
+    def _to_device(self, key, staging):
+        """Copy a staging tensor to the global device.
+
+        Args:
+            key (str): Key of the transitions.
+            staging (torch.Tensor): Staging tensor.
+
+        Returns:
+            torch.Tensor: A tensor on the global device with the values of
+                staging. This is staging itself on the CPU.
+
+        """
+        if not self._on_gpu():
+            return staging
+        device_staging = self._device_staging.get(key, None)
+        if (device_staging is None or device_staging.shape != staging.shape
+                or device_staging.device != tu.global_device()):
+            device_staging = torch.empty(staging.shape,
+                                         dtype=torch.float32,
+                                         device=tu.global_device())
+            self._device_staging[key] = device_staging
+        device_staging.copy_(staging)
+        return device_staging
+
+    @staticmethod
+    def _on_gpu():
+        """Return whether the global device is a GPU.
+
+        Returns:
+            bool: Whether the global device is a GPU.
+
+        """
+        device = tu.global_device()
+        return device is not None and device.type == 'cuda'
+
+    def __getstate__(self):
+        """Object.__getstate__.
+
+        Returns:
+            dict: The state to be pickled for the instance. Views of the
+                buffers and staging tensors are not pickled.
+
+        """
+        return {'_keys': self._keys}
+
+    def __setstate__(self, state):
+        """Object.__setstate__.
+
+        Args:
+            state (dict): Unpickled state.
+
+        """
+        self.__init__(state['_keys'])
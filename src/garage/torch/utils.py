@@ -98,6 +98,38 @@ def update_module_params(module, new_params):  # noqa: D202
             update(module, name, new_param)
 
 
+def soft_update_model(target_model, source_model, tau, n_steps=1):
+    """Update a target model's parameters with Polyak averaging.
+
+    Each target parameter is moved in place towards its source parameter,
+    as `target = target + tau * (source - target)`. With n_steps greater
+    than 1, the result of n_steps successive updates towards the current
+    source parameters is applied in a single update, so that the target
+    can be updated every n_steps gradient steps at the same averaging rate.
+
+    All parameters are updated in one `torch._foreach_lerp_` call if it is
+    available, and with one in-place `lerp_` per parameter otherwise.
+
+    Args:
+        target_model (torch.nn.Module): Model whose parameters are updated.
+        source_model (torch.nn.Module): Model with the same parameter
+            shapes as target_model.
+        tau (float): Interpolation coefficient of a single update.
+        n_steps (int): Number of updates applied at once.
+
+    """
+    weight = 1. - (1. - tau)**n_steps
+    target_params = list(target_model.parameters())
+    source_params = list(source_model.parameters())
+    with torch.no_grad():
+        if hasattr(torch, '_foreach_lerp_'):
+            # pylint: disable=no-member, protected-access
+            torch._foreach_lerp_(target_params, source_params, weight)
+        else:
+            for t_param, param in zip(target_params, source_params):
+                t_param.lerp_(param, weight)
+
+
 def set_gpu_mode(mode, gpu_id=0):
     """Set GPU mode and device ID.
 
@@ -132,7 +164,7 @@ def global_device():
     return _DEVICE
 
 
-def product_of_gaussians(mus, sigmas_squared):
+def product_of_gaussians(mus, sigmas_squared, dim=0):
     """Compute mu, sigma of product of gaussians.
 
     Args:
@@ -140,12 +172,16 @@ def product_of_gaussians(mus, sigmas_squared):
             of mean values.
         sigmas_squared (torch.Tensor): Variances, with shape :math:`(N, V)`. V
             is the number of variance values.
+        dim (int): Dimension of the gaussians multiplied together. Other
+            dimensions are batch dimensions, e.g. with dim=1, products of
+            gaussians of several tasks with shape :math:`(X, N, M)` are
+            computed at once.
 
     Returns:
         torch.Tensor: Mu of product of gaussians, with shape :math:`(N, 1)`.
         torch.Tensor: Sigma of product of gaussians, with shape :math:`(N, 1)`.
     """
     sigmas_squared = torch.clamp(sigmas_squared, min=1e-7)
-    sigma_squared = 1. / torch.sum(torch.reciprocal(sigmas_squared), dim=0)
-    mu = sigma_squared * torch.sum(mus / sigmas_squared, dim=0)
+    sigma_squared = 1. / torch.sum(torch.reciprocal(sigmas_squared), dim=dim)
+    mu = sigma_squared * torch.sum(mus / sigmas_squared, dim=dim)
     return mu, sigma_squared
@@ -1,6 +1,11 @@
 """Value functions which use PyTorch."""
-from garage.torch.value_functions.value_function import ValueFunction
-from garage.torch.value_functions.gaussian_mlp_value_function import (  # noqa: I100,E501
-    GaussianMLPValueFunction)
+from garage._lazy import lazy_import
 
 __all__ = ['ValueFunction', 'GaussianMLPValueFunction']
+
+_ATTRIBUTES = {
+    'ValueFunction': 'value_function',
+    'GaussianMLPValueFunction': 'gaussian_mlp_value_function',
+}
+
+__getattr__, __dir__ = lazy_import(__name__, _ATTRIBUTES)
@@ -4,7 +4,9 @@ import torch
 
 from garage.envs import GarageEnv
 from garage.envs import normalize
+from garage.envs import PointEnv
 from garage.experiment import deterministic, LocalRunner
+from garage.np.policies import FixedPolicy
 from garage.plotter import Plotter
 from garage.sampler import LocalSampler
 from garage.torch.algos import PPO
@@ -107,3 +109,63 @@ def test_setup_no_batch_size():
     runner.setup(algo, None, sampler_cls=LocalSampler)
     with pytest.raises(ValueError, match='batch_size'):
         runner.train(n_epochs=5)
+
+
+def test_setup_worker_sampler_args():
+    runner = LocalRunner(snapshot_config)
+    algo = CrashingAlgo()
+    algo.policy = None
+    runner.setup(algo,
+                 None,
+                 sampler_cls=LocalSampler,
+                 sampler_args=dict(max_path_length=7, seed=3))
+    assert runner._sampler._factory.max_path_length == 7
+    assert runner._sampler._factory._seed == 3
+    with pytest.raises(TypeError):
+        runner.setup(algo,
+                     None,
+                     sampler_cls=LocalSampler,
+                     sampler_args=dict(max_path_length=7,
+                                       truncate_rollout=True))
+
+
+def test_obtain_samples_for_tasks():
+    deterministic.set_seed(0)
+    max_path_length = 5
+    env = GarageEnv(PointEnv())
+    task_actions = [env.action_space.sample() for _ in range(5)]
+    task_policies = [
+        FixedPolicy(env.spec, [action] * max_path_length)
+        for action in task_actions
+    ]
+    runner = LocalRunner(snapshot_config)
+    algo = CrashingAlgo()
+    algo.max_path_length = max_path_length
+    algo.policy = task_policies[0]
+    runner.setup(algo, env, sampler_cls=LocalSampler, n_workers=3)
+    task_paths = runner.obtain_samples_for_tasks(0, 12, task_policies,
+                                                 [None] * len(task_policies))
+    assert len(task_paths) == len(task_actions)
+    for paths, action in zip(task_paths, task_actions):
+        assert sum(len(path['rewards']) for path in paths) >= 12
+        for path in paths:
+            assert (path['actions'] == action).all()
+
+
+def test_obtain_samples_consumer():
+    deterministic.set_seed(0)
+    env = GarageEnv(PointEnv())
+    runner = LocalRunner(snapshot_config)
+    algo = CrashingAlgo()
+    algo.max_path_length = 5
+    algo.policy = FixedPolicy(env.spec, [env.action_space.sample()] * 5)
+    runner.setup(algo, env, sampler_cls=LocalSampler, n_workers=2)
+    consumed = []
+
+    def consumer(path):
+        path['consumed'] = True
+        consumed.append(path)
+
+    paths = runner.obtain_samples(0, 12, consumer=consumer)
+    assert len(consumed) == len(paths)
+    assert all(path['consumed'] for path in paths)
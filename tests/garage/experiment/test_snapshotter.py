@@ -1,10 +1,13 @@
+import os
 from os import path as osp
 import pickle
 import tempfile
 
+import numpy as np
 import pytest
 
 from garage.experiment import Snapshotter
+from garage.experiment.snapshotter import load_snapshot_file
 
 configurations = [('all', {
     'itr_1.pkl': 0,
@@ -50,3 +53,79 @@ class TestSnapshotter:
             snapshotter = Snapshotter(
                 snapshot_dir=self.temp_dir.name, snapshot_mode='invalid')
             snapshotter.save_itr_params(2, {'testparam': 'invalid'})
+
+    def test_chunked_arrays(self):
+        snapshotter = Snapshotter(self.temp_dir.name,
+                                  'last',
+                                  array_chunk_bytes=800)
+        buffer = np.zeros((100, 4))
+        small = np.arange(3)
+        params = {'buffer': buffer, 'same': buffer, 'small': small}
+        snapshotter.save_itr_params(1, params)
+        chunk_dir = osp.join(self.temp_dir.name, 'chunks')
+        # 4 chunks of 25 identical rows of zeros are stored once.
+        assert len(os.listdir(chunk_dir)) == 1
+
+        buffer[:10] = 1.
+        snapshotter.save_itr_params(2, params)
+        assert len(os.listdir(chunk_dir)) == 2
+        loaded = snapshotter.load(self.temp_dir.name)
+        assert np.array_equal(loaded['buffer'], buffer)
+        assert loaded['same'] is loaded['buffer']
+        assert np.array_equal(loaded['small'], small)
+
+        buffer[:] = 2.
+        snapshotter.save_itr_params(3, params)
+        # Chunks only used by the overwritten snapshot are removed.
+        assert len(os.listdir(chunk_dir)) == 1
+        loaded = load_snapshot_file(osp.join(self.temp_dir.name,
+                                             'params.pkl'))
+        assert np.array_equal(loaded['buffer'], buffer)
+
+    def test_async_write(self):
+        snapshotter = Snapshotter(self.temp_dir.name,
+                                  'all',
+                                  async_write=True,
+                                  array_chunk_bytes=800)
+        buffer = np.zeros((100, 4))
+        snapshotter.save_itr_params(1, {'buffer': buffer})
+        # Arrays are captured when save_itr_params is called.
+        buffer[:] = 1.
+        snapshotter.save_itr_params(2, {'buffer': buffer})
+        snapshotter.flush()
+        assert np.all(snapshotter.load(self.temp_dir.name, 1)['buffer'] == 0.)
+        assert np.all(snapshotter.load(self.temp_dir.name, 2)['buffer'] == 1.)
+        snapshotter = pickle.loads(pickle.dumps(snapshotter))
+        assert snapshotter.snapshot_mode == 'all'
+
+    def test_load_keys(self):
+        snapshotter = Snapshotter(self.temp_dir.name,
+                                  'last',
+                                  array_chunk_bytes=800)
+        shared = [1, 2]
+        snapshotter.save_itr_params(1, {
+            'a': shared,
+            'b': np.ones((10, 20)),
+            'c': shared,
+            'd': 4
+        })
+        loaded = snapshotter.load(self.temp_dir.name, keys=['c'])
+        assert list(loaded.keys()) == ['c']
+        assert loaded['c'] == shared
+        loaded = snapshotter.load(self.temp_dir.name)
+        assert loaded['a'] is loaded['c']
+        assert loaded['d'] == 4
+        with pytest.raises(KeyError):
+            snapshotter.load(self.temp_dir.name, keys=['e'])
+
+    def test_load_mmap(self):
+        snapshotter = Snapshotter(self.temp_dir.name,
+                                  'last',
+                                  array_chunk_bytes=1600)
+        snapshotter.save_itr_params(1, {'array': np.ones((10, 20))})
+        loaded = snapshotter.load(self.temp_dir.name, mmap_mode='c')
+        assert isinstance(loaded['array'], np.memmap)
+        assert np.all(loaded['array'] == 1.)
+        loaded['array'][0] = 2.
+        loaded = snapshotter.load(self.temp_dir.name, mmap_mode='r')
+        assert np.all(loaded['array'] == 1.)
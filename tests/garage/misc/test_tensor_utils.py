@@ -8,6 +8,7 @@ from garage.misc.tensor_utils import concat_tensor_dict_list
 from garage.misc.tensor_utils import explained_variance_1d
 from garage.misc.tensor_utils import normalize_pixel_batch
 from garage.misc.tensor_utils import pad_tensor
+from garage.misc.tensor_utils import scatter_and_pad
 from garage.misc.tensor_utils import stack_and_pad_tensor_dict_list
 from garage.misc.tensor_utils import stack_tensor_dict_list
 from garage.tf.envs import TfEnv
@@ -92,3 +93,16 @@ class TestTensorUtil:
                               np.array([[1, 1, 0, 0, 0], [1, 1, 0, 0, 0]]))
         assert np.array_equal(result['info']['baba'],
                               np.array([[2, 2, 0, 0, 0], [2, 2, 0, 0, 0]]))
+
+    def test_scatter_and_pad(self):
+        data = dict(obs=np.array([1, 2, 3, 4, 5]),
+                    info=dict(lala=np.array([[1, 1], [2, 2], [3, 3], [4, 4],
+                                             [5, 5]])))
+        rows = np.array([1, 1, 0, 1, 0])
+        cols = np.array([0, 1, 0, 2, 1])
+        result = scatter_and_pad(data, rows, cols, n_rows=2, max_len=4)
+        assert np.array_equal(result['obs'],
+                              np.array([[3, 5, 0, 0], [1, 2, 4, 0]]))
+        assert result['info']['lala'].shape == (2, 4, 2)
+        assert np.array_equal(result['info']['lala'][0],
+                              np.array([[3, 3], [5, 5], [0, 0], [0, 0]]))
@@ -2,7 +2,7 @@ import pytest
 
 from garage.np.algos import CEM
 from garage.np.baselines import LinearFeatureBaseline
-from garage.sampler import OnPolicyVectorizedSampler
+from garage.sampler import LocalSampler, OnPolicyVectorizedSampler
 from garage.tf.envs import TfEnv
 from garage.tf.experiment import LocalTFRunner
 from garage.tf.policies import CategoricalMLPPolicy
@@ -36,3 +36,32 @@ class TestCEM(TfGraphTestCase):
             assert rtn > 40
 
             env.close()
+
+    def test_cem_cartpole_population_mode(self):
+        """Test CEM sampling all policies of an epoch at once."""
+        with LocalTFRunner(snapshot_config) as runner:
+            env = TfEnv(env_name='CartPole-v1')
+
+            policy = CategoricalMLPPolicy(name='policy',
+                                          env_spec=env.spec,
+                                          hidden_sizes=(8, 8))
+            baseline = LinearFeatureBaseline(env_spec=env.spec)
+
+            n_samples = 4
+
+            algo = CEM(env_spec=env.spec,
+                       policy=policy,
+                       baseline=baseline,
+                       best_frac=0.5,
+                       max_path_length=10,
+                       n_samples=n_samples,
+                       population_mode=True)
+
+            runner.setup(algo, env, sampler_cls=LocalSampler, n_workers=2)
+            rtn = runner.train(n_epochs=2, batch_size=10)
+            assert rtn > 0
+            # One sampling round per epoch.
+            assert runner.step_itr == 2
+            assert algo.cur_mean.shape == (algo.n_params, )
+
+            env.close()
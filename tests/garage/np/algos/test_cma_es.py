@@ -1,6 +1,6 @@
 from garage.np.algos import CMAES
 from garage.np.baselines import LinearFeatureBaseline
-from garage.sampler import OnPolicyVectorizedSampler
+from garage.sampler import LocalSampler, OnPolicyVectorizedSampler
 from garage.tf.envs import TfEnv
 from garage.tf.experiment import LocalTFRunner
 from garage.tf.policies import CategoricalMLPPolicy
@@ -32,3 +32,26 @@ class TestCMAES(TfGraphTestCase):
             # No assertion on return because CMAES is not stable.
 
             env.close()
+
+    def test_cma_es_cartpole_population_mode(self):
+        """Test CMAES sampling all policies of an epoch at once."""
+        with LocalTFRunner(snapshot_config) as runner:
+            env = TfEnv(env_name='CartPole-v1')
+
+            policy = CategoricalMLPPolicy(name='policy',
+                                          env_spec=env.spec,
+                                          hidden_sizes=(8, 8))
+            baseline = LinearFeatureBaseline(env_spec=env.spec)
+
+            algo = CMAES(env_spec=env.spec,
+                         policy=policy,
+                         baseline=baseline,
+                         max_path_length=10,
+                         n_samples=4,
+                         population_mode=True)
+
+            runner.setup(algo, env, sampler_cls=LocalSampler, n_workers=2)
+            rtn = runner.train(n_epochs=1, batch_size=10)
+            assert rtn > 0
+
+            env.close()
@@ -23,7 +23,8 @@ class ConstantPolicy:
         return self.action, dict()
 
     def get_actions(self, observations):
-        return np.full(len(observations), self.action), dict()
+        return np.full((len(observations), ) + np.shape(self.action),
+                       self.action), dict()
 
     def reset(self, *args, **kwargs):
         pass
@@ -59,3 +60,21 @@ def test_decay_period(env):
     assert (exp_policy.get_action(None)[0] != policy.get_action(None)[0]).all()
     exp_policy.reset()
     assert (exp_policy.get_action(None)[0] == policy.get_action(None)[0]).all()
+
+
+@pytest.mark.parametrize('noise_block_size', [None, 3])
+def test_get_actions(env, noise_block_size):
+    policy = ConstantPolicy(np.zeros(env.action_space.shape))
+    exp_policy = AddGaussianNoise(env,
+                                  policy,
+                                  max_sigma=1e-3,
+                                  min_sigma=1e-3,
+                                  noise_block_size=noise_block_size)
+    for _ in range(4):
+        actions, _ = exp_policy.get_actions([None] * 2)
+        assert actions.shape == (2, ) + env.action_space.shape
+        # Each environment gets its own noise.
+        assert (actions[0] != actions[1]).all()
+        assert np.abs(actions).max() < 1e-2
+    exp_policy = pickle.loads(pickle.dumps(exp_policy))
+    assert exp_policy.get_actions([None] * 2)[0].shape == actions.shape
@@ -0,0 +1,81 @@
+"""Tests for Ornstein-Uhlenbeck exploration policy."""
+import pickle
+
+import numpy as np
+import pytest
+
+from garage.envs import EnvSpec
+from garage.np.exploration_policies import AddOrnsteinUhlenbeckNoise
+from tests.fixtures.envs.dummy import DummyBoxEnv
+
+
+class ZeroPolicy:
+    """Policy which always takes the zero action."""
+
+    def __init__(self, action_dim):
+        self.action_dim = action_dim
+
+    def get_action(self, _):
+        return np.zeros(self.action_dim), dict()
+
+    def get_actions(self, observations):
+        return np.zeros((len(observations), self.action_dim)), dict()
+
+    def reset(self, dones=None):
+        pass
+
+
+@pytest.fixture
+def env_spec():
+    env = DummyBoxEnv()
+    return EnvSpec(env.observation_space, env.action_space)
+
+
+@pytest.mark.parametrize('noise_block_size', [None, 5])
+def test_get_actions(env_spec, noise_block_size):
+    policy = ZeroPolicy(env_spec.action_space.flat_dim)
+    exp_policy = AddOrnsteinUhlenbeckNoise(env_spec,
+                                           policy,
+                                           noise_block_size=noise_block_size)
+    exp_policy.reset([True] * 3)
+    for _ in range(10):
+        actions, _ = exp_policy.get_actions([None] * 3)
+    assert actions.shape == (3, env_spec.action_space.flat_dim)
+    # Each environment has its own process.
+    assert (actions[0] != actions[1]).all()
+    action, _ = exp_policy.get_action(None)
+    assert action.shape == (env_spec.action_space.flat_dim, )
+
+
+def test_masked_reset(env_spec):
+    policy = ZeroPolicy(env_spec.action_space.flat_dim)
+    # Without noise, the process moves from x0 = 0 towards mu = 1.
+    theta, dt = 0.15, 1e-2
+    exp_policy = AddOrnsteinUhlenbeckNoise(env_spec,
+                                           policy,
+                                           mu=1.,
+                                           sigma=0.,
+                                           theta=theta,
+                                           dt=dt)
+    exp_policy.reset([True] * 3)
+    for _ in range(3):
+        exp_policy.get_actions([None] * 3)
+    exp_policy.reset([False, True, False])
+    actions, _ = exp_policy.get_actions([None] * 3)
+    assert np.allclose(actions[[0, 2]], 1 - (1 - theta * dt)**4)
+    assert np.allclose(actions[1], theta * dt)
+    exp_policy.reset()
+    actions, _ = exp_policy.get_actions([None] * 3)
+    assert np.allclose(actions, theta * dt)
+
+
+def test_pickleable(env_spec):
+    policy = ZeroPolicy(env_spec.action_space.flat_dim)
+    exp_policy = AddOrnsteinUhlenbeckNoise(env_spec,
+                                           policy,
+                                           noise_block_size=100)
+    exp_policy.get_actions([None] * 2)
+    unpickled = pickle.loads(pickle.dumps(exp_policy))
+    assert np.array_equal(unpickled._state, exp_policy._state)
+    assert unpickled.get_actions([None] * 2)[0].shape == (
+        2, env_spec.action_space.flat_dim)
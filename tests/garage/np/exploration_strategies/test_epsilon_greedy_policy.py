@@ -64,3 +64,21 @@ class TestEpsilonGreedyPolicy:
         h_data = pickle.dumps(self.epsilon_greedy_policy)
         policy = pickle.loads(h_data)
         assert policy._epsilon == self.epsilon_greedy_policy._epsilon
+
+    def test_get_actions_noise_block(self):
+        policy = EpsilonGreedyPolicy(env_spec=self.env,
+                                     policy=self.policy,
+                                     total_timesteps=100,
+                                     max_epsilon=1.0,
+                                     min_epsilon=0.02,
+                                     decay_ratio=0.1,
+                                     noise_block_size=7)
+        obs, _, _, _ = self.env.step(1)
+        for _ in range(4):
+            actions, _ = policy.get_actions([obs] * 5)
+            for action in actions:
+                assert self.env.action_space.contains(action)
+        # Epsilon stops decaying at min_epsilon, after 10 steps.
+        assert np.isclose(policy._epsilon, 0.02)
+        policy = pickle.loads(pickle.dumps(policy))
+        assert len(policy.get_actions([obs] * 3)[0]) == 3
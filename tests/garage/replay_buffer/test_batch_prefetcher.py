@@ -0,0 +1,45 @@
+import threading
+
+import pytest
+
+from garage.replay_buffer import BatchPrefetcher
+
+
+class TestBatchPrefetcher:
+
+    @pytest.mark.parametrize('max_prefetch', [0, 1, 3])
+    def test_yields_batches_in_order(self, max_prefetch):
+        counter = iter(range(10))
+        with BatchPrefetcher(lambda: next(counter), 5,
+                             max_prefetch) as batches:
+            assert list(batches) == [0, 1, 2, 3, 4]
+
+    def test_samples_on_background_thread(self):
+        threads = []
+
+        def sample():
+            threads.append(threading.current_thread())
+            return 0
+
+        with BatchPrefetcher(sample, 3) as batches:
+            list(batches)
+        assert all(thread is not threading.main_thread()
+                   for thread in threads)
+
+    def test_reraises_sample_error(self):
+
+        def sample():
+            raise RuntimeError('sample failed')
+
+        with pytest.raises(RuntimeError, match='sample failed'):
+            with BatchPrefetcher(sample, 3) as batches:
+                list(batches)
+
+    def test_stops_early(self):
+        counter = iter(range(100))
+        with BatchPrefetcher(lambda: next(counter), 100, 2) as batches:
+            for batch in batches:
+                if batch == 1:
+                    break
+        # the background thread stops instead of sampling everything
+        assert next(counter) < 10
@@ -0,0 +1,61 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from garage.replay_buffer import MultiTaskPathBuffer
+
+
+class TestMultiTaskPathBuffer:
+
+    def test_sample_transitions(self):
+        replay_buffer = MultiTaskPathBuffer(n_tasks=3,
+                                            capacity_in_transitions=4)
+        for task in range(3):
+            replay_buffer.add_path(task, dict(obs=np.full((2, 1), task)))
+        sample = replay_buffer.sample_transitions(5, [2, 0])
+        assert sample['obs'].shape == (2, 5, 1)
+        assert (sample['obs'][0] == 2).all()
+        assert (sample['obs'][1] == 0).all()
+
+    def test_eviction_policy(self):
+        replay_buffer = MultiTaskPathBuffer(n_tasks=2,
+                                            capacity_in_transitions=3)
+        replay_buffer.add_path(0, dict(obs=np.array([[1], [1]])))
+        replay_buffer.add_path(1, dict(obs=np.array([[5]])))
+        replay_buffer.add_path(0, dict(obs=np.array([[2], [3]])))
+        assert replay_buffer.n_transitions_stored(0) == 3
+        assert replay_buffer.n_transitions_stored(1) == 1
+        sampled_obs = replay_buffer.sample_transitions(20, [0])['obs']
+        assert set(sampled_obs.flatten()) <= {1, 2, 3}
+        assert 1 not in replay_buffer.sample_transitions(20, [1])['obs'][0]
+
+    def test_clear_task(self):
+        replay_buffer = MultiTaskPathBuffer(n_tasks=2,
+                                            capacity_in_transitions=3)
+        replay_buffer.add_path(0, dict(obs=np.array([[1]])))
+        replay_buffer.add_path(1, dict(obs=np.array([[2]])))
+        replay_buffer.clear(0)
+        assert replay_buffer.n_transitions_stored(0) == 0
+        assert replay_buffer.n_transitions_stored(1) == 1
+        with pytest.raises(ValueError):
+            replay_buffer.sample_transitions(1, [0, 1])
+
+    def test_add_path_errors(self):
+        replay_buffer = MultiTaskPathBuffer(n_tasks=1,
+                                            capacity_in_transitions=2)
+        replay_buffer.add_path(0, dict(obs=np.array([[1]])))
+        with pytest.raises(ValueError):
+            replay_buffer.add_path(0, dict(act=np.array([[1]])))
+        with pytest.raises(ValueError):
+            replay_buffer.add_path(0, dict(obs=np.array([[1, 2]])))
+        with pytest.raises(ValueError):
+            replay_buffer.add_path(0, dict(obs=np.ones((3, 1))))
+
+    def test_pickleable(self):
+        replay_buffer = MultiTaskPathBuffer(n_tasks=2,
+                                            capacity_in_transitions=3)
+        replay_buffer.add_path(1, dict(obs=np.array([[4]])))
+        unpickled = pickle.loads(pickle.dumps(replay_buffer))
+        assert (unpickled.sample_transitions(2, [1])['obs'] == 4).all()
+        assert (unpickled.get_array('obs')[3] == 4).all()
@@ -62,3 +62,39 @@ class TestPathBuffer:
         replay_buffer.clear()
         assert replay_buffer.n_transitions_stored == 0
         assert not replay_buffer._buffer
+
+    def test_sample_n_step(self):
+        replay_buffer = PathBuffer(capacity_in_transitions=5)
+        replay_buffer.add_path(
+            dict(observation=np.array([[0], [1], [2]]),
+                 reward=np.array([[1.], [1.], [1.]]),
+                 terminal=np.array([[False], [False], [True]]),
+                 next_observation=np.array([[1], [2], [3]])))
+        replay_buffer.add_path(
+            dict(observation=np.array([[10], [11], [12]]),
+                 reward=np.array([[2.], [2.], [2.]]),
+                 terminal=np.array([[False], [False], [False]]),
+                 next_observation=np.array([[11], [12], [13]])))
+        discount = 0.5
+        samples = replay_buffer.sample_transitions(100,
+                                                   n_step=2,
+                                                   discount=discount)
+        # The second path wraps around and overwrites the first step of the
+        # first path.
+        expected = {
+            1: (1.5, True, 3, discount**2),
+            2: (1., True, 3, discount),
+            10: (3., False, 12, discount**2),
+            11: (3., False, 13, discount**2),
+            12: (2., False, 13, discount)
+        }
+        for obs, reward, terminal, next_obs, bootstrap_discount in zip(
+                samples['observation'], samples['reward'],
+                samples['terminal'], samples['next_observation'],
+                samples['discount']):
+            exp_reward, exp_terminal, exp_next_obs, exp_discount = expected[
+                int(obs)]
+            assert np.isclose(reward[0], exp_reward)
+            assert terminal[0] == exp_terminal
+            assert next_obs[0] == exp_next_obs
+            assert np.isclose(bootstrap_discount, exp_discount)
@@ -70,3 +70,98 @@ class TestReplayBuffer:
         for k in replay_buffer_pickled._buffer:
             assert replay_buffer_pickled._buffer[
                 k].shape == replay_buffer._buffer[k].shape
+
+    def test_sample_n_step(self):
+        env = DummyDiscreteEnv()
+        obs = env.reset()
+        replay_buffer = SimpleReplayBuffer(env_spec=env,
+                                           size_in_transitions=4,
+                                           time_horizon=4)
+        for t in range(4):
+            replay_buffer.add_transitions(observation=[obs],
+                                          action=[t],
+                                          reward=[1.],
+                                          terminal=[t == 1],
+                                          next_observation=[obs + t])
+        discount = 0.5
+        samples = replay_buffer.sample(4, n_step=3, discount=discount)
+        for action, reward, terminal, next_obs, bootstrap_discount in zip(
+                samples['action'], samples['reward'], samples['terminal'],
+                samples['next_observation'], samples['discount']):
+            # (n-step return, terminal, last step) from each time step
+            expected = {
+                0: (1.5, True, 1),
+                1: (1., True, 1),
+                2: (1.5, False, 3),
+                3: (1., False, 3)
+            }[int(action)]
+            n_steps = expected[2] - int(action) + 1
+            assert np.isclose(reward, expected[0])
+            assert terminal == expected[1]
+            assert np.array_equal(next_obs, obs + expected[2])
+            assert np.isclose(bootstrap_discount, discount**n_steps)
+
+    def test_sample_n_step_time_limit(self):
+        env = DummyDiscreteEnv()
+        obs = env.reset()
+        replay_buffer = SimpleReplayBuffer(env_spec=env,
+                                           size_in_transitions=4,
+                                           time_horizon=4)
+        # Two episodes of two steps, ending by a time limit.
+        for t in range(4):
+            replay_buffer.add_transitions(observation=[obs],
+                                          action=[t],
+                                          reward=[1.],
+                                          terminal=[False],
+                                          complete=[t % 2 == 1],
+                                          next_observation=[obs + t])
+        discount = 0.5
+        samples = replay_buffer.sample(4, n_step=3, discount=discount)
+        for action, reward, terminal, next_obs, bootstrap_discount in zip(
+                samples['action'], samples['reward'], samples['terminal'],
+                samples['next_observation'], samples['discount']):
+            # (n-step return, last step) from each time step
+            expected = {
+                0: (1.5, 1),
+                1: (1., 1),
+                2: (1.5, 3),
+                3: (1., 3)
+            }[int(action)]
+            n_steps = expected[1] - int(action) + 1
+            assert np.isclose(reward, expected[0])
+            assert not terminal
+            assert np.array_equal(next_obs, obs + expected[1])
+            assert np.isclose(bootstrap_discount, discount**n_steps)
+
+    def test_store_episodes(self):
+        env = DummyDiscreteEnv()
+        obs = env.reset()
+        replay_buffer = SimpleReplayBuffer(env_spec=env,
+                                           size_in_transitions=8,
+                                           time_horizon=2)
+        for t in range(4):
+            replay_buffer.add_transitions(observation=[obs, obs],
+                                          action=[2 * t, 2 * t + 1])
+        # Each episode holds the transitions of one environment.
+        assert np.array_equal(replay_buffer._buffer['action'],
+                              [[0, 2], [1, 3], [4, 6], [5, 7]])
+        assert replay_buffer.n_transitions_stored == 8
+
+    def test_unpickle_episode_lists(self):
+        env = DummyDiscreteEnv()
+        obs = env.reset()
+        replay_buffer = SimpleReplayBuffer(env_spec=env,
+                                           size_in_transitions=8,
+                                           time_horizon=2)
+        replay_buffer.add_transitions(observation=[obs, obs], action=[0, 1])
+        # Older buffers kept a list of the transitions of each key.
+        state = replay_buffer.__dict__.copy()
+        state['_episode_buffer'] = dict(observation=[np.array([obs, obs])],
+                                        action=[np.array([0, 1])])
+        del state['_episode_step']
+        replay_buffer = pickle.loads(pickle.dumps(replay_buffer))
+        replay_buffer.__setstate__(state)
+        replay_buffer.add_transitions(observation=[obs, obs], action=[2, 3])
+        assert np.array_equal(replay_buffer._buffer['action'][:2],
+                              [[0, 2], [1, 3]])
+        assert replay_buffer.n_transitions_stored == 4
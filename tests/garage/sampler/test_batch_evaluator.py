@@ -0,0 +1,62 @@
+import pickle
+
+import numpy as np
+
+from garage.envs import GarageEnv, PointEnv
+from garage.sampler import BatchEvaluator
+
+MAX_PATH_LENGTH = 7
+
+
+class ConstantPolicy:
+    """Policy whose sampled action differs from its mean action."""
+
+    def __init__(self, action_dim):
+        self._action_dim = action_dim
+        self.n_calls = 0
+
+    def reset(self, dones=None):
+        pass
+
+    def get_actions(self, observations):
+        self.n_calls += 1
+        n = len(observations)
+        return (np.ones((n, self._action_dim)),
+                dict(mean=np.full((n, self._action_dim), 0.1)))
+
+
+def test_evaluate():
+    env = GarageEnv(PointEnv(never_done=True))
+    evaluator = BatchEvaluator(env, n_envs=3, max_path_length=MAX_PATH_LENGTH)
+    policy = ConstantPolicy(env.action_space.flat_dim)
+    trajs = evaluator.evaluate(policy, n_trajs=5)
+    assert len(trajs.lengths) == 5
+    assert all(trajs.lengths == MAX_PATH_LENGTH)
+    assert np.allclose(trajs.actions, 0.1)
+    # The 3 copies step together, and 2 of them run a second rollout.
+    assert policy.n_calls == 2 * MAX_PATH_LENGTH
+
+    trajs = evaluator.evaluate(policy, n_trajs=2, deterministic=False)
+    assert len(trajs.lengths) == 2
+    assert np.allclose(trajs.actions, 1.)
+    evaluator.shutdown()
+
+
+def test_start_in_background():
+    env = GarageEnv(PointEnv(never_done=True))
+    evaluator = BatchEvaluator(env, n_envs=2, max_path_length=MAX_PATH_LENGTH)
+    policy = ConstantPolicy(env.action_space.flat_dim)
+    trajs = evaluator.start(policy, n_trajs=4).result()
+    assert len(trajs.lengths) == 4
+    # The background evaluation uses a copy of the policy.
+    assert policy.n_calls == 0
+    evaluator.shutdown()
+
+
+def test_pickleable():
+    env = GarageEnv(PointEnv(never_done=True))
+    evaluator = BatchEvaluator(env, n_envs=2, max_path_length=MAX_PATH_LENGTH)
+    policy = ConstantPolicy(env.action_space.flat_dim)
+    evaluator.evaluate(policy, n_trajs=2)
+    evaluator = pickle.loads(pickle.dumps(evaluator))
+    assert len(evaluator.evaluate(policy, n_trajs=2).lengths) == 2
@@ -0,0 +1,79 @@
+import pickle
+from unittest import mock
+
+from dowel import tabular
+import pytest
+
+from garage.sampler import CPUResources, WorkerFactory
+from garage.sampler import cpu_resources as cpu_resources_module
+
+
+def _allocate(n_cpus, n_workers, **kwargs):
+    resources = CPUResources(**kwargs)
+    with mock.patch.object(cpu_resources_module,
+                           '_available_cpus',
+                           return_value=list(range(n_cpus))):
+        resources.allocate(n_workers)
+    return resources
+
+
+def test_allocate_disjoint_cores():
+    resources = _allocate(8, 3, n_trainer_cpus=2)
+    assert resources.trainer_cpus == [0, 1]
+    assert resources.worker_cpus == [[2, 3], [4, 5], [6, 7]]
+
+
+def test_allocate_more_workers_than_cores():
+    resources = _allocate(4, 5, n_trainer_cpus=1)
+    assert resources.trainer_cpus == [0]
+    assert resources.worker_cpus == [[1], [2], [3], [1], [2]]
+
+
+def test_allocate_all_cores_reserved():
+    resources = _allocate(2, 2, n_trainer_cpus=4)
+    assert resources.trainer_cpus == [0, 1]
+    assert resources.worker_cpus == [[0], [1]]
+
+
+def test_allocate_no_worker_processes():
+    resources = _allocate(4, 0, n_trainer_cpus=1)
+    assert resources.trainer_cpus == [0, 1, 2, 3]
+    assert resources.worker_cpus == []
+
+
+def test_configure_worker_sets_threads():
+    resources = _allocate(8, 2, n_trainer_cpus=2, pin=False)
+    with mock.patch.object(cpu_resources_module,
+                           '_set_thread_counts') as set_thread_counts:
+        resources.configure_worker(1)
+        set_thread_counts.assert_called_once_with(3)
+        resources.configure_trainer()
+        set_thread_counts.assert_called_with(2)
+
+
+def test_configure_before_allocate():
+    with pytest.raises(ValueError):
+        CPUResources().configure_trainer()
+    with pytest.raises(ValueError):
+        CPUResources().configure_worker(0)
+
+
+def test_worker_factory_configure_process():
+    resources = _allocate(4, 2, threads_per_worker=1, pin=False)
+    factory = WorkerFactory(seed=0,
+                            max_path_length=1,
+                            n_workers=2,
+                            cpu_resources=resources)
+    with mock.patch.object(cpu_resources_module,
+                           '_set_thread_counts') as set_thread_counts:
+        factory.configure_process(0)
+        set_thread_counts.assert_called_once_with(1)
+
+
+def test_record_utilization_and_pickle():
+    resources = _allocate(4, 2)
+    resources.record_utilization()
+    resources.record_utilization()
+    tabular.clear()
+    unpickled = pickle.loads(pickle.dumps(resources))
+    assert unpickled.worker_cpus == resources.worker_cpus
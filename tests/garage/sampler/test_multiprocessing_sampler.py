@@ -52,6 +52,27 @@ def test_obtain_samples():
     env.close()
 
 
+@pytest.mark.timeout(10)
+def test_iter_samples():
+    env = TfEnv(GridWorldEnv(desc='4x4'))
+    policy = ScriptedPolicy(
+        scripted_actions=[2, 2, 1, 0, 3, 1, 1, 1, 2, 2, 1, 1, 1, 2, 2, 1])
+    workers = WorkerFactory(seed=100, max_path_length=16, n_workers=4)
+    sampler = MultiprocessingSampler.from_worker_factory(workers, policy, env)
+    n_steps = 0
+    for batch in sampler.iter_samples(0, 100,
+                                      tuple(policy.get_param_values())):
+        # Batches are yielded before all samples are collected.
+        assert n_steps < 100
+        n_steps += batch.lengths.sum()
+    assert n_steps >= 100
+    # The sampler can be used again after streaming.
+    trajs = sampler.obtain_samples(0, 50, tuple(policy.get_param_values()))
+    assert trajs.lengths.sum() >= 50
+    sampler.shutdown_worker()
+    env.close()
+
+
 @pytest.mark.timeout(10)
 def test_update_envs_env_update():
     max_path_length = 16
@@ -73,7 +73,7 @@ class TestOffPolicyVectorizedSampler(TfGraphTestCase):
             # When done is True in 1st sampling, the next sampling should be
             # separated
             case2 = len(paths2[0]['rewards']) == paths2[0]['running_length']
-            done = paths1[-1]['dones'][-1]
+            done = paths1[-1]['env_infos']['vec_env_executor.complete'][-1]
             assert (
                 (not done and case1) or (done and case2)
             ), 'Running length should be the length of full path'
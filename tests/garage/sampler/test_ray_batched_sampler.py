@@ -1,6 +1,7 @@
 """Tests for ray_batched_sampler."""
 from unittest.mock import Mock
 
+import cloudpickle
 import numpy as np
 import pytest
 import ray
@@ -10,6 +11,7 @@ from garage.envs.grid_world_env import GridWorldEnv
 from garage.experiment.task_sampler import SetTaskSampler
 from garage.np.policies import FixedPolicy, ScriptedPolicy
 from garage.sampler import OnPolicyVectorizedSampler, RaySampler, WorkerFactory
+from garage.sampler.ray_sampler import SamplerWorker
 from garage.tf.envs import TfEnv
 from tests.fixtures.sampler import ray_local_session_fixture
 
@@ -134,3 +136,47 @@ def test_init_with_env_updates(ray_local_session_fixture):
                                              envs=tasks.sample(n_workers))
     rollouts = sampler.obtain_samples(0, 160, policy)
     assert sum(rollouts.lengths) >= 160
+
+
+def test_sampler_worker_truncated_rollout():
+    max_path_length = 16
+    env = TfEnv(PointEnv(never_done=True))
+    policy = FixedPolicy(env.spec,
+                         scripted_actions=[
+                             env.action_space.sample()
+                             for _ in range(max_path_length)
+                         ])
+    workers = WorkerFactory(seed=100,
+                            max_path_length=max_path_length,
+                            n_workers=1)
+    worker = SamplerWorker(0, env, cloudpickle.dumps(policy), workers)
+    worker_id, rollout = worker.rollout(max_steps=3)
+    assert worker_id == 0
+    assert list(rollout.lengths) == [3]
+    assert not rollout.terminals.any()
+    _, rollout = worker.rollout()
+    assert list(rollout.lengths) == [max_path_length]
+
+
+def test_truncate_rollouts(ray_local_session_fixture):
+    del ray_local_session_fixture
+    max_path_length = 16
+    env = TfEnv(PointEnv(never_done=True))
+    policy = FixedPolicy(env.spec,
+                         scripted_actions=[
+                             env.action_space.sample()
+                             for _ in range(max_path_length)
+                         ])
+    workers = WorkerFactory(seed=100,
+                            max_path_length=max_path_length,
+                            n_workers=2)
+    sampler = RaySampler.from_worker_factory(workers,
+                                             policy,
+                                             env,
+                                             truncate_rollouts=True)
+    for _ in range(3):
+        rollouts = sampler.obtain_samples(0, 40, policy)
+        assert sum(rollouts.lengths) >= 40
+        assert max(rollouts.lengths) <= max_path_length
+    sampler.shutdown_worker()
+    env.close()
@@ -0,0 +1,151 @@
+import types
+
+import numpy as np
+import pytest
+
+from garage.envs import GarageEnv, PointEnv
+from garage.replay_buffer import SimpleReplayBuffer
+from garage.sampler import (OffPolicyVectorizedSampler,
+                            OnPolicyVectorizedSampler, ParallelVecEnvExecutor,
+                            SubprocVecEnvExecutor, VecEnvExecutor)
+from tests.fixtures.envs.dummy import DummyDiscreteEnv
+
+MAX_PATH_LENGTH = 3
+
+
+@pytest.mark.parametrize('n_workers', [None, 2])
+def test_same_as_vec_env_executor(n_workers):
+    env = GarageEnv(PointEnv(never_done=True))
+    vec_env = VecEnvExecutor(
+        [GarageEnv(PointEnv(never_done=True)) for _ in range(3)],
+        max_path_length=MAX_PATH_LENGTH)
+    subproc_vec_env = SubprocVecEnvExecutor([env] * 3,
+                                            max_path_length=MAX_PATH_LENGTH,
+                                            n_workers=n_workers)
+    assert subproc_vec_env.num_envs == 3
+    assert np.allclose(vec_env.reset(), subproc_vec_env.reset())
+    for t in range(2 * MAX_PATH_LENGTH):
+        actions = np.random.uniform(-.1, .1, (3, 2))
+        expected = vec_env.step(actions)
+        results = subproc_vec_env.step(actions)
+        assert np.allclose(expected[0], results[0])
+        assert np.allclose(expected[1], results[1])
+        assert np.array_equal(expected[2], results[2])
+        completes = results[3]['vec_env_executor.complete']
+        assert np.array_equal(
+            expected[3]['vec_env_executor.complete'], completes)
+        assert completes.all() == ((t + 1) % MAX_PATH_LENGTH == 0)
+    subproc_vec_env.close()
+    subproc_vec_env.close()
+
+
+def test_step_async():
+    env = GarageEnv(PointEnv(never_done=True))
+    vec_env = SubprocVecEnvExecutor([env] * 2, max_path_length=None)
+    first_obs = vec_env.reset()
+    vec_env.step_async(np.full((2, 2), .1))
+    obs, _, dones, _ = vec_env.step_wait()
+    assert np.allclose(obs, first_obs + .1)
+    assert not dones.any()
+    # Reset waits for a step in progress.
+    vec_env.step_async(np.full((2, 2), .1))
+    assert np.allclose(vec_env.reset(), first_obs)
+    vec_env.close()
+
+
+def test_discrete_actions():
+    vec_env = SubprocVecEnvExecutor([DummyDiscreteEnv()] * 2,
+                                    max_path_length=MAX_PATH_LENGTH,
+                                    n_workers=1)
+    vec_env.reset()
+    obs, rewards, _, _ = vec_env.step(np.array([0, 1]))
+    assert len(obs) == len(rewards) == 2
+    vec_env.close()
+
+
+class FailingPointEnv(PointEnv):
+
+    def step(self, action):
+        raise ValueError('Step failed')
+
+
+def test_env_exception():
+    vec_env = SubprocVecEnvExecutor([FailingPointEnv()],
+                                    max_path_length=MAX_PATH_LENGTH)
+    vec_env.reset()
+    with pytest.raises(RuntimeError, match='Step failed'):
+        vec_env.step(np.zeros((1, 2)))
+    vec_env.close()
+
+
+def test_parallel_vec_env_executor():
+    env = GarageEnv(PointEnv(never_done=True))
+    vec_env = ParallelVecEnvExecutor(env, 2, max_path_length=MAX_PATH_LENGTH)
+    vec_env.reset()
+    for t in range(MAX_PATH_LENGTH):
+        _, _, dones, env_infos = vec_env.step(np.zeros((2, 2)))
+        assert dones.all() == (t == MAX_PATH_LENGTH - 1)
+        assert 'vec_env_executor.complete' not in env_infos
+    vec_env.close()
+
+
+class ZeroPolicy:
+
+    def __init__(self):
+        self.resets = []
+
+    def reset(self, dones):
+        self.resets.append(np.array(dones))
+
+    def get_actions(self, observations):
+        return np.zeros((len(observations), 2)), dict()
+
+
+@pytest.mark.parametrize('n_workers', [None, 1])
+def test_on_policy_sampler_completes_paths(n_workers):
+    env = GarageEnv(PointEnv(never_done=True))
+    policy = ZeroPolicy()
+    algo = types.SimpleNamespace(policy=policy,
+                                 max_path_length=MAX_PATH_LENGTH)
+    sampler = OnPolicyVectorizedSampler(algo,
+                                        env,
+                                        n_envs=2,
+                                        n_workers=n_workers)
+    sampler.start_worker()
+    paths = sampler.obtain_samples(0, batch_size=4 * MAX_PATH_LENGTH)
+    sampler.shutdown_worker()
+    assert len(paths) == 4
+    for path in paths:
+        assert len(path['rewards']) == MAX_PATH_LENGTH
+        # Rollouts reaching max_path_length are done.
+        assert path['dones'].tolist() == [False] * (MAX_PATH_LENGTH - 1) + [
+            True
+        ]
+    assert all(done.all() for done in policy.resets[::MAX_PATH_LENGTH])
+
+
+@pytest.mark.parametrize('n_workers', [None, 1])
+def test_off_policy_sampler_completes_paths(n_workers):
+    env = GarageEnv(PointEnv(never_done=True))
+    replay_buffer = SimpleReplayBuffer(env_spec=env.spec,
+                                       size_in_transitions=100,
+                                       time_horizon=1)
+    algo = types.SimpleNamespace(exploration_policy=ZeroPolicy(),
+                                 env_spec=env.spec,
+                                 replay_buffer=replay_buffer,
+                                 max_path_length=MAX_PATH_LENGTH)
+    sampler = OffPolicyVectorizedSampler(algo,
+                                         env,
+                                         n_envs=2,
+                                         n_workers=n_workers)
+    sampler.start_worker()
+    paths = sampler.obtain_samples(0, batch_size=2 * (MAX_PATH_LENGTH + 1))
+    sampler.shutdown_worker()
+    assert [len(path['rewards']) for path in paths] == [3, 3, 1, 1]
+    assert [path['running_length'] for path in paths] == [3, 3, 1, 1]
+    assert [path['dones'][-1] for path in paths] == [True, True, False, False]
+    for path in paths:
+        assert not path['dones'][:-1].any()
+        assert np.isclose(path['undiscounted_return'], path['rewards'].sum())
+    # The last step of rollouts reaching max_path_length is terminal.
+    assert replay_buffer._buffer['terminal'].sum() == 2
@@ -0,0 +1,166 @@
+import tempfile
+
+import cloudpickle
+import gym
+import numpy as np
+import pytest
+
+from garage.envs import GarageEnv, PointEnv
+from garage.experiment import LocalRunner, SnapshotConfig
+from garage.np.policies import FixedPolicy
+from garage.sampler import MultiprocessingSampler, WorkerFactory, WorkerPool
+from garage.sampler.worker_pool import rebuild_worker
+
+
+class FakeSampler:
+
+    def __init__(self, worker_factory):
+        self.worker_factory = worker_factory
+        self.n_reconfigured = 0
+        self.shut_down = False
+
+    @classmethod
+    def from_worker_factory(cls, worker_factory, agents, envs):
+        del agents, envs
+        return cls(worker_factory)
+
+    def reconfigure(self, worker_factory, agents, envs):
+        del agents, envs
+        self.worker_factory = worker_factory
+        self.n_reconfigured += 1
+
+    def shutdown_worker(self):
+        self.shut_down = True
+
+
+class RandomResetEnv(gym.Env):
+    """Environment starting episodes at random, from its own generator."""
+
+    observation_space = gym.spaces.Box(low=-1, high=1, shape=(2, ))
+    action_space = gym.spaces.Box(low=-1, high=1, shape=(2, ))
+
+    def __init__(self):
+        self._rng = np.random.RandomState(0)
+
+    def reset(self):
+        return self._rng.uniform(-1, 1, size=2)
+
+    def step(self, action):
+        return self._rng.uniform(-1, 1, size=2), 0., False, {}
+
+    def render(self, mode='human'):
+        pass
+
+
+class NoSamplingAlgo:
+
+    policy = None
+    max_path_length = 5
+
+    def train(self, runner):
+        for _ in runner.step_epochs():
+            pass
+
+
+def _factory(n_workers=2, seed=0):
+    return WorkerFactory(seed=seed, max_path_length=5, n_workers=n_workers)
+
+
+def test_reuse_sampler():
+    pool = WorkerPool()
+    sampler = pool.get_sampler(FakeSampler, _factory(), None, None)
+    pool.release(sampler)
+    pool.release(sampler)
+    assert not sampler.shut_down
+    factory = _factory(seed=1)
+    assert pool.get_sampler(FakeSampler, factory, None, None) is sampler
+    assert sampler.n_reconfigured == 1
+    assert sampler.worker_factory is factory
+    # Samplers are only reused with the same number of workers.
+    other = pool.get_sampler(FakeSampler, _factory(n_workers=3), None, None)
+    assert other is not sampler
+    pool.release(sampler)
+    pool.release(other)
+    pool.shutdown()
+    assert sampler.shut_down and other.shut_down
+
+
+def test_rebuild_worker():
+    env = GarageEnv(PointEnv())
+    policy = FixedPolicy(env.spec, [env.action_space.sample()] * 5)
+    factory = _factory(n_workers=1)
+    worker = factory(0)
+    worker.update_agent(policy)
+    worker.update_env(env)
+    env_pkl = cloudpickle.dumps(env)
+
+    new_worker = rebuild_worker(worker, factory, 0, policy, env_pkl)
+    assert new_worker is not worker
+    assert new_worker.env is not env
+    assert new_worker.rollout().lengths[0] == 5
+
+
+@pytest.mark.timeout(30)
+def test_reuse_multiprocessing_sampler():
+    env = GarageEnv(PointEnv())
+    pool = WorkerPool()
+    for _ in range(2):
+        action = env.action_space.sample()
+        policy = FixedPolicy(env.spec, [action] * 5)
+        sampler = pool.get_sampler(MultiprocessingSampler, _factory(),
+                                   policy, env)
+        trajs = sampler.obtain_samples(0, 20, policy)
+        assert trajs.lengths.sum() >= 20
+        assert (trajs.actions == action).all()
+        pool.release(sampler)
+    pool.shutdown()
+    env.close()
+
+
+@pytest.mark.timeout(30)
+def test_pooled_sampler_is_deterministic():
+    env = GarageEnv(RandomResetEnv())
+    policy = FixedPolicy(env.spec, [env.action_space.sample()] * 5)
+
+    def first_trajectory(sampler):
+        trajs = sampler.obtain_samples(0, 5, policy)
+        return trajs.split()[0].observations
+
+    sampler = MultiprocessingSampler.from_worker_factory(_factory(n_workers=1),
+                                                         agents=policy,
+                                                         envs=env)
+    expected = first_trajectory(sampler)
+    sampler.shutdown_worker()
+
+    pool = WorkerPool()
+    for _ in range(2):
+        sampler = pool.get_sampler(MultiprocessingSampler,
+                                   _factory(n_workers=1), policy, env)
+        np.testing.assert_equal(first_trajectory(sampler), expected)
+        pool.release(sampler)
+    pool.shutdown()
+
+
+def test_restore_reuses_pooled_sampler():
+    pool = WorkerPool()
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        snapshot_config = SnapshotConfig(snapshot_dir=snapshot_dir,
+                                         snapshot_mode='last',
+                                         snapshot_gap=1)
+        runner = LocalRunner(snapshot_config)
+        runner.setup(NoSamplingAlgo(),
+                     None,
+                     sampler_cls=FakeSampler,
+                     n_workers=2,
+                     worker_pool=pool)
+        sampler = runner._sampler
+        runner.train(n_epochs=1)
+        assert not sampler.shut_down
+
+        runner = LocalRunner(snapshot_config)
+        runner.restore(snapshot_dir, worker_pool=pool)
+        assert runner._sampler is sampler
+        assert sampler.n_reconfigured == 1
+    pool.release(sampler)
+    pool.shutdown()
+    assert sampler.shut_down
@@ -0,0 +1,26 @@
+"""Test lazy loading of the attributes of garage packages."""
+import subprocess
+import sys
+
+import pytest
+
+import garage.sampler
+from garage.sampler.local_sampler import LocalSampler
+
+
+def test_lazy_attributes():
+    assert 'RaySampler' in dir(garage.sampler)
+    assert garage.sampler.LocalSampler is LocalSampler
+    with pytest.raises(AttributeError):
+        garage.sampler.NotASampler  # pylint: disable=pointless-statement
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='Packages are imported eagerly before Python 3.7')
+def test_import_does_not_import_backends():
+    statement = ('import sys\n'
+                 'from garage.sampler import LocalSampler\n'
+                 'from garage.experiment import LocalRunner\n'
+                 'for name in ("ray", "tensorflow", "torch"):\n'
+                 '    assert name not in sys.modules, name\n')
+    subprocess.run([sys.executable, '-c', statement], check=True)
@@ -148,6 +148,111 @@ class TestDQN(TfGraphTestCase):
 
             env.close()
 
+    @pytest.mark.large
+    def test_dqn_cartpole_fused_grad_steps(self):
+        """Test DQN running several gradient steps per session call."""
+        with LocalTFRunner(snapshot_config, sess=self.sess) as runner:
+            n_epochs = 10
+            steps_per_epoch = 10
+            sampler_batch_size = 500
+            num_timesteps = n_epochs * steps_per_epoch * sampler_batch_size
+            env = TfEnv(gym.make('CartPole-v0'))
+            replay_buffer = SimpleReplayBuffer(env_spec=env.spec,
+                                               size_in_transitions=int(1e4),
+                                               time_horizon=1)
+            qf = DiscreteMLPQFunction(env_spec=env.spec, hidden_sizes=(64, 64))
+            policy = DiscreteQfDerivedPolicy(env_spec=env.spec, qf=qf)
+            epilson_greedy_policy = EpsilonGreedyPolicy(
+                env_spec=env.spec,
+                policy=policy,
+                total_timesteps=num_timesteps,
+                max_epsilon=1.0,
+                min_epsilon=0.02,
+                decay_ratio=0.1)
+            algo = DQN(env_spec=env.spec,
+                       policy=policy,
+                       qf=qf,
+                       exploration_policy=epilson_greedy_policy,
+                       replay_buffer=replay_buffer,
+                       qf_lr=1e-4,
+                       discount=1.0,
+                       min_buffer_size=int(1e3),
+                       double_q=True,
+                       n_train_steps=500,
+                       grad_steps_per_call=10,
+                       steps_per_epoch=steps_per_epoch,
+                       target_network_update_freq=1,
+                       buffer_batch_size=32)
+
+            runner.setup(algo, env)
+            last_avg_ret = runner.train(n_epochs=n_epochs,
+                                        batch_size=sampler_batch_size)
+            assert last_avg_ret > 15
+            # the steps sharing a replay sample each log their own loss
+            assert len(set(algo.episode_qf_losses[-10:])) == 10
+
+            env.close()
+
+    @pytest.mark.large
+    def test_dqn_cartpole_n_step(self):
+        """Test DQN with n-step returns."""
+        with LocalTFRunner(snapshot_config, sess=self.sess) as runner:
+            n_epochs = 10
+            steps_per_epoch = 10
+            sampler_batch_size = 500
+            num_timesteps = n_epochs * steps_per_epoch * sampler_batch_size
+            env = TfEnv(gym.make('CartPole-v0'))
+            # n-step returns are computed within the stored episodes
+            replay_buffer = SimpleReplayBuffer(env_spec=env.spec,
+                                               size_in_transitions=int(1e4),
+                                               time_horizon=10)
+            qf = DiscreteMLPQFunction(env_spec=env.spec, hidden_sizes=(64, 64))
+            policy = DiscreteQfDerivedPolicy(env_spec=env.spec, qf=qf)
+            epilson_greedy_policy = EpsilonGreedyPolicy(
+                env_spec=env.spec,
+                policy=policy,
+                total_timesteps=num_timesteps,
+                max_epsilon=1.0,
+                min_epsilon=0.02,
+                decay_ratio=0.1)
+            algo = DQN(env_spec=env.spec,
+                       policy=policy,
+                       qf=qf,
+                       exploration_policy=epilson_greedy_policy,
+                       replay_buffer=replay_buffer,
+                       qf_lr=1e-4,
+                       discount=1.0,
+                       min_buffer_size=int(1e3),
+                       double_q=True,
+                       n_step=3,
+                       n_train_steps=500,
+                       steps_per_epoch=steps_per_epoch,
+                       target_network_update_freq=1,
+                       buffer_batch_size=32)
+
+            runner.setup(algo, env)
+            last_avg_ret = runner.train(n_epochs=n_epochs,
+                                        batch_size=sampler_batch_size)
+            assert last_avg_ret > 15
+
+            env.close()
+
+    def test_dqn_invalid_grad_steps_per_call(self):
+        env = TfEnv(gym.make('CartPole-v0'))
+        replay_buffer = SimpleReplayBuffer(env_spec=env.spec,
+                                           size_in_transitions=int(1e4),
+                                           time_horizon=1)
+        qf = DiscreteMLPQFunction(env_spec=env.spec, hidden_sizes=(8, ))
+        policy = DiscreteQfDerivedPolicy(env_spec=env.spec, qf=qf)
+        with pytest.raises(ValueError):
+            DQN(env_spec=env.spec,
+                policy=policy,
+                qf=qf,
+                replay_buffer=replay_buffer,
+                n_train_steps=10,
+                grad_steps_per_call=3)
+        env.close()
+
     def test_dqn_cartpole_pickle(self):
         """Test DQN with CartPole environment."""
         with LocalTFRunner(snapshot_config, sess=self.sess) as runner:
@@ -5,7 +5,6 @@ import numpy as np
 import pytest
 import tensorflow as tf
 
-from garage.misc.tensor_utils import normalize_pixel_batch
 from garage.tf.baselines import GaussianCNNBaseline
 from garage.tf.envs import TfEnv
 from tests.fixtures import TfGraphTestCase
@@ -48,68 +47,33 @@ class TestGaussianCNNBaseline(TfGraphTestCase):
         with mock.patch(('garage.tf.baselines.'
                          'gaussian_cnn_baseline.'
                          'GaussianCNNRegressor'),
-                        new=SimpleGaussianCNNRegressor):
-            with mock.patch(
-                    'garage.tf.baselines.'
-                    'gaussian_cnn_baseline.'
-                    'normalize_pixel_batch',
-                    side_effect=normalize_pixel_batch) as npb:
-
-                gcb = GaussianCNNBaseline(env_spec=env.spec)
-
-                obs_dim = env.spec.observation_space.shape
-                paths = [{
-                    'observations': [np.full(obs_dim, 1)],
-                    'returns': [1]
-                }, {
-                    'observations': [np.full(obs_dim, 2)],
-                    'returns': [2]
-                }]
-
-                gcb.fit(paths)
-                observations = np.concatenate(
-                    [p['observations'] for p in paths])
-                npb.assert_called_once()
-                assert (npb.call_args_list[0][0][0] == observations).all()
-
-                obs = {
-                    'observations': [np.full(obs_dim, 1),
-                                     np.full(obs_dim, 2)]
-                }
-                observations = obs['observations']
-                gcb.predict(obs)
-                assert npb.call_args_list[1][0][0] == observations
+                        side_effect=SimpleGaussianCNNRegressor) as regressor:
+            gcb = GaussianCNNBaseline(env_spec=env.spec)
+        assert regressor.call_args[1]['input_dtype'] == tf.uint8
+
+        obs_dim = env.spec.observation_space.shape
+        paths = [{
+            'observations': [np.full(obs_dim, 1, dtype=np.uint8)],
+            'returns': [1]
+        }, {
+            'observations': [np.full(obs_dim, 2, dtype=np.uint8)],
+            'returns': [2]
+        }]
+        with mock.patch.object(gcb._regressor,
+                               'fit',
+                               wraps=gcb._regressor.fit) as fit:
+            gcb.fit(paths)
+            # pixels are passed through unnormalized
+            assert fit.call_args[0][0].dtype == np.uint8
 
     def test_obs_not_image(self):
         env = TfEnv(DummyDiscretePixelEnv(), is_image=False)
         with mock.patch(('garage.tf.baselines.'
                          'gaussian_cnn_baseline.'
                          'GaussianCNNRegressor'),
-                        new=SimpleGaussianCNNRegressor):
-            with mock.patch(
-                    'garage.tf.baselines.'
-                    'gaussian_cnn_baseline.'
-                    'normalize_pixel_batch',
-                    side_effect=normalize_pixel_batch) as npb:
-
-                gcb = GaussianCNNBaseline(env_spec=env.spec)
-
-                obs_dim = env.spec.observation_space.shape
-                paths = [{
-                    'observations': [np.full(obs_dim, 1)],
-                    'returns': [1]
-                }, {
-                    'observations': [np.full(obs_dim, 2)],
-                    'returns': [2]
-                }]
-
-                gcb.fit(paths)
-                obs = {
-                    'observations': [np.full(obs_dim, 1),
-                                     np.full(obs_dim, 2)]
-                }
-                gcb.predict(obs)
-                assert not npb.called
+                        side_effect=SimpleGaussianCNNRegressor) as regressor:
+            GaussianCNNBaseline(env_spec=env.spec)
+        assert 'input_dtype' not in regressor.call_args[1]
 
     @pytest.mark.parametrize('obs_dim', [[1, 1, 1], [2, 2, 2], [1, 1], [2, 2]])
     def test_param_values(self, obs_dim):
@@ -73,6 +73,16 @@ class TestGaussianMLPBaseline(TfGraphTestCase):
             scope='GaussianMLPBaseline')
         assert np.array_equal(params_interal, trainable_params)
 
+    def test_num_slices_in_regressor_args(self):
+        box_env = TfEnv(DummyBoxEnv(obs_dim=(1, )))
+        with mock.patch(('garage.tf.baselines.'
+                         'gaussian_mlp_baseline.'
+                         'GaussianMLPRegressor')) as regressor:
+            GaussianMLPBaseline(env_spec=box_env.spec,
+                                num_slices=3,
+                                regressor_args=dict(num_slices=2))
+        assert regressor.call_args[1]['num_slices'] == 2
+
     def test_is_pickleable(self):
         box_env = TfEnv(DummyBoxEnv(obs_dim=(1, )))
         with mock.patch(('garage.tf.baselines.'
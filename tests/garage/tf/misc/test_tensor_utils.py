@@ -6,6 +6,7 @@ import tensorflow as tf
 
 from garage.tf.misc.tensor_utils import compute_advantages
 from garage.tf.misc.tensor_utils import get_target_ops
+from garage.tf.misc.tensor_utils import normalize_pixel_input
 from tests.fixtures import TfGraphTestCase
 
 
@@ -61,3 +62,15 @@ class TestTensorUtil(TfGraphTestCase):
         assert np.allclose(target_var.eval(), 1.8)
         self.sess.run(init_ops)
         assert np.allclose(target_var.eval(), 1)
+
+    def test_normalize_pixel_input(self):
+        pixels = tf.compat.v1.placeholder(tf.uint8, shape=[None, 2])
+        floats = tf.compat.v1.placeholder(tf.float32, shape=[None, 2])
+        normalized = normalize_pixel_input(pixels)
+        assert normalized.dtype == tf.float32
+        assert normalize_pixel_input(floats) is floats
+        assert normalize_pixel_input(floats, tf.float16).dtype == tf.float16
+
+        output = self.sess.run(normalized,
+                               feed_dict={pixels: [[0, 255], [51, 102]]})
+        assert np.allclose(output, [[0., 1.], [0.2, 0.4]])
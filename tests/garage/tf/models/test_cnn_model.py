@@ -64,6 +64,48 @@ class TestCNNModel(TfGraphTestCase):
 
         assert np.array_equal(output, expected_output)
 
+    def test_uint8_input(self):
+        model = CNNModel(filter_dims=(3, ),
+                         num_filters=(4, ),
+                         strides=(1, ),
+                         name='cnn_model',
+                         padding='VALID',
+                         hidden_w_init=tf.constant_initializer(1),
+                         hidden_nonlinearity=None)
+        input_shape = self.obs_input.shape[1:]
+        pixel_ph = tf.compat.v1.placeholder(tf.uint8,
+                                            shape=(None, ) + input_shape)
+        pixel_outputs = model.build(pixel_ph)
+        outputs = model.build(self._input_ph, name='float_input')
+        self.sess.run(tf.compat.v1.global_variables_initializer())
+
+        pixels = np.full(self.obs_input.shape, 255, dtype=np.uint8)
+        pixel_output = self.sess.run(pixel_outputs,
+                                     feed_dict={pixel_ph: pixels})
+        output = self.sess.run(outputs,
+                               feed_dict={self._input_ph: self.obs_input})
+        assert pixel_output.dtype == np.float32
+        assert np.allclose(pixel_output, output)
+
+    def test_reduced_precision(self):
+        model = CNNModel(filter_dims=(3, ),
+                         num_filters=(4, ),
+                         strides=(1, ),
+                         name='cnn_model',
+                         padding='VALID',
+                         hidden_w_init=tf.constant_initializer(1),
+                         hidden_nonlinearity=None,
+                         compute_dtype=tf.float16)
+        outputs = model.build(self._input_ph)
+        self.sess.run(tf.compat.v1.global_variables_initializer())
+        output = self.sess.run(outputs,
+                               feed_dict={self._input_ph: self.obs_input})
+        # variables are still stored in float32
+        assert all(value.dtype == np.float32
+                   for value in model.parameters.values())
+        assert output.dtype == np.float32
+        assert np.allclose(output, 3 * 3 * 3, rtol=1e-2)
+
     # yapf: disable
     @pytest.mark.parametrize('filter_sizes, in_channels, out_channels, '
                              'strides, pool_strides, pool_shapes', [
@@ -138,6 +138,55 @@ class TestGaussianMLPRegressor(TfGraphTestCase):
         expected = [[0], [-1], [-0.707], [0], [0.707], [1], [0]]
         assert np.allclose(prediction, expected, rtol=0, atol=0.1)
 
+    def test_fit_sliced(self):
+        sliced = GaussianMLPRegressor(input_shape=(1, ),
+                                      output_dim=1,
+                                      name='Sliced',
+                                      num_slices=7)
+        whole = GaussianMLPRegressor(input_shape=(1, ),
+                                     output_dim=1,
+                                     name='Whole')
+        whole.set_param_values(sliced.get_param_values())
+        data = np.linspace(-np.pi, np.pi, 1000)
+        observations = data.reshape((-1, 1))
+        returns = np.sin(data).reshape((-1, 1))
+
+        # The sliced loss and constraint are the ones of the whole batch.
+        old_means, old_log_stds = whole._f_pdists(observations)
+        inputs = [observations, returns, old_means + 0.1, old_log_stds]
+        assert np.isclose(sliced._optimizer.loss(inputs),
+                          whole._optimizer.loss(inputs))
+        assert np.isclose(sliced._optimizer.constraint_val(inputs),
+                          whole._optimizer.constraint_val(inputs))
+
+        # So are the normalization statistics.
+        sliced.fit(observations, returns)
+        whole.fit(observations, returns)
+        for name in ('x_mean', 'x_std', 'y_mean', 'y_std'):
+            assert np.allclose(
+                self.sess.run(getattr(sliced.model.networks['default'],
+                                      name)),
+                self.sess.run(getattr(whole.model.networks['default'], name)))
+
+    def test_warm_start_normalization(self):
+        gmr = GaussianMLPRegressor(input_shape=(1, ),
+                                   output_dim=1,
+                                   num_slices=3,
+                                   warm_start_normalization=True)
+        observations = np.random.normal(size=(200, 1))
+        returns = np.random.normal(loc=2., size=(200, 1))
+        gmr.fit(observations[:100], returns[:100])
+        gmr.fit(observations[100:], returns[100:])
+
+        x_mean = self.sess.run(gmr.model.networks['default'].x_mean)
+        x_std = self.sess.run(gmr.model.networks['default'].x_std)
+        y_mean = self.sess.run(gmr.model.networks['default'].y_mean)
+        y_std = self.sess.run(gmr.model.networks['default'].y_std)
+        assert np.allclose(x_mean, np.mean(observations, axis=0))
+        assert np.allclose(x_std, np.std(observations, axis=0))
+        assert np.allclose(y_mean, np.mean(returns, axis=0))
+        assert np.allclose(y_std, np.std(returns, axis=0))
+
     @pytest.mark.parametrize('output_dim, input_shape',
                              [(1, (1, )), (1, (2, )), (2, (3, )), (2, (1, 1)),
                               (3, (2, 2))])
@@ -2,6 +2,7 @@
 
 import akro
 import numpy as np
+import torch
 import torch.nn as nn
 from torch.nn import functional as F  # NOQA
 
@@ -14,6 +15,40 @@ from garage.torch.policies import TanhGaussianMLPPolicy
 from tests.fixtures.envs.dummy import DummyBoxEnv
 
 
+def _context_policy(env_spec, latent_dim):
+    """Create a context conditioned policy for an environment.
+
+    Args:
+        env_spec (garage.envs.EnvSpec): Environment specification.
+        latent_dim (int): Latent context variable dimension.
+
+    Returns:
+        ContextConditionedPolicy: The policy.
+
+    """
+    latent_space = akro.Box(low=-1,
+                            high=1,
+                            shape=(latent_dim, ),
+                            dtype=np.float32)
+    augmented_obs_space = akro.Tuple(
+        (env_spec.observation_space, latent_space))
+    augmented_env_spec = EnvSpec(augmented_obs_space, env_spec.action_space)
+    obs_dim = int(np.prod(env_spec.observation_space.shape))
+    action_dim = int(np.prod(env_spec.action_space.shape))
+    context_encoder = MLPEncoder(input_dim=obs_dim + action_dim + 1,
+                                 output_dim=latent_dim * 2,
+                                 hidden_sizes=(3, 2))
+    policy = TanhGaussianMLPPolicy(env_spec=augmented_env_spec,
+                                   hidden_sizes=(3, 5, 7),
+                                   hidden_nonlinearity=F.relu,
+                                   output_nonlinearity=None)
+    return ContextConditionedPolicy(latent_dim=latent_dim,
+                                    context_encoder=context_encoder,
+                                    policy=policy,
+                                    use_information_bottleneck=True,
+                                    use_next_obs=False)
+
+
 def test_methods():
     """Test PEARLWorker methods."""
     env_spec = TfEnv(DummyBoxEnv())
@@ -79,3 +114,54 @@ def test_methods():
     assert rollouts.observations.shape == (max_path_length, obs_dim)
     assert rollouts.actions.shape == (max_path_length, action_dim)
     assert rollouts.rewards.shape == (max_path_length, )
+
+    context_policy.reset_belief()
+    worker3 = PEARLWorker(seed=1,
+                          max_path_length=max_path_length,
+                          worker_number=1,
+                          deterministic=True,
+                          accum_context=True,
+                          update_posterior=True)
+    worker3.update_agent(context_policy)
+    worker3.update_env(env_spec)
+    worker3.rollout()
+
+    # The posterior is updated with the context of the rollout.
+    z_means = context_policy.z_means.clone()
+    context_policy.infer_posterior(context_policy.context)
+    assert np.allclose(z_means.numpy(),
+                       context_policy.z_means.detach().numpy(),
+                       rtol=1e-3)
+
+
+def test_posterior_reset_between_tasks():
+    """Test the posterior of a task doesn't depend on previous tasks."""
+    env = TfEnv(DummyBoxEnv())
+    context_policy = _context_policy(env, latent_dim=3)
+    max_path_length = 10
+    worker = PEARLWorker(seed=1,
+                         max_path_length=max_path_length,
+                         worker_number=1,
+                         deterministic=True,
+                         accum_context=True,
+                         update_posterior=True)
+    worker.update_env(env)
+    for _ in range(2):
+        # Explore the task, as MetaEvaluator does with a reset belief.
+        context_policy.reset_belief()
+        worker.update_agent(context_policy)
+        worker.rollout()
+        assert context_policy.context.shape[1] == max_path_length
+        z_means = context_policy.z_means.clone()
+
+        # The posterior only depends on the context of this task, which is
+        # also the context the policy is adapted to.
+        context_policy.infer_posterior(context_policy.context)
+        assert np.allclose(z_means.numpy(),
+                           context_policy.z_means.detach().numpy(),
+                           rtol=1e-3)
+
+        # The adapted policy keeps the posterior inferred by adaptation.
+        adapted_z_means = context_policy.z_means.detach().clone()
+        worker.rollout()
+        assert torch.equal(context_policy.z_means.detach(), adapted_z_means)
@@ -80,6 +80,24 @@ class DummyCriticNet:
         return ret
 
 
+class DummyEnsembleCriticNet(DummyCriticNet):
+    """Mock ensemble of QFunctions."""
+
+    def __init__(self, n_members):
+        super().__init__()
+        self._n_members = n_members
+
+    @property
+    def n_members(self):
+        """Number of members of the ensemble."""
+        return self._n_members
+
+    def __call__(self, observation, actions):
+        """Mock Sampling function."""
+        q_value = super().__call__(observation, actions)
+        return q_value.expand(self._n_members, -1).unsqueeze(-1)
+
+
 def testCriticLoss():
     """Test Sac Critic/QF loss."""
     # pylint: disable=no-member
@@ -118,6 +136,60 @@ def testCriticLoss():
     assert np.all(np.isclose(np.sum(loss), expected_loss))
 
 
+def testCriticLossEnsemble():
+    """Test Sac Critic/QF loss with an ensemble of critics."""
+    # pylint: disable=no-member
+    policy = DummyActorPolicy()
+    sac = SAC(env_spec=None,
+              policy=policy,
+              qf1=DummyEnsembleCriticNet(n_members=5),
+              qf2=None,
+              replay_buffer=None,
+              gradient_steps_per_itr=1,
+              discount=0.9,
+              buffer_batch_size=2,
+              target_entropy=3.0,
+              max_path_length=10,
+              optimizer=MagicMock,
+              target_qf_subset_size=2)
+
+    observations = torch.FloatTensor([[1, 2], [3, 4]])
+    actions = torch.FloatTensor([[5], [6]])
+    rewards = torch.FloatTensor([10, 20])
+    terminals = torch.Tensor([[0.], [0.]])
+    next_observations = torch.FloatTensor([[5, 6], [7, 8]])
+    samples_data = {
+        'observation': observations,
+        'action': actions,
+        'reward': rewards,
+        'terminal': terminals,
+        'next_observation': next_observations
+    }
+    td_targets = [7.3, 19.1]
+    pred_td_targets = [7., 10.]
+
+    expected_loss = F.mse_loss(torch.Tensor(td_targets),
+                               torch.Tensor(pred_td_targets))
+    loss = sac._critic_objective(samples_data)
+    assert len(loss) == 5
+    assert np.all(np.isclose(loss, expected_loss))
+
+
+@pytest.mark.parametrize('target_qf_subset_size', [0, 6])
+def testInvalidTargetQfSubsetSize(target_qf_subset_size):
+    """Test that the target Q-function subset size is validated."""
+    with pytest.raises(ValueError, match='target_qf_subset_size'):
+        SAC(env_spec=None,
+            policy=DummyActorPolicy(),
+            qf1=DummyEnsembleCriticNet(n_members=5),
+            qf2=None,
+            replay_buffer=None,
+            gradient_steps_per_itr=1,
+            max_path_length=10,
+            optimizer=MagicMock,
+            target_qf_subset_size=target_qf_subset_size)
+
+
 def testActorLoss():
     """Test Sac Actor/Policy loss."""
     # pylint: disable=no-member
@@ -0,0 +1,98 @@
+"""Test EnsembleMLPModule."""
+
+import pickle
+
+import numpy as np
+import pytest
+import torch
+import torch.nn as nn
+
+from garage.torch.modules import EnsembleMLPModule, MLPModule
+
+
+class TestEnsembleMLPModule:
+    """Test EnsembleMLPModule."""
+    # yapf: disable
+    @pytest.mark.parametrize('n_members, input_dim, output_dim, hidden_sizes', [
+        (1, 5, 1, (1, )),
+        (2, 5, 1, (2, )),
+        (2, 5, 2, (3, )),
+        (3, 5, 2, (1, 1)),
+        (5, 5, 3, (2, 2)),
+    ])
+    # yapf: enable
+    def test_output_values(self, n_members, input_dim, output_dim,
+                           hidden_sizes):
+        """Test output values from EnsembleMLPModule.
+
+        Args:
+            n_members (int): Number of MLPs in the ensemble.
+            input_dim (int): Input dimension.
+            output_dim (int): Ouput dimension.
+            hidden_sizes (list[int]): Size of hidden layers.
+
+        """
+        input_val = torch.ones([4, input_dim], dtype=torch.float32)
+        module = EnsembleMLPModule(n_members=n_members,
+                                   input_dim=input_dim,
+                                   output_dim=output_dim,
+                                   hidden_nonlinearity=torch.relu,
+                                   hidden_sizes=hidden_sizes,
+                                   hidden_w_init=nn.init.ones_,
+                                   output_w_init=nn.init.ones_)
+        output = module(input_val)
+        expected = input_dim * np.prod(hidden_sizes)
+        assert output.shape == (n_members, 4, output_dim)
+        assert np.all(output.detach().numpy() == expected)
+
+    def test_same_as_mlp(self):
+        """Test that each member computes the same function as an MLP."""
+        n_members, input_dim, output_dim = 3, 4, 2
+        hidden_sizes = (8, 8)
+        module = EnsembleMLPModule(n_members=n_members,
+                                   input_dim=input_dim,
+                                   output_dim=output_dim,
+                                   hidden_sizes=hidden_sizes,
+                                   hidden_nonlinearity=torch.tanh)
+        input_val = torch.randn(10, input_dim)
+        output = module(input_val)
+        # pylint: disable=protected-access
+        for member in range(n_members):
+            mlp = MLPModule(input_dim=input_dim,
+                            output_dim=output_dim,
+                            hidden_sizes=hidden_sizes,
+                            hidden_nonlinearity=torch.tanh)
+            linears = [layer.linear for layer in mlp._layers] + [
+                layer.linear for layer in mlp._output_layers
+            ]
+            for linear, weight, bias in zip(linears, module._weights,
+                                            module._biases):
+                linear.weight.data.copy_(weight.data[member].t())
+                linear.bias.data.copy_(bias.data[member, 0])
+            assert torch.allclose(output[member], mlp(input_val), atol=1e-6)
+
+    def test_per_member_inputs(self):
+        """Test that each member can get its own batch of inputs."""
+        module = EnsembleMLPModule(n_members=2,
+                                   input_dim=3,
+                                   output_dim=1,
+                                   hidden_sizes=(4, ))
+        inputs = torch.randn(2, 5, 3)
+        output = module(inputs)
+        assert output.shape == (2, 5, 1)
+        assert torch.allclose(output[1], module(inputs[1])[1])
+
+    def test_is_pickleable(self):
+        """Check EnsembleMLPModule is pickeable."""
+        module = EnsembleMLPModule(n_members=2,
+                                   input_dim=3,
+                                   output_dim=1,
+                                   hidden_sizes=(4, ))
+        input_val = torch.ones([1, 3], dtype=torch.float32)
+        output1 = module(input_val)
+
+        h = pickle.dumps(module)
+        module_pickled = pickle.loads(h)
+        output2 = module_pickled(input_val)
+
+        assert torch.equal(output1, output2)
@@ -99,6 +99,30 @@ class TestContextConditionedPolicy:
         assert all(
             [a == b for a, b in zip(self.module.z.shape, expected_shape)])
 
+    def test_update_posterior(self):
+        """Test update_posterior matches infer_posterior on the context."""
+        for i in range(40):
+            s = TimeStep(env_spec=self.env_spec,
+                         observation=np.full(self.obs_dim, i / 40.),
+                         next_observation=np.ones(self.obs_dim),
+                         action=np.full(self.action_dim, -i / 40.),
+                         reward=float(i),
+                         terminal=False,
+                         env_info={},
+                         agent_info={})
+            self.module.update_context(s)
+            if i % 7 == 0:
+                self.module.update_posterior()
+        self.module.update_posterior()
+        z_means = self.module.z_means.clone()
+        z_vars = self.module.z_vars.clone()
+        assert self.module.context.shape == (1, 40, self.encoder_input_dim)
+        assert torch.allclose(self.module.context[0, 39, -1],
+                              torch.tensor(39.))
+        self.module.infer_posterior(self.module.context)
+        assert torch.allclose(z_means, self.module.z_means)
+        assert torch.allclose(z_vars, self.module.z_vars)
+
     def test_forward(self):
         """Test forward."""
         t, b = 1, 2
@@ -216,3 +216,30 @@ class TestGaussianMLPPolicies:
         dist = policy(obs)
         assert torch.allclose(dist.log_prob(action),
                               policy.log_likelihood(obs, action))
+
+    @pytest.mark.parametrize('batch_size', [1, 5])
+    def test_get_actions_jit_inference(self, batch_size):
+        """Test get_actions with float64 inputs and traced inference."""
+        env_spec = TfEnv(DummyBoxEnv())
+        obs_dim = env_spec.observation_space.flat_dim
+        act_dim = env_spec.action_space.flat_dim
+        obs = np.random.random((batch_size, obs_dim))
+        policy = GaussianMLPPolicy(env_spec=env_spec,
+                                   hidden_sizes=(3, 4),
+                                   init_std=2.)
+
+        action, prob = policy.get_actions(obs)
+        policy.jit_inference = True
+        action_jit, prob_jit = policy.get_actions(obs)
+        _, prob_jit_single = policy.get_action(obs[0])
+
+        assert action_jit.shape == action.shape == (batch_size, act_dim)
+        assert np.allclose(prob['mean'], prob_jit['mean'])
+        assert np.allclose(prob['log_std'], np.log(2.))
+        assert np.allclose(prob['log_std'], prob_jit['log_std'])
+        assert np.allclose(prob['mean'][0], prob_jit_single['mean'])
+
+        policy_pickled = pickle.loads(pickle.dumps(policy))
+        assert policy_pickled.jit_inference
+        _, prob_pickled = policy_pickled.get_actions(obs)
+        assert np.allclose(prob['mean'], prob_pickled['mean'])
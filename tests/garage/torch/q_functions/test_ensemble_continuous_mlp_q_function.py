@@ -0,0 +1,57 @@
+import pickle
+
+import numpy as np
+import pytest
+import torch
+from torch import nn
+
+from garage.tf.envs import TfEnv
+from garage.torch.q_functions import EnsembleContinuousMLPQFunction
+from tests.fixtures.envs.dummy import DummyBoxEnv
+
+
+class TestEnsembleContinuousMLPQFunction:
+    # yapf: disable
+    @pytest.mark.parametrize('n_members, batch_size, hidden_sizes', [
+        (2, 1, (1, )),
+        (2, 3, (2, )),
+        (3, 9, (3, )),
+        (5, 15, (1, 1)),
+        (10, 22, (2, 2)),
+    ])
+    # yapf: enable
+    def test_forward(self, n_members, batch_size, hidden_sizes):
+        env_spec = TfEnv(DummyBoxEnv())
+        obs_dim = env_spec.observation_space.flat_dim
+        act_dim = env_spec.action_space.flat_dim
+        obs = torch.ones(batch_size, obs_dim, dtype=torch.float32)
+        act = torch.ones(batch_size, act_dim, dtype=torch.float32)
+
+        qf = EnsembleContinuousMLPQFunction(env_spec=env_spec,
+                                            n_members=n_members,
+                                            hidden_nonlinearity=None,
+                                            hidden_sizes=hidden_sizes,
+                                            hidden_w_init=nn.init.ones_,
+                                            output_w_init=nn.init.ones_)
+        output = qf(obs, act)
+        expected_output = torch.full([n_members, batch_size, 1],
+                                     fill_value=(obs_dim + act_dim) *
+                                     np.prod(hidden_sizes),
+                                     dtype=torch.float32)
+        assert torch.equal(output, expected_output)
+
+    def test_is_pickleable(self):
+        env_spec = TfEnv(DummyBoxEnv())
+        obs_dim = env_spec.observation_space.flat_dim
+        act_dim = env_spec.action_space.flat_dim
+        obs = torch.ones(2, obs_dim, dtype=torch.float32)
+        act = torch.ones(2, act_dim, dtype=torch.float32)
+
+        qf = EnsembleContinuousMLPQFunction(env_spec=env_spec,
+                                            hidden_sizes=(3, ))
+        output1 = qf(obs, act)
+
+        qf_pickled = pickle.loads(pickle.dumps(qf))
+        output2 = qf_pickled(obs, act)
+
+        assert torch.equal(output1, output2)
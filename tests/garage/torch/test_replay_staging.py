@@ -0,0 +1,87 @@
+"""Module to test garage.torch.replay_staging."""
+import pickle
+
+import numpy as np
+import torch
+
+from garage.replay_buffer import MultiTaskPathBuffer, PathBuffer
+from garage.torch.replay_staging import ReplayStager
+
+
+def _make_buffer(offset):
+    """Make a buffer whose observations equal their rewards plus offset.
+
+    Args:
+        offset (float): Offset of the observations.
+
+    Returns:
+        PathBuffer: The buffer.
+
+    """
+    buffer = PathBuffer(10)
+    rewards = np.arange(6, dtype=np.float64).reshape(-1, 1)
+    buffer.add_path({
+        'obs': np.hstack([rewards, rewards]) + offset,
+        'reward': rewards.astype(np.float32)
+    })
+    return buffer
+
+
+def test_sample():
+    """Test sampled transitions are float32 rows of the buffer."""
+    stager = ReplayStager(['obs', 'reward'])
+    samples = stager.sample(_make_buffer(10.), 5)
+    assert samples['obs'].shape == (5, 2)
+    assert samples['reward'].shape == (5, 1)
+    assert samples['obs'].dtype == torch.float32
+    assert torch.allclose(samples['obs'],
+                          samples['reward'].expand(5, 2) + 10.)
+
+
+def test_sample_buffers():
+    """Test a batch of each buffer is gathered into one tensor."""
+    stager = ReplayStager(['obs', 'reward'])
+    samples = stager.sample_buffers([_make_buffer(10.), _make_buffer(20.)], 4)
+    assert samples['obs'].shape == (2, 4, 2)
+    assert torch.allclose(samples['obs'][0, :, :1],
+                          samples['reward'][0] + 10.)
+    assert torch.allclose(samples['obs'][1, :, :1],
+                          samples['reward'][1] + 20.)
+
+
+def test_staging_is_reused():
+    """Test staging tensors are reused and track cleared buffers."""
+    stager = ReplayStager(['obs', 'reward'])
+    buffer = _make_buffer(10.)
+    first = stager.sample(buffer, 3)['obs']
+    buffer.clear()
+    rewards = np.ones((2, 1), dtype=np.float32)
+    buffer.add_path({'obs': np.full((2, 2), 5.), 'reward': rewards})
+    second = stager.sample(buffer, 3)['obs']
+    assert first.data_ptr() == second.data_ptr()
+    assert torch.all(second == 5.)
+
+
+def test_pickleable():
+    """Test pickling does not keep views of the buffers."""
+    stager = ReplayStager(['obs', 'reward'])
+    stager.sample(_make_buffer(10.), 3)
+    unpickled = pickle.loads(pickle.dumps(stager))
+    samples = unpickled.sample(_make_buffer(10.), 3)
+    assert samples['obs'].shape == (3, 2)
+
+
+def test_sample_tasks():
+    """Test batches of several tasks are gathered together."""
+    buffer = MultiTaskPathBuffer(3, 4)
+    for task in range(3):
+        buffer.add_path(task, {
+            'obs': np.full((2, 2), float(task)),
+            'reward': np.full((2, 1), task, dtype=np.float32)
+        })
+    stager = ReplayStager(['obs', 'reward'])
+    samples = stager.sample_tasks(buffer, [2, 0], 5)
+    assert samples['obs'].shape == (2, 5, 2)
+    assert samples['reward'].shape == (2, 5, 1)
+    assert torch.all(samples['obs'][0] == 2.)
+    assert torch.all(samples['obs'][1] == 0.)
@@ -43,3 +43,29 @@ def test_product_of_gaussians():
     output = tu.product_of_gaussians(mu, sigmas_squared)
     assert output[0] == 1
     assert output[1] == 1 / size
+
+
+def test_soft_update_model():
+    """Test soft update of a target model's parameters."""
+    target = torch.nn.Linear(2, 3)
+    source = torch.nn.Linear(2, 3)
+    expected = [
+        t_param.detach() * 0.9 + param.detach() * 0.1
+        for t_param, param in zip(target.parameters(), source.parameters())
+    ]
+    tu.soft_update_model(target, source, 0.1)
+    for t_param, value in zip(target.parameters(), expected):
+        assert torch.allclose(t_param, value)
+
+
+def test_soft_update_model_n_steps():
+    """Test n soft updates applied at once match n successive updates."""
+    target = torch.nn.Linear(2, 3)
+    target_copy = torch.nn.Linear(2, 3)
+    target_copy.load_state_dict(target.state_dict())
+    source = torch.nn.Linear(2, 3)
+    for _ in range(3):
+        tu.soft_update_model(target, source, 0.1)
+    tu.soft_update_model(target_copy, source, 0.1, n_steps=3)
+    for t_param, param in zip(target.parameters(), target_copy.parameters()):
+        assert torch.allclose(t_param, param)